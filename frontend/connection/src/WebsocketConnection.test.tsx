@@ -18,7 +18,7 @@ import axios from "axios"
 import { default as WS } from "vitest-websocket-mock"
 import zip from "lodash/zip"
 
-import { BackMsg } from "@streamlit/protobuf"
+import { BackMsg, ForwardMsg } from "@streamlit/protobuf"
 
 import { ConnectionState } from "./ConnectionState"
 import { Args, WebsocketConnection } from "./WebsocketConnection"
@@ -646,6 +646,39 @@ describe("WebsocketConnection", () => {
     expect(sendSpy).toHaveBeenCalledWith(buffer)
   })
 
+  it("dispatches messages of a ForwardMsgBatch in order", async () => {
+    const encode = (msg: ForwardMsg): Uint8Array =>
+      ForwardMsg.encode(msg).finish()
+    const batch = ForwardMsg.create({
+      forwardMsgBatch: {
+        messages: [
+          encode(ForwardMsg.create({ scriptFinished: 0 })),
+          encode(ForwardMsg.create({ refHash: "" })),
+        ],
+      },
+    })
+    const onMessage = vi.fn()
+    // @ts-expect-error
+    client.args.onMessage = onMessage
+    // @ts-expect-error
+    vi.spyOn(client.cache, "processMessagePayload").mockImplementation(
+      async (msg: ForwardMsg) => {
+        // Resolve the second message before the first one.
+        if (msg.type === "scriptFinished") {
+          await new Promise(resolve => setTimeout(resolve, 10))
+        }
+        return msg
+      }
+    )
+
+    // @ts-expect-error
+    await client.handleMessage(encode(batch))
+
+    expect(onMessage).toHaveBeenCalledTimes(2)
+    expect(onMessage.mock.calls[0][0].type).toBe("scriptFinished")
+    expect(onMessage.mock.calls[1][0].type).toBe("refHash")
+  })
+
   describe("getBaseUriParts", () => {
     it("returns correct base uri parts when ConnectionState == Connected", () => {
       // @ts-expect-error
@@ -493,13 +493,35 @@ export class WebsocketConnection {
   }
 
   private async handleMessage(data: ArrayBuffer): Promise<void> {
+    const encodedMsg = new Uint8Array(data)
+    const msg = ForwardMsg.decode(encodedMsg)
+
+    if (msg.type === "forwardMsgBatch") {
+      // The server batched several messages into this one. Each of them
+      // gets its own index here, so they're dispatched in order.
+      const encodedMsgs = msg.forwardMsgBatch?.messages ?? []
+      await Promise.all(
+        encodedMsgs.map(encodedBatchedMsg =>
+          this.handleDecodedMessage(
+            ForwardMsg.decode(encodedBatchedMsg),
+            encodedBatchedMsg
+          )
+        )
+      )
+      return
+    }
+
+    await this.handleDecodedMessage(msg, encodedMsg)
+  }
+
+  private async handleDecodedMessage(
+    msg: ForwardMsg,
+    encodedMsg: Uint8Array
+  ): Promise<void> {
     // Assign this message an index.
     const messageIndex = this.nextMessageIndex
     this.nextMessageIndex += 1
 
-    const encodedMsg = new Uint8Array(data)
-    const msg = ForwardMsg.decode(encodedMsg)
-
     this.messageQueue[messageIndex] = await this.cache.processMessagePayload(
       msg,
       encodedMsg
@@ -25,6 +25,7 @@ import {
   ForwardMsgMetadata,
   IArrowVegaLiteChart,
   Logo as LogoProto,
+  TextAppend,
 } from "@streamlit/protobuf"
 
 import { isNullOrUndefined } from "~lib/util/utils"
@@ -466,6 +467,34 @@ describe("ElementNode.arrowAddRows", () => {
   })
 })
 
+describe("ElementNode.appendText", () => {
+  it("appends text to a markdown body", () => {
+    const node = markdown("Hello")
+    const newNode = node.appendText(
+      TextAppend.create({ text: " world" }),
+      NO_SCRIPT_RUN_ID
+    )
+    expect(newNode.element.markdown?.body).toBe("Hello world")
+    expect(node.element.markdown?.body).toBe("Hello")
+  })
+
+  it("strips the given suffix before appending", () => {
+    const node = markdown("Hello|")
+    const newNode = node.appendText(
+      TextAppend.create({ text: " world|", stripSuffix: "|" }),
+      NO_SCRIPT_RUN_ID
+    )
+    expect(newNode.element.markdown?.body).toBe("Hello world|")
+  })
+
+  it("throws an error for other element types", () => {
+    const node = text("foo")
+    expect(() =>
+      node.appendText(TextAppend.create({ text: "bar" }), NO_SCRIPT_RUN_ID)
+    ).toThrow("elementType 'text' is not a valid appendText target!")
+  })
+})
+
 describe("AppRoot.empty", () => {
   let windowSpy: MockInstance
 
@@ -1092,6 +1121,16 @@ function text(text: string, scriptRunId = NO_SCRIPT_RUN_ID): ElementNode {
 }
 
 /** Create a BlockNode with the given properties. */
+function markdown(body: string, scriptRunId = NO_SCRIPT_RUN_ID): ElementNode {
+  const element = makeProto(Element, { markdown: { body } })
+  return new ElementNode(
+    element,
+    ForwardMsgMetadata.create(),
+    scriptRunId,
+    FAKE_SCRIPT_HASH
+  )
+}
+
 function block(
   children: AppNode[] = [],
   scriptRunId = NO_SCRIPT_RUN_ID
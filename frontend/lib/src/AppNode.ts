@@ -27,6 +27,8 @@ import {
   IArrow,
   IArrowNamedDataSet,
   Logo,
+  Markdown as MarkdownProto,
+  TextAppend,
 } from "@streamlit/protobuf"
 
 import {
@@ -335,6 +337,40 @@ export class ElementNode implements AppNode {
     return newNode
   }
 
+  public appendText(textAppend: TextAppend, scriptRunId: string): ElementNode {
+    if (this.element.type !== "markdown") {
+      // This should never happen!
+      throw new Error(
+        `elementType '${this.element.type}' is not a valid appendText target!`
+      )
+    }
+
+    const markdown = this.element.markdown as MarkdownProto
+    const stripSuffix = textAppend.stripSuffix
+    const body =
+      stripSuffix && markdown.body.endsWith(stripSuffix)
+        ? markdown.body.slice(0, -stripSuffix.length)
+        : markdown.body
+
+    const element = new Element({
+      markdown: {
+        body: body + textAppend.text,
+        allowHtml: markdown.allowHtml,
+        isCaption: markdown.isCaption,
+        elementType: markdown.elementType,
+        help: markdown.help,
+      },
+    })
+
+    return new ElementNode(
+      element,
+      this.metadata,
+      scriptRunId,
+      this.activeScriptHash,
+      this.fragmentId
+    )
+  }
+
   private static quiverAddRowsHelper(
     element: Quiver,
     namedDataSet: ArrowNamedDataSet
@@ -768,6 +804,14 @@ export class AppRoot {
         }
       }
 
+      case "appendText": {
+        return this.appendText(
+          deltaPath,
+          delta.appendText as TextAppend,
+          scriptRunId
+        )
+      }
+
       default: {
         throw new Error(`Unrecognized deltaType: '${delta.type}'`)
       }
@@ -927,6 +971,24 @@ export class AppRoot {
       this.appLogo
     )
   }
+
+  private appendText(
+    deltaPath: number[],
+    textAppend: TextAppend,
+    scriptRunId: string
+  ): AppRoot {
+    const existingNode = this.root.getIn(deltaPath) as ElementNode
+    if (isNullOrUndefined(existingNode)) {
+      throw new Error(`Can't appendText: invalid deltaPath: ${deltaPath}`)
+    }
+
+    const elementNode = existingNode.appendText(textAppend, scriptRunId)
+    return new AppRoot(
+      this.mainScriptHash,
+      this.root.setIn(deltaPath, elementNode, scriptRunId),
+      this.appLogo
+    )
+  }
 }
 
 /** Iterates over datasets and converts data to Quiver. */
@@ -24,7 +24,7 @@ import { render } from "~lib/test_util"
 import { mockEndpoints } from "~lib/mocks/mocks"
 import * as UseResizeObserver from "~lib/hooks/useResizeObserver"
 
-import ImageList, { ImageListProps } from "./ImageList"
+import ImageList, { getImageVariantUrl, ImageListProps } from "./ImageList"
 
 describe("ImageList Element", () => {
   const buildMediaURL = vi.fn().mockReturnValue("https://mock.media.url")
@@ -74,8 +74,14 @@ describe("ImageList Element", () => {
     const images = screen.getAllByRole("img")
     expect(images).toHaveLength(2)
 
-    expect(buildMediaURL).toHaveBeenNthCalledWith(1, "/media/mockImage1.jpeg")
-    expect(buildMediaURL).toHaveBeenNthCalledWith(2, "/media/mockImage2.jpeg")
+    expect(buildMediaURL).toHaveBeenNthCalledWith(
+      1,
+      "/media/mockImage1.jpeg?w=320"
+    )
+    expect(buildMediaURL).toHaveBeenNthCalledWith(
+      2,
+      "/media/mockImage2.jpeg?w=320"
+    )
 
     images.forEach(image => {
       expect(image).toHaveAttribute("src", "https://mock.media.url")
@@ -102,4 +108,22 @@ describe("ImageList Element", () => {
       expect(caption).toHaveStyle("width: 300px")
     })
   })
+
+  it("requests image variants that fit the displayed width", () => {
+    expect(getImageVariantUrl("/media/mockImage.png", 250)).toBe(
+      "/media/mockImage.png?w=320"
+    )
+    expect(getImageVariantUrl("/media/mockImage.png", 640)).toBe(
+      "/media/mockImage.png?w=640"
+    )
+    expect(getImageVariantUrl("/media/mockImage.png", 2000)).toBe(
+      "/media/mockImage.png"
+    )
+    expect(getImageVariantUrl("/media/mockImage.png", 0)).toBe(
+      "/media/mockImage.png"
+    )
+    expect(getImageVariantUrl("https://mock.url/image.png", 250)).toBe(
+      "https://mock.url/image.png"
+    )
+  })
 })
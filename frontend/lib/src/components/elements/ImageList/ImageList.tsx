@@ -56,6 +56,34 @@ enum WidthBehavior {
   MaxImageOrContainer = -5,
 }
 
+/**
+ * The widths of the image variants that the media endpoint serves.
+ * @see IMAGE_VARIANT_WIDTHS on the Backend
+ */
+const IMAGE_VARIANT_WIDTHS = [320, 640, 960, 1280]
+
+function isMediaUrl(url: string): boolean {
+  return url.startsWith("/media/")
+}
+
+/**
+ * Return the URL of the smallest image variant that's at least as wide as
+ * the displayed image, in device pixels. Only media files have variants, and
+ * images that are displayed wider than all variants get the original image.
+ */
+export function getImageVariantUrl(url: string, displayWidth: number): string {
+  if (!isMediaUrl(url) || displayWidth <= 0) {
+    return url
+  }
+
+  const pixelWidth = displayWidth * (window.devicePixelRatio || 1)
+  const variantWidth = IMAGE_VARIANT_WIDTHS.find(width => width >= pixelWidth)
+  if (variantWidth === undefined) {
+    return url
+  }
+  return `${url}?w=${variantWidth}`
+}
+
 /**
  * Functional element for a horizontal list of images.
  */
@@ -113,6 +141,13 @@ function ImageList({
     imgStyle.maxWidth = "100%"
   }
 
+  // Images are never displayed wider than their element. In fullscreen mode,
+  // the image's height is limited instead, so we only use the element width.
+  const displayWidth =
+    imageWidth !== undefined && !isFullScreen
+      ? Math.min(imageWidth, elementWidth)
+      : elementWidth
+
   return (
     <StyledToolbarElementContainer
       width={elementWidth}
@@ -134,7 +169,15 @@ function ImageList({
             <StyledImageContainer data-testid="stImageContainer" key={idx}>
               <img
                 style={imgStyle}
-                src={endpoints.buildMediaURL(image.url)}
+                src={
+                  // Until the element's width is measured, we don't know
+                  // which variant to request.
+                  width === undefined && isMediaUrl(image.url)
+                    ? undefined
+                    : endpoints.buildMediaURL(
+                        getImageVariantUrl(image.url, displayWidth)
+                      )
+                }
                 alt={idx.toString()}
               />
               {image.caption && (
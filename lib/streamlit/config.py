@@ -22,7 +22,8 @@ import secrets
 import threading
 from collections import OrderedDict
 from enum import Enum
-from typing import Any, Callable
+from types import MappingProxyType
+from typing import Any, Callable, NamedTuple
 
 from blinker import Signal
 
@@ -54,6 +55,28 @@ _config_options_template: dict[str, ConfigOption] = OrderedDict()
 _config_options: dict[str, ConfigOption] | None = None
 
 
+class _ConfigSnapshot(NamedTuple):
+    """The values of _config_options at some point in time."""
+
+    # The _config_options dict that the values were read from.
+    options: dict[str, ConfigOption]
+    # Maps option names to their values. Options with a computed value (like
+    # the default of server.headless) aren't included, since their value can
+    # depend on the environment or on other options.
+    values: MappingProxyType[str, Any]
+
+
+# An immutable snapshot of the config option values, so that get_option can
+# read them without grabbing _config_lock. It's replaced (never mutated)
+# whenever config options change, and is only used while it belongs to the
+# current _config_options dict.
+_config_snapshot: _ConfigSnapshot | None = None
+
+# Whether config files are being parsed. No snapshot is published before
+# parsing is done, so that readers never see a partially parsed config.
+_is_parsing_config = False
+
+
 # Indicates that a config option was defined by the user.
 _USER_DEFINED = "<user defined>"
 
@@ -179,6 +202,14 @@ def get_option(key: str) -> Any:
     >>> color = st.get_option("theme.primaryColor")
 
     """
+    snapshot = _config_snapshot
+    if snapshot is not None and snapshot.options is _config_options:
+        try:
+            return snapshot.values[key]
+        except KeyError:
+            # The option is computed or doesn't exist.
+            pass
+
     with _config_lock:
         config_options = get_config_options()
 
@@ -298,15 +329,21 @@ def _delete_option(key: str) -> None:
 
     Only for use in testing.
     """
-    try:
-        del _config_options_template[key]
-        assert _config_options is not None, (
-            "_config_options should always be populated here."
-        )
-        del _config_options[key]
-    except Exception:
-        # We don't care if the option already doesn't exist.
-        pass
+    global _config_snapshot
+
+    with _config_lock:
+        old_snapshot = _config_snapshot
+        _config_snapshot = None
+        try:
+            del _config_options_template[key]
+            assert _config_options is not None, (
+                "_config_options should always be populated here."
+            )
+            del _config_options[key]
+        except Exception:
+            # We don't care if the option already doesn't exist.
+            pass
+        _publish_config_snapshot(old_snapshot)
 
 
 # Config Section: Global #
@@ -420,6 +457,43 @@ _create_option(
     type_=bool,
 )
 
+_create_option(
+    "global.maxCachedMessagesSize",
+    description="""
+        Maximum size, in megabytes, of the cached ForwardMsgs held in backend
+        memory across all sessions. Once it's exceeded, the least recently
+        used messages are evicted. Set to 0 for no limit.
+    """,
+    visibility="hidden",
+    default_val=0,
+    type_=int,
+)
+
+_create_option(
+    "global.spillCachedMessagesToDisk",
+    description="""
+        If True, cached ForwardMsgs evicted by `global.maxCachedMessagesSize`
+        are moved to a temporary folder on local disk instead of being
+        dropped, so they can still be served by reference.
+    """,
+    visibility="hidden",
+    default_val=False,
+    type_=bool,
+)
+
+_create_option(
+    "global.maxCachedImagesSize",
+    description="""
+        Maximum size, in megabytes, of the images that st.image and similar
+        commands keep encoded in memory, so that images that are shown again
+        don't need to be encoded again. Once it's exceeded, the least
+        recently used images are evicted. Set to 0 to disable the cache.
+    """,
+    visibility="hidden",
+    default_val=64,
+    type_=int,
+)
+
 _create_option(
     "global.includeFragmentRunsInForwardMessageCacheCount",
     description="""
@@ -434,6 +508,46 @@ _create_option(
     type_=bool,
 )
 
+_create_option(
+    "global.zeroCopyCacheData",
+    description="""
+        If True, `@st.cache_data` stores NumPy, pandas, and Arrow buffers
+        out-of-band (pickle protocol 5), and a cache hit returns read-only
+        views on the cached buffers instead of unpickling a fresh copy.
+        Mutating a returned array or DataFrame in place will raise an error,
+        so only enable this if your app treats cached data as immutable.
+    """,
+    default_val=False,
+    type_=bool,
+)
+
+
+_create_option(
+    "global.maxDiskCacheSize",
+    description="""
+        Maximum size, in megabytes, of all `@st.cache_data` entries persisted
+        to disk with `persist="disk"`. When set, persisted entries are sharded
+        into one folder per function, support `ttl` and `max_entries`, and the
+        least recently used entries are evicted once the total size exceeds
+        this limit. Set to 0 to use the legacy, unbounded disk cache.
+    """,
+    default_val=0,
+    type_=int,
+)
+
+
+_create_option(
+    "global.exactDataHashing",
+    description="""
+        If True, `@st.cache_data` and `@st.cache_resource` hash large pandas
+        and Polars dataframes and NumPy arrays in full, instead of hashing a
+        sample of their rows or elements. This guarantees that any change to
+        such an argument invalidates the cached value. Columns are hashed in
+        parallel, and the hashes of unchanged Arrow-backed columns are reused.
+    """,
+    default_val=False,
+    type_=bool,
+)
 
 # Config Section: Logger #
 _create_section("logger", "Settings to customize Streamlit log messages.")
@@ -570,6 +684,21 @@ _create_option(
     type_=bool,
 )
 
+_create_option(
+    "runner.bytecodeCachePath",
+    description="""
+        Folder in which the compiled bytecode of the app's scripts is cached,
+        like Python's __pycache__. Server processes that share the folder
+        only compile each version of a script once, also across restarts.
+        `streamlit cache warm` fills the cache before the app is first run.
+
+        The folder must only be writable by the app, since the bytecode in it
+        is run. Set to None to disable the cache.
+    """,
+    default_val=None,
+    type_=str,
+)
+
 _create_option(
     "runner.postScriptGC",
     description="""
@@ -603,6 +732,11 @@ _create_option(
         Some execution environments may require serializing all data in Session
         State, so it may be useful to detect incompatibility during development,
         or when the execution environment will stop supporting it in the future.
+
+        Values are checked after the script run in which they're assigned to
+        a key. A value that's mutated in place is only checked again once
+        it's assigned again, so unserializable data that's added in place
+        (e.g. `st.session_state.x.append(lambda: 0)`) isn't detected.
     """,
     default_val=False,
     type_=bool,
@@ -626,6 +760,20 @@ _create_option(
     type_=str,
 )
 
+_create_option(
+    "runner.writeStreamFlushInterval",
+    description="""
+        Minimum time, in seconds, between two updates that `st.write_stream`
+        sends to the frontend while text is streaming. Text chunks that
+        arrive within this interval are coalesced into a single update, which
+        is sent with the first chunk that arrives after the interval, even
+        an empty one, or once a non-text chunk arrives or the stream ends.
+        Set to 0 to send every chunk as soon as it arrives.
+    """,
+    default_val=0.0,
+    type_=float,
+)
+
 # Config Section: Server #
 
 _create_section("server", "Settings for the Streamlit server")
@@ -790,6 +938,17 @@ _create_option(
     type_=int,
 )
 
+_create_option(
+    "server.maxSessionUploadSize",
+    description="""
+        Max total size, in megabytes, of the files that a single session can
+        have uploaded at the same time. Set to 0 to only limit the size of
+        each file with `server.maxUploadSize`.
+    """,
+    default_val=0,
+    type_=int,
+)
+
 _create_option(
     "server.maxMessageSize",
     description="""
@@ -800,6 +959,72 @@ _create_option(
     type_=int,
 )
 
+_create_option(
+    "server.websocketBatchSize",
+    description="""
+        Max size, in kilobytes, of a batch of messages sent to the browser in a
+        single WebSocket message. Messages that a session produces while the
+        server is busy sending earlier ones are batched together, which saves
+        WebSocket frames and event loop iterations for apps with many elements.
+        Set to 0 to send each message in its own WebSocket message.
+    """,
+    default_val=512,
+    type_=int,
+)
+
+_create_option(
+    "server.mediaFileDiskThreshold",
+    description="""
+        Min size, in megabytes, from which media files (e.g. of st.video,
+        st.audio or st.download_button) are kept on disk instead of in memory.
+        Files passed as a path are served from that path, and files passed as
+        raw data are written to a temporary directory. Set to 0 to keep all
+        media files in memory.
+    """,
+    default_val=0,
+    type_=int,
+)
+
+_create_option(
+    "server.mediaFileIdHash",
+    description="""
+        The hash function used to compute the IDs of media files (e.g. of
+        st.image, st.audio or st.video), which are part of their URLs.
+
+        Allowed values:
+        - "sha224" : A cryptographic hash, so that no user can make their
+                     file replace another user's file.
+        - "xxhash" : The much faster, but non-cryptographic, XXH3 hash. Only
+                     use it if all users of the app are trusted. Requires the
+                     xxhash module, and falls back to "sha224" if it's not
+                     installed.
+    """,
+    default_val="sha224",
+    type_=str,
+)
+
+_create_option(
+    "server.enableImageVariants",
+    description="""
+        Serve smaller variants of PNG and JPEG images to clients that display
+        them at a smaller size, e.g. on mobile devices. Variants are created
+        when they're first requested, in a few fixed widths, and are kept in
+        memory along with their image.
+    """,
+    default_val=False,
+    type_=bool,
+)
+
+_create_option(
+    "server.enableWebpImageVariants",
+    description="""
+        Serve PNG and JPEG images as WebP to browsers that support it, which
+        usually makes them smaller. Requires Pillow with WebP support.
+    """,
+    default_val=False,
+    type_=bool,
+)
+
 _create_option(
     "server.enableArrowTruncation",
     description="""
@@ -842,6 +1067,24 @@ _create_option(
     type_=int,
 )
 
+_create_option(
+    "server.workerProcesses",
+    description="""
+        The number of processes that run app sessions.
+
+        If greater than 1, Streamlit forks this many worker processes, each
+        with its own runtime, and the main process forwards the connections
+        of every session to one of them. This lets apps use more than one
+        CPU core. The worker processes share st.cache_data caches through
+        the disk, while st.cache_resource caches and Session State belong to
+        a single worker process.
+
+        This requires os.fork, so it's not supported on Windows.
+    """,
+    default_val=1,
+    type_=int,
+)
+
 # Config Section: Browser #
 
 _create_section("browser", "Configuration of non-UI browser options.")
@@ -1194,6 +1437,8 @@ def _set_option(key: str, value: Any, where_defined: str) -> None:
         Tells the config system where this was set.
 
     """
+    global _config_snapshot
+
     assert _config_options is not None, (
         "_config_options should always be populated here."
     )
@@ -1209,7 +1454,13 @@ def _set_option(key: str, value: Any, where_defined: str) -> None:
         )
 
     else:
-        _config_options[key].set_value(value, where_defined)
+        with _config_lock:
+            # Make readers wait for the new snapshot, instead of reading the
+            # old value.
+            old_snapshot = _config_snapshot
+            _config_snapshot = None
+            _config_options[key].set_value(value, where_defined)
+            _publish_config_snapshot(old_snapshot)
 
 
 def _update_config_with_sensitive_env_var(config_options: dict[str, ConfigOption]):
@@ -1302,6 +1553,10 @@ def _maybe_convert_to_number(v: Any) -> Any:
 # something.
 _on_config_parsed = Signal(doc="Emitted when the config file is parsed.")
 
+_on_config_changed = Signal(
+    doc="Emitted with the new option values when config options change."
+)
+
 CONFIG_FILENAMES = [
     file_util.get_streamlit_file_path("config.toml"),
     file_util.get_project_streamlit_file_path("config.toml"),
@@ -1335,7 +1590,7 @@ def get_config_options(
     dict[str, ConfigOption]
         An ordered dict that maps config option names to their values.
     """
-    global _config_options
+    global _config_options, _is_parsing_config
 
     if not options_from_flags:
         options_from_flags = {}
@@ -1354,21 +1609,27 @@ def get_config_options(
         old_options = _config_options
         _config_options = copy.deepcopy(_config_options_template)
 
-        # Values set in files later in the CONFIG_FILENAMES list overwrite those
-        # set earlier.
-        for filename in CONFIG_FILENAMES:
-            if not os.path.exists(filename):
-                continue
+        _is_parsing_config = True
+        try:
+            # Values set in files later in the CONFIG_FILENAMES list overwrite
+            # those set earlier.
+            for filename in CONFIG_FILENAMES:
+                if not os.path.exists(filename):
+                    continue
+
+                with open(filename, encoding="utf-8") as input:
+                    file_contents = input.read()
 
-            with open(filename, encoding="utf-8") as input:
-                file_contents = input.read()
+                _update_config_with_toml(file_contents, filename)
 
-            _update_config_with_toml(file_contents, filename)
+            _update_config_with_sensitive_env_var(_config_options)
 
-        _update_config_with_sensitive_env_var(_config_options)
+            for opt_name, opt_val in options_from_flags.items():
+                _set_option(opt_name, opt_val, _DEFINED_BY_FLAG)
+        finally:
+            _is_parsing_config = False
 
-        for opt_name, opt_val in options_from_flags.items():
-            _set_option(opt_name, opt_val, _DEFINED_BY_FLAG)
+        _publish_config_snapshot(_config_snapshot)
 
         if old_options and config_util.server_option_changed(
             old_options, _config_options
@@ -1386,6 +1647,34 @@ def get_config_options(
         return _config_options
 
 
+def _publish_config_snapshot(old_snapshot: _ConfigSnapshot | None) -> None:
+    """Replace _config_snapshot with the current values of _config_options,
+    and notify on_config_changed receivers if any value changed since
+    old_snapshot.
+
+    This should be called with _config_lock held, after _config_options is
+    updated.
+    """
+    global _config_snapshot
+
+    if _is_parsing_config or _config_options is None:
+        _config_snapshot = old_snapshot
+        return
+
+    config_options = _config_options
+    values = MappingProxyType(
+        {
+            key: option.value
+            for key, option in config_options.items()
+            if not option.is_computed
+        }
+    )
+    _config_snapshot = _ConfigSnapshot(config_options, values)
+
+    if old_snapshot is None or old_snapshot.values != values:
+        _on_config_changed.send(values=values)
+
+
 def _check_conflicts() -> None:
     # Node-related conflicts
 
@@ -1484,6 +1773,39 @@ def on_config_parsed(
     return disconnect
 
 
+def on_config_changed(
+    func: Callable[[MappingProxyType[str, Any]], None],
+) -> Callable[[], bool]:
+    """Call func with the new option values whenever config options change.
+
+    This lets subsystems cache values derived from config options, instead
+    of recomputing them on every use. func is called with _config_lock held,
+    so it shouldn't block.
+
+    Parameters
+    ----------
+    func : Callable[[MappingProxyType[str, Any]], None]
+        A function that's passed a read-only dict mapping config option names
+        to their new values. Options with a computed value (like the default
+        of server.headless) aren't included, so use get_option for those.
+
+    Returns
+    -------
+    Callable[[], bool]
+        A function that the caller can use to deregister func.
+    """
+
+    # See on_config_parsed for why we need a receiver that we can disconnect.
+    def receiver(_, values: MappingProxyType[str, Any]) -> None:
+        func(values)
+
+    def disconnect():
+        return _on_config_changed.disconnect(receiver)
+
+    _on_config_changed.connect(receiver, weak=False)
+    return disconnect
+
+
 # Run _check_conflicts only once the config file is parsed in order to avoid
 # loops. We also need to grab the lock when running _check_conflicts since it
 # may edit config options based on the values of other config options.
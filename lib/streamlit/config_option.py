@@ -69,6 +69,9 @@ class ConfigOption:
         ConfigOption.DEFAULT_DEFINITION means this file.
     is_default: bool
         True if the config value is equal to its default value.
+    is_computed: bool
+        True if the value is computed by a function each time it's
+        evaluated, rather than set to a fixed value.
     visibility : {"visible", "hidden"}
         See __init__.
     scriptable : bool
@@ -175,6 +178,7 @@ class ConfigOption:
         self.deprecated = deprecated
         self.replaced_by = replaced_by
         self.is_default = True
+        self.is_computed = False
         self._get_val_func: Callable[[], Any] | None = None
         self.where_defined = ConfigOption.DEFAULT_DEFINITION
         self.type = type_
@@ -220,6 +224,7 @@ class ConfigOption:
         )
         self.description = get_val_func.__doc__
         self._get_val_func = get_val_func
+        self.is_computed = True
         return self
 
     @property
@@ -241,6 +246,7 @@ class ConfigOption:
 
         """
         self._get_val_func = lambda: value
+        self.is_computed = False
 
         if where_defined is None:
             self.where_defined = ConfigOption.DEFAULT_DEFINITION
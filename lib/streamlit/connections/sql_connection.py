@@ -330,14 +330,11 @@ class SQLConnection(BaseConnection["Engine"]):
                 **kwargs,
             )
 
-        # We modify our helper function's `__qualname__` here to work around default
-        # `@st.cache_data` behavior. Otherwise, `.query()` being called with different
-        # `ttl` values will reset the cache with each call, and the query caches won't
-        # be scoped by connection.
-        ttl_str = str(  # Avoid adding extra `.` characters to `__qualname__`
-            ttl
-        ).replace(".", "_")
-        _query.__qualname__ = f"{_query.__qualname__}_{self._connection_name}_{ttl_str}"
+        # We modify our helper function's `__qualname__` here to scope the query
+        # caches by connection. Calls with different `ttl` values share the same
+        # cached results, as `@st.cache_data` stores each result once and
+        # returns it to every call whose `ttl` it's still fresh for.
+        _query.__qualname__ = f"{_query.__qualname__}_{self._connection_name}"
         _query = cache_data(
             show_spinner=show_spinner,
             ttl=ttl,
@@ -14,10 +14,13 @@
 
 from __future__ import annotations
 
+import hashlib
 import io
 import os
 import re
+import threading
 from collections.abc import Sequence
+from concurrent.futures import ThreadPoolExecutor
 from enum import IntEnum
 from pathlib import Path
 from typing import TYPE_CHECKING, Final, Literal, Union, cast
@@ -27,9 +30,14 @@ from typing_extensions import TypeAlias
 from streamlit import runtime, url_util
 from streamlit.errors import StreamlitAPIException
 from streamlit.runtime import caching
+from streamlit.runtime.image_transcode_cache import (
+    TranscodedImage,
+    get_image_transcode_cache,
+)
 from streamlit.type_util import NumpyShape
 
 if TYPE_CHECKING:
+    from collections.abc import Hashable
     from typing import Any
 
     import numpy.typing as npt
@@ -48,6 +56,8 @@ Channels: TypeAlias = Literal["RGB", "BGR"]
 ImageFormat: TypeAlias = Literal["JPEG", "PNG", "GIF"]
 ImageFormatOrAuto: TypeAlias = Literal[ImageFormat, "auto"]
 ImageOrImageList: TypeAlias = Union[AtomicImage, Sequence[AtomicImage]]
+# The images that image_to_url encodes. Other images are loaded as bytes first.
+_TranscodableImage: TypeAlias = Union[PILImage, "npt.NDArray[Any]", bytes]
 
 # This constant is related to the frontend maximum content width specified
 # in App.jsx main container
@@ -55,6 +65,9 @@ ImageOrImageList: TypeAlias = Union[AtomicImage, Sequence[AtomicImage]]
 # DPI.
 MAXIMUM_CONTENT_WIDTH: Final[int] = 2 * 730
 
+# The max number of threads that transcode the images of an image list.
+_TRANSCODE_MAX_WORKERS: Final = min(4, os.cpu_count() or 1)
+
 
 # @see Image.proto
 # @see WidthBehavior on the frontend
@@ -229,25 +242,13 @@ def _clip_image(image: npt.NDArray[Any], clamp: bool) -> npt.NDArray[Any]:
     return data
 
 
-def image_to_url(
-    image: AtomicImage,
-    width: int,
-    clamp: bool,
-    channels: Channels,
-    output_format: ImageFormatOrAuto,
-    image_id: str,
-) -> str:
-    """Return a URL that an image can be served from.
-    If `image` is already a URL, return it unmodified.
-    Otherwise, add the image to the MediaFileManager and return the URL.
-    (When running in "raw" mode, we won't actually load data into the
-    MediaFileManager, and we'll return an empty URL.)
+def _load_image(image: AtomicImage, image_id: str) -> str | _TranscodableImage:
+    """Return the URL of an image that doesn't need to be transcoded, or the
+    image's data.
+    If `image` is already a URL, return it unmodified. SVG images are returned
+    as data URIs. Images that can't be opened are added to the
+    MediaFileManager by path.
     """
-    import numpy as np
-    from PIL import Image, ImageFile
-
-    image_data: bytes
-
     # Convert Path to string if necessary
     if isinstance(image, Path):
         image = str(image)
@@ -284,7 +285,7 @@ def image_to_url(
         # Otherwise, try to open it as a file.
         try:
             with open(image, "rb") as f:
-                image_data = f.read()
+                return f.read()
         except Exception:
             # When we aren't able to open the image file, we still pass the path to
             # the MediaFileManager - its storage backend may have access to files
@@ -299,16 +300,33 @@ def image_to_url(
             caching.save_media_data(image, mimetype, image_id)
             return url
 
-    # PIL Images
-    elif isinstance(image, (ImageFile.ImageFile, Image.Image)):
-        format = _validate_image_format_string(image, output_format)
-        image_data = _PIL_to_bytes(image, format)
-
     # BytesIO
     # Note: This doesn't support SVG. We could convert to png (cairosvg.svg2png)
     # or just decode BytesIO to string and handle that way.
-    elif isinstance(image, io.BytesIO):
-        image_data = _BytesIO_to_bytes(image)
+    if isinstance(image, io.BytesIO):
+        return _BytesIO_to_bytes(image)
+
+    return image
+
+
+def _transcode_image(
+    image: _TranscodableImage,
+    width: int,
+    clamp: bool,
+    channels: Channels,
+    output_format: ImageFormatOrAuto,
+) -> TranscodedImage:
+    """Encode an image in a format browsers can show, and resize it to fit
+    the given width."""
+    import numpy as np
+    from PIL import Image, ImageFile
+
+    image_data: bytes
+
+    # PIL Images
+    if isinstance(image, (ImageFile.ImageFile, Image.Image)):
+        format = _validate_image_format_string(image, output_format)
+        image_data = _PIL_to_bytes(image, format)
 
     # Numpy Arrays (ie opencv)
     elif isinstance(image, np.ndarray):
@@ -332,17 +350,141 @@ def image_to_url(
     # Determine the image's format, resize it, and get its mimetype
     image_format = _validate_image_format_string(image_data, output_format)
     image_data = _ensure_image_size_and_format(image_data, width, image_format)
-    mimetype = _get_image_format_mimetype(image_format)
+    return TranscodedImage(image_data, _get_image_format_mimetype(image_format))
+
+
+def _get_transcode_cache_key(
+    image: _TranscodableImage,
+    width: int,
+    clamp: bool,
+    channels: Channels,
+    output_format: ImageFormatOrAuto,
+) -> tuple[Any, ...] | None:
+    """Return the key of a transcoded image in the ImageTranscodeCache, or
+    None if the image can't be cached."""
+    import numpy as np
+    from PIL import Image
 
+    # The cache is shared by all sessions, so we use a cryptographic hash.
+    content_hash = hashlib.new("sha224", usedforsecurity=False)
+    if isinstance(image, Image.Image):
+        # Everything that's used when the image is saved.
+        content_hash.update(
+            repr(("PIL", image.mode, image.size, image.format, image.info)).encode()
+        )
+        palette = image.getpalette()
+        if palette is not None:
+            content_hash.update(bytes(palette))
+        content_hash.update(image.tobytes())
+    elif isinstance(image, np.ndarray):
+        if image.dtype.hasobject:
+            return None
+        content_hash.update(repr(("ndarray", image.dtype.str, image.shape)).encode())
+        content_hash.update(image.tobytes())
+    else:
+        content_hash.update(b"bytes")
+        content_hash.update(image)
+
+    return (content_hash.digest(), width, output_format, clamp, channels)
+
+
+_transcode_executor: ThreadPoolExecutor | None = None
+_transcode_executor_lock = threading.Lock()
+
+
+def _transcode_images(
+    images: Sequence[_TranscodableImage],
+    width: int,
+    clamp: bool,
+    channels: Channels,
+    output_format: ImageFormatOrAuto,
+) -> list[TranscodedImage]:
+    """Transcode images, using the ImageTranscodeCache.
+
+    Images that aren't cached are transcoded on a thread pool if there's more
+    than one. Pillow releases the GIL while it encodes and resizes images.
+    """
+    cache = get_image_transcode_cache()
+    results: list[TranscodedImage | None] = [None] * len(images)
+    # Images that are in the list more than once are only transcoded once.
+    # Dict[cache key, or id of an image that can't be cached] -> image indices
+    misses: dict[Hashable, list[int]] = {}
+    for i, image in enumerate(images):
+        key = (
+            _get_transcode_cache_key(image, width, clamp, channels, output_format)
+            if cache.enabled
+            else None
+        )
+        if key is not None and key not in misses:
+            results[i] = cache.get(key)
+        if results[i] is None:
+            misses.setdefault(key if key is not None else id(image), []).append(i)
+
+    def transcode(indices: list[int]) -> TranscodedImage:
+        return _transcode_image(
+            images[indices[0]], width, clamp, channels, output_format
+        )
+
+    if len(misses) > 1:
+        global _transcode_executor
+        with _transcode_executor_lock:
+            if _transcode_executor is None:
+                _transcode_executor = ThreadPoolExecutor(
+                    max_workers=_TRANSCODE_MAX_WORKERS,
+                    thread_name_prefix="ImageTranscoding",
+                )
+        transcoded_images = list(_transcode_executor.map(transcode, misses.values()))
+    else:
+        transcoded_images = [transcode(indices) for indices in misses.values()]
+
+    for (key, indices), transcoded_image in zip(misses.items(), transcoded_images):
+        if isinstance(key, tuple):
+            cache.put(key, transcoded_image)
+        for i in indices:
+            results[i] = transcoded_image
+    return cast(list[TranscodedImage], results)
+
+
+def _add_transcoded_image(image: TranscodedImage, image_id: str) -> str:
+    """Add a transcoded image to the MediaFileManager and return its URL.
+    (When running in "raw" mode, we won't actually load data into the
+    MediaFileManager, and we'll return an empty URL.)
+    """
     if runtime.exists():
-        url = runtime.get_instance().media_file_mgr.add(image_data, mimetype, image_id)
-        caching.save_media_data(image_data, mimetype, image_id)
+        url = runtime.get_instance().media_file_mgr.add(
+            image.data, image.mimetype, image_id
+        )
+        caching.save_media_data(image.data, image.mimetype, image_id)
         return url
     else:
         # When running in "raw mode", we can't access the MediaFileManager.
         return ""
 
 
+def image_to_url(
+    image: AtomicImage,
+    width: int,
+    clamp: bool,
+    channels: Channels,
+    output_format: ImageFormatOrAuto,
+    image_id: str,
+) -> str:
+    """Return a URL that an image can be served from.
+    If `image` is already a URL, return it unmodified.
+    Otherwise, add the image to the MediaFileManager and return the URL.
+    (When running in "raw" mode, we won't actually load data into the
+    MediaFileManager, and we'll return an empty URL.)
+    """
+    image_or_url = _load_image(image, image_id)
+    if isinstance(image_or_url, str):
+        return image_or_url
+
+    [transcoded_image] = _transcode_images(
+        [image_or_url], width, clamp, channels, output_format
+    )
+    return _add_transcoded_image(transcoded_image, image_id)
+
+
 def _4d_to_list_3d(array: npt.NDArray[Any]) -> list[npt.NDArray[Any]]:
     return [array[i, :, :, :] for i in range(0, array.shape[0])]
 
@@ -425,17 +567,34 @@ def marshall_images(
         len(images),
     )
 
+    # We use the index of the image in the input image list to identify this image inside
+    # MediaFileManager. For this, we just add the index to the image's "coordinates".
+    image_ids = [
+        "%s-%i" % (coordinates, coord_suffix) for coord_suffix in range(len(images))
+    ]
+    images_or_urls: list[str | _TranscodableImage] = []
+    for image, image_id in zip(images, image_ids):
+        images_or_urls.append(_load_image(image, image_id))
+    # All images of the list are transcoded together, so that they can be
+    # transcoded in parallel.
+    transcoded_images = iter(
+        _transcode_images(
+            [image for image in images_or_urls if not isinstance(image, str)],
+            width,
+            clamp,
+            channels,
+            output_format,
+        )
+    )
+
     proto_imgs.width = int(width)
     # Each image in an image list needs to be kept track of at its own coordinates.
-    for coord_suffix, (image, caption) in enumerate(zip(images, captions)):
+    for image_or_url, image_id, caption in zip(images_or_urls, image_ids, captions):
         proto_img = proto_imgs.imgs.add()
         if caption is not None:
             proto_img.caption = str(caption)
 
-        # We use the index of the image in the input image list to identify this image inside
-        # MediaFileManager. For this, we just add the index to the image's "coordinates".
-        image_id = "%s-%i" % (coordinates, coord_suffix)
-
-        proto_img.url = image_to_url(
-            image, width, clamp, channels, output_format, image_id
-        )
+        if isinstance(image_or_url, str):
+            proto_img.url = image_or_url
+        else:
+            proto_img.url = _add_transcoded_image(next(transcoded_images), image_id)
@@ -15,6 +15,14 @@
 from __future__ import annotations
 
 import contextlib
+import importlib.abc
+import importlib.util
+import sys
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from importlib.machinery import ModuleSpec
+    from types import ModuleType
 
 
 def configure_streamlit_plotly_theme() -> None:
@@ -205,3 +213,59 @@ def configure_streamlit_plotly_theme() -> None:
         )
 
         pio.templates.default = "streamlit"
+
+
+class _ThemeConfiguringLoader(importlib.abc.Loader):
+    """Wraps Plotly's loader to configure the theme once Plotly is imported.
+
+    Everything but module execution is delegated to the wrapped loader, so
+    that Plotly can still read its package data through it.
+    """
+
+    def __init__(self, loader: importlib.abc.Loader):
+        self._loader = loader
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self._loader, name)
+
+    def create_module(self, spec: ModuleSpec) -> ModuleType | None:
+        return self._loader.create_module(spec)
+
+    def exec_module(self, module: ModuleType) -> None:
+        self._loader.exec_module(module)
+        configure_streamlit_plotly_theme()
+
+
+class _PlotlyImportHook(importlib.abc.MetaPathFinder):
+    """Configures the theme right after the `plotly` package is imported."""
+
+    def find_spec(
+        self,
+        fullname: str,
+        path: Any = None,
+        target: ModuleType | None = None,
+    ) -> ModuleSpec | None:
+        if fullname != "plotly":
+            return None
+
+        # The hook is only needed once. Removing it first also means that
+        # the lookup below goes to the other finders.
+        with contextlib.suppress(ValueError):
+            sys.meta_path.remove(self)
+        spec = importlib.util.find_spec(fullname)
+        if spec is not None and spec.loader is not None:
+            spec.loader = _ThemeConfiguringLoader(spec.loader)
+        return spec
+
+
+def configure_streamlit_plotly_theme_on_import() -> None:
+    """Configure the Streamlit chart theme for Plotly once Plotly is imported.
+
+    Importing Plotly takes a while, so `import streamlit` doesn't do it.
+    The theme must still be set up before any Plotly figures are created,
+    which is why it's configured as part of importing Plotly.
+    """
+    if "plotly" in sys.modules:
+        configure_streamlit_plotly_theme()
+    elif not any(isinstance(finder, _PlotlyImportHook) for finder in sys.meta_path):
+        sys.meta_path.insert(0, _PlotlyImportHook())
@@ -37,7 +37,7 @@ from streamlit.elements.lib.event_utils import AttributeDictionary
 from streamlit.elements.lib.form_utils import current_form_id
 from streamlit.elements.lib.policies import check_widget_policies
 from streamlit.elements.lib.streamlit_plotly_theme import (
-    configure_streamlit_plotly_theme,
+    configure_streamlit_plotly_theme_on_import,
 )
 from streamlit.elements.lib.utils import Key, compute_and_register_element_id, to_key
 from streamlit.errors import StreamlitAPIException
@@ -56,7 +56,7 @@ if TYPE_CHECKING:
     from streamlit.delta_generator import DeltaGenerator
 
 # We need to configure the Plotly theme before any Plotly figures are created:
-configure_streamlit_plotly_theme()
+configure_streamlit_plotly_theme_on_import()
 
 _AtomicFigureOrData: TypeAlias = Union[
     "go.Figure",
@@ -16,6 +16,7 @@ from __future__ import annotations
 
 import dataclasses
 import inspect
+import time
 import types
 from collections import ChainMap, UserDict, UserList
 from collections.abc import (
@@ -35,10 +36,12 @@ from typing import (
     cast,
 )
 
-from streamlit import dataframe_util, type_util
+from streamlit import config, dataframe_util, type_util
 from streamlit.errors import StreamlitAPIException
 from streamlit.logger import get_logger
+from streamlit.proto.ForwardMsg_pb2 import ForwardMsg
 from streamlit.runtime.metrics_util import gather_metrics
+from streamlit.runtime.scriptrunner_utils.script_run_context import enqueue_message
 from streamlit.string_util import (
     is_mem_address_str,
     max_char_sequence,
@@ -155,6 +158,12 @@ class WriteMixin:
         stream_container: DeltaGenerator | None = None
         streamed_response: str = ""
         written_content: list[Any] = StreamingOutput()
+        # How much of streamed_response was already sent to the frontend, and
+        # whether the frontend currently shows the streaming symbol.
+        sent_length: int = 0
+        cursor_shown: bool = False
+        last_sent_time: float = 0.0
+        flush_interval: float = config.get_option("runner.writeStreamFlushInterval")
 
         def flush_stream_response():
             """Write the full response to the app."""
@@ -168,6 +177,25 @@ class WriteMixin:
                 stream_container = None
                 streamed_response = ""
 
+        def send_pending_text():
+            """Send the text that was streamed since the last update."""
+            nonlocal sent_length
+            nonlocal cursor_shown
+            nonlocal last_sent_time
+
+            if stream_container is None or sent_length == len(streamed_response):
+                return
+            # Only send the text that was streamed since the last update,
+            # instead of re-sending the whole accumulated response.
+            _append_text(
+                stream_container,
+                streamed_response[sent_length:] + _TEXT_CURSOR,
+                strip_suffix=_TEXT_CURSOR if cursor_shown else "",
+            )
+            sent_length = len(streamed_response)
+            cursor_shown = True
+            last_sent_time = time.monotonic()
+
         # Make sure we have a generator and not just a generator function.
         if inspect.isgeneratorfunction(stream) or inspect.isasyncgenfunction(stream):
             stream = stream()
@@ -219,19 +247,23 @@ class WriteMixin:
                     ) from err
 
             if isinstance(chunk, str):
-                if not chunk:
-                    # Empty strings can be ignored
+                streamed_response += chunk
+                if chunk and not stream_container:
+                    stream_container = self.dg.empty()
+                    # Send the first text chunk right away, without the
+                    # streaming symbol.
+                    stream_container.markdown(streamed_response)
+                    sent_length = len(streamed_response)
+                    cursor_shown = False
+                    last_sent_time = time.monotonic()
                     continue
 
-                first_text = False
-                if not stream_container:
-                    stream_container = self.dg.empty()
-                    first_text = True
-                streamed_response += chunk
-                # Only add the streaming symbol on the second text chunk
-                stream_container.markdown(
-                    streamed_response + ("" if first_text else _TEXT_CURSOR),
-                )
+                # Chunks that arrive within the flush interval are coalesced.
+                # Empty chunks add no text, but still send the coalesced text
+                # once the interval is over, so that it isn't held back while
+                # the stream only yields empty chunks.
+                if time.monotonic() - last_sent_time >= flush_interval:
+                    send_pending_text()
             elif callable(chunk):
                 flush_stream_response()
                 chunk()
@@ -572,3 +604,22 @@ class WriteMixin:
     def dg(self) -> DeltaGenerator:
         """Get our DeltaGenerator."""
         return cast("DeltaGenerator", self)
+
+
+def _append_text(dg: DeltaGenerator, text: str, strip_suffix: str = "") -> None:
+    """Append text to the body of the markdown element at the given
+    DeltaGenerator's position.
+
+    This sends an `append_text` delta containing only `text`, which is much
+    cheaper than re-sending the element with its full body for every update.
+    If the element's body currently ends with `strip_suffix`, the frontend
+    removes it before appending.
+    """
+    if dg._root_container is None or dg._cursor is None:
+        return
+
+    msg = ForwardMsg()
+    msg.metadata.delta_path[:] = dg._cursor.delta_path
+    msg.delta.append_text.text = text
+    msg.delta.append_text.strip_suffix = strip_suffix
+    enqueue_message(msg)
@@ -0,0 +1,98 @@
+# Copyright (c) Streamlit Inc. (2018-2022) Snowflake Inc. (2022-2025)
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Utilities for measuring how long it takes to import a module."""
+
+from __future__ import annotations
+
+import re
+import subprocess
+import sys
+from typing import Final, NamedTuple
+
+# A line of the output of `python -X importtime`, e.g.
+# "import time:       373 |      57192 |     streamlit.runtime"
+_IMPORT_TIME_LINE_RE: Final = re.compile(
+    r"^import time:\s+(?P<self>\d+) \|\s+(?P<cumulative>\d+) \| (?P<name>.*)$"
+)
+
+
+class ImportTime(NamedTuple):
+    """How long it took to import a module, in microseconds."""
+
+    module: str
+    self_us: int
+    # Includes the time it took to import the module's imports.
+    cumulative_us: int
+    # How deeply nested the import is. The profiled module itself is at 0.
+    depth: int
+
+
+def parse_import_time_output(output: str) -> list[ImportTime]:
+    """Parse the output of `python -X importtime`.
+
+    Lines that aren't written by `-X importtime` are ignored.
+    """
+    import_times = []
+    for line in output.splitlines():
+        match = _IMPORT_TIME_LINE_RE.match(line)
+        if match is None:
+            continue
+        name = match.group("name")
+        # Every level of nesting is indented by two more spaces.
+        depth = (len(name) - len(name.lstrip())) // 2
+        import_times.append(
+            ImportTime(
+                module=name.strip(),
+                self_us=int(match.group("self")),
+                cumulative_us=int(match.group("cumulative")),
+                depth=depth,
+            )
+        )
+    return import_times
+
+
+def profile_import(module: str = "streamlit") -> list[ImportTime]:
+    """Import a module in a new Python process and return how long importing
+    it and each of its imports took.
+
+    A new process is used because modules that are already imported in this
+    one wouldn't be measured.
+
+    Raises a RuntimeError if the module can't be imported.
+    """
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        capture_output=True,
+        text=True,
+        check=False,
+    )
+    if result.returncode != 0:
+        raise RuntimeError(f"Unable to import {module}:\n{result.stderr}")
+    return parse_import_time_output(result.stderr)
+
+
+def get_imports_of(import_times: list[ImportTime], module: str) -> list[ImportTime]:
+    """Return the import times of `module` and of everything that was
+    imported while importing it, or an empty list if it wasn't imported."""
+    # Python writes a module's import time once the module is imported, so
+    # its imports are listed right before it.
+    imports: list[ImportTime] = []
+    for import_time in import_times:
+        imports.append(import_time)
+        if import_time.depth == 0:
+            if import_time.module == module:
+                return imports
+            imports = []
+    return []
@@ -18,8 +18,9 @@ import asyncio
 import json
 import sys
 import uuid
+from collections import deque
 from enum import Enum
-from typing import TYPE_CHECKING, Callable, Final
+from typing import TYPE_CHECKING, Any, Callable, Final
 
 from google.protobuf.json_format import ParseDict
 
@@ -143,6 +144,14 @@ class AppSession:
         self._browser_queue = ForwardMsgQueue()
         self._message_enqueued_callback = message_enqueued_callback
 
+        # ScriptRunner events that haven't been handled on the eventloop yet.
+        # Script threads append to this queue, and a single eventloop callback
+        # handles all the events that were appended until it runs, so a
+        # script that emits many elements doesn't wake up the eventloop for
+        # each of them.
+        self._scriptrunner_events: deque[tuple[Any, ...]] = deque()
+        self._scriptrunner_events_handler_scheduled = False
+
         self._state = AppSessionState.APP_NOT_RUNNING
 
         # Need to remember the client state here because when a script reruns
@@ -512,8 +521,9 @@ class AppSession:
         We forward the event on to _handle_scriptrunner_event_on_event_loop,
         which will be called on the main thread.
         """
-        self._event_loop.call_soon_threadsafe(
-            lambda: self._handle_scriptrunner_event_on_event_loop(
+        # deque.append is atomic, so script threads don't need a lock here.
+        self._scriptrunner_events.append(
+            (
                 sender,
                 event,
                 forward_msg,
@@ -524,6 +534,29 @@ class AppSession:
                 pages,
             )
         )
+        if not self._scriptrunner_events_handler_scheduled:
+            # If two threads get here at once, the handler is scheduled twice,
+            # and the second call finds no events to handle.
+            self._scriptrunner_events_handler_scheduled = True
+            self._event_loop.call_soon_threadsafe(
+                self._handle_scriptrunner_events_on_event_loop
+            )
+
+    def _handle_scriptrunner_events_on_event_loop(self) -> None:
+        """Handle the ScriptRunner events that were queued by
+        _on_scriptrunner_event, in order."""
+        # Reset the flag before taking events off the queue, so that an event
+        # that's queued while we're handling the others schedules another call.
+        self._scriptrunner_events_handler_scheduled = False
+        # Only handle the events that are queued already, so that a script
+        # thread that keeps emitting events can't block the eventloop.
+        for _ in range(len(self._scriptrunner_events)):
+            try:
+                self._handle_scriptrunner_event_on_event_loop(
+                    *self._scriptrunner_events.popleft()
+                )
+            except Exception:
+                _LOGGER.exception("Error handling a ScriptRunner event")
 
     def _handle_scriptrunner_event_on_event_loop(
         self,
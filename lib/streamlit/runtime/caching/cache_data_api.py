@@ -16,9 +16,12 @@
 
 from __future__ import annotations
 
+import math
 import pickle
+import struct
 import threading
 import types
+from collections import OrderedDict
 from typing import (
     TYPE_CHECKING,
     Any,
@@ -34,9 +37,10 @@ from typing import (
 from typing_extensions import TypeAlias
 
 import streamlit as st
-from streamlit import runtime
+from streamlit import config, runtime
 from streamlit.errors import StreamlitAPIException
 from streamlit.logger import get_logger
+from streamlit.runtime.caching import cache_utils
 from streamlit.runtime.caching.cache_errors import CacheError, CacheKeyNotFoundError
 from streamlit.runtime.caching.cache_type import CacheType
 from streamlit.runtime.caching.cache_utils import (
@@ -79,6 +83,23 @@ CACHE_DATA_MESSAGE_REPLAY_CTX = CachedMessageReplayContext(CacheType.DATA)
 # The cache persistence options we support: "disk" or None
 CachePersistType: TypeAlias = Union[Literal["disk"], None]
 
+# Prefix of entries that were serialized with out-of-band buffers. Regular
+# pickles (protocol >= 2) always start with b"\x80", so the two formats can't
+# be confused.
+_OUT_OF_BAND_MAGIC: Final = b"STOOB1\x00\x00"
+
+# Every stored entry starts with this header: a magic value and the time the
+# entry was created at, as returned by cache_utils.CACHE_DATA_TIMER.
+_ENTRY_HEADER: Final = struct.Struct("<8sd")
+_ENTRY_MAGIC: Final = b"STDATA1\x00"
+
+# A DataCache's caching policy: (max_entries, ttl_seconds).
+_CachePolicy: TypeAlias = tuple[Union[int, None], Union[float, None]]
+
+# Buffer offsets within an entry are aligned to this many bytes, so that
+# NumPy arrays reconstructed on top of them are aligned too.
+_OUT_OF_BAND_ALIGNMENT: Final = 64
+
 
 class CachedDataFuncInfo(CachedFuncInfo):
     """Implements the CachedFuncInfo interface for @st.cache_data"""
@@ -145,7 +166,7 @@ class DataCaches(CacheStatsProvider):
 
     def __init__(self):
         self._caches_lock = threading.Lock()
-        self._function_caches: dict[str, DataCache] = {}
+        self._function_stores: dict[str, DataCacheStore] = {}
 
     def get_cache(
         self,
@@ -155,67 +176,50 @@ class DataCaches(CacheStatsProvider):
         ttl: int | float | timedelta | str | None,
         display_name: str,
     ) -> DataCache:
-        """Return the mem cache for the given key.
+        """Return the mem cache for the given key and caching policy.
 
-        If it doesn't exist, create a new one with the given params.
+        All caches of the same function share its DataCacheStore, so changing
+        the ttl or max_entries of a function doesn't throw away its cached
+        values. If `persist` changes, the function's store is replaced.
         """
 
         ttl_seconds = time_to_seconds(ttl, coerce_none_to_inf=False)
 
-        # Get the existing cache, if it exists, and validate that its params
-        # haven't changed.
         with self._caches_lock:
-            cache = self._function_caches.get(key)
-            if (
-                cache is not None
-                and cache.ttl_seconds == ttl_seconds
-                and cache.max_entries == max_entries
-                and cache.persist == persist
-            ):
-                return cache
-
-            # Close the existing cache's storage, if it exists.
-            if cache is not None:
+            store = self._function_stores.get(key)
+            if store is not None and store.persist != persist:
                 _LOGGER.debug(
-                    "Closing existing DataCache storage "
-                    "(key=%s, persist=%s, max_entries=%s, ttl=%s) "
-                    "before creating new one with different params",
+                    "Closing existing DataCacheStore (key=%s, persist=%s) "
+                    "before creating new one with persist=%s",
                     key,
+                    store.persist,
                     persist,
-                    max_entries,
-                    ttl,
                 )
-                cache.storage.close()
-
-            # Create a new cache object and put it in our dict
-            _LOGGER.debug(
-                "Creating new DataCache (key=%s, persist=%s, max_entries=%s, ttl=%s)",
-                key,
-                persist,
-                max_entries,
-                ttl,
-            )
+                store.storage.close()
+                store = None
 
-            cache_context = self.create_cache_storage_context(
-                function_key=key,
-                function_name=display_name,
-                ttl_seconds=ttl_seconds,
-                max_entries=max_entries,
-                persist=persist,
-            )
-            cache_storage_manager = self.get_storage_manager()
-            storage = cache_storage_manager.create(cache_context)
+            if store is None:
+                _LOGGER.debug(
+                    "Creating new DataCacheStore (key=%s, persist=%s)", key, persist
+                )
+                # The storage doesn't expire or evict entries by itself. The
+                # store does, according to the policies of all of its caches.
+                cache_context = self.create_cache_storage_context(
+                    function_key=key,
+                    function_name=display_name,
+                    ttl_seconds=None,
+                    max_entries=None,
+                    persist=persist,
+                )
+                storage = self.get_storage_manager().create(cache_context)
+                store = DataCacheStore(key=key, storage=storage, persist=persist)
+                self._function_stores[key] = store
 
-            cache = DataCache(
-                key=key,
-                storage=storage,
-                persist=persist,
+            return store.get_cache(
                 max_entries=max_entries,
                 ttl_seconds=ttl_seconds,
                 display_name=display_name,
             )
-            self._function_caches[key] = cache
-            return cache
 
     def clear_all(self) -> None:
         """Clear all in-memory and on-disk caches."""
@@ -227,20 +231,21 @@ class DataCaches(CacheStatsProvider):
                 # available storages one by one
                 self.get_storage_manager().clear_all()
             except NotImplementedError:
-                for data_cache in self._function_caches.values():
-                    data_cache.clear()
-                    data_cache.storage.close()
-            self._function_caches = {}
+                for store in self._function_stores.values():
+                    store.clear()
+                    store.storage.close()
+            self._function_stores = {}
 
     def get_stats(self) -> list[CacheStat]:
         with self._caches_lock:
-            # Shallow-clone our caches. We don't want to hold the global
+            # Shallow-clone our stores. We don't want to hold the global
             # lock during stats-gathering.
-            function_caches = self._function_caches.copy()
+            function_stores = list(self._function_stores.values())
 
         stats: list[CacheStat] = []
-        for cache in function_caches.values():
-            stats.extend(cache.get_stats())
+        for store in function_stores:
+            if isinstance(store.storage, CacheStatsProvider):
+                stats.extend(store.storage.get_stats())
         return group_stats(stats)
 
     def validate_cache_params(
@@ -596,14 +601,132 @@ class CacheDataAPI:
         _data_caches.clear_all()
 
 
+class DataCacheStore:
+    """Stores the cached values of a single st.cache_data function.
+
+    Each value is stored once, with the time it was created at, no matter
+    which ttl or max_entries it was cached with. The function's DataCaches,
+    one per caching policy, are views on the store: a value that's older than
+    a DataCache's ttl is a miss for it, but can still be a hit for a DataCache
+    with a longer ttl.
+
+    Values are removed from the storage once they're expired for all of the
+    function's DataCaches, or when there are more values than the largest
+    max_entries of the function's DataCaches allows.
+    """
+
+    def __init__(self, key: str, storage: CacheStorage, persist: CachePersistType):
+        self.key = key
+        self.storage = storage
+        self.persist = persist
+
+        # Guards the fields below.
+        self._lock = threading.Lock()
+        self._caches: dict[_CachePolicy, DataCache] = {}
+        self._max_ttl_seconds = 0.0
+        self._max_entries = 0.0
+        # The creation times of the stored values this process knows of, in
+        # the order they were created.
+        self._created_at: dict[str, float] = {}
+        # The keys of the same values, least recently used first.
+        self._recently_used: OrderedDict[str, None] = OrderedDict()
+
+    def get_cache(
+        self, max_entries: int | None, ttl_seconds: float | None, display_name: str
+    ) -> DataCache:
+        """Return the DataCache with the given policy, creating it if
+        necessary."""
+        policy: _CachePolicy = (max_entries, ttl_seconds)
+        with self._lock:
+            cache = self._caches.get(policy)
+            if cache is None:
+                cache = DataCache(
+                    key=self.key,
+                    store=self,
+                    max_entries=max_entries,
+                    ttl_seconds=ttl_seconds,
+                    display_name=display_name,
+                )
+                self._caches[policy] = cache
+                self._max_ttl_seconds = max(
+                    self._max_ttl_seconds, _ttl_or_inf(ttl_seconds)
+                )
+                self._max_entries = max(
+                    self._max_entries,
+                    max_entries if max_entries is not None else math.inf,
+                )
+            return cache
+
+    def get(self, key: str) -> tuple[float | None, memoryview]:
+        """Return the creation time of a stored value, or None if it's not
+        known, and the value.
+
+        Raises
+        ------
+        CacheStorageError
+            Raised if the value can't be read, or CacheStorageKeyNotFoundError
+            if there's no value for the key.
+        """
+        created_at, data = _unpack_entry(self.storage.get(key))
+        with self._lock:
+            if created_at is not None and key not in self._created_at:
+                # The value was stored by another process, or before a
+                # restart.
+                self._created_at[key] = created_at
+            self._recently_used[key] = None
+            self._recently_used.move_to_end(key)
+        return created_at, data
+
+    def set(self, key: str, data: bytes, created_at: float) -> None:
+        """Store a value that starts with an entry header, and remove the
+        values that none of the function's DataCaches can use anymore."""
+        self.storage.set(key, data)
+
+        evicted: list[str] = []
+        with self._lock:
+            self._created_at.pop(key, None)
+            self._created_at[key] = created_at
+            self._recently_used[key] = None
+            self._recently_used.move_to_end(key)
+
+            expires_before = cache_utils.CACHE_DATA_TIMER() - self._max_ttl_seconds
+            for oldest_key, oldest_created_at in self._created_at.items():
+                if oldest_created_at > expires_before:
+                    break
+                evicted.append(oldest_key)
+            for evicted_key in evicted:
+                del self._created_at[evicted_key]
+                del self._recently_used[evicted_key]
+
+            while len(self._recently_used) > self._max_entries:
+                evicted_key, _ = self._recently_used.popitem(last=False)
+                self._created_at.pop(evicted_key, None)
+                evicted.append(evicted_key)
+
+        for evicted_key in evicted:
+            self.storage.delete(evicted_key)
+
+    def delete(self, key: str) -> None:
+        with self._lock:
+            self._created_at.pop(key, None)
+            self._recently_used.pop(key, None)
+        self.storage.delete(key)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._created_at.clear()
+            self._recently_used.clear()
+        self.storage.clear()
+
+
 class DataCache(Cache):
-    """Manages cached values for a single st.cache_data function."""
+    """Manages cached values for a single st.cache_data function and caching
+    policy. The values are kept in the function's DataCacheStore."""
 
     def __init__(
         self,
         key: str,
-        storage: CacheStorage,
-        persist: CachePersistType,
+        store: DataCacheStore,
         max_entries: int | None,
         ttl_seconds: float | None,
         display_name: str,
@@ -611,10 +734,17 @@ class DataCache(Cache):
         super().__init__()
         self.key = key
         self.display_name = display_name
-        self.storage = storage
+        self.store = store
         self.ttl_seconds = ttl_seconds
         self.max_entries = max_entries
-        self.persist = persist
+
+    @property
+    def storage(self) -> CacheStorage:
+        return self.store.storage
+
+    @property
+    def persist(self) -> CachePersistType:
+        return self.store.persist
 
     def get_stats(self) -> list[CacheStat]:
         if isinstance(self.storage, CacheStatsProvider):
@@ -623,25 +753,32 @@ class DataCache(Cache):
 
     def read_result(self, key: str) -> CachedResult:
         """Read a value and messages from the cache. Raise `CacheKeyNotFoundError`
-        if the value doesn't exist, and `CacheError` if the value exists but can't
-        be unpickled.
+        if the value doesn't exist or is older than the cache's ttl, and
+        `CacheError` if the value exists but can't be unpickled.
         """
         try:
-            pickled_entry = self.storage.get(key)
+            created_at, pickled_entry = self.store.get(key)
         except CacheStorageKeyNotFoundError as e:
             raise CacheKeyNotFoundError(str(e)) from e
         except CacheStorageError as e:
             raise CacheError(str(e)) from e
 
+        if self.ttl_seconds is not None and (
+            # Values stored without a creation time are only used without a ttl.
+            created_at is None
+            or cache_utils.CACHE_DATA_TIMER() - created_at >= self.ttl_seconds
+        ):
+            raise CacheKeyNotFoundError("Key expired in cache")
+
         try:
-            entry = pickle.loads(pickled_entry)
+            entry = _loads_cached_entry(pickled_entry)
             if not isinstance(entry, CachedResult):
                 # Loaded an old cache file format, remove it and let the caller
                 # rerun the function.
-                self.storage.delete(key)
+                self.store.delete(key)
                 raise CacheKeyNotFoundError()
             return entry
-        except pickle.UnpicklingError as exc:
+        except (pickle.UnpicklingError, struct.error) as exc:
             raise CacheError(f"Failed to unpickle {key}") from exc
 
     @gather_metrics("_cache_data_object")
@@ -649,17 +786,114 @@ class DataCache(Cache):
         """Write a value and associated messages to the cache.
         The value must be pickleable.
         """
+        created_at = cache_utils.CACHE_DATA_TIMER()
+        header = _ENTRY_HEADER.pack(_ENTRY_MAGIC, created_at)
         try:
             main_id = st._main.id
             sidebar_id = st.sidebar.id
             entry = CachedResult(value, messages, main_id, sidebar_id)
-            pickled_entry = pickle.dumps(entry)
-        except (pickle.PicklingError, TypeError) as exc:
+            if config.get_option("global.zeroCopyCacheData"):
+                pickled_entry = _dumps_out_of_band(entry, prefix=header)
+            else:
+                pickled_entry = header + pickle.dumps(entry)
+        except (pickle.PicklingError, TypeError, BufferError) as exc:
             raise CacheError(f"Failed to pickle {key}") from exc
-        self.storage.set(key, pickled_entry)
+        self.store.set(key, pickled_entry, created_at)
 
     def _clear(self, key: str | None = None) -> None:
+        # The store is shared by all of the function's caching policies.
         if not key:
-            self.storage.clear()
+            self.store.clear()
         else:
-            self.storage.delete(key)
+            self.store.delete(key)
+
+
+def _unpack_entry(data: bytes) -> tuple[float | None, memoryview]:
+    """Split a stored value into its creation time, or None if it was stored
+    without one, and the pickled entry."""
+    view = memoryview(data)
+    if view[: len(_ENTRY_MAGIC)].tobytes() != _ENTRY_MAGIC:
+        return None, view
+    _, created_at = _ENTRY_HEADER.unpack_from(view)
+    return created_at, view[_ENTRY_HEADER.size :]
+
+
+def _dumps_out_of_band(entry: CachedResult, prefix: bytes = b"") -> bytes:
+    """Pickle an entry with protocol 5, storing large buffers out-of-band.
+
+    The result is `prefix`, followed by the entry laid out as::
+
+        magic | header | pickle | padding | buffer 0 | padding | buffer 1 | ...
+
+    where the header holds the number of buffers and the (offset, length) of the
+    pickle and of every buffer. NumPy arrays (and therefore pandas blocks) and
+    Arrow buffers implement the out-of-band protocol, so their data ends up
+    in the buffer section without being copied into the pickle stream.
+    """
+    buffers: list[pickle.PickleBuffer] = []
+    pickled = pickle.dumps(entry, protocol=5, buffer_callback=buffers.append)
+    raw_buffers = [buf.raw() for buf in buffers]
+
+    # The header is the buffer count, then an (offset, length) pair for the
+    # pickle and for every buffer.
+    header_size = len(_OUT_OF_BAND_MAGIC) + 8 + 16 * (len(raw_buffers) + 1)
+    chunks: list[bytes | memoryview] = [pickled, *raw_buffers]
+    sections: list[tuple[int, bytes | memoryview]] = []
+    offset = header_size
+    for data in chunks:
+        sections.append((offset, data))
+        offset = _align(offset + len(data))
+
+    # Offsets are relative to the end of the prefix.
+    start = len(prefix)
+    out = bytearray(start + offset)
+    header = struct.pack("<Q", len(raw_buffers)) + b"".join(
+        struct.pack("<QQ", section_offset, len(data))
+        for section_offset, data in sections
+    )
+    out[:start] = prefix
+    out[start : start + len(_OUT_OF_BAND_MAGIC)] = _OUT_OF_BAND_MAGIC
+    out[start + len(_OUT_OF_BAND_MAGIC) : start + header_size] = header
+    for section_offset, data in sections:
+        out[start + section_offset : start + section_offset + len(data)] = data
+    for buf in buffers:
+        buf.release()
+    return bytes(out)
+
+
+def _loads_cached_entry(data: bytes | memoryview) -> Any:
+    """Unpickle an entry written by `pickle.dumps` or `_dumps_out_of_band`.
+
+    Out-of-band buffers are handed to `pickle.loads` as read-only views on
+    `data` when `global.zeroCopyCacheData` is enabled, so arrays in the returned
+    value share memory with the cached bytes instead of being copied. Otherwise
+    each buffer is copied into a writable bytearray, which keeps the usual
+    "every caller gets its own copy" semantics.
+    """
+    view = memoryview(data)
+    if view[: len(_OUT_OF_BAND_MAGIC)].tobytes() != _OUT_OF_BAND_MAGIC:
+        return pickle.loads(view)
+
+    position = len(_OUT_OF_BAND_MAGIC)
+    (num_buffers,) = struct.unpack_from("<Q", view, position)
+    position += 8
+    sections: list[memoryview] = []
+    for _ in range(num_buffers + 1):
+        section_offset, length = struct.unpack_from("<QQ", view, position)
+        position += 16
+        if section_offset + length > len(view):
+            raise pickle.UnpicklingError("Truncated out-of-band cache entry")
+        sections.append(view[section_offset : section_offset + length])
+
+    pickled, *buffers = sections
+    if not config.get_option("global.zeroCopyCacheData"):
+        return pickle.loads(pickled, buffers=[bytearray(buf) for buf in buffers])
+    return pickle.loads(pickled, buffers=buffers)
+
+
+def _ttl_or_inf(ttl_seconds: float | None) -> float:
+    return ttl_seconds if ttl_seconds is not None else math.inf
+
+
+def _align(offset: int) -> int:
+    return -(-offset // _OUT_OF_BAND_ALIGNMENT) * _OUT_OF_BAND_ALIGNMENT
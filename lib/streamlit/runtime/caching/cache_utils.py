@@ -61,6 +61,11 @@ _LOGGER: Final = get_logger(__name__)
 # is exposed here as a constant so that it can be patched in unit tests.
 TTLCACHE_TIMER = time.monotonic
 
+# The timer function that the creation times of st.cache_data values are
+# measured with. Unlike TTLCACHE_TIMER, it's comparable across processes, since
+# values can be persisted. It's exposed so that it can be patched in unit tests.
+CACHE_DATA_TIMER = time.time
+
 
 class Cache:
     """Function cache interface. Caches persist across script runs."""
@@ -31,19 +31,27 @@ import tempfile
 import threading
 import uuid
 import weakref
+from concurrent.futures import ThreadPoolExecutor
 from enum import Enum
 from re import Pattern
 from types import MappingProxyType
-from typing import Any, Callable, Final, Union, cast
+from typing import TYPE_CHECKING, Any, Callable, Final, TypeVar, Union, cast
 
 from typing_extensions import TypeAlias
 
-from streamlit import logger, type_util, util
+from streamlit import config, logger, type_util, util
 from streamlit.errors import StreamlitAPIException
 from streamlit.runtime.caching.cache_errors import UnhashableTypeError
 from streamlit.runtime.caching.cache_type import CacheType
 from streamlit.runtime.uploaded_file_manager import UploadedFile
 
+if TYPE_CHECKING:
+    from collections.abc import Iterable, Sequence
+
+    import numpy as np
+    import pandas as pd
+    import pyarrow as pa
+
 _LOGGER: Final = logger.get_logger(__name__)
 
 # If a dataframe has more than this many rows, we consider it large and hash a sample.
@@ -54,6 +62,11 @@ _PANDAS_SAMPLE_SIZE: Final = 10_000
 _NP_SIZE_LARGE: Final = 500_000
 _NP_SAMPLE_SIZE: Final = 100_000
 
+# With global.exactDataHashing, large buffers are split into chunks of this many
+# bytes, which are hashed in parallel.
+_EXACT_HASH_CHUNK_SIZE: Final = 16 * 1024 * 1024
+_EXACT_HASH_MAX_WORKERS: Final = min(8, os.cpu_count() or 1)
+
 HashFuncsDict: TypeAlias = dict[Union[str, type[Any]], Callable[[Any], Any]]
 
 # Arbitrary item to denote where we found a cycle in a hashed object.
@@ -242,33 +255,76 @@ def _float_to_bytes(f: float) -> bytes:
     return struct.pack("<d", f)
 
 
+def _none_to_bytes(obj: None) -> bytes:
+    return b"0"
+
+
+def _bytes_to_bytes(obj: bytes) -> bytes:
+    return obj
+
+
+def _uuid_to_bytes(obj: uuid.UUID) -> bytes:
+    return obj.bytes
+
+
+def _datetime_to_bytes(obj: datetime.datetime) -> bytes:
+    return obj.isoformat().encode()
+
+
+# Dispatch table for scalars, keyed by exact type. These produce the same bytes
+# as the corresponding branches of _CacheFuncHasher._to_bytes (note that bools
+# are hashed like ints there), but skip its long chain of type checks.
+# Subclasses, like enums deriving from str, are not in the table and still go
+# through that chain.
+_SCALAR_TO_BYTES: Final[dict[type, Callable[[Any], bytes]]] = {
+    bytes: _bytes_to_bytes,
+    str: str.encode,
+    int: _int_to_bytes,
+    bool: _int_to_bytes,
+    float: _float_to_bytes,
+    type(None): _none_to_bytes,
+    uuid.UUID: _uuid_to_bytes,
+    datetime.datetime: _datetime_to_bytes,
+}
+
+_SCALAR_TYPE_NAMES: Final[dict[type, bytes]] = {
+    t: t.__qualname__.encode() for t in _SCALAR_TO_BYTES
+}
+
+# Scalar types for which equal values always produce the same bytes. Lists of
+# such values can be hashed in a single pass, as skipping the memoization of
+# their items can't change the result.
+_VECTORIZABLE_TYPES: Final = frozenset({bytes, str, int, bool, type(None), uuid.UUID})
+
+# Scalar types whose bytes aren't memoized. Memoization is keyed by equality,
+# and aware datetimes for the same instant in different timezones are equal
+# but have different bytes.
+_UNMEMOIZED_SCALAR_TYPES: Final = _VECTORIZABLE_TYPES | {datetime.datetime}
+
+_SIMPLE_TYPES: Final = (bytes, bytearray, str, float, int, uuid.UUID, type(None))
+
+_MOCK_TYPES: Final = frozenset({"unittest.mock.Mock", "unittest.mock.MagicMock"})
+
+
+def _is_simple(obj: Any) -> bool:
+    return isinstance(obj, _SIMPLE_TYPES)
+
+
 def _key(obj: Any | None) -> Any:
     """Return key for memoization."""
 
     if obj is None:
         return None
 
-    def is_simple(obj):
-        return (
-            isinstance(obj, bytes)
-            or isinstance(obj, bytearray)
-            or isinstance(obj, str)
-            or isinstance(obj, float)
-            or isinstance(obj, int)
-            or isinstance(obj, bool)
-            or isinstance(obj, uuid.UUID)
-            or obj is None
-        )
-
-    if is_simple(obj):
+    if _is_simple(obj):
         return obj
 
     if isinstance(obj, tuple):
-        if all(map(is_simple, obj)):
+        if all(map(_is_simple, obj)):
             return obj
 
     if isinstance(obj, list):
-        if all(map(is_simple, obj)):
+        if all(map(_is_simple, obj)):
             return ("__l", tuple(obj))
 
     if inspect.isbuiltin(obj) or inspect.isroutine(obj) or inspect.iscode(obj):
@@ -297,30 +353,84 @@ class _CacheFuncHasher:
         else:
             self._hash_funcs = {}
         self._hashes: dict[Any, bytes] = {}
+        # Hashes of immutable containers that aren't covered by _hashes, keyed
+        # by id. The objects are kept alive along with their hashes, so that
+        # their ids can't be reused while this hasher exists.
+        self._hashes_by_id: dict[int, tuple[Any, bytes]] = {}
+        # The number of cycles found so far. Objects whose hash contains a
+        # cycle placeholder depend on where they were found, so they're not
+        # memoized by id.
+        self._num_cycles = 0
+
+        # Types with a user-provided hash function must not take the fast
+        # paths. Bytes are never passed to hash functions, see _to_bytes.
+        self._scalar_to_bytes: dict[type, Callable[[Any], bytes]] = {
+            t: f
+            for t, f in _SCALAR_TO_BYTES.items()
+            if t is bytes or type_util.get_fqn(t) not in self._hash_funcs
+        }
+        self._dispatch: dict[type, Callable[[Any], bytes]] = {
+            t: f
+            for t, f in (
+                (list, self._sequence_to_bytes),
+                (tuple, self._sequence_to_bytes),
+                (dict, self._dict_to_bytes),
+            )
+            if type_util.get_fqn(t) not in self._hash_funcs
+        }
 
         # The number of the bytes in the hash.
         self.size = 0
 
         self.cache_type = cache_type
+        self._exact_data_hashing: bool = config.get_option("global.exactDataHashing")
 
     def __repr__(self) -> str:
         return util.repr_(self)
 
     def to_bytes(self, obj: Any) -> bytes:
         """Add memoization to _to_bytes and protect against cycles in data structures."""
-        tname = type(obj).__qualname__.encode()
+        obj_type = type(obj)
+        scalar_to_bytes = self._scalar_to_bytes.get(obj_type)
+        if scalar_to_bytes is not None:
+            # Scalars can't contain cycles, so they don't need the hash stack.
+            tname = _SCALAR_TYPE_NAMES[obj_type]
+            if obj_type in _UNMEMOIZED_SCALAR_TYPES:
+                # Cheaper to recompute than to memoize, or can't be memoized.
+                b = b"%s:%s" % (tname, scalar_to_bytes(obj))
+                self.size += sys.getsizeof(b)
+                return b
+
+            key = (tname, obj)
+            b = self._hashes.get(key)
+            if b is None:
+                b = b"%s:%s" % (tname, scalar_to_bytes(obj))
+                self.size += sys.getsizeof(b)
+                self._hashes[key] = b
+            return b
+
+        tname = obj_type.__qualname__.encode()
         key = (tname, _key(obj))
 
         # Memoize if possible.
+        memoize_by_id = False
         if key[1] is not NoResult:
             if key in self._hashes:
                 return self._hashes[key]
+        elif isinstance(obj, (tuple, frozenset)):
+            memoized = self._hashes_by_id.get(id(obj))
+            if memoized is not None:
+                return memoized[1]
+            memoize_by_id = True
 
         # Break recursive cycles.
-        if obj in hash_stacks.current:
+        hash_stack = hash_stacks.current
+        if obj in hash_stack:
+            self._num_cycles += 1
             return _CYCLE_PLACEHOLDER
 
-        hash_stacks.current.push(obj)
+        num_cycles = self._num_cycles
+        hash_stack.push(obj)
 
         try:
             # Hash the input
@@ -332,11 +442,13 @@ class _CacheFuncHasher:
 
             if key[1] is not NoResult:
                 self._hashes[key] = b
+            elif memoize_by_id and self._num_cycles == num_cycles:
+                self._hashes_by_id[id(obj)] = (obj, b)
 
         finally:
             # In case an UnhashableTypeError (or other) error is thrown, clean up the
             # stack so we don't get false positives in future hashing calls
-            hash_stacks.current.pop()
+            hash_stack.pop()
 
         return b
 
@@ -345,6 +457,32 @@ class _CacheFuncHasher:
         b = self.to_bytes(obj)
         hasher.update(b)
 
+    def _sequence_to_bytes(self, obj: list[Any] | tuple[Any, ...]) -> bytes:
+        h = hashlib.new("md5", usedforsecurity=False)
+
+        item_types = set(map(type, obj))
+        if len(item_types) == 1:
+            (item_type,) = item_types
+            scalar_to_bytes = self._scalar_to_bytes.get(item_type)
+            if scalar_to_bytes is not None and item_type in _VECTORIZABLE_TYPES:
+                # Fast path for homogeneous sequences of scalars: this produces
+                # the same bytes as calling self.update for each item.
+                prefix = _SCALAR_TYPE_NAMES[item_type] + b":"
+                items = [prefix + scalar_to_bytes(item) for item in obj]
+                self.size += sum(map(sys.getsizeof, items))
+                h.update(b"".join(items))
+                return h.digest()
+
+        for item in obj:
+            h.update(self.to_bytes(item))
+        return h.digest()
+
+    def _dict_to_bytes(self, obj: dict[Any, Any]) -> bytes:
+        h = hashlib.new("md5", usedforsecurity=False)
+        for item in obj.items():
+            self.update(h, item)
+        return h.digest()
+
     def _to_bytes(self, obj: Any) -> bytes:
         """Hash objects to bytes, including code with dependencies.
 
@@ -352,11 +490,14 @@ class _CacheFuncHasher:
         runs.
         """
 
+        dispatch = self._dispatch.get(type(obj))
+        if dispatch is not None:
+            return dispatch(obj)
+
         h = hashlib.new("md5", usedforsecurity=False)
+        fqn_type = type_util.get_fqn_type(obj)
 
-        if type_util.is_type(obj, "unittest.mock.Mock") or type_util.is_type(
-            obj, "unittest.mock.MagicMock"
-        ):
+        if fqn_type in _MOCK_TYPES:
             # Mock objects can appear to be infinitely
             # deep, so we don't try to hash them at all.
             return self.to_bytes(id(obj))
@@ -364,9 +505,9 @@ class _CacheFuncHasher:
         elif isinstance(obj, bytes) or isinstance(obj, bytearray):
             return obj
 
-        elif type_util.get_fqn_type(obj) in self._hash_funcs:
+        elif fqn_type in self._hash_funcs:
             # Escape hatch for unsupported objects
-            hash_func = self._hash_funcs[type_util.get_fqn_type(obj)]
+            hash_func = self._hash_funcs[fqn_type]
             try:
                 output = hash_func(obj)
             except Exception as ex:
@@ -391,14 +532,10 @@ class _CacheFuncHasher:
             return obj.isoformat().encode()
 
         elif isinstance(obj, (list, tuple)):
-            for item in obj:
-                self.update(h, item)
-            return h.digest()
+            return self._sequence_to_bytes(obj)
 
         elif isinstance(obj, dict):
-            for item in obj.items():
-                self.update(h, item)
-            return h.digest()
+            return self._dict_to_bytes(obj)
 
         elif obj is None:
             return b"0"
@@ -414,17 +551,20 @@ class _CacheFuncHasher:
         elif isinstance(obj, Enum):
             return str(obj).encode()
 
-        elif type_util.is_type(obj, "pandas.core.series.Series"):
+        elif fqn_type == "pandas.core.series.Series":
             import pandas as pd
 
             obj = cast(pd.Series, obj)
             self.update(h, obj.size)
             self.update(h, obj.dtype.name)
 
-            if len(obj) >= _PANDAS_ROWS_LARGE:
-                obj = obj.sample(n=_PANDAS_SAMPLE_SIZE, random_state=0)
-
             try:
+                if len(obj) >= _PANDAS_ROWS_LARGE:
+                    if self._exact_data_hashing:
+                        self.update(h, _pandas_series_digest(obj))
+                        return h.digest()
+                    obj = obj.sample(n=_PANDAS_SAMPLE_SIZE, random_state=0)
+
                 self.update(h, pd.util.hash_pandas_object(obj).values.tobytes())
                 return h.digest()
             except TypeError:
@@ -437,15 +577,19 @@ class _CacheFuncHasher:
                 # it contains unhashable objects.
                 return b"%s" % pickle.dumps(obj, pickle.HIGHEST_PROTOCOL)
 
-        elif type_util.is_type(obj, "pandas.core.frame.DataFrame"):
+        elif fqn_type == "pandas.core.frame.DataFrame":
             import pandas as pd
 
             obj = cast(pd.DataFrame, obj)
             self.update(h, obj.shape)
 
-            if len(obj) >= _PANDAS_ROWS_LARGE:
-                obj = obj.sample(n=_PANDAS_SAMPLE_SIZE, random_state=0)
             try:
+                if len(obj) >= _PANDAS_ROWS_LARGE:
+                    if self._exact_data_hashing:
+                        self.update(h, _pandas_dataframe_digest(obj))
+                        return h.digest()
+                    obj = obj.sample(n=_PANDAS_SAMPLE_SIZE, random_state=0)
+
                 column_hash_bytes = self.to_bytes(
                     pd.util.hash_pandas_object(obj.dtypes)
                 )
@@ -463,17 +607,20 @@ class _CacheFuncHasher:
                 # it contains unhashable objects.
                 return b"%s" % pickle.dumps(obj, pickle.HIGHEST_PROTOCOL)
 
-        elif type_util.is_type(obj, "polars.series.series.Series"):
+        elif fqn_type == "polars.series.series.Series":
             import polars as pl  # type: ignore[import-not-found]
 
             obj = cast(pl.Series, obj)
             self.update(h, str(obj.dtype).encode())
             self.update(h, obj.shape)
 
-            if len(obj) >= _PANDAS_ROWS_LARGE:
-                obj = obj.sample(n=_PANDAS_SAMPLE_SIZE, seed=0)
-
             try:
+                if len(obj) >= _PANDAS_ROWS_LARGE:
+                    if self._exact_data_hashing:
+                        self.update(h, _arrow_digest(obj.to_arrow()))
+                        return h.digest()
+                    obj = obj.sample(n=_PANDAS_SAMPLE_SIZE, seed=0)
+
                 self.update(h, obj.hash(seed=0).to_arrow().to_string().encode())
                 return h.digest()
             except TypeError:
@@ -485,15 +632,19 @@ class _CacheFuncHasher:
                 # Use pickle if polars cannot hash the object for example if
                 # it contains unhashable objects.
                 return b"%s" % pickle.dumps(obj, pickle.HIGHEST_PROTOCOL)
-        elif type_util.is_type(obj, "polars.dataframe.frame.DataFrame"):
+        elif fqn_type == "polars.dataframe.frame.DataFrame":
             import polars as pl
 
             obj = cast(pl.DataFrame, obj)
             self.update(h, obj.shape)
 
-            if len(obj) >= _PANDAS_ROWS_LARGE:
-                obj = obj.sample(n=_PANDAS_SAMPLE_SIZE, seed=0)
             try:
+                if len(obj) >= _PANDAS_ROWS_LARGE:
+                    if self._exact_data_hashing:
+                        self.update(h, _arrow_table_digest(obj.to_arrow()))
+                        return h.digest()
+                    obj = obj.sample(n=_PANDAS_SAMPLE_SIZE, seed=0)
+
                 for c, t in obj.schema.items():
                     self.update(h, c.encode())
                     self.update(h, str(t).encode())
@@ -513,7 +664,7 @@ class _CacheFuncHasher:
                 # Use pickle if polars cannot hash the object for example if
                 # it contains unhashable objects.
                 return b"%s" % pickle.dumps(obj, pickle.HIGHEST_PROTOCOL)
-        elif type_util.is_type(obj, "numpy.ndarray"):
+        elif fqn_type == "numpy.ndarray":
             import numpy as np
 
             # write cast type as string to make it work with our Python 3.8 tests
@@ -522,6 +673,14 @@ class _CacheFuncHasher:
             self.update(h, obj.shape)
             self.update(h, str(obj.dtype))
 
+            if (
+                obj.size >= _NP_SIZE_LARGE
+                and self._exact_data_hashing
+                and not obj.dtype.hasobject
+            ):
+                self.update(h, _numpy_digest(obj))
+                return h.digest()
+
             if obj.size >= _NP_SIZE_LARGE:
                 import numpy as np
 
@@ -530,7 +689,7 @@ class _CacheFuncHasher:
 
             self.update(h, obj.tobytes())
             return h.digest()
-        elif type_util.is_type(obj, "PIL.Image.Image"):
+        elif fqn_type == "PIL.Image.Image":
             import numpy as np
             from PIL.Image import Image
 
@@ -549,7 +708,7 @@ class _CacheFuncHasher:
         ):
             return self.to_bytes(dict(obj))
 
-        elif type_util.is_type(obj, "builtins.getset_descriptor"):
+        elif fqn_type == "builtins.getset_descriptor":
             return bytes(obj.__qualname__.encode())
 
         elif isinstance(obj, UploadedFile):
@@ -587,7 +746,7 @@ class _CacheFuncHasher:
             self.update(h, obj.getvalue())
             return h.digest()
 
-        elif type_util.is_type(obj, "numpy.ufunc"):
+        elif fqn_type == "numpy.ufunc":
             # For numpy.remainder, this returns remainder.
             return bytes(obj.__name__.encode())
 
@@ -635,3 +794,179 @@ class NoResult:
     """Placeholder class for return values when None is meaningful."""
 
     pass
+
+
+# Exact hashing of large dataframes and arrays (global.exactDataHashing).
+#
+# Instead of hashing a sample, these hash all the underlying buffers with
+# BLAKE2, which is much faster than MD5 and releases the GIL while hashing, so
+# that columns (or chunks of large arrays) can be hashed on a thread pool.
+
+_exact_hash_executor: ThreadPoolExecutor | None = None
+_exact_hash_executor_lock = threading.Lock()
+
+# Marks the threads of _exact_hash_executor. Only one level of nested hashing
+# calls (e.g. the columns of a dataframe, but not the chunks of each column)
+# runs on the pool, since a pool thread that waited on tasks it submitted to
+# the pool could deadlock it.
+_exact_hash_thread = threading.local()
+
+# Digests of immutable Arrow arrays, keyed by id. Entries are removed when
+# their array is garbage collected, so an id is never reused for another array
+# while its entry exists.
+_arrow_digests: dict[int, tuple[weakref.ref[Any], bytes]] = {}
+
+_T = TypeVar("_T")
+
+
+def _mark_exact_hash_thread() -> None:
+    _exact_hash_thread.is_pool_thread = True
+
+
+def _map_in_parallel(func: Callable[[_T], bytes], items: Sequence[_T]) -> list[bytes]:
+    if len(items) <= 1 or getattr(_exact_hash_thread, "is_pool_thread", False):
+        return [func(item) for item in items]
+
+    global _exact_hash_executor
+    with _exact_hash_executor_lock:
+        if _exact_hash_executor is None:
+            _exact_hash_executor = ThreadPoolExecutor(
+                max_workers=_EXACT_HASH_MAX_WORKERS,
+                thread_name_prefix="ExactDataHashing",
+                initializer=_mark_exact_hash_thread,
+            )
+    return list(_exact_hash_executor.map(func, items))
+
+
+def _combine_digests(digests: Iterable[bytes], *prefix: bytes) -> bytes:
+    h = hashlib.blake2b(digest_size=16)
+    for item in (*prefix, *digests):
+        h.update(item)
+    return h.digest()
+
+
+def _buffer_digest(buffer: Any) -> bytes:
+    return hashlib.blake2b(buffer, digest_size=16).digest()
+
+
+def _numpy_digest(arr: np.ndarray[Any, Any]) -> bytes:
+    """Hash the full contents of an array that doesn't contain objects."""
+    import numpy as np
+
+    data = np.ascontiguousarray(arr).reshape(-1).view(np.uint8)
+    chunks = [
+        data[start : start + _EXACT_HASH_CHUNK_SIZE]
+        for start in range(0, len(data), _EXACT_HASH_CHUNK_SIZE)
+    ]
+    return _combine_digests(
+        _map_in_parallel(_buffer_digest, chunks),
+        str(arr.dtype).encode(),
+        str(arr.shape).encode(),
+    )
+
+
+def _arrow_digest(array: pa.Array | pa.ChunkedArray) -> bytes:
+    """Hash the full contents of an Arrow array."""
+    import pyarrow as pa
+
+    h = hashlib.blake2b(digest_size=16)
+    h.update(str(array.type).encode())
+    chunks = array.chunks if isinstance(array, pa.ChunkedArray) else [array]
+    for chunk in chunks:
+        _update_with_arrow_chunk(h, chunk)
+    return h.digest()
+
+
+def _update_with_arrow_chunk(h: Any, chunk: pa.Array) -> None:
+    import struct
+
+    import pyarrow as pa
+
+    if pa.types.is_dictionary(chunk.type):
+        # The dictionary isn't part of the chunk's buffers.
+        _update_with_arrow_chunk(h, chunk.indices)
+        _update_with_arrow_chunk(h, chunk.dictionary)
+        return
+
+    if chunk.type.num_fields > 0:
+        # The buffers of nested arrays don't include the offsets of their
+        # children, so serialize them instead. This only writes the values
+        # that are part of the chunk.
+        batch = pa.RecordBatch.from_arrays([chunk], names=[""])
+        h.update(batch.serialize())
+        return
+
+    # The buffers of a sliced array hold the values of the whole parent array,
+    # so the slice's offset and length are part of its contents.
+    h.update(struct.pack("<qq", chunk.offset, len(chunk)))
+    for buffer in chunk.buffers():
+        if buffer is None:
+            h.update(b"\x00")
+        else:
+            h.update(struct.pack("<q", buffer.size))
+            h.update(buffer)
+
+
+def _cached_arrow_digest(array: pa.ChunkedArray) -> bytes:
+    """Hash an Arrow array, reusing its digest if it was hashed before.
+
+    Arrow arrays are immutable, so an array's digest can't change while it's
+    alive.
+    """
+    key = id(array)
+    entry = _arrow_digests.get(key)
+    if entry is not None and entry[0]() is array:
+        return entry[1]
+
+    digest = _arrow_digest(array)
+    _arrow_digests[key] = (
+        weakref.ref(array, functools.partial(_drop_arrow_digest, key)),
+        digest,
+    )
+    return digest
+
+
+def _drop_arrow_digest(key: int, _: weakref.ref[Any]) -> None:
+    _arrow_digests.pop(key, None)
+
+
+def _arrow_table_digest(table: pa.Table) -> bytes:
+    return _combine_digests(
+        _map_in_parallel(_arrow_digest, table.columns),
+        str(table.schema).encode(),
+    )
+
+
+def _pandas_column_digest(column: pd.Series | pd.Index) -> bytes:
+    import numpy as np
+    import pandas as pd
+    import pyarrow as pa
+
+    dtype = column.dtype
+    if isinstance(dtype, np.dtype) and not dtype.hasobject:
+        return _numpy_digest(column.to_numpy())
+
+    # Columns backed by Arrow hold immutable arrays, whose digests are cached.
+    # NumPy-backed columns can be modified in place without any way to detect
+    # it, so they are always rehashed.
+    pa_array = getattr(column.array, "_pa_array", None)
+    if isinstance(pa_array, pa.ChunkedArray):
+        return _cached_arrow_digest(pa_array)
+
+    try:
+        return _arrow_digest(pa.array(column, from_pandas=True))
+    except (pa.ArrowException, ValueError):
+        # Arrow can't represent some columns, e.g. objects of mixed types.
+        # This raises a TypeError for unhashable values.
+        return _numpy_digest(pd.util.hash_pandas_object(column, index=False).to_numpy())
+
+
+def _pandas_series_digest(series: pd.Series) -> bytes:
+    return _combine_digests(
+        _map_in_parallel(_pandas_column_digest, [series.index, series])
+    )
+
+
+def _pandas_dataframe_digest(df: pd.DataFrame) -> bytes:
+    columns = [df.index, df.columns] + [df.iloc[:, i] for i in range(df.shape[1])]
+    return _combine_digests(_map_in_parallel(_pandas_column_digest, columns))
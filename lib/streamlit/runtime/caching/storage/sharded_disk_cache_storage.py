@@ -0,0 +1,437 @@
+# Copyright (c) Streamlit Inc. (2018-2022) Snowflake Inc. (2022-2025)
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Declares the ShardedDiskCacheStorageManager class, which is used to create
+ShardedDiskCacheStorage instances wrapped by InMemoryCacheStorageWrapper.
+
+Declares the ShardedDiskCacheStorage class, which is used to store cached
+values on disk for a single `@st.cache_data` decorated function.
+
+Compared to LocalDiskCacheStorage, which writes every entry into one flat
+folder, this storage:
+
+- Shards entries into one folder per function, and one sub-folder per
+  two-character prefix of the value key, so clearing a function's cache is a
+  single `rmtree` and no folder grows to tens of thousands of files.
+- Keeps a compact in-memory index of the size and last access time of every
+  entry, shared by all storages created by the same manager.
+- Enforces a global byte budget across all functions by evicting the least
+  recently used entries, and honors the `ttl` and `max_entries` of each
+  function.
+
+How these classes work together
+-------------------------------
+
+    ┌────────────────────────────────┐
+    │ ShardedDiskCacheStorageManager │
+    │                                │
+    │     - clear_all                │
+    │     - check_context            │
+    │     - _DiskCacheIndex          │
+    └──┬─────────────────────────────┘
+       │
+       │                ┌──────────────────────────────┐
+       │                │                              │
+       │ create(context)│  InMemoryCacheStorageWrapper │
+       └────────────────►                              │
+                        │  ┌────────────────────────┐  │
+                        │  │                        │  │
+                        │  │ ShardedDiskCacheStorage│  │
+                        │  │                        │  │
+                        │  └────────────────────────┘  │
+                        │                              │
+                        └──────────────────────────────┘
+
+Notes
+-----
+Entries served from the in-memory layer don't reach the disk storage, so their
+last access time on disk is only updated when they are (re-)read from disk.
+
+Several processes on the same host can share one cache folder: entries are
+written atomically, and entries written by another process are picked up
+(and indexed) when they are read. Each process enforces the byte budget over
+the entries it knows about.
+"""
+
+from __future__ import annotations
+
+import math
+import os
+import shutil
+import threading
+import time
+from collections import OrderedDict
+from typing import Final, NamedTuple
+
+from streamlit.file_util import get_streamlit_file_path
+from streamlit.logger import get_logger
+from streamlit.runtime.caching.storage.cache_storage_protocol import (
+    CacheStorage,
+    CacheStorageContext,
+    CacheStorageError,
+    CacheStorageKeyNotFoundError,
+    CacheStorageManager,
+)
+from streamlit.runtime.caching.storage.in_memory_cache_storage_wrapper import (
+    InMemoryCacheStorageWrapper,
+)
+
+_LOGGER: Final = get_logger(__name__)
+
+# Sub-folder of the Streamlit cache folder where sharded entries live.
+_SHARDED_CACHE_DIR_NAME: Final = "sharded"
+
+# The extension for persisted @st.cache_data objects.
+_CACHED_FILE_EXTENSION: Final = "memo"
+
+# Number of leading characters of the value key used to pick the shard folder.
+_SHARD_PREFIX_LENGTH: Final = 2
+
+
+class _IndexEntry(NamedTuple):
+    function_key: str
+    size: int
+    # Time the entry was written, used for TTL expiration.
+    created_at: float
+
+
+class _DiskCacheIndex:
+    """Tracks size and recency of every entry on disk, across all functions.
+
+    Entries are kept in an OrderedDict in least-recently-used-first order, so
+    finding eviction candidates is cheap. The index is built lazily by scanning
+    the cache folder once, the first time it's accessed.
+
+    This class is not thread-safe: callers must hold the manager's lock.
+    """
+
+    def __init__(self, cache_dir: str, max_size_bytes: int | None):
+        self._cache_dir = cache_dir
+        self._max_size_bytes = max_size_bytes
+        self._entries: OrderedDict[str, _IndexEntry] = OrderedDict()
+        # The paths of each function's entries, least recently used first.
+        self._function_entries: dict[str, OrderedDict[str, None]] = {}
+        self._total_size = 0
+        self._loaded = False
+
+    @property
+    def total_size(self) -> int:
+        self._ensure_loaded()
+        return self._total_size
+
+    def get(self, path: str) -> _IndexEntry | None:
+        self._ensure_loaded()
+        return self._entries.get(path)
+
+    def touch(self, path: str) -> None:
+        """Mark an entry as most recently used."""
+        entry = self.get(path)
+        if entry is not None:
+            self._entries.move_to_end(path)
+            self._function_entries[entry.function_key].move_to_end(path)
+
+    def add(
+        self,
+        path: str,
+        function_key: str,
+        size: int,
+        created_at: float | None = None,
+    ) -> None:
+        self._ensure_loaded()
+        self.remove(path)
+        self._add(
+            path,
+            _IndexEntry(
+                function_key,
+                size,
+                created_at if created_at is not None else time.time(),
+            ),
+        )
+
+    def remove(self, path: str) -> None:
+        entry = self._entries.pop(path, None)
+        if entry is not None:
+            self._total_size -= entry.size
+            function_entries = self._function_entries[entry.function_key]
+            del function_entries[path]
+            if not function_entries:
+                del self._function_entries[entry.function_key]
+
+    def remove_function(self, function_key: str) -> None:
+        for path in self.function_entries(function_key):
+            self.remove(path)
+
+    def clear(self) -> None:
+        self._entries.clear()
+        self._function_entries.clear()
+        self._total_size = 0
+
+    def function_entries(self, function_key: str) -> list[str]:
+        """Return the paths of a function's entries, least recently used first."""
+        self._ensure_loaded()
+        return list(self._function_entries.get(function_key, ()))
+
+    def paths_over_budget(self) -> list[str]:
+        """Return the least recently used paths that have to be evicted to
+        bring the total size within the byte budget.
+        """
+        self._ensure_loaded()
+        if self._max_size_bytes is None:
+            return []
+
+        excess = self._total_size - self._max_size_bytes
+        paths = []
+        for path, entry in self._entries.items():
+            if excess <= 0:
+                break
+            paths.append(path)
+            excess -= entry.size
+        return paths
+
+    def _add(self, path: str, entry: _IndexEntry) -> None:
+        self._entries[path] = entry
+        function_entries = self._function_entries.setdefault(
+            entry.function_key, OrderedDict()
+        )
+        function_entries[path] = None
+        self._total_size += entry.size
+
+    def _ensure_loaded(self) -> None:
+        if self._loaded:
+            return
+        self._loaded = True
+
+        found: list[tuple[float, str, _IndexEntry]] = []
+        for function_dir in _scandir_dirs(self._cache_dir):
+            for shard_dir in _scandir_dirs(function_dir.path):
+                with os.scandir(shard_dir.path) as it:
+                    for file in it:
+                        if not file.name.endswith(f".{_CACHED_FILE_EXTENSION}"):
+                            continue
+                        try:
+                            stat = file.stat()
+                        except FileNotFoundError:
+                            continue
+                        found.append(
+                            (
+                                stat.st_atime,
+                                file.path,
+                                _IndexEntry(
+                                    function_dir.name, stat.st_size, stat.st_mtime
+                                ),
+                            )
+                        )
+
+        for _, path, entry in sorted(found, key=lambda item: item[0]):
+            self._add(path, entry)
+
+
+class ShardedDiskCacheStorageManager(CacheStorageManager):
+    """Creates sharded, size-bounded disk storages for `@st.cache_data`.
+
+    Parameters
+    ----------
+    max_size_bytes : int or None
+        The maximum total size of all entries on disk. When a write exceeds it,
+        the least recently used entries of any function are removed. If None,
+        the size is not limited.
+
+    cache_dir : str or None
+        The folder to store entries in. Defaults to a sub-folder of the
+        Streamlit cache folder.
+    """
+
+    def __init__(self, max_size_bytes: int | None = None, cache_dir: str | None = None):
+        self._cache_dir = cache_dir or get_streamlit_file_path(
+            "cache", _SHARDED_CACHE_DIR_NAME
+        )
+        self._lock = threading.Lock()
+        self._index = _DiskCacheIndex(self._cache_dir, max_size_bytes)
+
+    @property
+    def cache_dir(self) -> str:
+        return self._cache_dir
+
+    def create(self, context: CacheStorageContext) -> CacheStorage:
+        """Creates a new cache storage instance wrapped with in-memory cache layer"""
+        persist_storage = ShardedDiskCacheStorage(context, self)
+        return InMemoryCacheStorageWrapper(
+            persist_storage=persist_storage, context=context
+        )
+
+    def clear_all(self) -> None:
+        with self._lock:
+            if os.path.isdir(self._cache_dir):
+                shutil.rmtree(self._cache_dir)
+            self._index.clear()
+
+    def check_context(self, context: CacheStorageContext) -> None:
+        # Unlike LocalDiskCacheStorage, TTL is supported for persisted entries.
+        pass
+
+
+class ShardedDiskCacheStorage(CacheStorage):
+    """Cache storage that persists data to a sharded folder on disk, with
+    TTL, max_entries, and a global byte budget enforced by its manager.
+    """
+
+    def __init__(
+        self, context: CacheStorageContext, manager: ShardedDiskCacheStorageManager
+    ):
+        self.function_key = context.function_key
+        self.persist = context.persist
+        self._ttl_seconds = context.ttl_seconds
+        self._max_entries = context.max_entries
+        self._manager = manager
+        self._function_dir = os.path.join(manager.cache_dir, self.function_key)
+
+    @property
+    def ttl_seconds(self) -> float:
+        return self._ttl_seconds if self._ttl_seconds is not None else math.inf
+
+    @property
+    def max_entries(self) -> float:
+        return float(self._max_entries) if self._max_entries is not None else math.inf
+
+    def get(self, key: str) -> bytes:
+        """
+        Returns the stored value for the key if persisted and not expired,
+        raise CacheStorageKeyNotFoundError if not found, or not configured
+        with persist="disk"
+        """
+        if self.persist != "disk":
+            raise CacheStorageKeyNotFoundError(
+                f"Sharded disk cache storage is disabled (persist={self.persist})"
+            )
+
+        path = self._get_cache_file_path(key)
+        with self._manager._lock:
+            entry = self._manager._index.get(path)
+            if entry is not None and self._is_expired(entry):
+                self._remove_file(path)
+                raise CacheStorageKeyNotFoundError("Key expired in disk cache")
+
+        try:
+            with open(path, "rb") as input:
+                value = input.read()
+                created_at = os.fstat(input.fileno()).st_mtime
+        except FileNotFoundError:
+            with self._manager._lock:
+                self._manager._index.remove(path)
+            raise CacheStorageKeyNotFoundError("Key not found in disk cache")
+        except OSError as ex:
+            _LOGGER.exception("Error reading from cache")
+            raise CacheStorageError("Unable to read from cache") from ex
+
+        _LOGGER.debug("Disk cache HIT: %s", key)
+        with self._manager._lock:
+            index = self._manager._index
+            if index.get(path) is None:
+                # The entry was written by another process.
+                if time.time() - created_at > self.ttl_seconds:
+                    self._remove_file(path)
+                    raise CacheStorageKeyNotFoundError("Key expired in disk cache")
+                index.add(path, self.function_key, len(value), created_at)
+            else:
+                index.touch(path)
+        return value
+
+    def set(self, key: str, value: bytes) -> None:
+        """Sets the value for a given key, evicting other entries if needed"""
+        if self.persist != "disk":
+            return
+
+        path = self._get_cache_file_path(key)
+        # Write to a temporary file first, so that readers (in this or in
+        # another process sharing the cache folder) never see a partially
+        # written entry.
+        tmp_path = f"{path}.{os.getpid()}-{threading.get_ident()}.tmp"
+        try:
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            with open(tmp_path, "wb") as output:
+                output.write(value)
+            os.replace(tmp_path, path)
+        except OSError as ex:
+            _LOGGER.debug("Unable to write to cache", exc_info=ex)
+            try:
+                os.remove(tmp_path)
+            except OSError:
+                # If we can't remove the file, it's not a big deal.
+                pass
+            raise CacheStorageError("Unable to write to cache") from ex
+
+        with self._manager._lock:
+            index = self._manager._index
+            index.add(path, self.function_key, len(value))
+
+            evicted = index.paths_over_budget()
+            if self._max_entries is not None:
+                function_entries = index.function_entries(self.function_key)
+                excess = len(function_entries) - self._max_entries
+                evicted.extend(function_entries[: max(excess, 0)])
+
+            for evicted_path in evicted:
+                self._remove_file(evicted_path)
+
+    def delete(self, key: str) -> None:
+        """Delete a cache file from disk. If the file does not exist on disk,
+        return silently. If another exception occurs, log it. Does not throw.
+        """
+        if self.persist == "disk":
+            with self._manager._lock:
+                self._remove_file(self._get_cache_file_path(key))
+
+    def clear(self) -> None:
+        """Delete all keys for the current storage"""
+        with self._manager._lock:
+            if os.path.isdir(self._function_dir):
+                shutil.rmtree(self._function_dir, ignore_errors=True)
+            self._manager._index.remove_function(self.function_key)
+
+    def close(self) -> None:
+        """Dummy implementation of close, we don't need to actually "close" anything"""
+
+    def _is_expired(self, entry: _IndexEntry) -> bool:
+        return time.time() - entry.created_at > self.ttl_seconds
+
+    def _remove_file(self, path: str) -> None:
+        """Remove an entry's file and its index entry. The caller must hold
+        the manager's lock.
+        """
+        self._manager._index.remove(path)
+        try:
+            os.remove(path)
+        except FileNotFoundError:
+            # The file is already removed.
+            pass
+        except Exception as ex:
+            _LOGGER.exception(
+                "Unable to remove a file from the disk cache", exc_info=ex
+            )
+
+    def _get_cache_file_path(self, value_key: str) -> str:
+        """Return the path of the disk cache file for the given value."""
+        return os.path.join(
+            self._function_dir,
+            value_key[:_SHARD_PREFIX_LENGTH],
+            f"{value_key}.{_CACHED_FILE_EXTENSION}",
+        )
+
+
+def _scandir_dirs(path: str) -> list[os.DirEntry[str]]:
+    try:
+        with os.scandir(path) as it:
+            return [entry for entry in it if entry.is_dir()]
+    except FileNotFoundError:
+        return []
@@ -0,0 +1,199 @@
+# Copyright (c) Streamlit Inc. (2018-2022) Snowflake Inc. (2022-2025)
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""MediaFileStorage implementation that keeps large files on disk."""
+
+from __future__ import annotations
+
+import contextlib
+import os
+import tempfile
+from typing import TYPE_CHECKING, Final, NamedTuple
+
+from streamlit.logger import get_logger
+from streamlit.runtime.media_file_storage import MediaFileKind, MediaFileStorageError
+from streamlit.runtime.memory_media_file_storage import (
+    CONTENT_CHUNK_SIZE,
+    MemoryMediaFileStorage,
+    StoredMediaFile,
+    _calculate_file_id,
+)
+
+if TYPE_CHECKING:
+    from collections.abc import Iterator
+
+_LOGGER: Final = get_logger(__name__)
+
+
+class DiskFile(NamedTuple):
+    """A MediaFile whose content is read from disk when it's served."""
+
+    path: str
+    mimetype: str
+    kind: MediaFileKind
+    filename: str | None
+    content_size: int
+    modified_time: float
+    # True if the file was written by the storage, which must delete it.
+    is_spilled: bool
+
+    def iter_content(self, start: int, end: int) -> Iterator[bytes]:
+        """Yield the content between the `start` and `end` offsets in
+        chunks, so that only a chunk at a time is held in memory."""
+        with open(self.path, "rb") as f:
+            f.seek(start)
+            remaining = end - start
+            while remaining > 0:
+                chunk = f.read(min(remaining, CONTENT_CHUNK_SIZE))
+                if not chunk:
+                    return
+                remaining -= len(chunk)
+                yield chunk
+
+
+class DiskMediaFileStorage(MemoryMediaFileStorage):
+    """A MemoryMediaFileStorage that doesn't hold large files in memory.
+
+    Files loaded from a path that are at least `disk_threshold_bytes` large
+    are served straight from that path. Raw data of at least that size is
+    written to a temporary directory. Smaller files are kept in memory.
+    """
+
+    def __init__(self, media_endpoint: str, disk_threshold_bytes: int):
+        """Create a new DiskMediaFileStorage instance
+
+        Parameters
+        ----------
+        media_endpoint
+            The name of the local endpoint that media is served from.
+            This endpoint should start with a forward-slash (e.g. "/media").
+        disk_threshold_bytes
+            The size from which files are kept on disk.
+        """
+        super().__init__(media_endpoint)
+        self._disk_threshold_bytes = disk_threshold_bytes
+        self._disk_files_by_id: dict[str, DiskFile] = {}
+        # Created when the first file is written to disk.
+        self._spill_dir: tempfile.TemporaryDirectory[str] | None = None
+
+    def load_and_get_id(
+        self,
+        path_or_data: str | bytes,
+        mimetype: str,
+        kind: MediaFileKind,
+        filename: str | None = None,
+    ) -> str:
+        """Add a file to the manager and return its ID."""
+        if isinstance(path_or_data, str):
+            try:
+                stat = os.stat(path_or_data)
+            except OSError as ex:
+                raise MediaFileStorageError(f"Error opening '{path_or_data}'") from ex
+            if stat.st_size < self._disk_threshold_bytes:
+                return super().load_and_get_id(path_or_data, mimetype, kind, filename)
+
+            # Hashing a large file would mean reading all of it, so the ID of
+            # a file on disk is based on its path, size and modification time.
+            path = os.path.abspath(path_or_data)
+            file_id = _calculate_file_id(
+                f"{path}:{stat.st_size}:{stat.st_mtime_ns}".encode(),
+                mimetype,
+                filename,
+            )
+            if file_id not in self._disk_files_by_id:
+                _LOGGER.debug("Adding media file %s from %s", file_id, path)
+                self._disk_files_by_id[file_id] = DiskFile(
+                    path=path,
+                    mimetype=mimetype,
+                    kind=kind,
+                    filename=filename,
+                    content_size=stat.st_size,
+                    modified_time=stat.st_mtime,
+                    is_spilled=False,
+                )
+            return file_id
+
+        if len(path_or_data) < self._disk_threshold_bytes:
+            return super().load_and_get_id(path_or_data, mimetype, kind, filename)
+
+        file_id = _calculate_file_id(path_or_data, mimetype, filename)
+        if file_id not in self._disk_files_by_id:
+            _LOGGER.debug("Writing media file %s to disk", file_id)
+            self._disk_files_by_id[file_id] = self._spill(
+                file_id, path_or_data, mimetype, kind, filename
+            )
+        return file_id
+
+    def get_file(self, filename: str) -> StoredMediaFile:
+        """Return the MemoryFile or DiskFile with the given filename. Filenames
+        are of the form "file_id.extension".
+
+        Raises a MediaFileStorageError if no such file exists.
+        """
+        file_id = os.path.splitext(filename)[0]
+        disk_file = self._disk_files_by_id.get(file_id)
+        if disk_file is not None:
+            return disk_file
+        return super().get_file(filename)
+
+    def _has_file(self, file_id: str) -> bool:
+        return file_id in self._disk_files_by_id or super()._has_file(file_id)
+
+    def delete_file(self, file_id: str) -> None:
+        """Delete the file with the given ID."""
+        disk_file = self._disk_files_by_id.pop(file_id, None)
+        if disk_file is None:
+            super().delete_file(file_id)
+            return
+
+        self._delete_image_variants(file_id)
+        if disk_file.is_spilled:
+            with contextlib.suppress(FileNotFoundError):
+                os.remove(disk_file.path)
+
+    def _spill(
+        self,
+        file_id: str,
+        data: bytes,
+        mimetype: str,
+        kind: MediaFileKind,
+        filename: str | None,
+    ) -> DiskFile:
+        """Write data to the spill directory. Raise MediaFileStorageError if we
+        can't."""
+        if self._spill_dir is None:
+            self._spill_dir = tempfile.TemporaryDirectory(prefix="streamlit-media-")
+        path = os.path.join(self._spill_dir.name, file_id)
+
+        try:
+            # Files are written under a temporary name first, so that a file
+            # that's being served is never partially written.
+            fd, tmp_path = tempfile.mkstemp(dir=self._spill_dir.name)
+            with os.fdopen(fd, "wb") as f:
+                f.write(data)
+            os.replace(tmp_path, path)
+        except OSError as ex:
+            raise MediaFileStorageError(
+                f"Error writing media file '{file_id}' to disk"
+            ) from ex
+
+        return DiskFile(
+            path=path,
+            mimetype=mimetype,
+            kind=kind,
+            filename=filename,
+            content_size=len(data),
+            modified_time=os.path.getmtime(path),
+            is_spilled=True,
+        )
@@ -14,13 +14,23 @@
 
 from __future__ import annotations
 
+import contextlib
+import hashlib
+import os
+import tempfile
 from typing import TYPE_CHECKING, Final
 from weakref import WeakKeyDictionary
 
 from streamlit import config, util
 from streamlit.logger import get_logger
 from streamlit.proto.ForwardMsg_pb2 import ForwardMsg
-from streamlit.runtime.stats import CacheStat, CacheStatsProvider, group_stats
+from streamlit.runtime.stats import (
+    CacheEventStat,
+    CacheEventStatsProvider,
+    CacheStat,
+    CacheStatsProvider,
+    group_stats,
+)
 
 if TYPE_CHECKING:
     from collections.abc import MutableMapping
@@ -29,8 +39,58 @@ if TYPE_CHECKING:
 
 _LOGGER: Final = get_logger(__name__)
 
+_WIRETYPE_LENGTH_DELIMITED: Final = 2
 
-def populate_hash_if_needed(msg: ForwardMsg) -> str:
+
+def _encode_varint(value: int) -> bytes:
+    """Encode a non-negative int as a protobuf varint."""
+    encoded = bytearray()
+    while value > 0x7F:
+        encoded.append((value & 0x7F) | 0x80)
+        value >>= 7
+    encoded.append(value)
+    return bytes(encoded)
+
+
+def serialize_payload(msg: ForwardMsg) -> bytes:
+    """Serialize all fields of a ForwardMsg except its hash and metadata.
+
+    The result is the part of the message that's identical each time the
+    message is sent, so it can be hashed and reused. Prefixing it with the
+    serialized hash and metadata gives a valid serialization of the whole
+    message, since protobuf fields may be serialized in any order.
+    """
+    serialized_fields: list[bytes] = []
+    for field, value in msg.ListFields():
+        if field.name in ("hash", "metadata"):
+            continue
+        if field.message_type is not None:
+            # Serializing the submessage directly avoids copying or clearing
+            # the message's metadata.
+            serialized_value = value.SerializeToString()
+            serialized_fields.append(
+                _encode_varint((field.number << 3) | _WIRETYPE_LENGTH_DELIMITED)
+            )
+            serialized_fields.append(_encode_varint(len(serialized_value)))
+            serialized_fields.append(serialized_value)
+        else:
+            scalar_msg = ForwardMsg()
+            setattr(scalar_msg, field.name, value)
+            serialized_fields.append(scalar_msg.SerializeToString())
+    return b"".join(serialized_fields)
+
+
+def _serialize_header(msg: ForwardMsg) -> bytes:
+    """Serialize the hash and metadata of a ForwardMsg."""
+    header = ForwardMsg(hash=msg.hash)
+    if msg.HasField("metadata"):
+        header.metadata.CopyFrom(msg.metadata)
+    return header.SerializeToString()
+
+
+def populate_hash_if_needed(
+    msg: ForwardMsg, serialized_payload: bytes | None = None
+) -> str:
     """Computes and assigns the unique hash for a ForwardMsg.
 
     If the ForwardMsg already has a hash, this is a no-op.
@@ -38,6 +98,9 @@ def populate_hash_if_needed(msg: ForwardMsg) -> str:
     Parameters
     ----------
     msg : ForwardMsg
+    serialized_payload : bytes or None
+        The message's payload as returned by `serialize_payload`, if the
+        caller already has it.
 
     Returns
     -------
@@ -48,16 +111,14 @@ def populate_hash_if_needed(msg: ForwardMsg) -> str:
 
     """
     if msg.hash == "":
-        # Move the message's metadata aside. It's not part of the
-        # hash calculation.
-        metadata = msg.metadata
-        msg.ClearField("metadata")
+        if serialized_payload is None:
+            serialized_payload = serialize_payload(msg)
 
-        # MD5 is good enough for what we need, which is uniqueness.
-        msg.hash = util.calc_md5(msg.SerializeToString())
-
-        # Restore metadata.
-        msg.metadata.CopyFrom(metadata)
+        # The hash only needs to be unique, and SHA-1 is faster than MD5 on
+        # most CPUs. The message's metadata is not part of the calculation.
+        msg.hash = hashlib.new(
+            "sha1", serialized_payload, usedforsecurity=False
+        ).hexdigest()
 
     return msg.hash
 
@@ -86,7 +147,7 @@ def create_reference_msg(msg: ForwardMsg) -> ForwardMsg:
     return ref_msg
 
 
-class ForwardMsgCache(CacheStatsProvider):
+class ForwardMsgCache(CacheStatsProvider, CacheEventStatsProvider):
     """A cache of ForwardMsgs.
 
     Large ForwardMsgs (e.g. those containing big DataFrame payloads) are
@@ -94,6 +155,12 @@ class ForwardMsgCache(CacheStatsProvider):
     rather than the message itself, to a client. Clients can then
     request messages from this cache via another endpoint.
 
+    Messages expire once no session has referenced them recently (see
+    `global.maxCachedMessageAge`). The memory they take up across all sessions
+    can also be bounded with `global.maxCachedMessagesSize`, in which case the
+    least recently used messages are dropped, or spilled to disk if
+    `global.spillCachedMessagesToDisk` is set.
+
     This cache is *not* thread safe. It's intended to only be accessed by
     the server thread.
 
@@ -102,17 +169,94 @@ class ForwardMsgCache(CacheStatsProvider):
     class Entry:
         """Cache entry.
 
-        Stores the cached message, and the set of AppSessions
-        that we've sent the cached message to.
+        Stores the cached message in serialized form, and the set of
+        AppSessions that we've sent the cached message to.
 
         """
 
-        def __init__(self, msg: ForwardMsg | None):
-            self.msg = msg
+        def __init__(
+            self, msg: ForwardMsg | None, serialized_payload: bytes | None = None
+        ):
+            # Only the serialized message is kept, so that a large message
+            # doesn't take up memory twice.
+            self.serialized_payload: bytes | None = None
+            self._serialized_header = b""
+            # The file holding the payload, once it has been spilled to disk.
+            self._spill_path: str | None = None
+            if msg is not None:
+                if serialized_payload is None:
+                    serialized_payload = serialize_payload(msg)
+                self.serialized_payload = serialized_payload
+                self._serialized_header = _serialize_header(msg)
+
             self._session_script_run_counts: MutableMapping[AppSession, int] = (
                 WeakKeyDictionary()
             )
 
+        @property
+        def byte_size(self) -> int:
+            """The memory taken by the serialized cached message."""
+            if self.serialized_payload is None:
+                return 0
+            return len(self._serialized_header) + len(self.serialized_payload)
+
+        @property
+        def is_spilled(self) -> bool:
+            return self._spill_path is not None
+
+        def spill(self, path: str) -> None:
+            """Move the payload out of memory, into a file at the given path."""
+            if self.serialized_payload is None:
+                return
+            with open(path, "wb") as f:
+                f.write(self.serialized_payload)
+            self._spill_path = path
+            self.serialized_payload = None
+
+        def unspill(self, serialized_payload: bytes) -> None:
+            """Move the payload back into memory."""
+            self.remove_spill_file()
+            self.serialized_payload = serialized_payload
+
+        def remove_spill_file(self) -> None:
+            if self._spill_path is not None:
+                with contextlib.suppress(FileNotFoundError):
+                    os.remove(self._spill_path)
+                self._spill_path = None
+
+        @property
+        def msg(self) -> ForwardMsg | None:
+            """The cached message, decoded from its serialized form."""
+            serialized_msg = self.serialize()
+            if serialized_msg is None:
+                return None
+            return ForwardMsg.FromString(serialized_msg)
+
+        def serialize(self, msg: ForwardMsg | None = None) -> bytes | None:
+            """Return the serialized cached message, or None if it isn't
+            stored.
+
+            Parameters
+            ----------
+            msg : ForwardMsg or None
+                A message with the same hash, whose metadata is serialized in
+                place of the cached message's metadata.
+
+            """
+            serialized_payload = self.serialized_payload
+            if serialized_payload is None:
+                if self._spill_path is None:
+                    return None
+                try:
+                    with open(self._spill_path, "rb") as f:
+                        serialized_payload = f.read()
+                except OSError:
+                    _LOGGER.exception("Unable to read spilled cached message")
+                    return None
+
+            header = self._serialized_header if msg is None else _serialize_header(msg)
+            return header + serialized_payload
+
         def __repr__(self) -> str:
             return util.repr_(self)
 
@@ -161,13 +305,25 @@ class ForwardMsgCache(CacheStatsProvider):
             return len(self._session_script_run_counts) > 0
 
     def __init__(self):
+        # Entries are ordered from least to most recently used.
         self._entries: dict[str, ForwardMsgCache.Entry] = {}
+        # The total size of the messages held in memory.
+        self._memory_size = 0
+        # Created when the first message is spilled to disk.
+        self._spill_dir: tempfile.TemporaryDirectory[str] | None = None
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
 
     def __repr__(self) -> str:
         return util.repr_(self)
 
     def add_message(
-        self, msg: ForwardMsg, session: AppSession, script_run_count: int
+        self,
+        msg: ForwardMsg,
+        session: AppSession,
+        script_run_count: int,
+        serialized_payload: bytes | None = None,
     ) -> None:
         """Add a ForwardMsg to the cache.
 
@@ -181,17 +337,30 @@ class ForwardMsgCache(CacheStatsProvider):
         session : AppSession
         script_run_count : int
             The number of times the session's script has run
+        serialized_payload : bytes or None
+            The message's payload as returned by `serialize_payload`, if the
+            caller already has it.
 
         """
-        populate_hash_if_needed(msg)
-        entry = self._entries.get(msg.hash, None)
+        populate_hash_if_needed(msg, serialized_payload)
+        entry = self._entries.pop(msg.hash, None)
         if entry is None:
             if config.get_option("global.storeCachedForwardMessagesInMemory"):
-                entry = ForwardMsgCache.Entry(msg)
+                if serialized_payload is None:
+                    serialized_payload = serialize_payload(msg)
+                entry = ForwardMsgCache.Entry(msg, serialized_payload)
             else:
                 entry = ForwardMsgCache.Entry(None)
-            self._entries[msg.hash] = entry
+            self._memory_size += entry.byte_size
+        elif entry.is_spilled and serialized_payload is not None:
+            # The message is in use again, and we already have its payload.
+            entry.unspill(serialized_payload)
+            self._memory_size += entry.byte_size
+
+        # Re-inserting the entry marks it as the most recently used.
+        self._entries[msg.hash] = entry
         entry.add_session_ref(session, script_run_count)
+        self._enforce_memory_budget()
 
     def get_message(self, hash: str) -> ForwardMsg | None:
         """Return the message with the given ID if it exists in the cache.
@@ -209,6 +378,34 @@ class ForwardMsgCache(CacheStatsProvider):
         entry = self._entries.get(hash, None)
         return entry.msg if entry else None
 
+    def get_serialized_message(
+        self, hash: str, msg: ForwardMsg | None = None
+    ) -> bytes | None:
+        """Return the serialized message with the given hash, or None if it
+        isn't cached in memory.
+
+        This reuses the payload serialized when the message was cached, so
+        that a large message isn't serialized again each time it's sent.
+
+        Parameters
+        ----------
+        hash : str
+            The id of the message to serialize.
+        msg : ForwardMsg or None
+            A message with the given hash, whose metadata is serialized in
+            place of the cached message's metadata.
+
+        Returns
+        -------
+        bytes | None
+
+        """
+        entry = self._entries.pop(hash, None)
+        if entry is None:
+            return None
+        self._entries[hash] = entry
+        return entry.serialize(msg)
+
     def has_message_reference(
         self, msg: ForwardMsg, session: AppSession, script_run_count: int
     ) -> bool:
@@ -217,11 +414,17 @@ class ForwardMsgCache(CacheStatsProvider):
 
         entry = self._entries.get(msg.hash, None)
         if entry is None or not entry.has_session_ref(session):
+            self._misses += 1
             return False
 
         # Ensure we're not expired
         age = entry.get_session_ref_age(session, script_run_count)
-        return age <= int(config.get_option("global.maxCachedMessageAge"))
+        if age > int(config.get_option("global.maxCachedMessageAge")):
+            self._misses += 1
+            return False
+
+        self._hits += 1
+        return True
 
     def remove_refs_for_session(self, session: AppSession) -> None:
         """Remove refs for all entries for the given session.
@@ -242,7 +445,7 @@ class ForwardMsgCache(CacheStatsProvider):
             if not entry.has_refs():
                 # The entry has no more references. Remove it from
                 # the cache completely.
-                del self._entries[msg_hash]
+                self._remove_entry(msg_hash)
 
     def remove_expired_entries_for_session(
         self, session: AppSession, script_run_count: int
@@ -278,19 +481,88 @@ class ForwardMsgCache(CacheStatsProvider):
                 if not entry.has_refs():
                     # The entry has no more references. Remove it from
                     # the cache completely.
-                    del self._entries[msg_hash]
+                    self._remove_entry(msg_hash)
 
     def clear(self) -> None:
         """Remove all entries from the cache"""
+        for entry in self._entries.values():
+            entry.remove_spill_file()
         self._entries.clear()
+        self._memory_size = 0
+
+    def _remove_entry(self, msg_hash: str) -> None:
+        entry = self._entries.pop(msg_hash)
+        self._memory_size -= entry.byte_size
+        entry.remove_spill_file()
+
+    def _enforce_memory_budget(self) -> None:
+        """Evict the least recently used messages from memory until the
+        messages held in memory fit into `global.maxCachedMessagesSize`.
+
+        Evicted messages are spilled to disk if
+        `global.spillCachedMessagesToDisk` is set, and dropped otherwise. The
+        most recently used message is never evicted.
+        """
+        max_size_mb = config.get_option("global.maxCachedMessagesSize")
+        if max_size_mb <= 0:
+            return
+        max_size_bytes = max_size_mb * 1024 * 1024
+        if self._memory_size <= max_size_bytes:
+            return
+
+        spill = config.get_option("global.spillCachedMessagesToDisk")
+        # Don't consider the most recently used entry.
+        for msg_hash in list(self._entries)[:-1]:
+            if self._memory_size <= max_size_bytes:
+                break
+
+            entry = self._entries[msg_hash]
+            if entry.byte_size == 0:
+                continue
+
+            self._evictions += 1
+            if spill:
+                byte_size = entry.byte_size
+                try:
+                    entry.spill(os.path.join(self._get_spill_dir(), msg_hash))
+                except OSError:
+                    _LOGGER.exception("Unable to spill cached message to disk")
+                else:
+                    self._memory_size -= byte_size
+                    continue
+
+            _LOGGER.debug("Evicting cached message (hash=%s)", msg_hash)
+            self._remove_entry(msg_hash)
+
+    def _get_spill_dir(self) -> str:
+        if self._spill_dir is None:
+            self._spill_dir = tempfile.TemporaryDirectory(
+                prefix="streamlit-forward-msg-cache-"
+            )
+        return self._spill_dir.name
 
     def get_stats(self) -> list[CacheStat]:
         stats: list[CacheStat] = [
             CacheStat(
                 category_name="ForwardMessageCache",
                 cache_name="",
-                byte_length=entry.msg.ByteSize() if entry.msg is not None else 0,
+                byte_length=entry.byte_size,
             )
             for _, entry in self._entries.items()
         ]
         return group_stats(stats)
+
+    def get_cache_event_stats(self) -> list[CacheEventStat]:
+        return [
+            CacheEventStat(
+                category_name="ForwardMessageCache",
+                cache_name="",
+                event=event,
+                event_count=count,
+            )
+            for event, count in (
+                ("hit", self._hits),
+                ("miss", self._misses),
+                ("eviction", self._evictions),
+            )
+        ]
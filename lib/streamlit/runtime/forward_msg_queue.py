@@ -14,6 +14,7 @@
 
 from __future__ import annotations
 
+import copy
 from typing import TYPE_CHECKING, Any, Callable
 
 from streamlit.proto.ForwardMsg_pb2 import ForwardMsg
@@ -206,9 +207,51 @@ def _maybe_compose_deltas(old_delta: Delta, new_delta: Delta) -> Delta | None:
     if new_delta_type == "add_block":
         return new_delta
 
+    if new_delta_type == "append_text":
+        return _maybe_compose_append_text(old_delta, new_delta)
+
     return None
 
 
+def _maybe_compose_append_text(old_delta: Delta, new_delta: Delta) -> Delta | None:
+    """Combines an append_text delta onto a markdown element or onto another
+    append_text delta that's still in the queue.
+
+    Returns None if the append can't be applied to old_delta, in which case
+    new_delta is sent as-is and applied by the frontend.
+    """
+    append = new_delta.append_text
+    old_delta_type = old_delta.WhichOneof("type")
+
+    if old_delta_type == "new_element":
+        if old_delta.new_element.WhichOneof("type") != "markdown":
+            return None
+        composed_delta = copy.deepcopy(old_delta)
+        markdown = composed_delta.new_element.markdown
+        markdown.body = _strip_suffix(markdown.body, append.strip_suffix) + append.text
+        return composed_delta
+
+    if old_delta_type == "append_text":
+        old_text = old_delta.append_text.text
+        if not old_text.endswith(append.strip_suffix):
+            # The frontend has to strip the suffix from text that isn't part
+            # of this queue, so we can't compose.
+            return None
+        composed_delta = copy.deepcopy(old_delta)
+        composed_delta.append_text.text = (
+            _strip_suffix(old_text, append.strip_suffix) + append.text
+        )
+        return composed_delta
+
+    return None
+
+
+def _strip_suffix(text: str, suffix: str) -> str:
+    if suffix and text.endswith(suffix):
+        return text[: -len(suffix)]
+    return text
+
+
 def _update_script_finished_message(
     msg: ForwardMsg, is_fragment_run: bool
 ) -> ForwardMsg:
@@ -0,0 +1,126 @@
+# Copyright (c) Streamlit Inc. (2018-2022) Snowflake Inc. (2022-2025)
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from __future__ import annotations
+
+import threading
+from collections import OrderedDict
+from typing import TYPE_CHECKING, Final, NamedTuple
+
+from streamlit import config
+from streamlit.runtime.stats import (
+    CacheEventStat,
+    CacheEventStatsProvider,
+    CacheStat,
+    CacheStatsProvider,
+)
+
+if TYPE_CHECKING:
+    from collections.abc import Hashable
+
+_CATEGORY_NAME: Final = "st_image_transcode_cache"
+
+
+class TranscodedImage(NamedTuple):
+    """An image encoded in a format browsers can show."""
+
+    data: bytes
+    mimetype: str
+
+
+class ImageTranscodeCache(CacheStatsProvider, CacheEventStatsProvider):
+    """Holds recently transcoded images, so that images that are shown again
+    with the same parameters don't need to be encoded again.
+
+    Entries are evicted in least-recently-used order once their total size
+    exceeds `global.maxCachedImagesSize`. ImageTranscodeCache is
+    thread-safe.
+    """
+
+    def __init__(self):
+        self._entries: OrderedDict[Hashable, TranscodedImage] = OrderedDict()
+        self._byte_length = 0
+        self._lock = threading.Lock()
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+
+    @property
+    def enabled(self) -> bool:
+        """False if the cache's size is set to 0. Callers can then skip
+        computing keys."""
+        return self._max_byte_length() > 0
+
+    def get(self, key: Hashable) -> TranscodedImage | None:
+        """Return the image with the given key, or None if it's not cached."""
+        with self._lock:
+            image = self._entries.get(key)
+            if image is None:
+                self._misses += 1
+                return None
+            self._hits += 1
+            self._entries.move_to_end(key)
+            return image
+
+    def put(self, key: Hashable, image: TranscodedImage) -> None:
+        """Add an image to the cache, and evict the least recently used
+        images if the cache is full."""
+        max_byte_length = self._max_byte_length()
+        with self._lock:
+            old_image = self._entries.pop(key, None)
+            if old_image is not None:
+                self._byte_length -= len(old_image.data)
+
+            if len(image.data) > max_byte_length:
+                return
+
+            self._entries[key] = image
+            self._byte_length += len(image.data)
+            while self._byte_length > max_byte_length:
+                _, evicted_image = self._entries.popitem(last=False)
+                self._byte_length -= len(evicted_image.data)
+                self._evictions += 1
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self._byte_length = 0
+
+    def get_stats(self) -> list[CacheStat]:
+        with self._lock:
+            if not self._entries:
+                return []
+            return [CacheStat(_CATEGORY_NAME, "", self._byte_length)]
+
+    def get_cache_event_stats(self) -> list[CacheEventStat]:
+        with self._lock:
+            return [
+                CacheEventStat(_CATEGORY_NAME, "", event, count)
+                for event, count in (
+                    ("hit", self._hits),
+                    ("miss", self._misses),
+                    ("eviction", self._evictions),
+                )
+            ]
+
+    @staticmethod
+    def _max_byte_length() -> int:
+        return int(config.get_option("global.maxCachedImagesSize")) * 1024 * 1024
+
+
+_image_transcode_cache: Final = ImageTranscodeCache()
+
+
+def get_image_transcode_cache() -> ImageTranscodeCache:
+    return _image_transcode_cache
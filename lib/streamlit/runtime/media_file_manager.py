@@ -18,13 +18,18 @@ from __future__ import annotations
 
 import collections
 import threading
+import time
 from typing import Final
 
 from streamlit.logger import get_logger
 from streamlit.runtime.media_file_storage import MediaFileKind, MediaFileStorage
+from streamlit.runtime.stats import MediaFileStat, MediaFileStatsProvider
 
 _LOGGER: Final = get_logger(__name__)
 
+# The number of locks that sessions and files are spread across.
+_NUM_LOCK_SHARDS: Final = 16
+
 
 def _get_session_id() -> str:
     """Get the active AppSession's session_id."""
@@ -61,7 +66,37 @@ class MediaFileMetadata:
         self._is_marked_for_delete = True
 
 
-class MediaFileManager:
+class _LockShard:
+    """A lock that keeps track of how long threads waited to acquire it."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        # Only updated while holding the lock.
+        self.wait_seconds = 0.0
+
+    def __enter__(self) -> None:
+        # Only contended acquisitions are timed, to keep the common path cheap.
+        if not self._lock.acquire(blocking=False):
+            start = time.perf_counter()
+            self._lock.acquire()
+            self.wait_seconds += time.perf_counter() - start
+
+    def __exit__(self, *args: object) -> None:
+        self._lock.release()
+
+
+class _FileShard(_LockShard):
+    """The lock and bookkeeping for the files that hash to the same shard."""
+
+    def __init__(self):
+        super().__init__()
+        # IDs of files whose reference count dropped to 0.
+        self.orphaned_file_ids: set[str] = set()
+        # The number of files deleted from this shard.
+        self.deletion_count = 0
+
+
+class MediaFileManager(MediaFileStatsProvider):
     """In-memory file manager for MediaFile objects.
 
     This keeps track of:
@@ -78,6 +113,10 @@ class MediaFileManager:
       where the file's coordinates keep changing for some reason, though! e.g.
       if new elements keep being prepended to the app. Unlikely to happen, but
       we should address it at some point.)
+
+    Each file's references (i.e. the session coordinates that point to it) are
+    counted as they are added and cleared, so that `remove_orphaned_files`
+    only has to look at the files whose count dropped to 0.
     """
 
     def __init__(self, storage: MediaFileStorage):
@@ -91,26 +130,42 @@ class MediaFileManager:
             collections.defaultdict(dict)
         )
 
-        # MediaFileManager is used from multiple threads, so all operations
-        # need to be protected with a Lock. (This is not an RLock, which
-        # means taking it multiple times from the same thread will deadlock.)
-        self._lock = threading.Lock()
-
-    def _get_inactive_file_ids(self) -> set[str]:
-        """Compute the set of files that are stored in the manager, but are
-        not referenced by any active session. These are files that can be
-        safely deleted.
-
-        Thread safety: callers must hold `self._lock`.
-        """
-        # Get the set of all our file IDs.
-        file_ids = set(self._file_metadata.keys())
-
-        # Subtract all IDs that are in use by each session
-        for session_file_ids_by_coord in self._files_by_session_and_coord.values():
-            file_ids.difference_update(session_file_ids_by_coord.values())
-
-        return file_ids
+        # Dict of [file_id -> number of session coordinates that use the file].
+        # Files that aren't referenced have no entry.
+        self._ref_counts: dict[str, int] = {}
+
+        # MediaFileManager is used from multiple threads. Instead of a single
+        # lock, a session's coordinates are protected by the lock of the
+        # session's shard, and a file's metadata and reference count by the
+        # lock of the file's shard. A session lock may be held while taking a
+        # file lock, but never the other way around, and at most one file lock
+        # is held at a time. (These are not RLocks, which means taking one
+        # multiple times from the same thread will deadlock.)
+        self._session_shards = [_LockShard() for _ in range(_NUM_LOCK_SHARDS)]
+        self._file_shards = [_FileShard() for _ in range(_NUM_LOCK_SHARDS)]
+
+    def _get_session_shard(self, session_id: str) -> _LockShard:
+        return self._session_shards[hash(session_id) % _NUM_LOCK_SHARDS]
+
+    def _get_file_shard(self, file_id: str) -> _FileShard:
+        return self._file_shards[hash(file_id) % _NUM_LOCK_SHARDS]
+
+    def _get_deletion_count(self) -> int:
+        return sum(shard.deletion_count for shard in self._file_shards)
+
+    def _add_ref(self, file_id: str) -> None:
+        """Thread safety: callers must hold the lock of the file's shard."""
+        self._ref_counts[file_id] = self._ref_counts.get(file_id, 0) + 1
+        self._get_file_shard(file_id).orphaned_file_ids.discard(file_id)
+
+    def _remove_ref(self, file_id: str) -> None:
+        """Thread safety: callers must hold the lock of the file's shard."""
+        ref_count = self._ref_counts[file_id] - 1
+        if ref_count > 0:
+            self._ref_counts[file_id] = ref_count
+        else:
+            del self._ref_counts[file_id]
+            self._get_file_shard(file_id).orphaned_file_ids.add(file_id)
 
     def remove_orphaned_files(self) -> None:
         """Remove all files that are no longer referenced by any active session.
@@ -119,27 +174,32 @@ class MediaFileManager:
         """
         _LOGGER.debug("Removing orphaned files...")
 
-        with self._lock:
-            for file_id in self._get_inactive_file_ids():
-                file = self._file_metadata[file_id]
-                if file.kind == MediaFileKind.MEDIA:
-                    self._delete_file(file_id)
-                elif file.kind == MediaFileKind.DOWNLOADABLE:
-                    if file.is_marked_for_delete:
+        for shard in self._file_shards:
+            with shard:
+                for file_id in list(shard.orphaned_file_ids):
+                    file = self._file_metadata[file_id]
+                    if file.kind == MediaFileKind.MEDIA:
                         self._delete_file(file_id)
-                    else:
-                        file.mark_for_delete()
+                    elif file.kind == MediaFileKind.DOWNLOADABLE:
+                        if file.is_marked_for_delete:
+                            self._delete_file(file_id)
+                        else:
+                            file.mark_for_delete()
 
     def _delete_file(self, file_id: str) -> None:
         """Delete the given file from storage, and remove its metadata from
         self._files_by_id.
 
-        Thread safety: callers must hold `self._lock`.
+        Thread safety: callers must hold the lock of the file's shard.
         """
         _LOGGER.debug("Deleting File: %s", file_id)
         self._storage.delete_file(file_id)
         del self._file_metadata[file_id]
 
+        shard = self._get_file_shard(file_id)
+        shard.orphaned_file_ids.discard(file_id)
+        shard.deletion_count += 1
+
     def clear_session_refs(self, session_id: str | None = None) -> None:
         """Remove the given session's file references.
 
@@ -155,13 +215,11 @@ class MediaFileManager:
 
         _LOGGER.debug("Disconnecting files for session with ID %s", session_id)
 
-        with self._lock:
-            if session_id in self._files_by_session_and_coord:
-                del self._files_by_session_and_coord[session_id]
-
-        _LOGGER.debug(
-            "Sessions still active: %r", self._files_by_session_and_coord.keys()
-        )
+        with self._get_session_shard(session_id):
+            file_ids_by_coord = self._files_by_session_and_coord.pop(session_id, {})
+            for file_id in file_ids_by_coord.values():
+                with self._get_file_shard(file_id):
+                    self._remove_ref(file_id)
 
         _LOGGER.debug(
             "Files: %s; Sessions with files: %s",
@@ -216,19 +274,56 @@ class MediaFileManager:
         """
 
         session_id = _get_session_id()
+        kind = (
+            MediaFileKind.DOWNLOADABLE
+            if is_for_static_download
+            else MediaFileKind.MEDIA
+        )
 
-        with self._lock:
-            kind = (
-                MediaFileKind.DOWNLOADABLE
-                if is_for_static_download
-                else MediaFileKind.MEDIA
+        # We don't know the file's ID (and therefore its shard) until the
+        # storage has loaded it, so the file is loaded without holding a lock.
+        deletion_count = self._get_deletion_count()
+        file_id = self._storage.load_and_get_id(path_or_data, mimetype, kind, file_name)
+
+        with self._get_session_shard(session_id):
+            file_ids_by_coord = self._files_by_session_and_coord[session_id]
+            prev_file_id = file_ids_by_coord.get(coordinates)
+            file_ids_by_coord[coordinates] = file_id
+
+            with self._get_file_shard(file_id):
+                if (
+                    file_id not in self._file_metadata
+                    and self._get_deletion_count() != deletion_count
+                ):
+                    # The file may have been deleted as an orphan after we
+                    # loaded it, so it's loaded again.
+                    self._storage.load_and_get_id(
+                        path_or_data, mimetype, kind, file_name
+                    )
+                self._file_metadata[file_id] = MediaFileMetadata(kind=kind)
+                self._add_ref(file_id)
+                url = self._storage.get_url(file_id)
+
+            if prev_file_id is not None:
+                with self._get_file_shard(prev_file_id):
+                    self._remove_ref(prev_file_id)
+
+        return url
+
+    def get_media_file_stats(self) -> list[MediaFileStat]:
+        # We operate on copies of our collections, to avoid race conditions
+        # with other threads that may be manipulating them.
+        ref_counts = list(self._ref_counts.values())
+        return [
+            MediaFileStat(
+                referenced_files=len(ref_counts),
+                orphaned_files=sum(
+                    len(shard.orphaned_file_ids) for shard in self._file_shards
+                ),
+                references=sum(ref_counts),
+                lock_wait_seconds=sum(
+                    shard.wait_seconds
+                    for shard in self._session_shards + self._file_shards
+                ),
             )
-            file_id = self._storage.load_and_get_id(
-                path_or_data, mimetype, kind, file_name
-            )
-            metadata = MediaFileMetadata(kind=kind)
-
-            self._file_metadata[file_id] = metadata
-            self._files_by_session_and_coord[session_id][coordinates] = file_id
-
-            return self._storage.get_url(file_id)
+        ]
@@ -18,10 +18,14 @@ from __future__ import annotations
 
 import contextlib
 import hashlib
+import io
 import mimetypes
 import os.path
-from typing import Final, NamedTuple
+import re
+import threading
+from typing import TYPE_CHECKING, Any, Final, NamedTuple, Protocol
 
+from streamlit import config
 from streamlit.logger import get_logger
 from streamlit.runtime.media_file_storage import (
     MediaFileKind,
@@ -30,8 +34,26 @@ from streamlit.runtime.media_file_storage import (
 )
 from streamlit.runtime.stats import CacheStat, CacheStatsProvider, group_stats
 
+if TYPE_CHECKING:
+    from collections.abc import Iterator
+
 _LOGGER: Final = get_logger(__name__)
 
+# The size of the chunks that file content is served in.
+CONTENT_CHUNK_SIZE: Final = 64 * 1024
+
+# The widths, in pixels, of the image variants that can be requested.
+# @see IMAGE_VARIANT_WIDTHS in ImageList.tsx
+IMAGE_VARIANT_WIDTHS: Final = (320, 640, 960, 1280)
+
+# The mimetypes of the images that have variants. GIFs may be animated, so
+# they're always served as they are.
+_IMAGE_VARIANT_MIMETYPES: Final = ("image/png", "image/jpeg")
+
+_IMAGE_VARIANT_FILENAME_RE: Final = re.compile(
+    r"^(?P<file_id>[0-9a-f]+)-(?P<width>\d+)w(?P<extension>\.[a-z]+)$"
+)
+
 # Mimetype -> filename extension map for the `get_extension_for_mimetype`
 # function. We use Python's `mimetypes.guess_extension` for most mimetypes,
 # but (as of Python 3.9) `mimetypes.guess_extension("audio/wav")` returns None,
@@ -42,6 +64,14 @@ PREFERRED_MIMETYPE_EXTENSION_MAP: Final = {
 }
 
 
+class _FileIdHash(Protocol):
+    """The parts of a hashlib or xxhash hash object that file IDs use."""
+
+    def update(self, data: bytes, /) -> None: ...
+
+    def hexdigest(self) -> str: ...
+
+
 def _calculate_file_id(data: bytes, mimetype: str, filename: str | None = None) -> str:
     """Hash data, mimetype, and an optional filename to generate a stable file ID.
 
@@ -54,7 +84,7 @@ def _calculate_file_id(data: bytes, mimetype: str, filename: str | None = None)
     filename
         Any string. Will be converted to bytes and used to compute a hash.
     """
-    filehash = hashlib.new("sha224", usedforsecurity=False)
+    filehash = _new_file_id_hash()
     filehash.update(data)
     filehash.update(bytes(mimetype.encode()))
 
@@ -64,6 +94,86 @@ def _calculate_file_id(data: bytes, mimetype: str, filename: str | None = None)
     return filehash.hexdigest()
 
 
+def _new_file_id_hash() -> _FileIdHash:
+    """Return the hash object for file IDs, depending on
+    `server.mediaFileIdHash`."""
+    if config.get_option("server.mediaFileIdHash") == "xxhash":
+        try:
+            import xxhash
+
+            filehash: _FileIdHash = xxhash.xxh3_128()
+            return filehash
+        except ImportError:
+            _LOGGER.warning(
+                "server.mediaFileIdHash is set to 'xxhash', but the xxhash "
+                "module isn't installed. Falling back to SHA-224."
+            )
+    return hashlib.new("sha224", usedforsecurity=False)
+
+
+def _get_path_key(path: str, mimetype: str, filename: str | None) -> tuple[Any, ...]:
+    """Return a key that identifies a version of the file at `path`, or
+    raise an OSError if the file can't be accessed."""
+    stat = os.stat(path)
+    return (os.path.abspath(path), stat.st_size, stat.st_mtime_ns, mimetype, filename)
+
+
+def get_image_variant_filename(filename: str, width: int, webp: bool) -> str:
+    """Return the filename of a variant of the image with the given filename.
+
+    Parameters
+    ----------
+    filename
+        The image's filename, of the form "file_id.extension".
+    width
+        The max width of the variant, which must be one of
+        IMAGE_VARIANT_WIDTHS. Smaller images keep their width. A width of 0
+        doesn't resize the image.
+    webp
+        If True, the variant is encoded as WebP. Otherwise it keeps the
+        image's format.
+    """
+    file_id, extension = os.path.splitext(filename)
+    if webp:
+        extension = ".webp"
+    return f"{file_id}-{width}w{extension}"
+
+
+def _create_image_variant(media_file: MemoryFile, width: int, webp: bool) -> MemoryFile:
+    """Resize and/or re-encode an image. Raise MediaFileStorageError if we
+    can't."""
+    from PIL import Image
+
+    try:
+        image = Image.open(io.BytesIO(media_file.content))
+        image_format = "WEBP" if webp else image.format
+        if 0 < width < image.width:
+            new_height = max(1, int(1.0 * image.height * width / image.width))
+            # See _ensure_image_size_and_format for the type: ignore.
+            image = image.resize((width, new_height), resample=Image.BILINEAR)  # type: ignore[attr-defined]
+        elif not webp:
+            return media_file
+
+        # Keep the image's metadata. Browsers rotate images by their EXIF
+        # orientation, and use their ICC color profile.
+        metadata = {
+            key: image.info[key]
+            for key in ("exif", "icc_profile")
+            if image.info.get(key)
+        }
+        content = io.BytesIO()
+        image.save(content, format=image_format, quality=90, **metadata)
+    except Exception as ex:
+        raise MediaFileStorageError("Error creating image variant") from ex
+
+    return MemoryFile(
+        content=content.getvalue(),
+        mimetype="image/webp" if webp else media_file.mimetype,
+        kind=media_file.kind,
+        filename=media_file.filename,
+    )
+
+
 def get_extension_for_mimetype(mimetype: str) -> str:
     if mimetype in PREFERRED_MIMETYPE_EXTENSION_MAP:
         return PREFERRED_MIMETYPE_EXTENSION_MAP[mimetype]
@@ -75,6 +185,28 @@ def get_extension_for_mimetype(mimetype: str) -> str:
     return extension
 
 
+class StoredMediaFile(Protocol):
+    """A file returned by `MemoryMediaFileStorage.get_file`. Subclasses of the
+    storage may keep files elsewhere than in memory."""
+
+    @property
+    def mimetype(self) -> str: ...
+
+    @property
+    def kind(self) -> MediaFileKind: ...
+
+    @property
+    def filename(self) -> str | None: ...
+
+    @property
+    def content_size(self) -> int: ...
+
+    @property
+    def modified_time(self) -> float | None: ...
+
+    def iter_content(self, start: int, end: int) -> Iterator[bytes]: ...
+
+
 class MemoryFile(NamedTuple):
     """A MediaFile stored in memory."""
 
@@ -87,6 +219,23 @@ class MemoryFile(NamedTuple):
     def content_size(self) -> int:
         return len(self.content)
 
+    @property
+    def modified_time(self) -> float | None:
+        # File IDs are content hashes, so a file never changes. Its ID is
+        # used as ETag instead.
+        return None
+
+    def iter_content(self, start: int, end: int) -> Iterator[bytes]:
+        """Yield the content between the `start` and `end` offsets in
+        chunks, without copying more than a chunk at a time."""
+        if start == 0 and end == len(self.content):
+            yield self.content
+            return
+
+        view = memoryview(self.content)
+        for offset in range(start, end, CONTENT_CHUNK_SIZE):
+            yield bytes(view[offset : min(offset + CONTENT_CHUNK_SIZE, end)])
+
 
 class MemoryMediaFileStorage(MediaFileStorage, CacheStatsProvider):
     def __init__(self, media_endpoint: str):
@@ -101,6 +250,25 @@ class MemoryMediaFileStorage(MediaFileStorage, CacheStatsProvider):
         self._files_by_id: dict[str, MemoryFile] = {}
         self._media_endpoint = media_endpoint
 
+        # Hashing a file is the expensive part of loading it, and apps tend
+        # to load the same files on every rerun. So we remember the IDs of
+        # the files we hold by the identity of their content object, and
+        # by the path and modification time of files loaded from disk.
+        # Dict[(id(content), mimetype, filename)] -> file_id
+        self._file_ids_by_content: dict[tuple[int, str, str | None], str] = {}
+        # Dict[path key] -> file_id
+        self._file_ids_by_path: dict[tuple[Any, ...], str] = {}
+        # Dict[file_id] -> the path keys of the file
+        self._path_keys_by_file_id: dict[str, list[tuple[Any, ...]]] = {}
+        # Protects the dicts above and the files' content objects.
+        self._memo_lock = threading.Lock()
+
+        # Smaller or WebP variants of images, which are created when they're
+        # first requested.
+        # Dict[file_id] -> Dict[variant filename] -> MemoryFile
+        self._image_variants_by_id: dict[str, dict[str, MemoryFile]] = {}
+        self._image_variants_lock = threading.Lock()
+
     def load_and_get_id(
         self,
         path_or_data: str | bytes,
@@ -110,38 +278,129 @@ class MemoryMediaFileStorage(MediaFileStorage, CacheStatsProvider):
     ) -> str:
         """Add a file to the manager and return its ID."""
         file_data: bytes
+        path_key: tuple[Any, ...] | None = None
         if isinstance(path_or_data, str):
+            # _read_file raises a MediaFileStorageError if the file can't be
+            # accessed.
+            with contextlib.suppress(OSError):
+                path_key = _get_path_key(path_or_data, mimetype, filename)
+                file_id = self._file_ids_by_path.get(path_key)
+                if file_id is not None and file_id in self._files_by_id:
+                    return file_id
             file_data = self._read_file(path_or_data)
         else:
             file_data = path_or_data
+            file_id = self._file_ids_by_content.get((id(file_data), mimetype, filename))
+            if file_id is not None:
+                media_file = self._files_by_id.get(file_id)
+                # The content object is kept alive by the file, so its id
+                # can't have been reused by another object.
+                if media_file is not None and media_file.content is file_data:
+                    return file_id
 
         # Because our file_ids are stable, if we already have a file with the
         # given ID, we don't need to create a new one.
         file_id = _calculate_file_id(file_data, mimetype, filename)
-        if file_id not in self._files_by_id:
-            _LOGGER.debug("Adding media file %s", file_id)
-            media_file = MemoryFile(
-                content=file_data, mimetype=mimetype, kind=kind, filename=filename
-            )
-            self._files_by_id[file_id] = media_file
+        with self._memo_lock:
+            media_file = self._files_by_id.get(file_id)
+            if media_file is None:
+                _LOGGER.debug("Adding media file %s", file_id)
+                self._files_by_id[file_id] = MemoryFile(
+                    content=file_data, mimetype=mimetype, kind=kind, filename=filename
+                )
+            elif media_file.content is not file_data:
+                # The same content was loaded from another object. We keep the
+                # object that was loaded last, which is the one that's likely
+                # to be loaded again.
+                self._forget_content(file_id, media_file)
+                self._files_by_id[file_id] = media_file._replace(content=file_data)
+
+            self._file_ids_by_content[(id(file_data), mimetype, filename)] = file_id
+            if path_key is not None:
+                self._file_ids_by_path[path_key] = file_id
+                self._path_keys_by_file_id.setdefault(file_id, []).append(path_key)
 
         return file_id
 
-    def get_file(self, filename: str) -> MemoryFile:
-        """Return the MemoryFile with the given filename. Filenames are of the
+    def _forget_content(self, file_id: str, media_file: MemoryFile) -> None:
+        """Thread safety: callers must hold `self._memo_lock`."""
+        key = (id(media_file.content), media_file.mimetype, media_file.filename)
+        if self._file_ids_by_content.get(key) == file_id:
+            del self._file_ids_by_content[key]
+
+    def get_file(self, filename: str) -> StoredMediaFile:
+        """Return the file with the given filename. Filenames are of the
         form "file_id.extension". (Note that this is *not* the optional
         user-specified filename for download files.)
 
+        Filenames returned by `get_image_variant_filename` return the image
+        variant, which is created if it doesn't exist yet.
+
         Raises a MediaFileStorageError if no such file exists.
         """
         file_id = os.path.splitext(filename)[0]
         try:
             return self._files_by_id[file_id]
         except KeyError as e:
+            variant_match = _IMAGE_VARIANT_FILENAME_RE.match(filename)
+            if variant_match is not None:
+                return self._get_image_variant(
+                    filename,
+                    variant_match["file_id"],
+                    int(variant_match["width"]),
+                    variant_match["extension"],
+                )
             raise MediaFileStorageError(
                 f"Bad filename '{filename}'. (No media file with id '{file_id}')"
             ) from e
 
+    def _get_image_variant(
+        self, filename: str, file_id: str, width: int, extension: str
+    ) -> StoredMediaFile:
+        with self._image_variants_lock:
+            variant = self._image_variants_by_id.get(file_id, {}).get(filename)
+        if variant is not None:
+            return variant
+
+        media_file = self.get_file(file_id)
+        webp = extension == ".webp"
+        if (
+            media_file.mimetype not in _IMAGE_VARIANT_MIMETYPES
+            or width not in (0, *IMAGE_VARIANT_WIDTHS)
+            or (width == 0 and not webp)
+            or (
+                not webp
+                and extension != get_extension_for_mimetype(media_file.mimetype)
+            )
+        ):
+            raise MediaFileStorageError(f"Bad image variant filename '{filename}'")
+
+        if isinstance(media_file, MemoryFile):
+            content_file = media_file
+        else:
+            # Files on disk are read into memory to create their variants.
+            content_file = MemoryFile(
+                content=b"".join(media_file.iter_content(0, media_file.content_size)),
+                mimetype=media_file.mimetype,
+                kind=media_file.kind,
+                filename=media_file.filename,
+            )
+
+        _LOGGER.debug("Creating image variant %s", filename)
+        variant = _create_image_variant(content_file, width, webp)
+        with self._image_variants_lock:
+            # The file may have been deleted in the meantime.
+            if self._has_file(file_id):
+                self._image_variants_by_id.setdefault(file_id, {})[filename] = variant
+        return variant
+
+    def _has_file(self, file_id: str) -> bool:
+        return file_id in self._files_by_id
+
+    def _delete_image_variants(self, file_id: str) -> None:
+        with self._image_variants_lock:
+            self._image_variants_by_id.pop(file_id, None)
+
     def get_url(self, file_id: str) -> str:
         """Get a URL for a given media file. Raise a MediaFileStorageError if
         no such file exists.
@@ -152,10 +411,14 @@ class MemoryMediaFileStorage(MediaFileStorage, CacheStatsProvider):
 
     def delete_file(self, file_id: str) -> None:
         """Delete the file with the given ID."""
-        # We swallow KeyErrors here - it's not an error to delete a file
-        # that doesn't exist.
-        with contextlib.suppress(KeyError):
-            del self._files_by_id[file_id]
+        # It's not an error to delete a file that doesn't exist.
+        with self._memo_lock:
+            media_file = self._files_by_id.pop(file_id, None)
+            if media_file is not None:
+                self._forget_content(file_id, media_file)
+            for path_key in self._path_keys_by_file_id.pop(file_id, []):
+                self._file_ids_by_path.pop(path_key, None)
+        self._delete_image_variants(file_id)
 
     def _read_file(self, filename: str) -> bytes:
         """Read a file into memory. Raise MediaFileStorageError if we can't."""
@@ -169,6 +432,12 @@ class MemoryMediaFileStorage(MediaFileStorage, CacheStatsProvider):
         # We operate on a copy of our dict, to avoid race conditions
         # with other threads that may be manipulating the cache.
         files_by_id = self._files_by_id.copy()
+        with self._image_variants_lock:
+            image_variants = [
+                variant
+                for variants in self._image_variants_by_id.values()
+                for variant in variants.values()
+            ]
 
         stats: list[CacheStat] = [
             CacheStat(
@@ -176,6 +445,6 @@ class MemoryMediaFileStorage(MediaFileStorage, CacheStatsProvider):
                 cache_name="",
                 byte_length=len(file.content),
             )
-            for _, file in files_by_id.items()
+            for file in [*files_by_id.values(), *image_variants]
         ]
         return group_stats(stats)
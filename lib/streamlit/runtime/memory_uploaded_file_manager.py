@@ -92,6 +92,14 @@ class MemoryUploadedFileManager(UploadedFileManager):
 
         self.file_storage[session_id][file.file_id] = file
 
+    def get_session_files_size(self, session_id: str) -> int:
+        """Return the total size of the files uploaded by a session.
+
+        Safe to call from any thread.
+        """
+        session_storage = self.file_storage.get(session_id, {})
+        return sum(len(file.data) for file in session_storage.copy().values())
+
     def remove_file(self, session_id, file_id):
         """Remove file with given file_id associated with a given session."""
         session_storage = self.file_storage[session_id]
@@ -440,6 +440,7 @@ def create_page_profile_message(
     exec_time: int,
     prep_time: int,
     uncaught_exception: str | None = None,
+    serialization_check_time: int = 0,
 ) -> ForwardMsg:
     """Create and return the full PageProfile ForwardMsg."""
     msg = ForwardMsg()
@@ -448,6 +449,7 @@ def create_page_profile_message(
     page_profile.commands.extend(commands)
     page_profile.exec_time = exec_time
     page_profile.prep_time = prep_time
+    page_profile.serialization_check_time = serialization_check_time
 
     page_profile.headless = config.get_option("server.headless")
 
@@ -37,7 +37,9 @@ from streamlit.runtime.forward_msg_cache import (
     ForwardMsgCache,
     create_reference_msg,
     populate_hash_if_needed,
+    serialize_payload,
 )
+from streamlit.runtime.image_transcode_cache import get_image_transcode_cache
 from streamlit.runtime.media_file_manager import MediaFileManager
 from streamlit.runtime.memory_session_storage import MemorySessionStorage
 from streamlit.runtime.runtime_util import is_cacheable_msg
@@ -45,11 +47,13 @@ from streamlit.runtime.script_data import ScriptData
 from streamlit.runtime.scriptrunner.script_cache import ScriptCache
 from streamlit.runtime.session_manager import (
     ActiveSessionInfo,
+    BatchingSessionClient,
     SessionClient,
     SessionClientDisconnectedError,
     SessionManager,
     SessionStorage,
 )
+from streamlit.runtime.session_message_scheduler import SessionMessageScheduler
 from streamlit.runtime.state import (
     SCRIPT_RUN_WITHOUT_ERRORS_KEY,
     SessionStateStatProvider,
@@ -204,6 +208,7 @@ class Runtime:
         # Initialize managers
         self._component_registry = config.component_registry
         self._message_cache = ForwardMsgCache()
+        self._message_scheduler = SessionMessageScheduler()
         self._uploaded_file_mgr = config.uploaded_file_manager
         self._media_file_mgr = MediaFileManager(storage=config.media_file_storage)
         self._cache_storage_manager = config.cache_storage_manager
@@ -220,8 +225,13 @@ class Runtime:
         self._stats_mgr.register_provider(get_data_cache_stats_provider())
         self._stats_mgr.register_provider(get_resource_cache_stats_provider())
         self._stats_mgr.register_provider(self._message_cache)
+        self._stats_mgr.register_cache_event_provider(self._message_cache)
         self._stats_mgr.register_provider(self._uploaded_file_mgr)
         self._stats_mgr.register_provider(SessionStateStatProvider(self._session_mgr))
+        self._stats_mgr.register_session_message_provider(self._message_scheduler)
+        self._stats_mgr.register_media_file_provider(self._media_file_mgr)
+        self._stats_mgr.register_provider(get_image_transcode_cache())
+        self._stats_mgr.register_cache_event_provider(get_image_transcode_cache())
 
     @property
     def state(self) -> RuntimeState:
@@ -642,19 +652,38 @@ class Runtime:
                 elif self._state == RuntimeState.ONE_OR_MORE_SESSIONS_CONNECTED:
                     async_objs.need_send_data.clear()
 
-                    for active_session_info in self._session_mgr.list_active_sessions():
-                        msg_list = active_session_info.session.flush_browser_queue()
-                        for msg in msg_list:
+                    session_infos = self._session_mgr.list_active_sessions()
+                    for active_session_info in session_infos:
+                        for msg in active_session_info.session.flush_browser_queue():
+                            msg_to_send, msg_size = self._prepare_message(
+                                active_session_info, msg
+                            )
+                            self._message_scheduler.enqueue(
+                                active_session_info.session.id, msg_to_send, msg_size
+                            )
+
+                    # Send the queued messages in fair rounds until all of them
+                    # are sent, or only backpressured sessions have any left.
+                    while scheduled := self._message_scheduler.next_round(
+                        session_infos
+                    ):
+                        for active_session_info, msgs in scheduled:
                             try:
-                                self._send_message(active_session_info, msg)
+                                self._send_messages(active_session_info, msgs)
                             except SessionClientDisconnectedError:
                                 self._session_mgr.disconnect_session(
                                     active_session_info.session.id
                                 )
 
-                            # Yield for a tick after sending a message.
+                            # Yield for a tick after sending a session's messages.
                             await asyncio.sleep(0)
 
+                        session_infos = self._session_mgr.list_active_sessions()
+
+                    # Check backpressured sessions again on the next iteration.
+                    if self._message_scheduler.has_queued_messages():
+                        async_objs.need_send_data.set()
+
                     # Yield for a few milliseconds between session message
                     # flushing.
                     await asyncio.sleep(0.01)
@@ -696,8 +725,30 @@ Please report this bug at https://github.com/streamlit/streamlit/issues.
 """
             )
 
-    def _send_message(self, session_info: ActiveSessionInfo, msg: ForwardMsg) -> None:
-        """Send a message to a client.
+    def _send_messages(
+        self, session_info: ActiveSessionInfo, msgs: list[ForwardMsg]
+    ) -> None:
+        """Send messages prepared by `_prepare_message` to a session's client.
+
+        Clients that support it receive all the messages at once, so they can
+        batch them into fewer writes. Other clients receive them one by one.
+
+        Notes
+        -----
+        Threading: UNSAFE. Must be called on the eventloop thread.
+        """
+        client = session_info.client
+        if isinstance(client, BatchingSessionClient):
+            client.write_forward_msgs(msgs)
+        else:
+            for msg in msgs:
+                client.write_forward_msg(msg)
+
+    def _prepare_message(
+        self, session_info: ActiveSessionInfo, msg: ForwardMsg
+    ) -> tuple[ForwardMsg, int]:
+        """Return the message to send to a client in place of the given one,
+        and its approximate size in bytes.
 
         If the client is likely to have already cached the message, we may
         instead send a "reference" message that contains only the hash of the
@@ -714,11 +765,15 @@ Please report this bug at https://github.com/streamlit/streamlit/issues.
         -----
         Threading: UNSAFE. Must be called on the eventloop thread.
         """
-        msg.metadata.cacheable = is_cacheable_msg(msg)
+        # Serialize the message's payload once. It's used to compute the
+        # message's hash and to decide whether it's cacheable, and it's kept in
+        # the message cache so it doesn't need to be serialized again when sent.
+        serialized_payload = serialize_payload(msg)
+        populate_hash_if_needed(msg, serialized_payload)
+        msg.metadata.cacheable = is_cacheable_msg(msg, len(serialized_payload))
         msg_to_send = msg
+        msg_size = len(serialized_payload)
         if msg.metadata.cacheable:
-            populate_hash_if_needed(msg)
-
             if self._message_cache.has_message_reference(
                 msg, session_info.session, session_info.script_run_count
             ):
@@ -726,13 +781,17 @@ Please report this bug at https://github.com/streamlit/streamlit/issues.
                 # a reference instead.
                 _LOGGER.debug("Sending cached message ref (hash=%s)", msg.hash)
                 msg_to_send = create_reference_msg(msg)
+                msg_size = msg_to_send.ByteSize()
 
             # Cache the message so it can be referenced in the future.
             # If the message is already cached, this will reset its
             # age.
             _LOGGER.debug("Caching message (hash=%s)", msg.hash)
             self._message_cache.add_message(
-                msg, session_info.session, session_info.script_run_count
+                msg,
+                session_info.session,
+                session_info.script_run_count,
+                serialized_payload,
             )
 
         # If this was a `script_finished` message, we increment the
@@ -757,8 +816,7 @@ Please report this bug at https://github.com/streamlit/streamlit/issues.
                 session_info.session, session_info.script_run_count
             )
 
-        # Ship it off!
-        session_info.client.write_forward_msg(msg_to_send)
+        return msg_to_send, msg_size
 
     def _enqueued_some_message(self) -> None:
         """Callback called by AppSession after the AppSession has enqueued a
@@ -770,7 +828,17 @@ Please report this bug at https://github.com/streamlit/streamlit/issues.
         Threading: SAFE. May be called on any thread.
         """
         async_objs = self._get_async_objs()
-        async_objs.eventloop.call_soon_threadsafe(async_objs.need_send_data.set)
+        try:
+            running_loop: asyncio.AbstractEventLoop | None = asyncio.get_running_loop()
+        except RuntimeError:
+            running_loop = None
+
+        if running_loop is async_objs.eventloop:
+            # AppSessions enqueue most messages on the eventloop, where the
+            # event can be set without waking the loop up.
+            async_objs.need_send_data.set()
+        else:
+            async_objs.eventloop.call_soon_threadsafe(async_objs.need_send_data.set)
 
     def _get_async_objs(self) -> AsyncObjects:
         """Return our AsyncObjects instance. If the Runtime hasn't been
@@ -24,6 +24,7 @@ from streamlit.runtime.forward_msg_cache import populate_hash_if_needed
 
 if TYPE_CHECKING:
     from streamlit.proto.ForwardMsg_pb2 import ForwardMsg
+    from streamlit.runtime.forward_msg_cache import ForwardMsgCache
 
 
 class MessageSizeError(MarkdownFormattedException):
@@ -60,22 +61,39 @@ class BadDurationStringError(StreamlitAPIException):
         )
 
 
-def is_cacheable_msg(msg: ForwardMsg) -> bool:
-    """True if the given message qualifies for caching."""
+def is_cacheable_msg(msg: ForwardMsg, byte_size: int | None = None) -> bool:
+    """True if the given message qualifies for caching.
+
+    `byte_size` is the size of the serialized message, if the caller already
+    knows it.
+    """
     if msg.WhichOneof("type") in {"ref_hash", "initialize"}:
         # Some message types never get cached
         return False
-    return msg.ByteSize() >= int(config.get_option("global.minCachedMessageSize"))
+    if byte_size is None:
+        byte_size = msg.ByteSize()
+    return byte_size >= int(config.get_option("global.minCachedMessageSize"))
 
 
-def serialize_forward_msg(msg: ForwardMsg) -> bytes:
+def serialize_forward_msg(
+    msg: ForwardMsg, message_cache: ForwardMsgCache | None = None
+) -> bytes:
     """Serialize a ForwardMsg to send to a client.
 
+    If the message is in the given message cache, its cached serialization
+    is reused.
+
     If the message is too large, it will be converted to an exception message
     instead.
     """
     populate_hash_if_needed(msg)
-    msg_str = msg.SerializeToString()
+    msg_str = (
+        message_cache.get_serialized_message(msg.hash, msg)
+        if message_cache is not None
+        else None
+    )
+    if msg_str is None:
+        msg_str = msg.SerializeToString()
 
     if len(msg_str) > get_max_message_size_bytes():
         import streamlit.elements.exception as exception
@@ -88,6 +106,18 @@ def serialize_forward_msg(msg: ForwardMsg) -> bytes:
     return msg_str
 
 
+def serialize_forward_msg_batch(serialized_msgs: list[bytes]) -> bytes:
+    """Serialize a ForwardMsg that wraps the given serialized ForwardMsgs, so
+    that they can be sent to a client in a single websocket message.
+    """
+    # Lazy-load for performance reasons.
+    from streamlit.proto.ForwardMsg_pb2 import ForwardMsg
+
+    batch = ForwardMsg()
+    batch.forward_msg_batch.messages.extend(serialized_msgs)
+    return batch.SerializeToString()
+
+
 # This needs to be initialized lazily to avoid calling config.get_option() and
 # thus initializing config options when this file is first imported.
 _max_message_size_bytes: int | None = None
@@ -14,17 +14,88 @@
 
 from __future__ import annotations
 
+import hashlib
+import importlib.util
+import marshal
 import os.path
+import sys
+import tempfile
 import threading
-from typing import Any
+import types
+from typing import Any, Final
 
 from streamlit import config
+from streamlit.logger import get_logger
 from streamlit.runtime.scriptrunner import magic
 from streamlit.source_util import open_python_file
+from streamlit.version import STREAMLIT_VERSION_STRING
+
+_LOGGER: Final = get_logger(__name__)
+
+
+def _get_disk_cache_path(script_path: str, source: str, magic_enabled: bool) -> str:
+    """Return the path of a script's bytecode in the bytecode cache.
+
+    The bytecode depends on everything that's hashed here: the script's path
+    (which ends up in tracebacks), its source, whether magic is enabled, the
+    Streamlit version (which may change magic), and the Python version and
+    optimization level.
+    """
+    cache_key = hashlib.sha256(usedforsecurity=False)
+    for value in (
+        STREAMLIT_VERSION_STRING,
+        importlib.util.MAGIC_NUMBER.hex(),
+        str(sys.flags.optimize),
+        str(magic_enabled),
+        script_path,
+        source,
+    ):
+        cache_key.update(value.encode("utf-8", "surrogatepass"))
+        cache_key.update(b"\0")
+    return os.path.join(
+        config.get_option("runner.bytecodeCachePath"), f"{cache_key.hexdigest()}.bin"
+    )
+
+
+def _read_disk_cache(path: str) -> types.CodeType | None:
+    """Return the bytecode at the given path, or None if it can't be read."""
+    try:
+        with open(path, "rb") as f:
+            bytecode = marshal.load(f)
+    except FileNotFoundError:
+        return None
+    except (OSError, EOFError, ValueError, TypeError):
+        _LOGGER.warning("Ignoring invalid bytecode cache file %s", path, exc_info=True)
+        return None
+    return bytecode if isinstance(bytecode, types.CodeType) else None
+
+
+def _write_disk_cache(path: str, bytecode: types.CodeType) -> None:
+    """Write bytecode to the given path. Errors are logged, not raised."""
+    try:
+        cache_dir = os.path.dirname(path)
+        os.makedirs(cache_dir, exist_ok=True)
+        # Other processes may share the cache, so the file is written under a
+        # temporary name first, and never read while it's partially written.
+        fd, tmp_path = tempfile.mkstemp(dir=cache_dir)
+        try:
+            with os.fdopen(fd, "wb") as f:
+                marshal.dump(bytecode, f)
+            os.replace(tmp_path, path)
+        except BaseException:
+            os.remove(tmp_path)
+            raise
+    except OSError:
+        _LOGGER.warning("Unable to write bytecode cache file %s", path, exc_info=True)
 
 
 class ScriptCache:
-    """Thread-safe cache of Python script bytecode."""
+    """Thread-safe cache of Python script bytecode.
+
+    If `runner.bytecodeCachePath` is set, bytecode is also cached in that
+    folder, so that other processes and later server runs don't need to
+    compile the same scripts again.
+    """
 
     def __init__(self):
         # Mapping of script_path: bytecode
@@ -44,8 +115,8 @@ class ScriptCache:
     def get_bytecode(self, script_path: str) -> Any:
         """Return the bytecode for the Python script at the given path.
 
-        If the bytecode is not already in the cache, the script will be
-        compiled first.
+        If the bytecode is not already in the cache, it's loaded from the
+        bytecode cache folder, or the script is compiled.
 
         Raises
         ------
@@ -68,7 +139,19 @@ class ScriptCache:
             with open_python_file(script_path) as f:
                 filebody = f.read()
 
-            if config.get_option("runner.magicEnabled"):
+            magic_enabled = config.get_option("runner.magicEnabled")
+            disk_cache_path = (
+                _get_disk_cache_path(script_path, filebody, magic_enabled)
+                if config.get_option("runner.bytecodeCachePath")
+                else None
+            )
+            if disk_cache_path is not None:
+                bytecode = _read_disk_cache(disk_cache_path)
+                if bytecode is not None:
+                    self._cache[script_path] = bytecode
+                    return bytecode
+
+            if magic_enabled:
                 filebody = magic.add_magic(filebody, script_path)
 
             bytecode = compile(  # type: ignore
@@ -85,5 +168,7 @@ class ScriptCache:
                 optimize=-1,
             )
 
+            if disk_cache_path is not None:
+                _write_disk_cache(disk_cache_path, bytecode)
             self._cache[script_path] = bytecode
             return bytecode
@@ -465,6 +465,8 @@ class ScriptRunner:
             _LOGGER.debug("Running script %s", rerun_data)
             start_time: float = timer()
             prep_time: float = 0  # This will be overwritten once preparations are done.
+            # Time spent verifying that session state is serializable.
+            serialization_check_time: float = 0
 
             if not rerun_data.fragment_id_queue:
                 # Don't clear session refs for media files if we're running a fragment.
@@ -582,6 +584,8 @@ class ScriptRunner:
             module.__dict__["__file__"] = script_path
 
             def code_to_exec(code=code, module=module, ctx=ctx, rerun_data=rerun_data):
+                nonlocal serialization_check_time
+
                 with (
                     modified_sys_path(self._main_script_path),
                     self._set_execing_flag(),
@@ -642,7 +646,9 @@ class ScriptRunner:
                             new_fragment_ids=ctx.new_fragment_ids
                         )
 
+                    serialization_check_start_time = timer()
                     self._session_state.maybe_check_serializable()
+                    serialization_check_time = timer() - serialization_check_start_time
                     # check for control requests, e.g. rerun requests have arrived
                     self._maybe_handle_execution_control_request()
 
@@ -675,6 +681,9 @@ class ScriptRunner:
                             commands=ctx.tracked_commands,
                             exec_time=to_microseconds(timer() - start_time),
                             prep_time=to_microseconds(prep_time),
+                            serialization_check_time=to_microseconds(
+                                serialization_check_time
+                            ),
                             uncaught_exception=(
                                 type(uncaught_exception).__name__
                                 if uncaught_exception
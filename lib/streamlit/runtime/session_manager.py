@@ -16,7 +16,7 @@ from __future__ import annotations
 
 from abc import abstractmethod
 from dataclasses import dataclass
-from typing import TYPE_CHECKING, Callable, Protocol, cast
+from typing import TYPE_CHECKING, Callable, Protocol, cast, runtime_checkable
 
 if TYPE_CHECKING:
     from streamlit.proto.ForwardMsg_pb2 import ForwardMsg
@@ -43,6 +43,39 @@ class SessionClient(Protocol):
         raise NotImplementedError
 
 
+@runtime_checkable
+class BatchingSessionClient(SessionClient, Protocol):
+    """A SessionClient that can deliver several ForwardMsgs at once.
+
+    The Runtime hands all of a session's pending messages to such a client in a
+    single call, so that it can send them with fewer writes.
+    """
+
+    @abstractmethod
+    def write_forward_msgs(self, msgs: list[ForwardMsg]) -> None:
+        """Deliver several ForwardMsgs to the client, in order.
+
+        If the SessionClient has been disconnected, it should raise a
+        SessionClientDisconnectedError.
+        """
+        raise NotImplementedError
+
+
+@runtime_checkable
+class BufferedSessionClient(SessionClient, Protocol):
+    """A SessionClient that buffers the data it can't write out immediately.
+
+    The Runtime holds back a session's messages while its client's buffer is
+    full, so a slow client doesn't pile up unsent data in server memory.
+    """
+
+    @abstractmethod
+    def pending_write_bytes(self) -> int:
+        """Return the number of bytes written to the client that haven't been
+        sent yet."""
+        raise NotImplementedError
+
+
 @dataclass
 class ActiveSessionInfo:
     """Type containing data related to an active session.
@@ -0,0 +1,177 @@
+# Copyright (c) Streamlit Inc. (2018-2022) Snowflake Inc. (2022-2025)
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from __future__ import annotations
+
+import time
+from collections import deque
+from typing import TYPE_CHECKING, Final, NamedTuple
+
+from streamlit.runtime.session_manager import BufferedSessionClient
+from streamlit.runtime.stats import SessionMessageStat, SessionMessageStatsProvider
+
+if TYPE_CHECKING:
+    from streamlit.proto.ForwardMsg_pb2 import ForwardMsg
+    from streamlit.runtime.session_manager import ActiveSessionInfo, SessionClient
+
+# The number of bytes each session may send per scheduling round.
+DEFAULT_QUANTUM_BYTES: Final = 256 * 1024
+
+# Messages are held back from a client whose write buffer holds more than
+# this many bytes.
+DEFAULT_MAX_PENDING_WRITE_BYTES: Final = 4 * 1024 * 1024
+
+
+class _QueuedMsg(NamedTuple):
+    msg: ForwardMsg
+    byte_size: int
+    enqueued_at: float
+
+
+class SessionMessageScheduler(SessionMessageStatsProvider):
+    """Shares the Runtime's message flushing fairly between sessions.
+
+    Each session's outgoing messages wait in their own queue. Every call to
+    `next_round` hands out the messages that can be sent now, using deficit
+    round-robin: each session that has messages waiting earns `quantum_bytes`
+    of credit per round and sends messages while its credit is positive. A
+    session that streams a lot of data therefore can't delay the messages of
+    other sessions by more than one message per round.
+
+    Sessions whose client is a BufferedSessionClient with more than
+    `max_pending_write_bytes` bytes still unsent are skipped, so that a slow
+    client doesn't accumulate unsent data in its write buffer.
+
+    SessionMessageScheduler is not thread-safe. It must only be used from the
+    eventloop thread.
+    """
+
+    def __init__(
+        self,
+        quantum_bytes: int = DEFAULT_QUANTUM_BYTES,
+        max_pending_write_bytes: int = DEFAULT_MAX_PENDING_WRITE_BYTES,
+    ):
+        self._quantum_bytes = quantum_bytes
+        self._max_pending_write_bytes = max_pending_write_bytes
+        self._queues: dict[str, deque[_QueuedMsg]] = {}
+        self._deficits: dict[str, int] = {}
+        # The session that goes first is rotated every round.
+        self._round_count = 0
+        # The number of sessions that were skipped in the last round because
+        # of backpressure.
+        self._backpressured_session_count = 0
+
+    def enqueue(self, session_id: str, msg: ForwardMsg, byte_size: int) -> None:
+        """Add a message of roughly `byte_size` bytes to the end of a
+        session's queue."""
+        queue = self._queues.setdefault(session_id, deque())
+        queue.append(_QueuedMsg(msg, byte_size, time.monotonic()))
+
+    def has_queued_messages(self) -> bool:
+        """True if any session has messages waiting to be sent."""
+        return any(self._queues.values())
+
+    def next_round(
+        self, session_infos: list[ActiveSessionInfo]
+    ) -> list[tuple[ActiveSessionInfo, list[ForwardMsg]]]:
+        """Return the messages each session may send in this round.
+
+        Parameters
+        ----------
+        session_infos : list[ActiveSessionInfo]
+            The active sessions. The queues of all other sessions are dropped.
+
+        Returns
+        -------
+        list[tuple[ActiveSessionInfo, list[ForwardMsg]]]
+            The sessions that may send messages, and their messages in order.
+        """
+        self._drop_inactive_sessions(session_infos)
+
+        eligible: list[ActiveSessionInfo] = []
+        self._backpressured_session_count = 0
+        for session_info in _rotated(session_infos, self._round_count):
+            if not self._queues.get(session_info.session.id):
+                continue
+            if self._is_backpressured(session_info.client):
+                self._backpressured_session_count += 1
+                continue
+            eligible.append(session_info)
+        self._round_count += 1
+        if not eligible:
+            return []
+
+        # A session that sent a message larger than its credit has a negative
+        # deficit. Rounds in which no session could send anything are skipped
+        # by handing out all of their credit at once.
+        rounds = min(
+            -self._deficits.get(session_info.session.id, 0) // self._quantum_bytes + 1
+            for session_info in eligible
+        )
+
+        result: list[tuple[ActiveSessionInfo, list[ForwardMsg]]] = []
+        for session_info in eligible:
+            session_id = session_info.session.id
+            queue = self._queues[session_id]
+            deficit = self._deficits.get(session_id, 0) + rounds * self._quantum_bytes
+
+            msgs: list[ForwardMsg] = []
+            while queue and deficit > 0:
+                queued_msg = queue.popleft()
+                msgs.append(queued_msg.msg)
+                deficit -= queued_msg.byte_size
+
+            # As in classic deficit round-robin, a session doesn't keep its
+            # credit once its queue is empty.
+            self._deficits[session_id] = deficit if queue else min(deficit, 0)
+            if msgs:
+                result.append((session_info, msgs))
+
+        return result
+
+    def get_session_message_stats(self) -> list[SessionMessageStat]:
+        now = time.monotonic()
+        queues = [queue for queue in self._queues.values() if queue]
+        return [
+            SessionMessageStat(
+                queued_messages=sum(len(queue) for queue in queues),
+                max_queue_depth=max((len(queue) for queue in queues), default=0),
+                max_queue_latency_seconds=max(
+                    (now - queue[0].enqueued_at for queue in queues), default=0.0
+                ),
+                backpressured_sessions=self._backpressured_session_count,
+            )
+        ]
+
+    def _drop_inactive_sessions(self, session_infos: list[ActiveSessionInfo]) -> None:
+        active_session_ids = {session_info.session.id for session_info in session_infos}
+        for session_id in list(self._queues):
+            if session_id not in active_session_ids:
+                del self._queues[session_id]
+                self._deficits.pop(session_id, None)
+
+    def _is_backpressured(self, client: SessionClient) -> bool:
+        return (
+            isinstance(client, BufferedSessionClient)
+            and client.pending_write_bytes() > self._max_pending_write_bytes
+        )
+
+
+def _rotated(
+    session_infos: list[ActiveSessionInfo], offset: int
+) -> list[ActiveSessionInfo]:
+    if not session_infos:
+        return session_infos
+    offset %= len(session_infos)
+    return session_infos[offset:] + session_infos[:offset]
@@ -364,6 +364,20 @@ class SessionState:
     # widget state at one point.
     query_params: QueryParams = field(default_factory=QueryParams)
 
+    # The number of times each key was set via __setitem__, so that
+    # _check_serializable can tell which keys were written since it last
+    # checked them.
+    _key_versions: dict[str, int] = field(
+        default_factory=dict, compare=False, repr=False
+    )
+
+    # The value and key version that _check_serializable last verified for each
+    # key. A key whose value is the same object, at the same version, isn't
+    # pickled again.
+    _serializable_values: dict[str, tuple[Any, int]] = field(
+        default_factory=dict, compare=False, repr=False
+    )
+
     def __repr__(self):
         return util.repr_(self)
 
@@ -389,6 +403,8 @@ class SessionState:
         self._new_session_state.clear()
         self._new_widget_state.clear()
         self._key_id_mapper.clear()
+        self._key_versions.clear()
+        self._serializable_values.clear()
 
     @property
     def filtered_state(self) -> dict[str, Any]:
@@ -518,6 +534,7 @@ class SessionState:
                 )
 
         self._new_session_state[user_key] = value
+        self._key_versions[user_key] = self._key_versions.get(user_key, 0) + 1
 
     def __delitem__(self, key: str) -> None:
         widget_id = self._get_widget_id(key)
@@ -719,16 +736,37 @@ class SessionState:
         """Verify that everything added to session state can be serialized.
         We use pickleability as the metric for serializability, and test for
         pickleability by just trying it.
+
+        Only values that changed since the last check are pickled: a value
+        is skipped if it's the same object as last time and its key wasn't
+        set since. This means that mutating a value in place without
+        setting its key again isn't detected.
         """
+        checked_values: dict[str, tuple[Any, int]] = {}
         for k in self:
-            try:
-                pickle.dumps(self[k])
-            except Exception as e:
-                err_msg = f"""Cannot serialize the value (of type `{type(self[k])}`) of '{k}' in st.session_state.
+            value = self[k]
+            # Keys of widgets are iterated as their widget ID.
+            user_key = self._key_id_mapper.id_key_mapping.get(k, k)
+            version = self._key_versions.get(user_key, 0)
+            checked = self._serializable_values.get(k)
+            if checked is None or checked[0] is not value or checked[1] != version:
+                self._check_value_serializable(k, value)
+            checked_values[k] = (value, version)
+
+        # Keys that were removed from session state are dropped as well.
+        self._serializable_values.clear()
+        self._serializable_values.update(checked_values)
+
+    @staticmethod
+    def _check_value_serializable(k: str, value: Any) -> None:
+        try:
+            pickle.dumps(value)
+        except Exception as e:
+            err_msg = f"""Cannot serialize the value (of type `{type(value)}`) of '{k}' in st.session_state.
                 Streamlit has been configured to use [pickle](https://docs.python.org/3/library/pickle.html) to
                 serialize session_state values. Please convert the value to a pickle-serializable type. To learn
                 more about this behavior, see [our docs](https://docs.streamlit.io/knowledge-base/using-streamlit/serializable-session-state). """
-                raise UnserializableSessionStateError(err_msg) from e
+            raise UnserializableSessionStateError(err_msg) from e
 
     def maybe_check_serializable(self) -> None:
         """Verify that session state can be serialized, if the relevant config
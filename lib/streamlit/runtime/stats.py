@@ -20,6 +20,9 @@ from typing import TYPE_CHECKING, NamedTuple, Protocol, runtime_checkable
 
 if TYPE_CHECKING:
     from streamlit.proto.openmetrics_data_model_pb2 import Metric as MetricProto
+    from streamlit.proto.openmetrics_data_model_pb2 import (
+        MetricFamily as MetricFamilyProto,
+    )
 
 
 class CacheStat(NamedTuple):
@@ -60,6 +63,47 @@ class CacheStat(NamedTuple):
         metric_point.gauge_value.int_value = self.byte_length
 
 
+class CacheEventStat(NamedTuple):
+    """Counts the events of a single kind that happened in a cache.
+
+    Properties
+    ----------
+    category_name : str
+        A human-readable name for the cache "category", as in CacheStat.
+    cache_name : str
+        A human-readable name for the cache instance, as in CacheStat.
+    event : str
+        The kind of event - e.g. "hit", "miss" or "eviction".
+    event_count : int
+        The number of times the event happened since the server started.
+    """
+
+    category_name: str
+    cache_name: str
+    event: str
+    event_count: int
+
+    def to_metric_str(self) -> str:
+        return f'cache_events_total{{cache_type="{self.category_name}",cache="{self.cache_name}",event="{self.event}"}} {self.event_count}'
+
+    def marshall_metric_proto(self, metric: MetricProto) -> None:
+        """Fill an OpenMetrics `Metric` protobuf object."""
+        label = metric.labels.add()
+        label.name = "cache_type"
+        label.value = self.category_name
+
+        label = metric.labels.add()
+        label.name = "cache"
+        label.value = self.cache_name
+
+        label = metric.labels.add()
+        label.name = "event"
+        label.value = self.event
+
+        metric_point = metric.metric_points.add()
+        metric_point.counter_value.int_value = self.event_count
+
+
 def group_stats(stats: list[CacheStat]) -> list[CacheStat]:
     """Group a list of CacheStats by category_name and cache_name and sum byte_length"""
 
@@ -82,6 +126,132 @@ def group_stats(stats: list[CacheStat]) -> list[CacheStat]:
     return result
 
 
+class SessionMessageStat(NamedTuple):
+    """Describes the outgoing messages that sessions are waiting to send.
+
+    Only totals and maximums over all sessions are reported. The metrics
+    endpoint isn't authenticated, so it must not reveal session IDs.
+
+    Properties
+    ----------
+    queued_messages : int
+        The number of messages waiting to be sent to any session's client.
+    max_queue_depth : int
+        The largest number of messages waiting to be sent to a single
+        session's client.
+    max_queue_latency_seconds : float
+        How long the oldest waiting message has been queued, or 0 if no
+        message is waiting.
+    backpressured_sessions : int
+        The number of sessions whose messages are held back because their
+        client hasn't sent the previous ones yet.
+    """
+
+    queued_messages: int
+    max_queue_depth: int
+    max_queue_latency_seconds: float
+    backpressured_sessions: int
+
+    def to_queued_messages_metric_str(self) -> str:
+        return f"session_message_queued_messages {self.queued_messages}"
+
+    def to_max_queue_depth_metric_str(self) -> str:
+        return f"session_message_max_queue_depth {self.max_queue_depth}"
+
+    def to_max_queue_latency_metric_str(self) -> str:
+        return f"session_message_max_queue_latency_seconds {self.max_queue_latency_seconds}"
+
+    def to_backpressured_sessions_metric_str(self) -> str:
+        return f"session_message_backpressured_sessions {self.backpressured_sessions}"
+
+    def marshall_queued_messages_metric_proto(self, metric: MetricProto) -> None:
+        """Fill an OpenMetrics `Metric` protobuf object with the number of
+        queued messages."""
+        metric_point = metric.metric_points.add()
+        metric_point.gauge_value.int_value = self.queued_messages
+
+    def marshall_max_queue_depth_metric_proto(self, metric: MetricProto) -> None:
+        """Fill an OpenMetrics `Metric` protobuf object with the largest queue
+        depth."""
+        metric_point = metric.metric_points.add()
+        metric_point.gauge_value.int_value = self.max_queue_depth
+
+    def marshall_max_queue_latency_metric_proto(self, metric: MetricProto) -> None:
+        """Fill an OpenMetrics `Metric` protobuf object with the largest queue
+        latency."""
+        metric_point = metric.metric_points.add()
+        metric_point.gauge_value.double_value = self.max_queue_latency_seconds
+
+    def marshall_backpressured_sessions_metric_proto(self, metric: MetricProto) -> None:
+        """Fill an OpenMetrics `Metric` protobuf object with the number of
+        backpressured sessions."""
+        metric_point = metric.metric_points.add()
+        metric_point.gauge_value.int_value = self.backpressured_sessions
+
+
+class MediaFileStat(NamedTuple):
+    """Describes the files that a MediaFileManager keeps track of.
+
+    Properties
+    ----------
+    referenced_files : int
+        The number of files that are used by at least one session.
+    orphaned_files : int
+        The number of files that are no longer used by any session, but
+        haven't been removed yet.
+    references : int
+        The total number of places in sessions' apps that use a file.
+    lock_wait_seconds : float
+        The total time threads waited for the manager's locks since the
+        server started.
+    """
+
+    referenced_files: int
+    orphaned_files: int
+    references: int
+    lock_wait_seconds: float
+
+    def to_file_count_metric_strs(self) -> list[str]:
+        return [
+            f'media_files{{state="referenced"}} {self.referenced_files}',
+            f'media_files{{state="orphaned"}} {self.orphaned_files}',
+        ]
+
+    def to_reference_metric_str(self) -> str:
+        return f"media_file_references {self.references}"
+
+    def to_lock_wait_metric_str(self) -> str:
+        return f"media_file_lock_wait_seconds_total {self.lock_wait_seconds}"
+
+    def marshall_file_count_metric_protos(
+        self, metric_family: MetricFamilyProto
+    ) -> None:
+        """Add the referenced and orphaned file counts to an OpenMetrics
+        `MetricFamily` protobuf object."""
+        for state, count in (
+            ("referenced", self.referenced_files),
+            ("orphaned", self.orphaned_files),
+        ):
+            metric = metric_family.metrics.add()
+            label = metric.labels.add()
+            label.name = "state"
+            label.value = state
+            metric_point = metric.metric_points.add()
+            metric_point.gauge_value.int_value = count
+
+    def marshall_reference_metric_proto(self, metric: MetricProto) -> None:
+        """Fill an OpenMetrics `Metric` protobuf object with the reference
+        count."""
+        metric_point = metric.metric_points.add()
+        metric_point.gauge_value.int_value = self.references
+
+    def marshall_lock_wait_metric_proto(self, metric: MetricProto) -> None:
+        """Fill an OpenMetrics `Metric` protobuf object with the lock wait
+        time."""
+        metric_point = metric.metric_points.add()
+        metric_point.counter_value.double_value = self.lock_wait_seconds
+
+
 @runtime_checkable
 class CacheStatsProvider(Protocol):
     @abstractmethod
@@ -89,9 +259,33 @@ class CacheStatsProvider(Protocol):
         raise NotImplementedError
 
 
+@runtime_checkable
+class CacheEventStatsProvider(Protocol):
+    @abstractmethod
+    def get_cache_event_stats(self) -> list[CacheEventStat]:
+        raise NotImplementedError
+
+
+@runtime_checkable
+class SessionMessageStatsProvider(Protocol):
+    @abstractmethod
+    def get_session_message_stats(self) -> list[SessionMessageStat]:
+        raise NotImplementedError
+
+
+@runtime_checkable
+class MediaFileStatsProvider(Protocol):
+    @abstractmethod
+    def get_media_file_stats(self) -> list[MediaFileStat]:
+        raise NotImplementedError
+
+
 class StatsManager:
     def __init__(self):
         self._cache_stats_providers: list[CacheStatsProvider] = []
+        self._cache_event_stats_providers: list[CacheEventStatsProvider] = []
+        self._session_message_stats_providers: list[SessionMessageStatsProvider] = []
+        self._media_file_stats_providers: list[MediaFileStatsProvider] = []
 
     def register_provider(self, provider: CacheStatsProvider) -> None:
         """Register a CacheStatsProvider with the manager.
@@ -107,3 +301,53 @@ class StatsManager:
             all_stats.extend(provider.get_stats())
 
         return all_stats
+
+    def register_cache_event_provider(self, provider: CacheEventStatsProvider) -> None:
+        """Register a CacheEventStatsProvider with the manager.
+        This function is not thread-safe. Call it immediately after
+        creation.
+        """
+        self._cache_event_stats_providers.append(provider)
+
+    def get_cache_event_stats(self) -> list[CacheEventStat]:
+        """Return a list containing all cache event stats from each
+        registered provider."""
+        all_stats: list[CacheEventStat] = []
+        for provider in self._cache_event_stats_providers:
+            all_stats.extend(provider.get_cache_event_stats())
+
+        return all_stats
+
+    def register_session_message_provider(
+        self, provider: SessionMessageStatsProvider
+    ) -> None:
+        """Register a SessionMessageStatsProvider with the manager.
+        This function is not thread-safe. Call it immediately after
+        creation.
+        """
+        self._session_message_stats_providers.append(provider)
+
+    def get_session_message_stats(self) -> list[SessionMessageStat]:
+        """Return a list containing all session message stats from each
+        registered provider."""
+        all_stats: list[SessionMessageStat] = []
+        for provider in self._session_message_stats_providers:
+            all_stats.extend(provider.get_session_message_stats())
+
+        return all_stats
+
+    def register_media_file_provider(self, provider: MediaFileStatsProvider) -> None:
+        """Register a MediaFileStatsProvider with the manager.
+        This function is not thread-safe. Call it immediately after
+        creation.
+        """
+        self._media_file_stats_providers.append(provider)
+
+    def get_media_file_stats(self) -> list[MediaFileStat]:
+        """Return a list containing all media file stats from each
+        registered provider."""
+        all_stats: list[MediaFileStat] = []
+        for provider in self._media_file_stats_providers:
+            all_stats.extend(provider.get_media_file_stats())
+
+        return all_stats
@@ -16,24 +16,31 @@ from __future__ import annotations
 
 import io
 from abc import abstractmethod
-from typing import TYPE_CHECKING, NamedTuple, Protocol
+from typing import TYPE_CHECKING, Any, NamedTuple, Protocol
 
 from streamlit import util
 from streamlit.runtime.stats import CacheStatsProvider
 
 if TYPE_CHECKING:
+    import mmap
     from collections.abc import Sequence
 
+    from _typeshed import ReadableBuffer, WriteableBuffer
+
     from streamlit.proto.Common_pb2 import FileURLs as FileURLsProto
 
 
 class UploadedFileRec(NamedTuple):
-    """Metadata and raw bytes for an uploaded file. Immutable."""
+    """Metadata and raw bytes for an uploaded file. Immutable.
+
+    Large uploads may be kept in a temporary file, in which case `data` is
+    a read-only memory map of that file.
+    """
 
     file_id: str
     name: str
     type: str
-    data: bytes
+    data: bytes | mmap.mmap
 
 
 class UploadFileUrlInfo(NamedTuple):
@@ -61,21 +68,164 @@ class UploadedFile(io.BytesIO):
     """A mutable uploaded file.
 
     This class extends BytesIO, which has copy-on-write semantics when
-    initialized with `bytes`.
+    initialized with `bytes`. Uploads that are kept in a temporary file are
+    read directly from its memory map, and are only copied into memory when
+    the file is modified (or its writable buffer is requested).
     """
 
+    # The memory-mapped content that hasn't been copied into the BytesIO yet,
+    # and the position in it. They're slots, so that they're neither part of
+    # the repr nor pickled.
+    __slots__ = ("_unloaded_data", "_unloaded_pos")
+
     def __init__(self, record: UploadedFileRec, file_urls: FileURLsProto):
         # BytesIO's copy-on-write semantics doesn't seem to be mentioned in
         # the Python docs - possibly because it's a CPython-only optimization
         # and not guaranteed to be in other Python runtimes. But it's detailed
         # here: https://hg.python.org/cpython/rev/79a5fbe2c78f
-        super().__init__(record.data)
+        if isinstance(record.data, bytes):
+            super().__init__(record.data)
+            self._unloaded_data = None
+        else:
+            super().__init__()
+            self._unloaded_data = record.data
+        self._unloaded_pos = 0
         self.file_id = record.file_id
         self.name = record.name
         self.type = record.type
         self.size = len(record.data)
         self._file_urls = file_urls
 
+    def _get_unloaded_data(self) -> mmap.mmap | None:
+        """Return the memory-mapped content, if it wasn't copied into the
+        BytesIO yet.
+
+        Closed files return None, so that BytesIO raises the usual error.
+        """
+        # Unpickled files don't have the slot set.
+        data: mmap.mmap | None = getattr(self, "_unloaded_data", None)
+        if data is None or self.closed:
+            return None
+        return data
+
+    def _load(self) -> None:
+        data = self._get_unloaded_data()
+        if data is not None:
+            self._unloaded_data = None
+            super().write(data)
+            super().seek(self._unloaded_pos)
+
+    def _read_unloaded(self, data: mmap.mmap, size: int | None) -> bytes:
+        start = min(self._unloaded_pos, len(data))
+        end = len(data) if size is None or size < 0 else min(start + size, len(data))
+        self._unloaded_pos = max(self._unloaded_pos, end)
+        return data[start:end]
+
+    # BytesIO is implemented in C, so each of its methods that access the
+    # content has to read the memory map, or load it first.
+    def read(self, size: int | None = -1, /) -> bytes:
+        data = self._get_unloaded_data()
+        if data is not None:
+            return self._read_unloaded(data, size)
+        return super().read(size)
+
+    def read1(self, size: int | None = -1, /) -> bytes:
+        return self.read(size)
+
+    def readinto(self, buffer: WriteableBuffer, /) -> int:
+        data = self._get_unloaded_data()
+        if data is not None:
+            with memoryview(buffer) as view, view.cast("B") as byte_view:
+                chunk = self._read_unloaded(data, len(byte_view))
+                byte_view[: len(chunk)] = chunk
+            return len(chunk)
+        return super().readinto(buffer)
+
+    def readline(self, size: int | None = -1, /) -> bytes:
+        data = self._get_unloaded_data()
+        if data is not None:
+            end = data.find(b"\n", self._unloaded_pos)
+            line_size = (
+                len(data) - self._unloaded_pos
+                if end < 0
+                else end + 1 - self._unloaded_pos
+            )
+            if size is not None and size >= 0:
+                line_size = min(line_size, size)
+            return self._read_unloaded(data, line_size)
+        return super().readline(size)
+
+    def readlines(self, hint: int | None = -1, /) -> list[bytes]:
+        if self._get_unloaded_data() is None:
+            return super().readlines(hint)
+
+        lines = []
+        total_size = 0
+        while line := self.readline():
+            lines.append(line)
+            total_size += len(line)
+            if hint is not None and 0 < hint <= total_size:
+                break
+        return lines
+
+    def __next__(self) -> bytes:
+        if self._get_unloaded_data() is None:
+            return super().__next__()
+
+        line = self.readline()
+        if not line:
+            raise StopIteration
+        return line
+
+    def write(self, buffer: ReadableBuffer, /) -> int:
+        self._load()
+        return super().write(buffer)
+
+    def seek(self, offset: int, whence: int = 0, /) -> int:
+        data = self._get_unloaded_data()
+        if data is None:
+            return super().seek(offset, whence)
+
+        if whence == io.SEEK_SET:
+            if offset < 0:
+                raise ValueError(f"negative seek value {offset}")
+            self._unloaded_pos = offset
+        elif whence == io.SEEK_CUR:
+            self._unloaded_pos = max(0, self._unloaded_pos + offset)
+        elif whence == io.SEEK_END:
+            self._unloaded_pos = max(0, len(data) + offset)
+        else:
+            raise ValueError(f"invalid whence ({whence}, should be 0, 1 or 2)")
+        return self._unloaded_pos
+
+    def tell(self) -> int:
+        if self._get_unloaded_data() is None:
+            return super().tell()
+        return self._unloaded_pos
+
+    def truncate(self, size: int | None = None, /) -> int:
+        self._load()
+        return super().truncate(size)
+
+    def getvalue(self) -> bytes:
+        data = self._get_unloaded_data()
+        if data is not None:
+            return data[:]
+        return super().getvalue()
+
+    def getbuffer(self) -> memoryview:
+        # The buffer is writable, so the content has to be copied.
+        self._load()
+        return super().getbuffer()
+
+    def __getstate__(self) -> Any:
+        data = self._get_unloaded_data()
+        if data is not None:
+            # The same state as BytesIO's, without copying the content into
+            # this file.
+            return (data[:], self._unloaded_pos, self.__dict__.copy())
+        return super().__getstate__()  # type: ignore[misc]
+
     def __eq__(self, other: object) -> bool:
         if not isinstance(other, UploadedFile):
             return NotImplemented
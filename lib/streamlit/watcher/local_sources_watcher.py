@@ -16,8 +16,10 @@ from __future__ import annotations
 
 import os
 import sys
+import threading
+from importlib.abc import MetaPathFinder
 from pathlib import Path
-from typing import TYPE_CHECKING, Any, Callable, Final, NamedTuple
+from typing import TYPE_CHECKING, Any, Callable, ClassVar, Final, NamedTuple
 
 from streamlit import config, file_util
 from streamlit.logger import get_logger
@@ -28,6 +30,8 @@ from streamlit.watcher.path_watcher import (
 )
 
 if TYPE_CHECKING:
+    from collections.abc import Sequence
+    from importlib.machinery import ModuleSpec
     from types import ModuleType
 
     from streamlit.runtime.pages_manager import PagesManager
@@ -46,20 +50,24 @@ PathWatcher = None
 
 
 class LocalSourcesWatcher:
+    """Watches the source files of a session's app: its page scripts, and the
+    local modules that the app imported.
+
+    Page scripts are watched for each session, since st.navigation lets
+    sessions have different pages. Modules are watched by a
+    _SharedModuleWatcher that all sessions of the app subscribe to.
+    """
+
     def __init__(self, pages_manager: PagesManager):
         self._pages_manager = pages_manager
         self._main_script_path = os.path.abspath(self._pages_manager.main_script_path)
-        self._script_folder = os.path.dirname(self._main_script_path)
         self._on_file_changed: list[Callable[[str], None]] = []
         self._is_closed = False
-        self._cached_sys_modules: set[str] = set()
 
-        # Blacklist for folders that should not be watched
-        self._folder_black_list = FolderBlackList(
-            config.get_option("server.folderWatchBlacklist")
+        self._module_watcher = _SharedModuleWatcher.subscribe(
+            self._main_script_path, self
         )
-
-        self._watched_modules: dict[str, WatchedModule] = {}
+        self._page_watchers: dict[str, Any] = {}
         self._watched_pages: set[str] = set()
 
         self.update_watched_pages()
@@ -74,17 +82,14 @@ class LocalSourcesWatcher:
 
             new_pages_paths.add(page_info["script_path"])
             if page_info["script_path"] not in self._watched_pages:
-                self._register_watcher(
-                    page_info["script_path"],
-                    module_name=None,
-                )
+                self._register_page_watcher(page_info["script_path"])
 
         for old_page_path in old_page_paths:
             # Only remove pages that are no longer valid files
             if old_page_path not in new_pages_paths and not os.path.isfile(
                 old_page_path
             ):
-                self._deregister_watcher(old_page_path)
+                self._deregister_page_watcher(old_page_path)
                 self._watched_pages.remove(old_page_path)
 
         self._watched_pages = self._watched_pages.union(new_pages_paths)
@@ -93,89 +98,217 @@ class LocalSourcesWatcher:
         self._on_file_changed.append(cb)
 
     def on_file_changed(self, filepath):
-        if filepath not in self._watched_modules:
+        if filepath not in self._page_watchers and not self._module_watcher.is_watched(
+            filepath
+        ):
             _LOGGER.error("Received event for non-watched file: %s", filepath)
             return
 
-        # Workaround:
-        # Delete all watched modules so we can guarantee changes to the
-        # updated module are reflected on reload.
-        #
-        # In principle, for reloading a given module, we only need to unload
-        # the module itself and all of the modules which import it (directly
-        # or indirectly) such that when we exec the application code, the
-        # changes are reloaded and reflected in the running application.
-        #
-        # However, determining all import paths for a given loaded module is
-        # non-trivial, and so as a workaround we simply unload all watched
-        # modules.
-        for wm in self._watched_modules.values():
-            if wm.module_name is not None and wm.module_name in sys.modules:
-                del sys.modules[wm.module_name]
+        self._module_watcher.unload_modules()
+        self._notify_file_changed(filepath)
 
+    def _on_module_file_changed(self, filepath: str) -> None:
+        """Called by the _SharedModuleWatcher after it unloaded the modules."""
+        if filepath in self._page_watchers:
+            # The page's own watcher reports this change.
+            return
+        self._notify_file_changed(filepath)
+
+    def _notify_file_changed(self, filepath: str) -> None:
         for cb in self._on_file_changed:
             cb(filepath)
 
     def close(self):
-        for wm in self._watched_modules.values():
-            wm.watcher.close()
-        self._watched_modules = {}
+        for watcher in self._page_watchers.values():
+            watcher.close()
+        self._page_watchers = {}
         self._watched_pages = set()
+        if not self._is_closed:
+            self._module_watcher.unsubscribe(self)
         self._is_closed = True
 
-    def _register_watcher(self, filepath, module_name):
-        global PathWatcher
-        if PathWatcher is None:
-            PathWatcher = get_default_path_watcher_class()
+    def _register_page_watcher(self, filepath: str) -> None:
+        watcher = _create_path_watcher(filepath, self.on_file_changed)
+        if watcher is not None:
+            self._page_watchers[filepath] = watcher
 
-        if PathWatcher is NoOpPathWatcher:
+    def _deregister_page_watcher(self, filepath: str) -> None:
+        if filepath not in self._page_watchers:
             return
 
-        try:
-            wm = WatchedModule(
-                watcher=PathWatcher(filepath, self.on_file_changed),
-                module_name=module_name,
-            )
-        except PermissionError:
-            # If you don't have permission to read this file, don't even add it
-            # to watchers.
+        if filepath == self._main_script_path:
             return
 
-        self._watched_modules[filepath] = wm
+        self._page_watchers.pop(filepath).close()
 
-    def _deregister_watcher(self, filepath):
-        if filepath not in self._watched_modules:
+    def update_watched_modules(self):
+        if self._is_closed:
             return
 
-        if filepath == self._main_script_path:
+        self._module_watcher.update_watched_modules()
+
+
+class _ImportCounter(MetaPathFinder):
+    """Counts the imports that go through the import system.
+
+    It doesn't find any modules itself. It lets _SharedModuleWatcher tell
+    cheaply that no modules were imported since it last looked at sys.modules.
+    """
+
+    def __init__(self) -> None:
+        self.import_count = 0
+
+    def find_spec(
+        self,
+        fullname: str,
+        path: Sequence[str] | None,
+        target: ModuleType | None = None,
+    ) -> ModuleSpec | None:
+        self.import_count += 1
+        return None
+
+
+_import_counter: _ImportCounter | None = None
+
+
+def _get_import_count() -> int:
+    """Return the number of imports since the first call of this function."""
+    global _import_counter
+    if _import_counter is None:
+        _import_counter = _ImportCounter()
+        sys.meta_path.insert(0, _import_counter)
+    return _import_counter.import_count
+
+
+class _SharedModuleWatcher:
+    """Watches the source files of the modules that an app imported, for all
+    sessions of the app.
+
+    Each module is looked at once, when it first shows up in sys.modules,
+    rather than once per session. The watcher stops watching all files when
+    the last session unsubscribes.
+    """
+
+    _instances: ClassVar[dict[str, _SharedModuleWatcher]] = {}
+    _instances_lock: ClassVar = threading.Lock()
+
+    @classmethod
+    def subscribe(
+        cls, main_script_path: str, subscriber: LocalSourcesWatcher
+    ) -> _SharedModuleWatcher:
+        """Return the _SharedModuleWatcher of the given app, creating it if
+        necessary, and notify subscriber of the changes of its files."""
+        with cls._instances_lock:
+            module_watcher = cls._instances.get(main_script_path)
+            if module_watcher is None:
+                module_watcher = cls(main_script_path)
+                cls._instances[main_script_path] = module_watcher
+            module_watcher._subscribers.append(subscriber)
+            return module_watcher
+
+    def __init__(self, main_script_path: str):
+        self._main_script_path = main_script_path
+        self._script_folder = os.path.dirname(main_script_path)
+        self._subscribers: list[LocalSourcesWatcher] = []
+
+        # Blacklist for folders that should not be watched
+        self._folder_black_list = FolderBlackList(
+            config.get_option("server.folderWatchBlacklist")
+        )
+
+        # Guards _watched_modules, which the file watcher's thread reads.
+        self._lock = threading.Lock()
+        self._watched_modules: dict[str, WatchedModule] = {}
+        self._known_module_names: set[str] = set()
+        # The import count and the size of sys.modules when the modules were
+        # last looked at.
+        self._last_update: tuple[int, int] | None = None
+
+    def unsubscribe(self, subscriber: LocalSourcesWatcher) -> None:
+        with self._instances_lock:
+            self._subscribers.remove(subscriber)
+            if self._subscribers:
+                return
+            if self._instances.get(self._main_script_path) is self:
+                del self._instances[self._main_script_path]
+
+        with self._lock:
+            for wm in self._watched_modules.values():
+                wm.watcher.close()
+            self._watched_modules = {}
+
+    def is_watched(self, filepath: str) -> bool:
+        return filepath in self._watched_modules
+
+    def update_watched_modules(self) -> None:
+        """Watch the files of the modules that were imported since the last
+        call."""
+        # A module can also be added to sys.modules without being imported,
+        # which changes its size.
+        update = (_get_import_count(), len(sys.modules))
+        if update == self._last_update:
             return
+        self._last_update = update
+
+        modules = dict(sys.modules)
+        new_module_names = modules.keys() - self._known_module_names
+        if not new_module_names:
+            return
+        self._known_module_names.update(new_module_names)
+
+        modules_paths = {
+            name: self._exclude_blacklisted_paths(get_module_paths(modules[name]))
+            for name in new_module_names
+        }
+        self._register_necessary_watchers(modules_paths)
+
+    def unload_modules(self) -> None:
+        """Unload all watched modules, so that the next script run imports
+        their current source."""
+        # Workaround:
+        # Delete all watched modules so we can guarantee changes to the
+        # updated module are reflected on reload.
+        #
+        # In principle, for reloading a given module, we only need to unload
+        # the module itself and all of the modules which import it (directly
+        # or indirectly) such that when we exec the application code, the
+        # changes are reloaded and reflected in the running application.
+        #
+        # However, determining all import paths for a given loaded module is
+        # non-trivial, and so as a workaround we simply unload all watched
+        # modules.
+        with self._lock:
+            watched_modules = list(self._watched_modules.values())
+        for wm in watched_modules:
+            if wm.module_name is not None and wm.module_name in sys.modules:
+                del sys.modules[wm.module_name]
 
-        wm = self._watched_modules[filepath]
-        wm.watcher.close()
-        del self._watched_modules[filepath]
+    def on_file_changed(self, filepath: str) -> None:
+        if not self.is_watched(filepath):
+            _LOGGER.error("Received event for non-watched file: %s", filepath)
+            return
 
-    def _file_is_new(self, filepath):
-        return filepath not in self._watched_modules
+        self.unload_modules()
+        with self._instances_lock:
+            subscribers = list(self._subscribers)
+        for subscriber in subscribers:
+            subscriber._on_module_file_changed(filepath)
+
+    def _register_watcher(self, filepath: str, module_name: str) -> None:
+        watcher = _create_path_watcher(filepath, self.on_file_changed)
+        if watcher is not None:
+            with self._lock:
+                self._watched_modules[filepath] = WatchedModule(
+                    watcher=watcher, module_name=module_name
+                )
 
     def _file_should_be_watched(self, filepath):
         # Using short circuiting for performance.
-        return self._file_is_new(filepath) and (
+        return filepath not in self._watched_modules and (
             file_util.file_is_in_folder_glob(filepath, self._script_folder)
             or file_util.file_in_pythonpath(filepath)
         )
 
-    def update_watched_modules(self):
-        if self._is_closed:
-            return
-
-        if set(sys.modules) != self._cached_sys_modules:
-            modules_paths = {
-                name: self._exclude_blacklisted_paths(get_module_paths(module))
-                for name, module in dict(sys.modules).items()
-            }
-            self._cached_sys_modules = set(sys.modules)
-            self._register_necessary_watchers(modules_paths)
-
     def _register_necessary_watchers(self, module_paths: dict[str, set[str]]) -> None:
         for name, paths in module_paths.items():
             for path in paths:
@@ -186,6 +319,26 @@ class LocalSourcesWatcher:
         return {p for p in paths if not self._folder_black_list.is_blacklisted(p)}
 
 
+def _create_path_watcher(
+    filepath: str, on_file_changed: Callable[[str], None]
+) -> Any | None:
+    """Return a PathWatcher for the given file, or None if files aren't
+    watched or the file can't be read."""
+    global PathWatcher
+    if PathWatcher is None:
+        PathWatcher = get_default_path_watcher_class()
+
+    if PathWatcher is NoOpPathWatcher:
+        return None
+
+    try:
+        return PathWatcher(filepath, on_file_changed)
+    except PermissionError:
+        # If you don't have permission to read this file, don't even add it
+        # to watchers.
+        return None
+
+
 def get_module_paths(module: ModuleType) -> set[str]:
     paths_extractors = [
         # https://docs.python.org/3/reference/datamodel.html
@@ -12,36 +12,107 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
-"""A class that watches a given path via polling."""
+"""A class that watches a given path via polling.
+
+How these classes work together
+-------------------------------
+
+- PollingPathWatcher : each instance of this watches a single file or
+  directory. It doesn't poll by itself, but registers with _PollingScheduler.
+
+- _PollingScheduler : singleton that polls all watched paths on a single
+  thread. Each scan lists every folder that contains due paths once, and
+  only hashes a path whose size or modification time changed.
+"""
 
 from __future__ import annotations
 
+import os
+import threading
 import time
-from concurrent.futures import ThreadPoolExecutor
-from typing import Callable, Final
+from collections import defaultdict
+from typing import TYPE_CHECKING, Callable, Final, Optional, cast
+
+from typing_extensions import Self, TypeAlias
 
 from streamlit.logger import get_logger
 from streamlit.util import repr_
 from streamlit.watcher import util
 
+if TYPE_CHECKING:
+    from collections.abc import Iterable
+
 _LOGGER: Final = get_logger(__name__)
 
-_MAX_WORKERS: Final = 4
 _POLLING_PERIOD_SECS: Final = 0.2
 
+# Paths that didn't change for a while are polled less often, up to this
+# period. Each unchanged poll multiplies a path's period by the backoff
+# factor, and a change resets it to _POLLING_PERIOD_SECS.
+_MAX_POLLING_PERIOD_SECS: Final = 1.0
+_POLLING_BACKOFF_FACTOR: Final = 1.25
+
+# The size and modification time of a path, or None if it doesn't exist.
+_PathStat: TypeAlias = Optional[tuple[float, int]]
+
+
+def _stat_path(path: str) -> _PathStat:
+    """Return the size and modification time of a single path."""
+    try:
+        stat = os.stat(path)
+    except OSError:
+        return None
+    return stat.st_mtime, stat.st_size
+
+
+def _stat_paths(paths: Iterable[str]) -> dict[str, _PathStat]:
+    """Return the size and modification time of the given absolute paths."""
+    if os.name != "nt":
+        return {path: _stat_path(path) for path in paths}
+    return _scan_paths(paths)
+
+
+def _scan_paths(paths: Iterable[str]) -> dict[str, _PathStat]:
+    """Like _stat_paths, but list each folder of the paths once.
+
+    On Windows, os.DirEntry.stat() returns the data from the folder listing,
+    so this makes one system call per folder instead of one per path, which
+    is much faster on network file systems. On other platforms,
+    DirEntry.stat() still makes a system call per entry.
+    """
+    paths_by_folder: dict[str, dict[str, str]] = defaultdict(dict)
+    for path in paths:
+        folder, name = os.path.split(path)
+        paths_by_folder[folder][name] = path
+
+    stats: dict[str, _PathStat] = {}
+    for folder, folder_paths in paths_by_folder.items():
+        try:
+            with os.scandir(folder) as entries:
+                for entry in entries:
+                    path = folder_paths.get(entry.name)
+                    if path is None:
+                        continue
+                    try:
+                        stat = entry.stat()
+                    except OSError:
+                        # The file was deleted since the folder was listed.
+                        continue
+                    stats[path] = (stat.st_mtime, stat.st_size)
+        except OSError:
+            # The folder doesn't exist (anymore), or can't be read.
+            pass
+
+    return {path: stats.get(path) for path in paths}
+
 
 class PollingPathWatcher:
     """Watches a path on disk via a polling loop."""
 
-    _executor = ThreadPoolExecutor(max_workers=_MAX_WORKERS)
-
     @staticmethod
     def close_all() -> None:
-        """Close top-level watcher object.
-
-        This is a no-op, and exists for interface parity with
-        EventBasedPathWatcher.
-        """
+        """Close the _PollingScheduler singleton."""
+        _PollingScheduler.get_singleton().close()
         _LOGGER.debug("Watcher closed")
 
     def __init__(
@@ -55,53 +126,51 @@ class PollingPathWatcher:
         """Constructor.
 
         You do not need to retain a reference to a PollingPathWatcher to
-        prevent it from being garbage collected. (The global _executor object
-        retains references to all active instances.)
+        prevent it from being garbage collected. (The _PollingScheduler
+        singleton retains references to all active instances.)
         """
         # TODO(vdonato): Modernize this by switching to pathlib.
         self._path = path
+        # The path that's polled. Unlike self._path, it's normalized, so that
+        # its folder and name can be looked up with os.scandir.
+        self._abs_path = os.path.abspath(path)
         self._on_changed = on_changed
 
         self._glob_pattern = glob_pattern
         self._allow_nonexistent = allow_nonexistent
 
-        self._active = True
-
-        self._modification_time = util.path_modification_time(
-            self._path, self._allow_nonexistent
-        )
+        self._stat = _stat_path(self._abs_path)
         self._md5 = util.calc_md5_with_blocking_retries(
             self._path,
             glob_pattern=self._glob_pattern,
             allow_nonexistent=self._allow_nonexistent,
         )
-        self._schedule()
+
+        self._polling_period = _POLLING_PERIOD_SECS
+        self._next_poll_time = time.monotonic() + self._polling_period
+        _PollingScheduler.get_singleton().watch(self)
 
     def __repr__(self) -> str:
         return repr_(self)
 
-    def _schedule(self) -> None:
-        def task():
-            time.sleep(_POLLING_PERIOD_SECS)
-            self._check_if_path_changed()
-
-        PollingPathWatcher._executor.submit(task)
+    def _poll(self, stat: _PathStat, now: float) -> None:
+        """Check whether the path changed, given its current stat.
 
-    def _check_if_path_changed(self) -> None:
-        if not self._active:
-            # Don't call self._schedule()
+        This is called by the _PollingScheduler when the path is due.
+        """
+        if stat is None and not self._allow_nonexistent:
+            # The file may be in the middle of being replaced by an editor.
+            # It's checked again on the next poll.
+            self._schedule_next_poll(now, changed=False)
             return
 
-        modification_time = util.path_modification_time(
-            self._path, self._allow_nonexistent
-        )
-        # We add modification_time != 0.0 check since on some file systems (s3fs/fuse)
-        # modification_time is always 0.0 because of file system limitations.
-        if modification_time != 0.0 and modification_time <= self._modification_time:
-            self._schedule()
+        # We check that the modification time isn't 0.0, since on some file
+        # systems (s3fs/fuse) it's always 0.0 because of file system limitations.
+        if stat == self._stat and (stat is None or stat[0] != 0.0):
+            self._schedule_next_poll(now, changed=False)
             return
 
-        self._modification_time = modification_time
+        self._stat = stat
 
         md5 = util.calc_md5_with_blocking_retries(
             self._path,
@@ -109,16 +178,147 @@ class PollingPathWatcher:
             allow_nonexistent=self._allow_nonexistent,
         )
         if md5 == self._md5:
-            self._schedule()
+            self._schedule_next_poll(now, changed=False)
             return
 
         self._md5 = md5
+        self._schedule_next_poll(now, changed=True)
 
         _LOGGER.debug("Change detected: %s", self._path)
         self._on_changed(self._path)
 
-        self._schedule()
+    def _schedule_next_poll(self, now: float, *, changed: bool) -> None:
+        if changed:
+            self._polling_period = _POLLING_PERIOD_SECS
+        else:
+            self._polling_period = min(
+                self._polling_period * _POLLING_BACKOFF_FACTOR,
+                _MAX_POLLING_PERIOD_SECS,
+            )
+        self._next_poll_time = now + self._polling_period
 
     def close(self) -> None:
         """Stop watching the file system."""
-        self._active = False
+        _PollingScheduler.get_singleton().stop_watching(self)
+
+
+class _PollingScheduler:
+    """Polls the paths of all PollingPathWatchers on a single thread."""
+
+    _singleton: _PollingScheduler | None = None
+
+    @classmethod
+    def get_singleton(cls) -> _PollingScheduler:
+        """Return the singleton _PollingScheduler object.
+
+        Instantiates one if necessary.
+        """
+        if cls._singleton is None:
+            _PollingScheduler()
+
+        return cast("_PollingScheduler", _PollingScheduler._singleton)
+
+    # Don't allow constructor to be called more than once.
+    def __new__(cls) -> Self:
+        """Constructor."""
+        if _PollingScheduler._singleton is not None:
+            raise RuntimeError("Use .get_singleton() instead")
+        return super().__new__(cls)
+
+    def __init__(self) -> None:
+        """Constructor."""
+        _PollingScheduler._singleton = self
+
+        self._watchers: set[PollingPathWatcher] = set()
+        # Used for mutation of _watchers, which the polling thread iterates.
+        self._lock = threading.Lock()
+        self._thread: threading.Thread | None = None
+        self._reported_slow_scan = False
+
+        # The duration of the last scan, and the number of paths it polled.
+        self.last_scan_secs = 0.0
+        self.last_scan_path_count = 0
+
+    def __repr__(self) -> str:
+        return repr_(self)
+
+    def watch(self, watcher: PollingPathWatcher) -> None:
+        with self._lock:
+            self._watchers.add(watcher)
+        self._start_thread()
+
+    def stop_watching(self, watcher: PollingPathWatcher) -> None:
+        with self._lock:
+            self._watchers.discard(watcher)
+
+    def close(self) -> None:
+        """Stop watching all paths. The polling thread exits on its next
+        iteration."""
+        with self._lock:
+            self._watchers.clear()
+
+    def _start_thread(self) -> None:
+        with self._lock:
+            if self._thread is not None:
+                return
+            self._thread = threading.Thread(
+                target=self._run, name="PollingPathWatcher", daemon=True
+            )
+        self._thread.start()
+
+    def _run(self) -> None:
+        while True:
+            time.sleep(_POLLING_PERIOD_SECS)
+            with self._lock:
+                if not self._watchers:
+                    # Nothing is watched anymore. A new thread is started
+                    # when a path is watched again.
+                    self._thread = None
+                    return
+            try:
+                self.scan(time.monotonic())
+            except Exception:
+                _LOGGER.exception("Error polling watched paths")
+
+    def scan(self, now: float) -> None:
+        """Poll the watched paths that are due at the given time."""
+        with self._lock:
+            due_watchers = [
+                watcher for watcher in self._watchers if watcher._next_poll_time <= now
+            ]
+        if not due_watchers:
+            return
+
+        start_time = time.monotonic()
+        stats = _stat_paths({watcher._abs_path for watcher in due_watchers})
+        for watcher in due_watchers:
+            with self._lock:
+                if watcher not in self._watchers:
+                    # The watcher was closed during this scan.
+                    continue
+            try:
+                watcher._poll(stats[watcher._abs_path], now)
+            except Exception:
+                _LOGGER.warning("Unable to poll %s", watcher._path, exc_info=True)
+                # Try again once the path is due again.
+                watcher._schedule_next_poll(now, changed=False)
+
+        self.last_scan_secs = time.monotonic() - start_time
+        self.last_scan_path_count = len(due_watchers)
+        if self.last_scan_secs <= _POLLING_PERIOD_SECS:
+            return
+
+        _LOGGER.debug(
+            "Polled %s paths in %.1f ms",
+            self.last_scan_path_count,
+            self.last_scan_secs * 1000,
+        )
+        if not self._reported_slow_scan:
+            self._reported_slow_scan = True
+            _LOGGER.warning(
+                "Polling %s watched paths took %.1f seconds, so changes to them are "
+                "detected late. Consider excluding folders with "
+                "server.folderWatchBlacklist, or installing watchdog.",
+                self.last_scan_path_count,
+                self.last_scan_secs,
+            )
@@ -15,20 +15,35 @@
 from __future__ import annotations
 
 import asyncio
+import contextlib
 import os
 import signal
 import sys
-from typing import Any, Final
+from typing import TYPE_CHECKING, Any, Final
 
 from streamlit import cli_util, config, env_util, file_util, net_util, secrets
 from streamlit.config import CONFIG_FILENAMES
+from streamlit.config_option import ConfigOption
 from streamlit.git_util import MIN_GIT_VERSION, GitRepo
 from streamlit.logger import get_logger
 from streamlit.watcher import report_watchdog_availability, watch_file
 from streamlit.web.server import Server, server_address_is_unix_socket, server_util
+from streamlit.web.server.server import start_listening
+from streamlit.web.worker_pool import (
+    WorkerPool,
+    get_worker_info,
+    is_worker_pool_supported,
+)
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Coroutine
 
 _LOGGER: Final = get_logger(__name__)
 
+# How often the main process of a worker pool checks if its workers are
+# alive, in seconds.
+_WORKER_POOL_CHECK_INTERVAL_SECONDS: Final = 1
+
 
 # The maximum possible total size of a static directory.
 # We agreed on these limitations for the initial release of static file sharing,
@@ -102,9 +117,11 @@ def _fix_sys_argv(main_script_path: str, args: list[str]) -> None:
 
 
 def _on_server_start(server: Server) -> None:
-    _maybe_print_old_git_warning(server.main_script_path)
-    _maybe_print_static_folder_warning(server.main_script_path)
-    _print_url(server.is_running_hello)
+    # The main process of a worker pool prints these for its workers.
+    if get_worker_info() is None:
+        _maybe_print_old_git_warning(server.main_script_path)
+        _maybe_print_static_folder_warning(server.main_script_path)
+        _print_url(server.is_running_hello)
     report_watchdog_availability()
 
     # Load secrets.toml if it exists. If the file doesn't exist, this
@@ -115,25 +132,26 @@ def _on_server_start(server: Server) -> None:
     except Exception as ex:
         _LOGGER.error("Failed to load secrets.toml file", exc_info=ex)
 
-    def maybe_open_browser():
-        if config.get_option("server.headless"):
-            # Don't open browser when in headless mode.
-            return
+    # Schedule the browser to open on the main thread.
+    asyncio.get_running_loop().call_soon(_maybe_open_browser)
 
-        if config.is_manually_set("browser.serverAddress"):
-            addr = config.get_option("browser.serverAddress")
-        elif config.is_manually_set("server.address"):
-            if server_address_is_unix_socket():
-                # Don't open browser when server address is an unix socket
-                return
-            addr = config.get_option("server.address")
-        else:
-            addr = "localhost"
 
-        cli_util.open_browser(server_util.get_url(addr))
+def _maybe_open_browser() -> None:
+    if config.get_option("server.headless"):
+        # Don't open browser when in headless mode.
+        return
 
-    # Schedule the browser to open on the main thread.
-    asyncio.get_running_loop().call_soon(maybe_open_browser)
+    if config.is_manually_set("browser.serverAddress"):
+        addr = config.get_option("browser.serverAddress")
+    elif config.is_manually_set("server.address"):
+        if server_address_is_unix_socket():
+            # Don't open browser when server address is an unix socket
+            return
+        addr = config.get_option("server.address")
+    else:
+        addr = "localhost"
+
+    cli_util.open_browser(server_util.get_url(addr))
 
 
 def _fix_pydeck_mapbox_api_warning() -> None:
@@ -309,6 +327,38 @@ def run(
     _fix_tornado_crash()
     _fix_sys_argv(main_script_path, args)
     _fix_pydeck_mapbox_api_warning()
+
+    worker_count = config.get_option("server.workerProcesses")
+    if worker_count > 1:
+        if is_worker_pool_supported():
+            _run_worker_pool(
+                main_script_path,
+                is_hello,
+                flag_options,
+                worker_count,
+                stop_immediately_for_testing=stop_immediately_for_testing,
+            )
+            return
+        _LOGGER.warning(
+            "server.workerProcesses requires os.fork, which isn't available on "
+            "this platform. Running all sessions in a single process instead."
+        )
+
+    _run_server(
+        main_script_path,
+        is_hello,
+        flag_options,
+        stop_immediately_for_testing=stop_immediately_for_testing,
+    )
+
+
+def _run_server(
+    main_script_path: str,
+    is_hello: bool,
+    flag_options: dict[str, Any],
+    *,
+    stop_immediately_for_testing: bool = False,
+) -> None:
     _install_config_watchers(flag_options)
 
     # Create the server. It won't start running yet.
@@ -332,14 +382,83 @@ def run(
         # by a debug websocket session.
         await server.stopped
 
+    _run_event_loop(run_server)
+
+
+def _run_worker_pool(
+    main_script_path: str,
+    is_hello: bool,
+    flag_options: dict[str, Any],
+    worker_count: int,
+    *,
+    stop_immediately_for_testing: bool = False,
+) -> None:
+    """Run the app's sessions in forked worker processes, and forward the
+    browser's connections to them from this process."""
+
+    def run_worker(worker_options: dict[str, Any]) -> None:
+        # Workers listen on a local port, and don't print URLs or open a
+        # browser.
+        for key, value in worker_options.items():
+            config.set_option(key, value, ConfigOption.STREAMLIT_DEFINITION)
+        # The options are also kept when the config files change.
+        worker_flag_options = {
+            **flag_options,
+            **{key.replace(".", "_"): value for key, value in worker_options.items()},
+        }
+        _run_server(main_script_path, is_hello, worker_flag_options)
+
+    # The workers are forked before this process starts any threads.
+    pool = WorkerPool(worker_count, run_worker)
+    pool.start()
+
+    async def run_proxy() -> None:
+        from streamlit.web.server.worker_proxy_handlers import (
+            create_worker_proxy_app,
+        )
+
+        start_listening(create_worker_proxy_app(pool))
+        _LOGGER.debug("Started a pool of %s workers", worker_count)
+        _maybe_print_old_git_warning(main_script_path)
+        _maybe_print_static_folder_warning(main_script_path)
+        _print_url(is_hello)
+        asyncio.get_running_loop().call_soon(_maybe_open_browser)
+
+        stopped = asyncio.Event()
+
+        def stop() -> None:
+            cli_util.print_to_cli("  Stopping...", fg="blue")
+            stopped.set()
+
+        # Worker pools are only supported where os.fork is, which also
+        # supports asyncio's signal handlers.
+        loop = asyncio.get_running_loop()
+        for signal_number in (signal.SIGTERM, signal.SIGINT, signal.SIGQUIT):
+            loop.add_signal_handler(signal_number, stop)
+
+        if stop_immediately_for_testing:
+            stopped.set()
+
+        # Stop once there are no workers left to forward connections to.
+        while not stopped.is_set() and pool.is_alive:
+            with contextlib.suppress(asyncio.TimeoutError):
+                await asyncio.wait_for(
+                    stopped.wait(), _WORKER_POOL_CHECK_INTERVAL_SECONDS
+                )
+
+        if not stopped.is_set():
+            _LOGGER.error("All worker processes have exited")
+
+    try:
+        _run_event_loop(run_proxy)
+    finally:
+        pool.stop()
+
+
+def _run_event_loop(main: Callable[[], Coroutine[Any, Any, None]]) -> None:
     # Run the server. This function will not return until the server is shut down.
     # FIX RuntimeError: asyncio.run() cannot be called from a running event loop on Python 3.10.16
     # asyncio.run(run_server())
-
-    # Define a main function to handle the event loop logic
-    async def main():
-        await run_server()
-
     try:
         # Check if we're already in an event loop
         if asyncio.get_running_loop().is_running():
@@ -14,14 +14,53 @@
 
 from __future__ import annotations
 
+import dataclasses
 from typing import TYPE_CHECKING
 
+from streamlit import config
+from streamlit.runtime.caching.storage import CacheStorageManager
 from streamlit.runtime.caching.storage.local_disk_cache_storage import (
     LocalDiskCacheStorageManager,
 )
+from streamlit.runtime.caching.storage.sharded_disk_cache_storage import (
+    ShardedDiskCacheStorageManager,
+)
+from streamlit.web.worker_pool import get_worker_info
 
 if TYPE_CHECKING:
-    from streamlit.runtime.caching.storage import CacheStorageManager
+    from streamlit.runtime.caching.storage import CacheStorage, CacheStorageContext
+
+
+class _WorkerPoolCacheStorageManager(CacheStorageManager):
+    """Shares the caches of all `@st.cache_data` functions between the
+    workers of a worker pool.
+
+    Functions with `persist="disk"` use the usual disk cache. The entries of
+    other functions are written to a folder that's removed with the pool.
+    """
+
+    def __init__(self, persist_manager: CacheStorageManager, shared_cache_dir: str):
+        self._persist_manager = persist_manager
+        max_disk_cache_size_mb = config.get_option("global.maxDiskCacheSize")
+        self._shared_manager = ShardedDiskCacheStorageManager(
+            max_size_bytes=max_disk_cache_size_mb * 1024 * 1024
+            if max_disk_cache_size_mb > 0
+            else None,
+            cache_dir=shared_cache_dir,
+        )
+
+    def create(self, context: CacheStorageContext) -> CacheStorage:
+        if context.persist == "disk":
+            return self._persist_manager.create(context)
+        return self._shared_manager.create(dataclasses.replace(context, persist="disk"))
+
+    def clear_all(self) -> None:
+        self._persist_manager.clear_all()
+        self._shared_manager.clear_all()
+
+    def check_context(self, context: CacheStorageContext) -> None:
+        if context.persist == "disk":
+            self._persist_manager.check_context(context)
 
 
 def create_default_cache_storage_manager() -> CacheStorageManager:
@@ -35,4 +74,18 @@ def create_default_cache_storage_manager() -> CacheStorageManager:
         The cache storage manager.
 
     """
-    return LocalDiskCacheStorageManager()
+    max_disk_cache_size_mb = config.get_option("global.maxDiskCacheSize")
+    persist_manager: CacheStorageManager
+    if max_disk_cache_size_mb > 0:
+        persist_manager = ShardedDiskCacheStorageManager(
+            max_size_bytes=max_disk_cache_size_mb * 1024 * 1024
+        )
+    else:
+        persist_manager = LocalDiskCacheStorageManager()
+
+    worker_info = get_worker_info()
+    if worker_info is not None:
+        return _WorkerPoolCacheStorageManager(
+            persist_manager, worker_info.shared_cache_dir
+        )
+    return persist_manager
@@ -299,6 +299,99 @@ def cache_clear():
     caching.cache_resource.clear()
 
 
+@cache.command("warm")
+@configurator_options
+@click.argument("target", required=True, envvar="STREAMLIT_RUN_TARGET")
+@click.argument("pages", nargs=-1)
+def cache_warm(target: str, pages: tuple[str, ...], **kwargs):
+    """Compile an app's scripts into the bytecode cache.
+
+    Compiles the main script TARGET, the scripts in its pages folder, and any
+    other PAGES, so that servers that share `runner.bytecodeCachePath` don't
+    need to compile them when they're first used. The pages of st.navigation
+    can't be found without running the app, so they need to be listed in
+    PAGES, with the same paths as in the app (relative to TARGET's folder).
+    """
+    from pathlib import Path
+
+    from streamlit.runtime.scriptrunner.script_cache import ScriptCache
+
+    bootstrap.load_config_options(flag_options=kwargs)
+    if not _config.get_option("runner.bytecodeCachePath"):
+        raise click.UsageError(
+            "The bytecode cache is disabled. Set runner.bytecodeCachePath to enable it."
+        )
+    if not os.path.exists(target):
+        raise click.BadParameter(f"File does not exist: {target}")
+
+    # Scripts are resolved like the script runner and st.navigation resolve
+    # them, since their paths are part of the cache key.
+    script_paths = [os.path.abspath(target)]
+    main_script_parent = Path(target).parent
+    pages_folder = Path(target).resolve().parent / "pages"
+    script_paths.extend(
+        str(pages_folder / page.name) for page in sorted(pages_folder.glob("*.py"))
+    )
+    script_paths.extend(str((main_script_parent / page).resolve()) for page in pages)
+
+    script_cache = ScriptCache()
+    for script_path in script_paths:
+        try:
+            script_cache.get_bytecode(script_path)
+        except Exception as ex:
+            raise click.ClickException(f"Unable to compile {script_path}: {ex}")
+        click.echo(f"Compiled {script_path}")
+
+
+# SUBCOMMAND: import-time
+
+
+@main.command("import-time")
+@click.option(
+    "--top",
+    default=20,
+    show_default=True,
+    type=click.IntRange(min=1),
+    help="The number of modules to show.",
+)
+@click.option(
+    "--sort",
+    "sort_by",
+    default="cumulative",
+    show_default=True,
+    type=click.Choice(["cumulative", "self"]),
+    help="Sort modules by their import time with or without their imports.",
+)
+def main_import_time(top: int, sort_by: str):
+    """Show how long it takes to import Streamlit.
+
+    Streamlit is imported in a new Python process, and the modules that took
+    the longest to import are listed.
+    """
+    from streamlit.import_time_util import get_imports_of, profile_import
+
+    try:
+        # Python's own startup imports aren't included.
+        streamlit_imports = get_imports_of(profile_import("streamlit"), "streamlit")
+    except RuntimeError as ex:
+        raise click.ClickException(str(ex))
+
+    total_us = streamlit_imports[-1].cumulative_us
+    click.echo(f"Importing streamlit took {total_us / 1000:.1f} ms.\n")
+
+    if sort_by == "self":
+        streamlit_imports.sort(key=lambda import_time: -import_time.self_us)
+    else:
+        streamlit_imports.sort(key=lambda import_time: -import_time.cumulative_us)
+
+    click.echo(f"{'cumulative (ms)':>15}  {'self (ms)':>9}  module")
+    for import_time in streamlit_imports[:top]:
+        click.echo(
+            f"{import_time.cumulative_us / 1000:>15.1f}  "
+            f"{import_time.self_us / 1000:>9.1f}  {import_time.module}"
+        )
+
+
 # SUBCOMMAND: config
 
 
@@ -14,6 +14,7 @@
 
 from __future__ import annotations
 
+import functools
 import hmac
 import json
 from typing import TYPE_CHECKING, Any, Final
@@ -30,8 +31,15 @@ from tornado.websocket import WebSocketHandler
 from streamlit import config
 from streamlit.logger import get_logger
 from streamlit.proto.BackMsg_pb2 import BackMsg
-from streamlit.runtime import Runtime, SessionClient, SessionClientDisconnectedError
-from streamlit.runtime.runtime_util import serialize_forward_msg
+from streamlit.runtime import Runtime, SessionClientDisconnectedError
+from streamlit.runtime.runtime_util import (
+    serialize_forward_msg,
+    serialize_forward_msg_batch,
+)
+from streamlit.runtime.session_manager import (
+    BatchingSessionClient,
+    BufferedSessionClient,
+)
 from streamlit.web.server.server_util import (
     AUTH_COOKIE_NAME,
     is_url_from_allowed_origins,
@@ -46,12 +54,17 @@ if TYPE_CHECKING:
 _LOGGER: Final = get_logger(__name__)
 
 
-class BrowserWebSocketHandler(WebSocketHandler, SessionClient):
+class BrowserWebSocketHandler(
+    WebSocketHandler, BatchingSessionClient, BufferedSessionClient
+):
     """Handles a WebSocket connection from the browser"""
 
     def initialize(self, runtime: Runtime) -> None:
         self._runtime = runtime
         self._session_id: str | None = None
+        # The size of the messages that were written to the websocket, but
+        # haven't been sent yet.
+        self._pending_write_bytes = 0
         # The XSRF cookie is normally set when xsrf_form_html is used, but in a
         # pure-Javascript application that does not use any regular forms we just
         # need to read the self.xsrf_token manually to set the cookie as a side
@@ -116,11 +129,64 @@ class BrowserWebSocketHandler(WebSocketHandler, SessionClient):
 
     def write_forward_msg(self, msg: ForwardMsg) -> None:
         """Send a ForwardMsg to the browser."""
+        self._write_serialized_msgs(
+            [serialize_forward_msg(msg, self._runtime.message_cache)]
+        )
+
+    def write_forward_msgs(self, msgs: list[ForwardMsg]) -> None:
+        """Send several ForwardMsgs to the browser.
+
+        The messages are batched into as few websocket messages as
+        `server.websocketBatchSize` allows.
+        """
+        max_batch_size = config.get_option("server.websocketBatchSize") * 1024
+
+        batch: list[bytes] = []
+        batch_size = 0
+        for msg in msgs:
+            serialized_msg = serialize_forward_msg(msg, self._runtime.message_cache)
+            if batch and batch_size + len(serialized_msg) > max_batch_size:
+                self._write_serialized_msgs(batch)
+                batch = []
+                batch_size = 0
+
+            batch.append(serialized_msg)
+            batch_size += len(serialized_msg)
+
+        if batch:
+            self._write_serialized_msgs(batch)
+
+    def _write_serialized_msgs(self, serialized_msgs: list[bytes]) -> None:
+        """Write serialized ForwardMsgs to the websocket, as a batch if there
+        are several of them.
+        """
+        if len(serialized_msgs) == 1:
+            payload = serialized_msgs[0]
+        else:
+            payload = serialize_forward_msg_batch(serialized_msgs)
+
         try:
-            self.write_message(serialize_forward_msg(msg), binary=True)
+            future = self.write_message(payload, binary=True)
         except tornado.websocket.WebSocketClosedError as e:
             raise SessionClientDisconnectedError from e
 
+        # The future resolves once the message was sent, or failed to send
+        # because the websocket was closed.
+        self._pending_write_bytes += len(payload)
+        future.add_done_callback(
+            functools.partial(self._on_message_written, len(payload))
+        )
+
+    def _on_message_written(
+        self, size: int, _: tornado.concurrent.Future[None]
+    ) -> None:
+        self._pending_write_bytes -= size
+
+    def pending_write_bytes(self) -> int:
+        """Return the number of bytes written to the websocket that haven't
+        been sent yet."""
+        return self._pending_write_bytes
+
     def select_subprotocol(self, subprotocols: list[str]) -> str | None:
         """Return the first subprotocol in the given list.
 
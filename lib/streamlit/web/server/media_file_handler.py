@@ -14,15 +14,21 @@
 
 from __future__ import annotations
 
+import asyncio
+import os
+from datetime import datetime, timezone
 from urllib.parse import quote
 
 import tornado.web
 
+from streamlit import config
 from streamlit.logger import get_logger
 from streamlit.runtime.media_file_storage import MediaFileKind, MediaFileStorageError
 from streamlit.runtime.memory_media_file_storage import (
+    IMAGE_VARIANT_WIDTHS,
     MemoryMediaFileStorage,
     get_extension_for_mimetype,
+    get_image_variant_filename,
 )
 from streamlit.web.server import allow_cross_origin_requests
 
@@ -46,6 +52,56 @@ class MediaFileHandler(tornado.web.StaticFileHandler):
         if allow_cross_origin_requests():
             self.set_header("Access-Control-Allow-Origin", "*")
 
+    async def get(self, path: str, include_body: bool = True) -> None:
+        variant_path = self._get_image_variant_path(path)
+        if variant_path is not None:
+            try:
+                # Creating a variant decodes and encodes the image, so it's
+                # done off the event loop. Once it's created, it's cached by
+                # the storage.
+                await asyncio.get_running_loop().run_in_executor(
+                    None, self._storage.get_file, variant_path
+                )
+                path = variant_path
+            except MediaFileStorageError:
+                # The file isn't an image, or the variant can't be created.
+                # We serve the file itself instead.
+                pass
+
+        await super().get(path, include_body)
+
+    def _get_image_variant_path(self, path: str) -> str | None:
+        """Return the path of the image variant that best fits the request,
+        or None if the file itself should be served.
+
+        Clients request a max width with the "w" query argument. The variant
+        has the smallest of IMAGE_VARIANT_WIDTHS that's at least that wide.
+        """
+        if not config.get_option("server.enableImageVariants"):
+            return None
+
+        webp = False
+        if config.get_option("server.enableWebpImageVariants"):
+            # The response depends on the Accept header of the request.
+            self.set_header("Vary", "Accept")
+            webp = "image/webp" in self.request.headers.get("Accept", "")
+
+        width = 0
+        width_arg = self.get_query_argument("w", None)
+        if width_arg is not None:
+            try:
+                requested_width = int(width_arg)
+            except ValueError:
+                requested_width = 0
+            if requested_width > 0:
+                width = next(
+                    (w for w in IMAGE_VARIANT_WIDTHS if w >= requested_width), 0
+                )
+
+        if width == 0 and not webp:
+            return None
+        return get_image_variant_filename(path, width, webp)
+
     def set_extra_headers(self, path: str) -> None:
         """Add Content-Disposition header for downloadable files.
 
@@ -100,10 +156,32 @@ class MediaFileHandler(tornado.web.StaticFileHandler):
         media_file = self._storage.get_file(abspath)
         return media_file.content_size
 
-    def get_modified_time(self) -> None:
-        # We do not track last modified time, but this can be improved to
-        # allow caching among files in the MediaFileManager
-        return None
+    def get_modified_time(self) -> datetime | None:
+        abspath = self.absolute_path
+        if abspath is None:
+            return None
+
+        modified_time = self._storage.get_file(abspath).modified_time
+        if modified_time is None:
+            return None
+        return datetime.fromtimestamp(int(modified_time), timezone.utc)
+
+    def get_content_type(self) -> str:
+        abspath = self.absolute_path
+        # Python's mimetypes only knows WebP if the platform's mime.types
+        # file lists it.
+        if abspath is not None and abspath.endswith(".webp"):
+            return "image/webp"
+        return super().get_content_type()
+
+    def compute_etag(self) -> str | None:
+        # File IDs are derived from the file's content, so they make good
+        # ETags, and unlike StaticFileHandler's default we don't need to read
+        # and hash the whole file.
+        abspath = self.absolute_path
+        if abspath is None:
+            return None
+        return f'"{os.path.splitext(abspath)[0]}"'
 
     @classmethod
     def get_absolute_path(cls, root: str, path: str) -> str:
@@ -128,14 +206,11 @@ class MediaFileHandler(tornado.web.StaticFileHandler):
             "MediaFileHandler: Sending %s file %s", media_file.mimetype, abspath
         )
 
-        # If there is no start and end, just return the full content
-        if start is None and end is None:
-            return media_file.content
-
         if start is None:
             start = 0
         if end is None:
-            end = len(media_file.content)
+            end = media_file.content_size
 
-        # content is bytes that work just by slicing supplied by start and end
-        return media_file.content[start:end]
+        # The content is served in chunks, so that large files and ranges
+        # aren't copied into memory all at once.
+        return media_file.iter_content(start, end)
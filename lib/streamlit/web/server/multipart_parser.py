@@ -0,0 +1,205 @@
+# Copyright (c) Streamlit Inc. (2018-2022) Snowflake Inc. (2022-2025)
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Incremental parser for multipart/form-data request bodies."""
+
+from __future__ import annotations
+
+import mmap
+import tempfile
+from email.message import Message
+from email.parser import Parser
+from typing import IO, TYPE_CHECKING, Final, NamedTuple
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+# Files larger than this are written to a temporary file instead of memory.
+SPOOL_MAX_MEMORY_BYTES: Final = 1024 * 1024
+
+# The max size of a part's headers.
+_MAX_HEADERS_BYTES: Final = 64 * 1024
+
+
+class MultipartParseError(Exception):
+    """Raised if a request body isn't valid multipart/form-data."""
+
+
+class MultipartFile(NamedTuple):
+    """A file part of a multipart/form-data body."""
+
+    filename: str
+    content_type: str
+    # bytes for small files. Larger files are spooled to an unnamed temporary
+    # file, which is read through a read-only memory map.
+    data: bytes | mmap.mmap
+
+
+class _SpooledData:
+    """Collects a part's data in memory, and moves it to a temporary file once
+    it grows larger than SPOOL_MAX_MEMORY_BYTES."""
+
+    def __init__(self):
+        self._buffer = bytearray()
+        self._file: IO[bytes] | None = None
+
+    def write(self, data: bytes | memoryview) -> None:
+        if self._file is not None:
+            self._file.write(data)
+            return
+
+        self._buffer += data
+        if len(self._buffer) > SPOOL_MAX_MEMORY_BYTES:
+            self._file = tempfile.TemporaryFile()
+            self._file.write(self._buffer)
+            self._buffer = bytearray()
+
+    def close(self) -> bytes | mmap.mmap:
+        if self._file is None:
+            return bytes(self._buffer)
+
+        self._file.flush()
+        # The memory map keeps the file's content available after the file
+        # is closed, and the file is removed once the map is garbage collected.
+        data = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+        self._file.close()
+        return data
+
+
+class MultipartParser:
+    """Parses a multipart/form-data body as it's received, without holding
+    the whole body in memory.
+
+    Only the body's files are kept, like `files` in Tornado's
+    `parse_body_arguments`. Other form fields are ignored.
+    """
+
+    def __init__(self, content_type: str):
+        """Create a parser for a body with the given Content-Type header.
+
+        Raises a MultipartParseError if the body isn't multipart/form-data.
+        """
+        msg = Message()
+        msg["Content-Type"] = content_type
+        boundary = msg.get_boundary()
+        if msg.get_content_type() != "multipart/form-data" or not boundary:
+            raise MultipartParseError("Expected a multipart/form-data body")
+
+        # The CRLF before a boundary belongs to the boundary. The first
+        # boundary doesn't need to be preceded by one, which is handled by
+        # pretending that the body starts with a CRLF.
+        self._delimiter = b"\r\n--" + boundary.encode("latin1")
+        self._buffer = bytearray(b"\r\n")
+        self._state: Callable[[], bool] = self._parse_preamble
+        self._part: tuple[str, str, _SpooledData] | None = None
+        self._files: list[MultipartFile] = []
+
+    def feed(self, data: bytes) -> None:
+        """Parse the next chunk of the body."""
+        self._buffer += data
+        # Each state returns False when it needs more data.
+        while self._state():
+            pass
+
+    def finish(self) -> list[MultipartFile]:
+        """Return the body's files, once the whole body has been fed."""
+        if self._state != self._parse_epilogue:
+            raise MultipartParseError("Unexpected end of multipart/form-data body")
+        return self._files
+
+    def _parse_preamble(self) -> bool:
+        index = self._buffer.find(self._delimiter)
+        if index == -1:
+            # Keep the part of the buffer that could be the start of the
+            # delimiter.
+            del self._buffer[: -len(self._delimiter)]
+            return False
+
+        del self._buffer[: index + len(self._delimiter)]
+        self._state = self._parse_delimiter_end
+        return True
+
+    def _parse_delimiter_end(self) -> bool:
+        if len(self._buffer) < 2:
+            return False
+
+        if self._buffer.startswith(b"--"):
+            self._state = self._parse_epilogue
+        elif self._buffer.startswith(b"\r\n"):
+            self._state = self._parse_headers
+        else:
+            raise MultipartParseError("Invalid multipart/form-data boundary")
+        del self._buffer[:2]
+        return True
+
+    def _parse_headers(self) -> bool:
+        index = self._buffer.find(b"\r\n\r\n")
+        if index == -1:
+            if len(self._buffer) > _MAX_HEADERS_BYTES:
+                raise MultipartParseError("multipart/form-data headers too large")
+            return False
+
+        headers = Parser().parsestr(
+            self._buffer[:index].decode("utf-8"), headersonly=True
+        )
+        del self._buffer[: index + 4]
+
+        filename = headers.get_filename()
+        if (
+            headers.get_content_disposition() == "form-data"
+            and headers.get_param("name", header="content-disposition")
+            and filename
+        ):
+            self._part = (
+                filename,
+                headers.get("Content-Type", "application/unknown"),
+                _SpooledData(),
+            )
+        else:
+            self._part = None
+
+        self._state = self._parse_part_body
+        return True
+
+    def _parse_part_body(self) -> bool:
+        index = self._buffer.find(self._delimiter)
+        if index == -1:
+            # Everything but what could be the start of the delimiter belongs
+            # to the part.
+            end = len(self._buffer) - len(self._delimiter) + 1
+            if end > 0:
+                self._write_part(end)
+            return False
+
+        self._write_part(index)
+        if self._part is not None:
+            filename, content_type, spooled_data = self._part
+            self._files.append(
+                MultipartFile(filename, content_type, spooled_data.close())
+            )
+            self._part = None
+
+        del self._buffer[: len(self._delimiter)]
+        self._state = self._parse_delimiter_end
+        return True
+
+    def _parse_epilogue(self) -> bool:
+        self._buffer.clear()
+        return False
+
+    def _write_part(self, end: int) -> None:
+        """Move the first `end` bytes of the buffer to the current part."""
+        if self._part is not None:
+            self._part[2].write(memoryview(self._buffer)[:end])
+        del self._buffer[:end]
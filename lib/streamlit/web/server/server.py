@@ -34,6 +34,7 @@ from streamlit.auth_util import is_authlib_installed
 from streamlit.config_option import ConfigOption
 from streamlit.logger import get_logger
 from streamlit.runtime import Runtime, RuntimeConfig, RuntimeState
+from streamlit.runtime.disk_media_file_storage import DiskMediaFileStorage
 from streamlit.runtime.memory_media_file_storage import MemoryMediaFileStorage
 from streamlit.runtime.memory_session_storage import MemorySessionStorage
 from streamlit.runtime.memory_uploaded_file_manager import MemoryUploadedFileManager
@@ -61,6 +62,7 @@ from streamlit.web.server.server_util import (
 )
 from streamlit.web.server.stats_request_handler import StatsRequestHandler
 from streamlit.web.server.upload_file_request_handler import UploadFileRequestHandler
+from streamlit.web.worker_pool import get_worker_info
 
 if TYPE_CHECKING:
     from collections.abc import Awaitable
@@ -248,7 +250,7 @@ class Server:
         self._main_script_path = main_script_path
 
         # Initialize MediaFileStorage and its associated endpoint
-        media_file_storage = MemoryMediaFileStorage(MEDIA_ENDPOINT)
+        media_file_storage = _create_media_file_storage()
         MediaFileHandler.initialize_storage(media_file_storage)
 
         uploaded_file_mgr = MemoryUploadedFileManager(UPLOAD_FILE_ENDPOINT)
@@ -477,3 +479,20 @@ def _set_tornado_log_levels() -> None:
         logging.getLogger("tornado.access").setLevel(logging.ERROR)
         logging.getLogger("tornado.application").setLevel(logging.ERROR)
         logging.getLogger("tornado.general").setLevel(logging.ERROR)
+
+
+def _get_media_endpoint() -> str:
+    worker_info = get_worker_info()
+    if worker_info is None:
+        return MEDIA_ENDPOINT
+    # The main process of a worker pool routes media requests to the worker
+    # that stores the file by its index.
+    return f"{MEDIA_ENDPOINT}/{worker_info.worker_index}"
+
+
+def _create_media_file_storage() -> MemoryMediaFileStorage:
+    media_endpoint = _get_media_endpoint()
+    disk_threshold_mb = config.get_option("server.mediaFileDiskThreshold")
+    if disk_threshold_mb > 0:
+        return DiskMediaFileStorage(media_endpoint, disk_threshold_mb * 1024 * 1024)
+    return MemoryMediaFileStorage(media_endpoint)
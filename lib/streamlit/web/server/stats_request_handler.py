@@ -23,7 +23,13 @@ from streamlit.web.server.server_util import emit_endpoint_deprecation_notice
 
 if TYPE_CHECKING:
     from streamlit.proto.openmetrics_data_model_pb2 import MetricSet as MetricSetProto
-    from streamlit.runtime.stats import CacheStat, StatsManager
+    from streamlit.runtime.stats import (
+        CacheEventStat,
+        CacheStat,
+        MediaFileStat,
+        SessionMessageStat,
+        StatsManager,
+    )
 
 
 class StatsRequestHandler(tornado.web.RequestHandler):
@@ -44,20 +50,36 @@ class StatsRequestHandler(tornado.web.RequestHandler):
             emit_endpoint_deprecation_notice(self, new_path="/_stcore/metrics")
 
         stats = self._manager.get_stats()
+        cache_event_stats = self._manager.get_cache_event_stats()
+        session_stats = self._manager.get_session_message_stats()
+        media_file_stats = self._manager.get_media_file_stats()
 
         # If the request asked for protobuf output, we return a serialized
         # protobuf. Else we return text.
         if "application/x-protobuf" in self.request.headers.get_list("Accept"):
-            self.write(self._stats_to_proto(stats).SerializeToString())
+            self.write(
+                self._stats_to_proto(
+                    stats, cache_event_stats, session_stats, media_file_stats
+                ).SerializeToString()
+            )
             self.set_header("Content-Type", "application/x-protobuf")
             self.set_status(200)
         else:
-            self.write(self._stats_to_text(self._manager.get_stats()))
+            self.write(
+                self._stats_to_text(
+                    stats, cache_event_stats, session_stats, media_file_stats
+                )
+            )
             self.set_header("Content-Type", "application/openmetrics-text")
             self.set_status(200)
 
     @staticmethod
-    def _stats_to_text(stats: list[CacheStat]) -> str:
+    def _stats_to_text(
+        stats: list[CacheStat],
+        cache_event_stats: list[CacheEventStat],
+        session_stats: list[SessionMessageStat],
+        media_file_stats: list[MediaFileStat],
+    ) -> str:
         metric_type = "# TYPE cache_memory_bytes gauge"
         metric_unit = "# UNIT cache_memory_bytes bytes"
         metric_help = "# HELP Total memory consumed by a cache."
@@ -66,14 +88,93 @@ class StatsRequestHandler(tornado.web.RequestHandler):
         # Format: header, stats, EOF
         result = [metric_type, metric_unit, metric_help]
         result.extend(stat.to_metric_str() for stat in stats)
+
+        if cache_event_stats:
+            result.extend(
+                [
+                    "# TYPE cache_events counter",
+                    "# HELP Number of hits, misses and evictions of a cache.",
+                ]
+            )
+            result.extend(stat.to_metric_str() for stat in cache_event_stats)
+
+        if session_stats:
+            result.extend(
+                [
+                    "# TYPE session_message_queued_messages gauge",
+                    "# HELP Number of messages waiting to be sent to any session.",
+                ]
+            )
+            result.extend(
+                stat.to_queued_messages_metric_str() for stat in session_stats
+            )
+            result.extend(
+                [
+                    "# TYPE session_message_max_queue_depth gauge",
+                    "# HELP Largest number of messages waiting to be sent to a session.",
+                ]
+            )
+            result.extend(
+                stat.to_max_queue_depth_metric_str() for stat in session_stats
+            )
+            result.extend(
+                [
+                    "# TYPE session_message_max_queue_latency_seconds gauge",
+                    "# UNIT session_message_max_queue_latency_seconds seconds",
+                    "# HELP Age of the oldest message waiting to be sent to a session.",
+                ]
+            )
+            result.extend(
+                stat.to_max_queue_latency_metric_str() for stat in session_stats
+            )
+            result.extend(
+                [
+                    "# TYPE session_message_backpressured_sessions gauge",
+                    "# HELP Number of sessions whose client is too slow to send more messages to.",
+                ]
+            )
+            result.extend(
+                stat.to_backpressured_sessions_metric_str() for stat in session_stats
+            )
+
+        if media_file_stats:
+            result.extend(
+                [
+                    "# TYPE media_files gauge",
+                    "# HELP Number of media files that are or are no longer in use.",
+                ]
+            )
+            for media_file_stat in media_file_stats:
+                result.extend(media_file_stat.to_file_count_metric_strs())
+            result.extend(
+                [
+                    "# TYPE media_file_references gauge",
+                    "# HELP Number of places in apps that use a media file.",
+                ]
+            )
+            result.extend(stat.to_reference_metric_str() for stat in media_file_stats)
+            result.extend(
+                [
+                    "# TYPE media_file_lock_wait_seconds counter",
+                    "# UNIT media_file_lock_wait_seconds seconds",
+                    "# HELP Time spent waiting for the media file manager's locks.",
+                ]
+            )
+            result.extend(stat.to_lock_wait_metric_str() for stat in media_file_stats)
+
         result.append(openmetrics_eof)
 
         return "\n".join(result)
 
     @staticmethod
-    def _stats_to_proto(stats: list[CacheStat]) -> MetricSetProto:
+    def _stats_to_proto(
+        stats: list[CacheStat],
+        cache_event_stats: list[CacheEventStat],
+        session_stats: list[SessionMessageStat],
+        media_file_stats: list[MediaFileStat],
+    ) -> MetricSetProto:
         # Lazy load the import of this proto message for better performance:
-        from streamlit.proto.openmetrics_data_model_pb2 import GAUGE
+        from streamlit.proto.openmetrics_data_model_pb2 import COUNTER, GAUGE
         from streamlit.proto.openmetrics_data_model_pb2 import (
             MetricSet as MetricSetProto,
         )
@@ -92,4 +193,85 @@ class StatsRequestHandler(tornado.web.RequestHandler):
 
         metric_set = MetricSetProto()
         metric_set.metric_families.append(metric_family)
+
+        if cache_event_stats:
+            event_family = metric_set.metric_families.add()
+            event_family.name = "cache_events"
+            event_family.type = COUNTER
+            event_family.help = "Number of hits, misses and evictions of a cache."
+            for event_stat in cache_event_stats:
+                event_stat.marshall_metric_proto(event_family.metrics.add())
+
+        if session_stats:
+            queued_family = metric_set.metric_families.add()
+            queued_family.name = "session_message_queued_messages"
+            queued_family.type = GAUGE
+            queued_family.help = "Number of messages waiting to be sent to any session."
+
+            depth_family = metric_set.metric_families.add()
+            depth_family.name = "session_message_max_queue_depth"
+            depth_family.type = GAUGE
+            depth_family.help = (
+                "Largest number of messages waiting to be sent to a session."
+            )
+
+            latency_family = metric_set.metric_families.add()
+            latency_family.name = "session_message_max_queue_latency_seconds"
+            latency_family.type = GAUGE
+            latency_family.unit = "seconds"
+            latency_family.help = (
+                "Age of the oldest message waiting to be sent to a session."
+            )
+
+            backpressured_family = metric_set.metric_families.add()
+            backpressured_family.name = "session_message_backpressured_sessions"
+            backpressured_family.type = GAUGE
+            backpressured_family.help = (
+                "Number of sessions whose client is too slow to send more messages to."
+            )
+
+            for session_stat in session_stats:
+                session_stat.marshall_queued_messages_metric_proto(
+                    queued_family.metrics.add()
+                )
+                session_stat.marshall_max_queue_depth_metric_proto(
+                    depth_family.metrics.add()
+                )
+                session_stat.marshall_max_queue_latency_metric_proto(
+                    latency_family.metrics.add()
+                )
+                session_stat.marshall_backpressured_sessions_metric_proto(
+                    backpressured_family.metrics.add()
+                )
+
+        if media_file_stats:
+            files_family = metric_set.metric_families.add()
+            files_family.name = "media_files"
+            files_family.type = GAUGE
+            files_family.help = (
+                "Number of media files that are or are no longer in use."
+            )
+
+            references_family = metric_set.metric_families.add()
+            references_family.name = "media_file_references"
+            references_family.type = GAUGE
+            references_family.help = "Number of places in apps that use a media file."
+
+            lock_wait_family = metric_set.metric_families.add()
+            lock_wait_family.name = "media_file_lock_wait_seconds"
+            lock_wait_family.type = COUNTER
+            lock_wait_family.unit = "seconds"
+            lock_wait_family.help = (
+                "Time spent waiting for the media file manager's locks."
+            )
+
+            for media_file_stat in media_file_stats:
+                media_file_stat.marshall_file_count_metric_protos(files_family)
+                media_file_stat.marshall_reference_metric_proto(
+                    references_family.metrics.add()
+                )
+                media_file_stat.marshall_lock_wait_metric_proto(
+                    lock_wait_family.metrics.add()
+                )
+
         return metric_set
@@ -14,22 +14,27 @@
 
 from __future__ import annotations
 
-from typing import TYPE_CHECKING, Any, Callable
+from typing import TYPE_CHECKING, Callable
 
-import tornado.httputil
 import tornado.web
 
 from streamlit import config
 from streamlit.runtime.uploaded_file_manager import UploadedFileRec
 from streamlit.web.server import routes, server_util
+from streamlit.web.server.multipart_parser import MultipartParseError, MultipartParser
 from streamlit.web.server.server_util import is_xsrf_enabled
 
 if TYPE_CHECKING:
     from streamlit.runtime.memory_uploaded_file_manager import MemoryUploadedFileManager
 
 
+@tornado.web.stream_request_body
 class UploadFileRequestHandler(tornado.web.RequestHandler):
-    """Implements the POST /upload_file endpoint."""
+    """Implements the POST /upload_file endpoint.
+
+    Uploaded files are parsed while they are received, so the request body
+    is never held in memory as a whole.
+    """
 
     def initialize(
         self,
@@ -48,6 +53,10 @@ class UploadFileRequestHandler(tornado.web.RequestHandler):
         """
         self._file_mgr = file_mgr
         self._is_active_session = is_active_session
+        self._parser: MultipartParser | None = None
+        # The number of bytes the session may still upload, or None if there
+        # is no quota.
+        self._remaining_quota_bytes: int | None = None
 
     def set_default_headers(self):
         self.set_header("Access-Control-Allow-Methods", "PUT, OPTIONS, DELETE")
@@ -83,22 +92,12 @@ class UploadFileRequestHandler(tornado.web.RequestHandler):
         self.set_status(204)
         self.finish()
 
-    def put(self, **kwargs):
-        """Receive an uploaded file and add it to our UploadedFileManager."""
-
-        args: dict[str, list[bytes]] = {}
-        files: dict[str, list[Any]] = {}
+    def prepare(self) -> None:
+        """Check that an upload is allowed before its body is received."""
+        if self.request.method != "PUT":
+            return
 
         session_id = self.path_kwargs["session_id"]
-        file_id = self.path_kwargs["file_id"]
-
-        tornado.httputil.parse_body_arguments(
-            content_type=self.request.headers["Content-Type"],
-            body=self.request.body,
-            arguments=args,
-            files=files,
-        )
-
         try:
             if not self._is_active_session(session_id):
                 raise Exception("Invalid session_id")
@@ -106,28 +105,70 @@ class UploadFileRequestHandler(tornado.web.RequestHandler):
             self.send_error(400, reason=str(e))
             return
 
-        uploaded_files: list[UploadedFileRec] = []
-
-        for _, flist in files.items():
-            for file in flist:
-                uploaded_files.append(
-                    UploadedFileRec(
-                        file_id=file_id,
-                        name=file["filename"],
-                        type=file["content_type"],
-                        data=file["body"],
-                    )
-                )
-
-        if len(uploaded_files) != 1:
-            self.send_error(
-                400, reason=f"Expected 1 file, but got {len(uploaded_files)}"
+        max_session_upload_size = config.get_option("server.maxSessionUploadSize")
+        if max_session_upload_size > 0:
+            self._remaining_quota_bytes = (
+                max_session_upload_size * 1024 * 1024
+                - self._file_mgr.get_session_files_size(session_id)
             )
+            content_length = int(self.request.headers.get("Content-Length", 0))
+            if content_length > self._remaining_quota_bytes:
+                self._send_quota_error()
+                return
+
+        try:
+            self._parser = MultipartParser(self.request.headers.get("Content-Type", ""))
+        except MultipartParseError as e:
+            self.send_error(400, reason=str(e))
+
+    def data_received(self, chunk: bytes) -> None:
+        if self._finished or self._parser is None:
+            return
+
+        if self._remaining_quota_bytes is not None:
+            self._remaining_quota_bytes -= len(chunk)
+            if self._remaining_quota_bytes < 0:
+                self._send_quota_error()
+                return
+
+        try:
+            self._parser.feed(chunk)
+        except MultipartParseError as e:
+            self.send_error(400, reason=str(e))
+
+    def put(self, **kwargs):
+        """Receive an uploaded file and add it to our UploadedFileManager."""
+        # An error was already sent while the body was received.
+        if self._finished or self._parser is None:
+            return
+
+        session_id = self.path_kwargs["session_id"]
+        file_id = self.path_kwargs["file_id"]
+
+        try:
+            files = self._parser.finish()
+        except MultipartParseError as e:
+            self.send_error(400, reason=str(e))
             return
 
-        self._file_mgr.add_file(session_id=session_id, file=uploaded_files[0])
+        if len(files) != 1:
+            self.send_error(400, reason=f"Expected 1 file, but got {len(files)}")
+            return
+
+        self._file_mgr.add_file(
+            session_id=session_id,
+            file=UploadedFileRec(
+                file_id=file_id,
+                name=files[0].filename,
+                type=files[0].content_type,
+                data=files[0].data,
+            ),
+        )
         self.set_status(204)
 
+    def _send_quota_error(self) -> None:
+        self.send_error(413, reason="Upload exceeds the session's upload quota")
+
     def delete(self, **kwargs):
         """Delete file request handler."""
         session_id = self.path_kwargs["session_id"]
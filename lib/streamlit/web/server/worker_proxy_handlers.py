@@ -0,0 +1,380 @@
+# Copyright (c) Streamlit Inc. (2018-2022) Snowflake Inc. (2022-2025)
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Handlers that forward the requests of the main process of a worker pool to
+its workers."""
+
+from __future__ import annotations
+
+import re
+import sys
+from typing import TYPE_CHECKING, Any, Final
+
+import tornado.httputil
+import tornado.ioloop
+import tornado.web
+import tornado.websocket
+from google.protobuf.message import DecodeError
+from tornado.httpclient import HTTPRequest
+from tornado.simple_httpclient import SimpleAsyncHTTPClient
+
+from streamlit import config
+from streamlit.logger import get_logger
+from streamlit.proto.ForwardMsg_pb2 import ForwardMsg
+from streamlit.runtime.runtime_util import get_max_message_size_bytes
+from streamlit.web.server.server import (
+    MEDIA_ENDPOINT,
+    STREAM_ENDPOINT,
+    TORNADO_SETTINGS,
+    UPLOAD_FILE_ENDPOINT,
+    _set_tornado_log_levels,
+)
+from streamlit.web.server.server_util import make_url_path_regex
+
+if TYPE_CHECKING:
+    from tornado.websocket import WebSocketClientConnection
+
+    from streamlit.web.worker_pool import Worker, WorkerPool
+
+_LOGGER: Final = get_logger(__name__)
+
+# Headers that only apply to a single connection, and which must not be
+# forwarded. See https://www.rfc-editor.org/rfc/rfc9110#section-7.6.1
+_HOP_BY_HOP_HEADERS: Final = frozenset(
+    [
+        "connection",
+        "keep-alive",
+        "proxy-authenticate",
+        "proxy-authorization",
+        "te",
+        "trailer",
+        "transfer-encoding",
+        "upgrade",
+    ]
+)
+
+# Headers of the browser's websocket handshake, which the connection to the
+# worker sets itself.
+_WEBSOCKET_HANDSHAKE_HEADERS: Final = frozenset(
+    [
+        "sec-websocket-extensions",
+        "sec-websocket-key",
+        "sec-websocket-protocol",
+        "sec-websocket-version",
+    ]
+)
+
+# The max number of requests that are forwarded to the workers at once.
+_MAX_PROXY_CLIENTS: Final = 1000
+
+
+def _copy_headers(
+    headers: tornado.httputil.HTTPHeaders, excluded_headers: frozenset[str]
+) -> tornado.httputil.HTTPHeaders:
+    copied_headers = tornado.httputil.HTTPHeaders()
+    for name, value in headers.get_all():
+        if name.lower() not in excluded_headers:
+            copied_headers.add(name, value)
+    return copied_headers
+
+
+def _get_new_session_id(message: bytes) -> str | None:
+    """Return the session ID of the NewSession message in the given serialized
+    ForwardMsg or ForwardMsg batch, or None if there's no such message."""
+    msg = ForwardMsg()
+    try:
+        msg.ParseFromString(message)
+    except DecodeError:
+        return None
+
+    if msg.HasField("new_session"):
+        return msg.new_session.initialize.session_id or None
+    if msg.HasField("forward_msg_batch"):
+        for batched_message in msg.forward_msg_batch.messages:
+            session_id = _get_new_session_id(batched_message)
+            if session_id is not None:
+                return session_id
+    return None
+
+
+class WorkerProxyHandler(tornado.web.RequestHandler):
+    """Forwards a request to a worker, and streams the worker's response back.
+
+    Requests that don't belong to a session can be served by any worker.
+    """
+
+    SUPPORTED_METHODS = ("GET", "HEAD", "POST", "DELETE", "PATCH", "PUT", "OPTIONS")
+
+    def initialize(self, pool: WorkerPool, http_client: SimpleAsyncHTTPClient) -> None:
+        self._pool = pool
+        self._http_client = http_client
+
+    def check_xsrf_cookie(self) -> None:
+        # The worker checks the XSRF cookie of the forwarded request.
+        pass
+
+    def _get_worker(self) -> Worker | None:
+        return self._pool.get_any_worker()
+
+    def _get_worker_uri(self) -> str:
+        return self.request.uri or "/"
+
+    def _on_header_line(self, line: str) -> None:
+        line = line.rstrip("\r\n")
+        if line.startswith("HTTP/"):
+            start_line = tornado.httputil.parse_response_start_line(line)
+            self.set_status(start_line.code, start_line.reason)
+            # The worker's response has its own headers.
+            for name in ("Content-Type", "Date", "Server"):
+                self.clear_header(name)
+        elif ":" in line:
+            name, value = line.split(":", 1)
+            if name.lower() not in _HOP_BY_HOP_HEADERS:
+                self.add_header(name.strip(), value.strip())
+
+    def _on_body_chunk(self, chunk: bytes) -> None:
+        self.write(chunk)
+        self.flush()
+
+    async def _forward(self) -> None:
+        worker = self._get_worker()
+        if worker is None:
+            raise tornado.web.HTTPError(503)
+
+        request = HTTPRequest(
+            worker.url + self._get_worker_uri(),
+            method=self.request.method or "GET",
+            headers=_copy_headers(self.request.headers, _HOP_BY_HOP_HEADERS),
+            body=self.request.body if self.request.body else None,
+            allow_nonstandard_methods=True,
+            follow_redirects=False,
+            decompress_response=False,
+            # Media can be streamed for as long as it takes.
+            request_timeout=0,
+            header_callback=self._on_header_line,
+            streaming_callback=self._on_body_chunk,
+        )
+        response = await self._http_client.fetch(request, raise_error=False)
+        if response.code == 599 and not self._headers_written:
+            _LOGGER.warning(
+                "Unable to forward a request to worker %s",
+                worker.index,
+                exc_info=response.error,
+            )
+            raise tornado.web.HTTPError(502)
+
+    async def get(self, *args: Any, **kwargs: Any) -> None:
+        await self._forward()
+
+    async def head(self, *args: Any, **kwargs: Any) -> None:
+        await self._forward()
+
+    async def post(self, *args: Any, **kwargs: Any) -> None:
+        await self._forward()
+
+    async def delete(self, *args: Any, **kwargs: Any) -> None:
+        await self._forward()
+
+    async def patch(self, *args: Any, **kwargs: Any) -> None:
+        await self._forward()
+
+    async def put(self, *args: Any, **kwargs: Any) -> None:
+        await self._forward()
+
+    async def options(self, *args: Any, **kwargs: Any) -> None:
+        await self._forward()
+
+
+class SessionWorkerProxyHandler(WorkerProxyHandler):
+    """Forwards a request to the worker that runs the session in the URL,
+    like a file upload."""
+
+    def _get_worker(self) -> Worker | None:
+        worker = self._pool.get_session_worker(self.path_kwargs["session_id"])
+        if worker is None:
+            # Like the worker's response for a session it doesn't know.
+            raise tornado.web.HTTPError(400, reason="Invalid session_id")
+        return worker
+
+
+class MediaWorkerProxyHandler(WorkerProxyHandler):
+    """Forwards a media request to the worker that stores the file.
+
+    Each worker serves its media under "/media/<worker index>", which the
+    worker itself doesn't expect in the URL.
+    """
+
+    def _get_worker(self) -> Worker | None:
+        return self._pool.get_worker(int(self.path_kwargs["worker_index"]))
+
+    def _get_worker_uri(self) -> str:
+        return re.sub(
+            rf"{MEDIA_ENDPOINT}/{self.path_kwargs['worker_index']}/",
+            f"{MEDIA_ENDPOINT}/",
+            super()._get_worker_uri(),
+            count=1,
+        )
+
+
+class WorkerWebSocketProxyHandler(tornado.websocket.WebSocketHandler):
+    """Forwards a session's websocket messages to and from the worker that
+    runs the session.
+
+    New sessions go to the worker with the fewest connections. The ID of
+    the session that the worker creates is read from its NewSession message,
+    so that a reconnect reaches the same worker.
+    """
+
+    def initialize(self, pool: WorkerPool) -> None:
+        self._pool = pool
+        self._worker: Worker | None = None
+        self._worker_connection: WebSocketClientConnection | None = None
+        self._session_id: str | None = None
+
+    def check_origin(self, origin: str) -> bool:
+        # The worker checks the origin of the forwarded handshake.
+        return True
+
+    def select_subprotocol(self, subprotocols: list[str]) -> str | None:
+        # Like BrowserWebSocketHandler. See its docstring for why.
+        if subprotocols:
+            return subprotocols[0]
+        return None
+
+    def get_compression_options(self) -> dict[Any, Any] | None:
+        if config.get_option("server.enableWebsocketCompression"):
+            return {}
+        return None
+
+    async def open(self, *args: Any, **kwargs: Any) -> None:
+        subprotocols_header = self.request.headers.get("Sec-Websocket-Protocol")
+        subprotocols = (
+            [protocol.strip() for protocol in subprotocols_header.split(",")]
+            if subprotocols_header
+            else []
+        )
+
+        worker = None
+        if len(subprotocols) >= 3:
+            # The third subprotocol is the ID of the session to reconnect to.
+            worker = self._pool.get_session_worker(subprotocols[2])
+        if worker is None:
+            worker = self._pool.get_worker_for_new_session()
+        if worker is None:
+            self.close(1013, "No workers are available")
+            return
+
+        request = HTTPRequest(
+            worker.websocket_url + (self.request.uri or "/"),
+            headers=_copy_headers(
+                self.request.headers, _HOP_BY_HOP_HEADERS | _WEBSOCKET_HANDSHAKE_HEADERS
+            ),
+        )
+        try:
+            self._worker_connection = await tornado.websocket.websocket_connect(
+                request,
+                subprotocols=subprotocols or None,
+                max_message_size=get_max_message_size_bytes(),
+            )
+        except Exception as ex:
+            _LOGGER.warning("Unable to connect to worker %s", worker.index, exc_info=ex)
+            self.close(1011, "Unable to connect to the worker")
+            return
+
+        self._worker = worker
+        self._worker.connection_count += 1
+        tornado.ioloop.IOLoop.current().add_callback(self._forward_worker_messages)
+
+    async def _forward_worker_messages(self) -> None:
+        worker_connection = self._worker_connection
+        assert worker_connection is not None and self._worker is not None
+
+        while True:
+            message = await worker_connection.read_message()
+            if message is None:
+                break
+
+            if self._session_id is None and isinstance(message, bytes):
+                self._session_id = _get_new_session_id(message)
+                if self._session_id is not None:
+                    self._pool.pin_session(self._session_id, self._worker)
+
+            try:
+                await self.write_message(message, binary=isinstance(message, bytes))
+            except tornado.websocket.WebSocketClosedError:
+                break
+
+        self.close()
+
+    def on_message(self, message: str | bytes) -> None:
+        if self._worker_connection is None:
+            return
+        try:
+            self._worker_connection.write_message(
+                message, binary=isinstance(message, bytes)
+            )
+        except tornado.websocket.WebSocketClosedError:
+            self.close()
+
+    def on_close(self) -> None:
+        if self._worker_connection is not None:
+            self._worker_connection.close()
+            self._worker_connection = None
+        if self._worker is not None:
+            self._worker.connection_count -= 1
+            self._worker = None
+
+
+def create_worker_proxy_app(pool: WorkerPool) -> tornado.web.Application:
+    """Create the web app of a worker pool's main process."""
+    _set_tornado_log_levels()
+    base = config.get_option("server.baseUrlPath")
+    http_client = SimpleAsyncHTTPClient(
+        force_instance=True,
+        max_clients=_MAX_PROXY_CLIENTS,
+        # Responses are streamed, so their size isn't limited by memory.
+        max_body_size=sys.maxsize,
+    )
+    proxy_args = {"pool": pool, "http_client": http_client}
+
+    routes: list[Any] = [
+        (
+            make_url_path_regex(base, STREAM_ENDPOINT),
+            WorkerWebSocketProxyHandler,
+            {"pool": pool},
+        ),
+        (
+            make_url_path_regex(
+                base,
+                rf"{UPLOAD_FILE_ENDPOINT}/(?P<session_id>[^/]+)/(?P<file_id>[^/]+)",
+            ),
+            SessionWorkerProxyHandler,
+            proxy_args,
+        ),
+        (
+            make_url_path_regex(
+                base, rf"{MEDIA_ENDPOINT}/(?P<worker_index>[0-9]+)/(?P<filename>.*)"
+            ),
+            MediaWorkerProxyHandler,
+            proxy_args,
+        ),
+        (make_url_path_regex(base, "(.*)"), WorkerProxyHandler, proxy_args),
+    ]
+
+    return tornado.web.Application(
+        routes,
+        websocket_max_message_size=get_max_message_size_bytes(),
+        websocket_ping_interval=TORNADO_SETTINGS["websocket_ping_interval"],
+        websocket_ping_timeout=TORNADO_SETTINGS["websocket_ping_timeout"],
+    )
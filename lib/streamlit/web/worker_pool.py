@@ -0,0 +1,235 @@
+# Copyright (c) Streamlit Inc. (2018-2022) Snowflake Inc. (2022-2025)
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Runs an app's sessions in several forked worker processes.
+
+The main process of a worker pool doesn't run any sessions. It accepts the
+browser's connections and forwards them to the workers (see
+server/worker_proxy_handlers.py). Each worker is a regular single-process Streamlit
+server that listens on a local port.
+"""
+
+from __future__ import annotations
+
+import multiprocessing
+import shutil
+import socket
+import tempfile
+from collections import OrderedDict
+from typing import TYPE_CHECKING, Any, Final, NamedTuple
+
+from streamlit.logger import get_logger
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+    from multiprocessing.process import BaseProcess
+
+_LOGGER: Final = get_logger(__name__)
+
+# The address the workers listen on. They are only reached through the main
+# process.
+WORKER_ADDRESS: Final = "127.0.0.1"
+
+# The number of session IDs that are remembered for routing reconnects and
+# file uploads to the worker that runs the session.
+_MAX_PINNED_SESSIONS: Final = 10_000
+
+# How long to wait for a worker to stop before killing it, in seconds.
+_WORKER_STOP_TIMEOUT_SECONDS: Final = 5
+
+
+class WorkerInfo(NamedTuple):
+    """What a worker process knows about its place in the pool."""
+
+    worker_index: int
+    # The folder where all workers store their st.cache_data caches.
+    shared_cache_dir: str
+
+
+# Set in worker processes only.
+_worker_info: WorkerInfo | None = None
+
+
+def get_worker_info() -> WorkerInfo | None:
+    """Return the WorkerInfo of this process, or None if this process isn't a
+    worker of a worker pool."""
+    return _worker_info
+
+
+def is_worker_pool_supported() -> bool:
+    return "fork" in multiprocessing.get_all_start_methods()
+
+
+def _get_free_port() -> int:
+    with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as sock:
+        sock.bind((WORKER_ADDRESS, 0))
+        return int(sock.getsockname()[1])
+
+
+class Worker:
+    """A worker process, and the sessions that are connected to it."""
+
+    def __init__(self, index: int, port: int, process: BaseProcess):
+        self.index = index
+        self.port = port
+        self.process = process
+        self.connection_count = 0
+
+    @property
+    def is_alive(self) -> bool:
+        return self.process.is_alive()
+
+    @property
+    def url(self) -> str:
+        return f"http://{WORKER_ADDRESS}:{self.port}"
+
+    @property
+    def websocket_url(self) -> str:
+        return f"ws://{WORKER_ADDRESS}:{self.port}"
+
+
+class WorkerPool:
+    """Starts and stops the worker processes, and picks the worker that
+    serves a session.
+
+    Sessions are pinned to the worker they were first connected to, so that
+    reconnects and file uploads reach the runtime that holds their state.
+    WorkerPool is not thread-safe, and is meant to be used from the main
+    process's event loop.
+    """
+
+    def __init__(
+        self,
+        worker_count: int,
+        run_worker: Callable[[dict[str, Any]], None],
+    ):
+        """Create a new WorkerPool. The workers won't be started yet.
+
+        Parameters
+        ----------
+        worker_count
+            The number of worker processes.
+        run_worker
+            Called in every worker process with the config options that the
+            worker must set, like the port to listen on. It runs a Streamlit
+            server until it's stopped.
+        """
+        self._worker_count = worker_count
+        self._run_worker = run_worker
+        self._workers: list[Worker] = []
+        self._worker_by_session_id: OrderedDict[str, Worker] = OrderedDict()
+        self._next_worker_index = 0
+        self._shared_cache_dir: str | None = None
+
+    @property
+    def workers(self) -> list[Worker]:
+        return self._workers
+
+    def start(self) -> None:
+        """Fork the worker processes.
+
+        This must be called before the main process starts any threads,
+        since only the forking thread is copied to the workers.
+        """
+        self._shared_cache_dir = tempfile.mkdtemp(prefix="streamlit-worker-pool-")
+        context = multiprocessing.get_context("fork")
+        for index in range(self._worker_count):
+            port = _get_free_port()
+            process = context.Process(
+                target=self._worker_main,
+                args=(WorkerInfo(index, self._shared_cache_dir), port),
+                name=f"StreamlitWorker-{index}",
+            )
+            process.start()
+            _LOGGER.debug("Started worker %s on port %s", index, port)
+            self._workers.append(Worker(index, port, process))
+
+    def _worker_main(self, worker_info: WorkerInfo, port: int) -> None:
+        global _worker_info
+        _worker_info = worker_info
+        self._run_worker(
+            {
+                "server.port": port,
+                "server.address": WORKER_ADDRESS,
+                "server.headless": True,
+            }
+        )
+
+    def stop(self) -> None:
+        """Stop the worker processes, and wait until they have exited."""
+        for worker in self._workers:
+            if worker.is_alive:
+                worker.process.terminate()
+
+        for worker in self._workers:
+            worker.process.join(_WORKER_STOP_TIMEOUT_SECONDS)
+            if worker.is_alive:
+                _LOGGER.warning("Worker %s didn't stop, killing it", worker.index)
+                worker.process.kill()
+                worker.process.join()
+
+        if self._shared_cache_dir is not None:
+            shutil.rmtree(self._shared_cache_dir, ignore_errors=True)
+            self._shared_cache_dir = None
+
+    @property
+    def is_alive(self) -> bool:
+        """True if at least one worker is alive."""
+        return any(worker.is_alive for worker in self._workers)
+
+    def get_worker(self, index: int) -> Worker | None:
+        """Return the worker with the given index, or None if there's no such
+        worker, or if it has exited."""
+        if 0 <= index < len(self._workers) and self._workers[index].is_alive:
+            return self._workers[index]
+        return None
+
+    def get_session_worker(self, session_id: str) -> Worker | None:
+        """Return the worker that the given session is pinned to, or None if
+        it's unknown."""
+        worker = self._worker_by_session_id.get(session_id)
+        if worker is None or not worker.is_alive:
+            return None
+        self._worker_by_session_id.move_to_end(session_id)
+        return worker
+
+    def pin_session(self, session_id: str, worker: Worker) -> None:
+        """Remember that the given session runs on the given worker."""
+        self._worker_by_session_id[session_id] = worker
+        self._worker_by_session_id.move_to_end(session_id)
+        while len(self._worker_by_session_id) > _MAX_PINNED_SESSIONS:
+            self._worker_by_session_id.popitem(last=False)
+
+    def get_worker_for_new_session(self) -> Worker | None:
+        """Return the alive worker with the fewest connections, or None if all
+        workers have exited. Ties are broken in round-robin order."""
+        return self._get_next_worker(key=lambda worker: worker.connection_count)
+
+    def get_any_worker(self) -> Worker | None:
+        """Return the next alive worker in round-robin order, for requests
+        that any worker can serve."""
+        return self._get_next_worker(key=lambda worker: 0)
+
+    def _get_next_worker(self, key: Callable[[Worker], int]) -> Worker | None:
+        workers = (
+            self._workers[self._next_worker_index :]
+            + self._workers[: self._next_worker_index]
+        )
+        alive_workers = [worker for worker in workers if worker.is_alive]
+        if not alive_workers:
+            return None
+        # min() returns the first of several workers with the same key.
+        worker = min(alive_workers, key=key)
+        self._next_worker_index = (worker.index + 1) % len(self._workers)
+        return worker
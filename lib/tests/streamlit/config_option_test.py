@@ -109,6 +109,21 @@ class ConfigOptionTest(unittest.TestCase):
         self.assertEqual(my_value, c.value)
         self.assertEqual(where_defined, c.where_defined)
 
+    def test_is_computed(self):
+        key = "mysection.myName"
+        c = ConfigOption(key, default_val="default")
+        self.assertFalse(c.is_computed)
+
+        @c
+        def someRandomFunction():
+            """Random docstring."""
+            return "computed"
+
+        self.assertTrue(c.is_computed)
+
+        c.set_value("myValue", "im defined here")
+        self.assertFalse(c.is_computed)
+
     def test_deprecated_expired(self):
         my_value = "myValue"
         where_defined = "im defined here"
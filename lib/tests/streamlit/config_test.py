@@ -44,6 +44,7 @@ class ConfigTest(unittest.TestCase):
                 config, "_section_descriptions", new=copy.deepcopy(SECTION_DESCRIPTIONS)
             ),
             patch.object(config, "_config_options", new=copy.deepcopy(CONFIG_OPTIONS)),
+            patch.object(config, "_config_snapshot", new=None),
             patch.dict(os.environ),
         ]
 
@@ -404,21 +405,29 @@ class ConfigTest(unittest.TestCase):
                 "global.developmentMode",
                 "global.disableWidgetStateDuplicationWarning",
                 "global.e2eTest",
+                "global.exactDataHashing",
+                "global.maxCachedImagesSize",
                 "global.maxCachedMessageAge",
+                "global.maxCachedMessagesSize",
+                "global.maxDiskCacheSize",
                 "global.minCachedMessageSize",
                 "global.showWarningOnDirectExecution",
+                "global.spillCachedMessagesToDisk",
                 "global.storeCachedForwardMessagesInMemory",
                 "global.includeFragmentRunsInForwardMessageCacheCount",
                 "global.suppressDeprecationWarnings",
                 "global.unitTest",
+                "global.zeroCopyCacheData",
                 "logger.enableRich",
                 "logger.level",
                 "logger.messageFormat",
+                "runner.bytecodeCachePath",
                 "runner.enforceSerializableSessionState",
                 "runner.magicEnabled",
                 "runner.postScriptGC",
                 "runner.fastReruns",
                 "runner.enumCoercion",
+                "runner.writeStreamFlushInterval",
                 "magic.displayRootDocString",
                 "magic.displayLastExprIfNoSemicolon",
                 "mapbox.token",
@@ -437,12 +446,19 @@ class ConfigTest(unittest.TestCase):
                 "server.port",
                 "server.runOnSave",
                 "server.maxUploadSize",
+                "server.maxSessionUploadSize",
                 "server.maxMessageSize",
                 "server.enableStaticServing",
                 "server.enableArrowTruncation",
                 "server.sslCertFile",
                 "server.sslKeyFile",
+                "server.websocketBatchSize",
+                "server.mediaFileDiskThreshold",
+                "server.mediaFileIdHash",
+                "server.enableImageVariants",
+                "server.enableWebpImageVariants",
                 "server.disconnectedSessionTTL",
+                "server.workerProcesses",
                 "ui.hideTopBar",
             ]
         )
@@ -518,6 +534,63 @@ class ConfigTest(unittest.TestCase):
         config._set_option("browser.gatherUsageStats", "test", "test")
         self.assertEqual("test", config.get_option("browser.gatherUsageStats"))
 
+    def test_get_option_from_snapshot(self):
+        """Once config options are set, get_option reads them from a snapshot
+        without grabbing the config lock."""
+        config._set_option("browser.serverAddress", "some.bucket", "test")
+
+        with patch.object(config, "_config_lock") as config_lock:
+            self.assertEqual("some.bucket", config.get_option("browser.serverAddress"))
+            config_lock.__enter__.assert_not_called()
+
+        with pytest.raises(RuntimeError) as e:
+            config.get_option("doesnt.exist")
+        self.assertEqual(str(e.value), 'Config key "doesnt.exist" not defined.')
+
+    def test_set_option_publishes_snapshot(self):
+        """Setting an option replaces the snapshot, which leaves out computed
+        options."""
+        config._set_option("server.port", 1234, "test")
+        old_snapshot = config._config_snapshot
+
+        config._set_option("server.port", 4321, "test")
+
+        assert old_snapshot is not None
+        self.assertEqual(1234, old_snapshot.values["server.port"])
+        self.assertEqual(4321, config.get_option("server.port"))
+        self.assertNotIn("browser.serverPort", config._config_snapshot.values)
+        self.assertEqual(4321, config.get_option("browser.serverPort"))
+        with pytest.raises(TypeError):
+            config._config_snapshot.values["server.port"] = 1  # type: ignore
+
+        # A computed option is included once it's set.
+        config._set_option("browser.serverPort", 1234, "test")
+        self.assertEqual(1234, config._config_snapshot.values["browser.serverPort"])
+
+    def test_snapshot_of_other_config_options_ignored(self):
+        """A snapshot is only used while it belongs to the current config
+        options."""
+        config._set_option("browser.serverAddress", "some.bucket", "test")
+
+        with patch.object(config, "_config_options", new=copy.deepcopy(CONFIG_OPTIONS)):
+            self.assertEqual("localhost", config.get_option("browser.serverAddress"))
+
+    def test_on_config_changed(self):
+        callback = MagicMock()
+        disconnect = config.on_config_changed(callback)
+
+        config._set_option("server.port", 1234, "test")
+        callback.assert_called_once()
+        self.assertEqual(1234, callback.call_args.args[0]["server.port"])
+
+        # Setting an option to its current value doesn't notify.
+        config._set_option("server.port", 1234, "test")
+        callback.assert_called_once()
+
+        disconnect()
+        config._set_option("server.port", 4321, "test")
+        callback.assert_called_once()
+
     def test_is_manually_set(self):
         config._set_option("browser.serverAddress", "some.bucket", "test")
         self.assertEqual(True, config.is_manually_set("browser.serverAddress"))
@@ -714,6 +787,7 @@ class ConfigLoadingTest(unittest.TestCase):
                 config, "_section_descriptions", new=copy.deepcopy(SECTION_DESCRIPTIONS)
             ),
             patch.object(config, "_config_options", new=None),
+            patch.object(config, "_config_snapshot", new=None),
         ]
 
         for p in self.patches:
@@ -876,6 +950,37 @@ class ConfigLoadingTest(unittest.TestCase):
     def test_max_message_size_default_values(self):
         self.assertEqual(200, config.get_option("server.maxMessageSize"))
 
+    def test_config_snapshot_published_once_parsed(self):
+        """The snapshot and on_config_changed only see fully parsed config."""
+        global_config = """
+        [theme]
+        base = "dark"
+        font = "sans serif"
+        """
+        open_patch = patch("streamlit.config.open", mock_open(read_data=global_config))
+        # patch streamlit.*.os.* instead of os.* for py35 compat
+        makedirs_patch = patch("streamlit.config.os.makedirs")
+        makedirs_patch.return_value = True
+        pathexists_patch = patch("streamlit.config.os.path.exists")
+        pathexists_patch.side_effect = (
+            lambda path: path == "/mock/home/folder/.streamlit/config.toml"
+        )
+
+        callback = MagicMock()
+        disconnect = config.on_config_changed(callback)
+        try:
+            with open_patch, makedirs_patch, pathexists_patch:
+                config.get_config_options()
+        finally:
+            disconnect()
+
+        callback.assert_called_once()
+        values = callback.call_args.args[0]
+        self.assertEqual("dark", values["theme.base"])
+        self.assertEqual("sans serif", values["theme.font"])
+        self.assertIs(config._config_snapshot.values, values)
+        self.assertIs(config._config_snapshot.options, config._config_options)
+
     def test_config_options_removed_on_reparse(self):
         """Test that config options that are removed in a file are also removed
         from our _config_options dict."""
@@ -34,17 +34,20 @@ from streamlit.elements.lib.image_utils import (
     _image_may_have_alpha_channel,
     _np_array_to_bytes,
     _PIL_to_bytes,
+    _transcode_image,
     image_to_url,
     marshall_images,
 )
 from streamlit.errors import StreamlitAPIException
 from streamlit.proto.Image_pb2 import ImageList as ImageListProto
+from streamlit.runtime.image_transcode_cache import get_image_transcode_cache
 from streamlit.runtime.memory_media_file_storage import (
     _calculate_file_id,
     get_extension_for_mimetype,
 )
 from streamlit.web.server.server import MEDIA_ENDPOINT
 from tests.delta_generator_test_case import DeltaGeneratorTestCase
+from tests.testutil import patch_config_options
 
 
 def create_image(size, format="RGB", add_alpha=True):
@@ -397,6 +400,68 @@ class ImageProtoTest(DeltaGeneratorTestCase):
         img = Image.new(format, (1, 1))
         self.assertEqual(_image_may_have_alpha_channel(img), expected_alpha)
 
+    def test_transcoded_images_are_cached(self):
+        """An image that's shown again with the same parameters isn't
+        transcoded again."""
+        get_image_transcode_cache().clear()
+        img = np.array(IMAGES["img_32_32_3_rgb"]["np"])
+
+        with mock.patch(
+            "streamlit.elements.lib.image_utils._transcode_image",
+            wraps=_transcode_image,
+        ) as transcode_image:
+            url = image_to_url(img, -1, False, "RGB", "auto", "mock_image_id")
+            self.assertEqual(
+                url, image_to_url(img.copy(), -1, False, "RGB", "auto", "other_id")
+            )
+            self.assertEqual(1, transcode_image.call_count)
+
+            # Changing the image or the parameters transcodes it again.
+            image_to_url(img, 16, False, "RGB", "auto", "mock_image_id")
+            image_to_url(img, -1, False, "BGR", "auto", "mock_image_id")
+            img[0, 0] = 255 - img[0, 0]
+            image_to_url(img, -1, False, "RGB", "auto", "mock_image_id")
+            self.assertEqual(4, transcode_image.call_count)
+
+    @patch_config_options({"global.maxCachedImagesSize": 0})
+    def test_transcoded_images_are_not_cached_if_disabled(self):
+        img = IMAGES["img_32_32_3_rgb"]["np"]
+
+        with mock.patch(
+            "streamlit.elements.lib.image_utils._transcode_image",
+            wraps=_transcode_image,
+        ) as transcode_image:
+            image_to_url(img, -1, False, "RGB", "auto", "mock_image_id")
+            image_to_url(img, -1, False, "RGB", "auto", "mock_image_id")
+            self.assertEqual(2, transcode_image.call_count)
+
+    def test_marshall_images_transcodes_list_once_per_image(self):
+        """The images of a list are transcoded together, and images that are
+        in the list more than once are transcoded once."""
+        get_image_transcode_cache().clear()
+        red = Image.new("RGB", (64, 64), color="red")
+        blue = Image.new("RGB", (64, 64), color="blue")
+
+        with mock.patch(
+            "streamlit.elements.lib.image_utils._transcode_image",
+            wraps=_transcode_image,
+        ) as transcode_image:
+            st.image([red, blue, "https://streamlit.io/test.png", red])
+            self.assertEqual(2, transcode_image.call_count)
+
+        imgs = self.get_delta_from_queue().new_element.imgs.imgs
+        self.assertEqual(4, len(imgs))
+        self.assertEqual(
+            image_to_url(red, -1, False, "RGB", "auto", "mock_image_id"),
+            imgs[0].url,
+        )
+        self.assertEqual(
+            image_to_url(blue, -1, False, "RGB", "auto", "mock_image_id"),
+            imgs[1].url,
+        )
+        self.assertEqual("https://streamlit.io/test.png", imgs[2].url)
+        self.assertEqual(imgs[0].url, imgs[3].url)
+
     def test_st_image_PIL_image(self):
         """Test st.image with PIL image."""
         img = Image.new("RGB", (64, 64), color="red")
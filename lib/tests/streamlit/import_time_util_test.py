@@ -0,0 +1,145 @@
+# Copyright (c) Streamlit Inc. (2018-2022) Snowflake Inc. (2022-2025)
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from __future__ import annotations
+
+import subprocess
+import sys
+import unittest
+
+import pytest
+
+from streamlit.import_time_util import (
+    ImportTime,
+    get_imports_of,
+    parse_import_time_output,
+    profile_import,
+)
+
+# Modules that take a while to import, and that `import streamlit` must not
+# import. They're imported once they're needed instead.
+_LAZILY_IMPORTED_MODULES = [
+    "altair",
+    "numpy",
+    "pandas",
+    "plotly",
+    "pyarrow",
+    "tornado",
+    "streamlit.emojis",
+    "streamlit.material_icon_names",
+]
+
+# The most Streamlit modules that `import streamlit` may import. Unlike the
+# import time, this doesn't depend on the machine or on the installed versions
+# of other packages. Raise it deliberately if a new module has to be imported
+# eagerly.
+_MAX_IMPORTED_STREAMLIT_MODULES = 265
+
+_IMPORT_TIME_OUTPUT = """\
+import time: self [us] | cumulative | imported package
+import time:       100 |        100 | site
+import time:       200 |        200 |     streamlit.version
+import time:       300 |        500 |   streamlit.config
+import time:       400 |        900 | streamlit
+Unrelated output
+"""
+
+
+class ImportTimeUtilTest(unittest.TestCase):
+    def test_parse_import_time_output(self):
+        self.assertEqual(
+            [
+                ImportTime("site", 100, 100, 0),
+                ImportTime("streamlit.version", 200, 200, 2),
+                ImportTime("streamlit.config", 300, 500, 1),
+                ImportTime("streamlit", 400, 900, 0),
+            ],
+            parse_import_time_output(_IMPORT_TIME_OUTPUT),
+        )
+
+    def test_get_imports_of(self):
+        import_times = parse_import_time_output(_IMPORT_TIME_OUTPUT)
+
+        self.assertEqual(
+            ["streamlit.version", "streamlit.config", "streamlit"],
+            [
+                import_time.module
+                for import_time in get_imports_of(import_times, "streamlit")
+            ],
+        )
+        self.assertEqual([], get_imports_of(import_times, "plotly"))
+
+    def test_profile_import(self):
+        streamlit_imports = get_imports_of(profile_import("streamlit"), "streamlit")
+
+        self.assertEqual("streamlit", streamlit_imports[-1].module)
+        self.assertIn(
+            "streamlit.delta_generator",
+            [import_time.module for import_time in streamlit_imports],
+        )
+
+    def test_profile_import_raises_for_missing_module(self):
+        with self.assertRaises(RuntimeError):
+            profile_import("streamlit_module_that_does_not_exist")
+
+    def test_slow_modules_are_not_imported(self):
+        """`import streamlit` doesn't import modules that are slow to import."""
+        # Streamlit is imported in a new process, since this one has already
+        # imported the modules through other tests.
+        output = subprocess.check_output(
+            [
+                sys.executable,
+                "-c",
+                "import sys, streamlit; print('\\n'.join(sys.modules))",
+            ],
+            text=True,
+        )
+        imported_modules = set(output.splitlines())
+
+        for module in _LAZILY_IMPORTED_MODULES:
+            self.assertNotIn(module, imported_modules)
+
+    def test_plotly_theme_is_configured_when_plotly_is_imported(self):
+        """The Streamlit theme is the default Plotly theme, even though Plotly
+        is imported after Streamlit."""
+        pytest.importorskip("plotly")
+        output = subprocess.check_output(
+            [
+                sys.executable,
+                "-c",
+                "import streamlit, plotly.io as pio; print(pio.templates.default)",
+            ],
+            text=True,
+        )
+        self.assertEqual("streamlit", output.strip())
+
+
+@pytest.mark.usefixtures("benchmark")
+def test_import_time_performance(benchmark):
+    """Performance test for `import streamlit` in a new interpreter.
+
+    Fails if `import streamlit` imports more Streamlit modules than
+    `_MAX_IMPORTED_STREAMLIT_MODULES`.
+    """
+    import_times = benchmark.pedantic(profile_import, args=("streamlit",), rounds=5)
+
+    streamlit_modules = [
+        import_time.module
+        for import_time in get_imports_of(import_times, "streamlit")
+        if import_time.module.split(".")[0] == "streamlit"
+    ]
+    assert len(streamlit_modules) <= _MAX_IMPORTED_STREAMLIT_MODULES, (
+        f"`import streamlit` imported {len(streamlit_modules)} Streamlit modules, "
+        f"more than the {_MAX_IMPORTED_STREAMLIT_MODULES} allowed."
+    )
@@ -859,6 +859,54 @@ class AppSessionScriptEventTest(IsolatedAsyncioTestCase):
 
         handle_event_spy.assert_called_once()
 
+    async def test_events_handled_in_a_single_callback(self):
+        """ScriptRunner events that are sent in a burst wake up the event loop
+        once, and are handled in order."""
+        event_loop = asyncio.get_running_loop()
+        session = _create_test_session(event_loop)
+        handle_event_spy = MagicMock()
+        session._handle_scriptrunner_event_on_event_loop = handle_event_spy
+        msgs = [ForwardMsg() for _ in range(100)]
+
+        def send_events():
+            for msg in msgs:
+                session._on_scriptrunner_event(
+                    sender=None,
+                    event=ScriptRunnerEvent.ENQUEUE_FORWARD_MSG,
+                    forward_msg=msg,
+                )
+
+        with patch.object(
+            event_loop, "call_soon_threadsafe", wraps=event_loop.call_soon_threadsafe
+        ) as call_soon_threadsafe_spy:
+            thread = threading.Thread(target=send_events)
+            thread.start()
+            thread.join()
+            call_soon_threadsafe_spy.assert_called_once()
+
+        await asyncio.sleep(0)
+
+        assert [call.args[2] for call in handle_event_spy.call_args_list] == msgs
+
+        # Events that are sent after the callback ran wake up the loop again.
+        send_events()
+        await asyncio.sleep(0)
+
+        assert handle_event_spy.call_count == 200
+
+    async def test_event_handler_error_does_not_drop_events(self):
+        session = _create_test_session(asyncio.get_running_loop())
+        handle_event_spy = MagicMock(side_effect=[RuntimeError("oops"), None])
+        session._handle_scriptrunner_event_on_event_loop = handle_event_spy
+
+        session._on_scriptrunner_event(None, ScriptRunnerEvent.SCRIPT_STARTED)
+        session._on_scriptrunner_event(
+            None, ScriptRunnerEvent.SCRIPT_STOPPED_WITH_SUCCESS
+        )
+        await asyncio.sleep(0)
+
+        assert handle_event_spy.call_count == 2
+
     async def test_event_handler_asserts_if_called_off_event_loop(self):
         """AppSession._handle_scriptrunner_event_on_event_loop will assert
         if it's called from another event loop (or no event loop).
@@ -25,6 +25,8 @@ import unittest
 from typing import Any
 from unittest.mock import MagicMock, Mock, mock_open, patch
 
+import numpy as np
+import pandas as pd
 from parameterized import parameterized
 
 import streamlit as st
@@ -33,7 +35,10 @@ from streamlit.errors import StreamlitAPIException
 from streamlit.proto.Text_pb2 import Text as TextProto
 from streamlit.runtime import Runtime
 from streamlit.runtime.caching import cached_message_replay
-from streamlit.runtime.caching.cache_data_api import get_data_cache_stats_provider
+from streamlit.runtime.caching.cache_data_api import (
+    _ENTRY_HEADER,
+    get_data_cache_stats_provider,
+)
 from streamlit.runtime.caching.cache_errors import CacheError
 from streamlit.runtime.caching.cached_message_replay import (
     CachedResult,
@@ -67,7 +72,7 @@ from tests.streamlit.element_mocks import (
 from tests.streamlit.runtime.caching.common_cache_test import (
     as_cached_result as _as_cached_result,
 )
-from tests.testutil import create_mock_script_run_ctx
+from tests.testutil import create_mock_script_run_ctx, patch_config_options
 
 
 def as_cached_result(value: Any) -> CachedResult:
@@ -565,6 +570,220 @@ class CacheDataPersistTest(DeltaGeneratorTestCase):
             mock_write.assert_not_called()
 
 
+class CacheDataZeroCopyTest(unittest.TestCase):
+    def setUp(self) -> None:
+        # Caching functions rely on an active script run ctx
+        add_script_run_ctx(threading.current_thread(), create_mock_script_run_ctx())
+        mock_runtime = MagicMock(spec=Runtime)
+        mock_runtime.cache_storage_manager = MemoryCacheStorageManager()
+        Runtime._instance = mock_runtime
+
+    def tearDown(self):
+        st.cache_data.clear()
+
+    @patch_config_options({"global.zeroCopyCacheData": True})
+    def test_hits_share_read_only_buffers(self):
+        """With zeroCopyCacheData, cache hits return read-only views on the
+        same cached buffers instead of fresh copies."""
+
+        @st.cache_data
+        def f():
+            return pd.DataFrame({"a": np.arange(1000), "b": np.ones(1000)})
+
+        f()
+        r1 = f()
+        r2 = f()
+
+        pd.testing.assert_frame_equal(
+            r1, pd.DataFrame({"a": np.arange(1000), "b": np.ones(1000)})
+        )
+        self.assertFalse(r1["a"].to_numpy().flags.writeable)
+        self.assertTrue(np.shares_memory(r1["a"].to_numpy(), r2["a"].to_numpy()))
+
+        with self.assertRaises(ValueError):
+            r1.loc[0, "a"] = 42
+
+    @patch_config_options({"global.zeroCopyCacheData": True})
+    def test_non_buffer_values_round_trip(self):
+        """Values without out-of-band buffers still round-trip."""
+
+        @st.cache_data
+        def f():
+            return {"list": [0, 1], "text": "hello"}
+
+        f()
+        r1 = f()
+        r1["list"][0] = 1
+
+        self.assertEqual({"list": [0, 1], "text": "hello"}, f())
+
+    def test_out_of_band_entries_are_copied_when_disabled(self):
+        """Entries written with zeroCopyCacheData can be read back with the
+        option disabled, in which case each caller gets a writable copy."""
+
+        @st.cache_data
+        def f():
+            return np.arange(10)
+
+        with patch_config_options({"global.zeroCopyCacheData": True}):
+            f()
+
+        r1 = f()
+        r1[0] = 42
+
+        self.assertTrue(r1.flags.writeable)
+        np.testing.assert_array_equal(np.arange(10), f())
+
+
+class CacheDataPolicyTest(unittest.TestCase):
+    """Tests for functions that are cached under several caching policies,
+    like `st.connection(...).query(sql, ttl=ttl)` with varying ttls."""
+
+    def setUp(self) -> None:
+        # Caching functions rely on an active script run ctx
+        add_script_run_ctx(threading.current_thread(), create_mock_script_run_ctx())
+        mock_runtime = MagicMock(spec=Runtime)
+        mock_runtime.cache_storage_manager = MemoryCacheStorageManager()
+        Runtime._instance = mock_runtime
+        self.calls: list[int] = []
+
+    def tearDown(self):
+        st.cache_data.clear()
+
+    def _make_query(self, ttl: float | None, max_entries: int | None = None) -> Any:
+        @st.cache_data(ttl=ttl, max_entries=max_entries)
+        def query(x):
+            self.calls.append(x)
+            return x * 2
+
+        return query
+
+    def _query(self, x: int, ttl: float | None = None) -> int:
+        return self._make_query(ttl)(x)
+
+    def test_policy_change_keeps_entries(self):
+        """Switching back to a previous policy reuses its cached entries."""
+        self.assertEqual(2, self._query(1, ttl=None))
+        self.assertEqual(2, self._query(1, ttl=60))
+        self.assertEqual(2, self._query(1, ttl=None))
+
+        self.assertEqual([1], self.calls)
+
+    def test_reuses_entries_of_shorter_ttl(self):
+        """An entry cached with a shorter ttl is fresh enough for a longer
+        one, so it's reused instead of recomputed."""
+        self._query(1, ttl=10)
+        self._query(1, ttl=60)
+        self._query(1, ttl=None)
+
+        self.assertEqual([1], self.calls)
+
+    @patch("streamlit.runtime.caching.cache_utils.CACHE_DATA_TIMER")
+    def test_tightened_ttl_keeps_young_entries(self, timer_patch: Mock):
+        """Tightening the ttl of a function keeps the entries that are young
+        enough for the new ttl, and recomputes the others."""
+        timer_patch.return_value = 0
+        self._query(1, ttl=None)
+        self._query(2, ttl=60)
+
+        timer_patch.return_value = 5
+        self._query(1, ttl=10)
+        self._query(2, ttl=10)
+        self.assertEqual([1, 2], self.calls)
+
+        timer_patch.return_value = 15
+        self._query(1, ttl=10)
+        self._query(2, ttl=10)
+        self.assertEqual([1, 2, 1, 2], self.calls)
+
+    @patch("streamlit.runtime.caching.cache_utils.CACHE_DATA_TIMER")
+    def test_reused_entry_expires_with_its_creation_time(self, timer_patch: Mock):
+        """A reused entry keeps the time it was created at, so it can't be
+        served for longer than a policy's ttl after it was created."""
+        timer_patch.return_value = 0
+        self._query(1, ttl=10)
+
+        timer_patch.return_value = 9
+        self._query(1, ttl=60)
+        self.assertEqual([1], self.calls)
+
+        timer_patch.return_value = 65
+        self._query(1, ttl=60)
+        self.assertEqual([1, 1], self.calls)
+
+    def test_clear_clears_all_policies(self):
+        self._query(1, ttl=10)
+        self._query(2, ttl=60)
+
+        st.cache_data.clear()
+        self._query(1, ttl=10)
+        self._query(2, ttl=60)
+
+        self.assertEqual([1, 2, 1, 2], self.calls)
+
+    def test_function_clear_clears_all_policies(self):
+        """Clearing a function's cache clears it under all of its policies."""
+        self._query(1, ttl=10)
+        query = self._make_query(ttl=None)
+        query(1)
+        self.assertEqual([1], self.calls)
+
+        query.clear()
+        self._query(1, ttl=10)
+        self._query(1, ttl=None)
+        self.assertEqual([1, 1], self.calls)
+
+    def test_entries_are_stored_once(self):
+        """An entry is stored once, no matter how many policies use it."""
+        for ttl in range(1, 11):
+            self._query(1, ttl=ttl)
+
+        self.assertEqual([1], self.calls)
+        (store,) = get_data_cache_stats_provider()._function_stores.values()
+        self.assertEqual(10, len(store._caches))
+        self.assertEqual(1, len(get_data_cache_stats_provider().get_stats()))
+
+    @patch("streamlit.runtime.caching.cache_utils.CACHE_DATA_TIMER")
+    def test_evicts_entries_expired_for_all_policies(self, timer_patch: Mock):
+        """Entries are only removed from the storage once they're older than
+        the longest ttl of the function's policies."""
+        timer_patch.return_value = 0
+        self._query(1, ttl=10)
+        self._query(2, ttl=60)
+        (store,) = get_data_cache_stats_provider()._function_stores.values()
+
+        # Entry 1 expired for ttl=10, but ttl=60 can still use it.
+        timer_patch.return_value = 30
+        self._query(3, ttl=10)
+        self.assertEqual(3, len(store._created_at))
+        self._query(1, ttl=60)
+        self.assertEqual([1, 2, 3], self.calls)
+
+        timer_patch.return_value = 70
+        self._query(4, ttl=10)
+        self.assertEqual(2, len(store._created_at))
+        self._query(1, ttl=None)
+        self.assertEqual([1, 2, 3, 4, 1], self.calls)
+
+    def test_evicts_entries_beyond_largest_max_entries(self):
+        """Entries are only evicted once there are more of them than the
+        largest max_entries of the function's policies allows."""
+        small = self._make_query(ttl=None, max_entries=1)
+        large = self._make_query(ttl=None, max_entries=2)
+
+        small(1)
+        large(2)
+        small(1)
+        large(2)
+        self.assertEqual([1, 2], self.calls)
+
+        # Entry 1 is the least recently used one.
+        large(3)
+        small(2)
+        small(1)
+        self.assertEqual([1, 2, 3, 1], self.calls)
+
+
 class CacheDataStatsProviderTest(unittest.TestCase):
     def setUp(self):
         # Caching functions rely on an active script run ctx
@@ -605,14 +824,14 @@ class CacheDataStatsProviderTest(unittest.TestCase):
                 category_name="st_cache_data",
                 cache_name=foo_cache_name,
                 byte_length=(
-                    get_byte_length(as_cached_result([3.14] * 53))
-                    + get_byte_length(as_cached_result([3.14]))
+                    get_data_byte_length(as_cached_result([3.14] * 53))
+                    + get_data_byte_length(as_cached_result([3.14]))
                 ),
             ),
             CacheStat(
                 category_name="st_cache_data",
                 cache_name=bar_cache_name,
-                byte_length=get_byte_length(as_cached_result("shivermetimbers")),
+                byte_length=get_data_byte_length(as_cached_result("shivermetimbers")),
             ),
         ]
 
@@ -727,6 +946,11 @@ def get_byte_length(value):
     return len(pickle.dumps(value))
 
 
+def get_data_byte_length(value):
+    """Return the byte length of the pickled value, as stored by st.cache_data."""
+    return _ENTRY_HEADER.size + get_byte_length(value)
+
+
 class AlwaysFailingTestCacheStorageManager(CacheStorageManager):
     """A CacheStorageManager that always fails in check_context."""
 
@@ -699,9 +699,12 @@ class CommonCacheTTLTest(unittest.TestCase):
     @parameterized.expand(
         [("cache_data", cache_data), ("cache_resource", cache_resource)]
     )
+    @patch("streamlit.runtime.caching.cache_utils.CACHE_DATA_TIMER")
     @patch("streamlit.runtime.caching.cache_utils.TTLCACHE_TIMER")
-    def test_ttl(self, _, cache_decorator, timer_patch: Mock):
+    def test_ttl(self, _, cache_decorator, timer_patch: Mock, data_timer_patch: Mock):
         """Entries should expire after the given ttl."""
+        # st.cache_data measures ttls with its own timer.
+        data_timer_patch.side_effect = lambda: timer_patch.return_value
         one_day = 60 * 60 * 24
 
         # Create 2 cached functions to test that they don't interfere
@@ -759,9 +762,14 @@ class CommonCacheTTLTest(unittest.TestCase):
     @parameterized.expand(
         [("cache_data", cache_data), ("cache_resource", cache_resource)]
     )
+    @patch("streamlit.runtime.caching.cache_utils.CACHE_DATA_TIMER")
     @patch("streamlit.runtime.caching.cache_utils.TTLCACHE_TIMER")
-    def test_ttl_timedelta(self, _, cache_decorator, timer_patch: Mock):
+    def test_ttl_timedelta(
+        self, _, cache_decorator, timer_patch: Mock, data_timer_patch: Mock
+    ):
         """Entries should expire after the given ttl."""
+        # st.cache_data measures ttls with its own timer.
+        data_timer_patch.side_effect = lambda: timer_patch.return_value
         one_day_seconds = 60 * 60 * 24
         one_day_timedelta = timedelta(days=1)
         two_days_timedelta = timedelta(days=2)
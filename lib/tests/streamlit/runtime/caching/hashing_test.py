@@ -16,6 +16,7 @@
 
 from __future__ import annotations
 
+import copy
 import datetime
 import functools
 import hashlib
@@ -26,10 +27,11 @@ import time
 import types
 import unittest
 import uuid
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
 from enum import Enum, auto
 from io import BytesIO, StringIO
-from unittest.mock import MagicMock, Mock
+from unittest.mock import MagicMock, Mock, patch
 
 import numpy as np
 import pandas as pd
@@ -45,10 +47,12 @@ from streamlit.runtime.caching.hashing import (
     _NP_SIZE_LARGE,
     _PANDAS_ROWS_LARGE,
     UserHashError,
+    _arrow_digest,
     update_hash,
 )
 from streamlit.runtime.uploaded_file_manager import UploadedFile, UploadedFileRec
 from streamlit.type_util import is_type
+from tests.testutil import patch_config_options
 
 get_main_script_director = MagicMock(return_value=os.getcwd())
 
@@ -192,6 +196,27 @@ class HashTest(unittest.TestCase):
         self.assertNotEqual(get_hash(aware_datetime1), get_hash(aware_datetime2))
         self.assertNotEqual(get_hash(aware_datetime1), get_hash(naive_datetime1))
 
+    def test_equal_datetimes_in_different_timezones(self):
+        """Datetimes for the same instant in different timezones are equal, but
+        hash differently, even when they're hashed together."""
+        utc_datetime = datetime.datetime(
+            2007, 12, 23, 15, 45, 55, tzinfo=datetime.timezone.utc
+        )
+        other_datetime = utc_datetime.astimezone(
+            datetime.timezone(datetime.timedelta(hours=1))
+        )
+        self.assertEqual(utc_datetime, other_datetime)
+
+        self.assertNotEqual(get_hash(utc_datetime), get_hash(other_datetime))
+        self.assertNotEqual(
+            get_hash([utc_datetime, utc_datetime]),
+            get_hash([utc_datetime, other_datetime]),
+        )
+        self.assertEqual(
+            get_hash([other_datetime, other_datetime]),
+            get_hash([other_datetime, copy.copy(other_datetime)]),
+        )
+
     @parameterized.expand(
         [
             "US/Pacific",
@@ -256,6 +281,62 @@ class HashTest(unittest.TestCase):
         self.assertNotEqual(get_hash((1,)), get_hash(1))
         self.assertNotEqual(get_hash((1,)), get_hash([1]))
 
+    @parameterized.expand(
+        [
+            ([1, 2, 3], "ed991ec1bbcc251364e15f21190c5041"),
+            (["a", "b"], "da1371d7075bb413ac664e9bc8655a3e"),
+            (
+                [(i, str(i), i / 2) for i in range(3)],
+                "257eba478a2abb3da2a32201f268232d",
+            ),
+            ({"a": [True, None], "b": (1.5, b"x")}, "776d8de1888071c008abcaeca0d8ab34"),
+        ]
+    )
+    def test_hash_is_stable(self, value, expected):
+        """Hashes must not change between versions, as they're used as the
+        keys of persisted caches."""
+        self.assertEqual(expected, get_hash(value).hex())
+
+    def test_homogeneous_list(self):
+        """Lists of scalars of the same type hash like any other list."""
+        self.assertEqual(get_hash([1, 2, 3]), get_hash([1, 2, 3]))
+        self.assertNotEqual(get_hash([1, 2, 3]), get_hash([1, 2, 4]))
+        self.assertNotEqual(get_hash([1, 2, 3]), get_hash([1, 2, 3.0]))
+        self.assertNotEqual(get_hash([1, 0]), get_hash([True, False]))
+        self.assertNotEqual(get_hash(["a", "b"]), get_hash([b"a", b"b"]))
+
+    def test_homogeneous_list_with_hash_funcs(self):
+        """User hash functions for scalar types apply to list items."""
+        hash_funcs = {int: lambda x: str(x % 2)}
+
+        self.assertEqual(
+            get_hash([1, 2], hash_funcs=hash_funcs),
+            get_hash([3, 4], hash_funcs=hash_funcs),
+        )
+        self.assertNotEqual(
+            get_hash([1, 2], hash_funcs=hash_funcs),
+            get_hash([2, 2], hash_funcs=hash_funcs),
+        )
+
+    def test_repeated_tuples(self):
+        """A tuple that's found several times hashes like equal distinct tuples."""
+        shared = (1, [2, 3])
+        self.assertEqual(
+            get_hash([shared, shared, {"a": shared}]),
+            get_hash([(1, [2, 3]), (1, [2, 3]), {"a": (1, [2, 3])}]),
+        )
+
+        # Tuples that contain a cycle hash differently depending on where the
+        # cycle was entered, so they must not be reused.
+        a = [0]
+        cyclic = (1, a)
+        a.append(cyclic)
+        b = [0]
+        b.append((1, b))
+        c = [0]
+        c.append((1, c))
+        self.assertEqual(get_hash([a, cyclic]), get_hash([b, c[1]]))
+
     def test_mappingproxy(self):
         a = types.MappingProxyType({"a": 1})
         b = types.MappingProxyType({"a": 1})
@@ -646,6 +727,164 @@ class HashTest(unittest.TestCase):
         self.assertNotEqual(get_hash(enum_a), get_hash(enum_b))
 
 
+class ExactDataHashingTest(unittest.TestCase):
+    """Tests for hashing large data in full, with global.exactDataHashing."""
+
+    def setUp(self) -> None:
+        super().setUp()
+        config_patch = patch_config_options({"global.exactDataHashing": True})
+        config_patch.__enter__()
+        self.addCleanup(config_patch.__exit__, None, None, None)
+
+    def _large_dataframe(self) -> pd.DataFrame:
+        n = _PANDAS_ROWS_LARGE
+        return pd.DataFrame(
+            {
+                "ints": np.arange(n),
+                "floats": np.zeros(n),
+                "strings": pd.Series(np.arange(n) % 10).astype(str),
+                "categories": pd.Categorical(np.arange(n) % 3),
+                "arrow": pd.Series(np.arange(n), dtype="int64[pyarrow]"),
+                "mixed": pd.Series([1, "a"] * (n // 2), dtype=object),
+            }
+        )
+
+    def test_pandas_dataframe(self):
+        df1 = self._large_dataframe()
+        df2 = self._large_dataframe()
+
+        self.assertEqual(get_hash(df1), get_hash(df2))
+
+        # Sampling hashes just a few rows, so it would miss these changes.
+        for column, value in [
+            ("ints", -1),
+            ("floats", 1.0),
+            ("strings", "x"),
+            ("categories", 1),
+            ("mixed", "b"),
+        ]:
+            df2 = self._large_dataframe()
+            df2.loc[_PANDAS_ROWS_LARGE - 2, column] = value
+            self.assertNotEqual(get_hash(df1), get_hash(df2), column)
+
+        df2 = self._large_dataframe()
+        df2.index = df2.index + 1
+        self.assertNotEqual(get_hash(df1), get_hash(df2))
+
+        df2 = self._large_dataframe().rename(columns={"ints": "other"})
+        self.assertNotEqual(get_hash(df1), get_hash(df2))
+
+    def test_pandas_dataframe_arrow_column(self):
+        df1 = self._large_dataframe()
+        df2 = self._large_dataframe()
+        df2.loc[_PANDAS_ROWS_LARGE - 2, "arrow"] = -1
+
+        self.assertNotEqual(get_hash(df1), get_hash(df2))
+
+    def test_arrow_digests_are_cached(self):
+        """The digests of Arrow-backed columns are reused."""
+        df = self._large_dataframe()[["arrow"]]
+        get_hash(df)
+
+        with patch(
+            "streamlit.runtime.caching.hashing._arrow_digest",
+            wraps=_arrow_digest,
+        ) as arrow_digest:
+            get_hash(df)
+
+        # Only the column labels were hashed again.
+        hashed_lengths = [len(c.args[0]) for c in arrow_digest.call_args_list]
+        self.assertEqual([1], hashed_lengths)
+
+    def test_pandas_series(self):
+        series1 = pd.Series(np.zeros(_PANDAS_ROWS_LARGE))
+        series2 = pd.Series(np.zeros(_PANDAS_ROWS_LARGE))
+        self.assertEqual(get_hash(series1), get_hash(series2))
+
+        series2[_PANDAS_ROWS_LARGE - 2] = 1
+        self.assertNotEqual(get_hash(series1), get_hash(series2))
+
+    def test_numpy(self):
+        np1 = np.zeros(_NP_SIZE_LARGE)
+        np2 = np.zeros(_NP_SIZE_LARGE)
+        self.assertEqual(get_hash(np1), get_hash(np2))
+
+        np2[_NP_SIZE_LARGE - 2] = 1
+        self.assertNotEqual(get_hash(np1), get_hash(np2))
+        self.assertNotEqual(
+            get_hash(np.zeros(_NP_SIZE_LARGE).reshape(2, -1)), get_hash(np1)
+        )
+
+    @patch("streamlit.runtime.caching.hashing._EXACT_HASH_CHUNK_SIZE", 1024)
+    def test_numpy_chunks(self):
+        """Large arrays are hashed in chunks, and every chunk counts."""
+        np1 = np.zeros(_NP_SIZE_LARGE)
+        np2 = np.zeros(_NP_SIZE_LARGE)
+        np2[100] = 1
+
+        self.assertNotEqual(get_hash(np1), get_hash(np2))
+        self.assertEqual(get_hash(np1), get_hash(np.zeros(_NP_SIZE_LARGE)))
+
+    @patch("streamlit.runtime.caching.hashing._EXACT_HASH_CHUNK_SIZE", 1024)
+    @patch("streamlit.runtime.caching.hashing._EXACT_HASH_MAX_WORKERS", 1)
+    @patch("streamlit.runtime.caching.hashing._exact_hash_executor", None)
+    def test_dataframe_with_chunked_columns(self):
+        """Columns larger than a chunk don't deadlock the thread pool by
+        waiting on their own chunk tasks."""
+        df = pd.DataFrame({str(i): np.zeros(_PANDAS_ROWS_LARGE) for i in range(3)})
+        df2 = df.copy()
+        df2.iloc[100, 2] = 1
+
+        # Hash on another thread, so that a deadlock fails the test instead of
+        # hanging it.
+        executor = ThreadPoolExecutor(max_workers=1)
+        try:
+            hashes = executor.submit(lambda: (get_hash(df), get_hash(df2)))
+            hash1, hash2 = hashes.result(timeout=30)
+        finally:
+            executor.shutdown(wait=False)
+
+        self.assertNotEqual(hash1, hash2)
+        self.assertEqual(hash1, get_hash(df.copy()))
+
+    def test_polars_dataframe(self):
+        import polars as pl
+
+        df1 = pl.DataFrame(
+            {"a": np.zeros(_PANDAS_ROWS_LARGE), "b": ["x"] * _PANDAS_ROWS_LARGE}
+        )
+        df2 = df1.clone()
+        self.assertEqual(get_hash(df1), get_hash(df2))
+
+        df3 = df1.with_columns(
+            pl.when(pl.int_range(pl.len()) == _PANDAS_ROWS_LARGE - 2)
+            .then(pl.lit("y"))
+            .otherwise(pl.col("b"))
+            .alias("b")
+        )
+        self.assertNotEqual(get_hash(df1), get_hash(df3))
+
+    def test_polars_series(self):
+        import polars as pl
+
+        series1 = pl.Series(np.zeros(_PANDAS_ROWS_LARGE))
+        series2 = pl.Series(np.concatenate([np.zeros(_PANDAS_ROWS_LARGE - 1), [1]]))
+
+        self.assertEqual(get_hash(series1), get_hash(series1.clone()))
+        self.assertNotEqual(get_hash(series1), get_hash(series2))
+
+    def test_sliced_arrow_arrays(self):
+        """Slices of the same Arrow array with equal lengths hash differently."""
+        import pyarrow as pa
+
+        array = pa.array(["a", "b", "c", None])
+        self.assertNotEqual(_arrow_digest(array[0:2]), _arrow_digest(array[1:3]))
+        self.assertEqual(_arrow_digest(array[1:3]), _arrow_digest(array[1:3]))
+
+        nested = pa.array([[1], [2], [3]])
+        self.assertNotEqual(_arrow_digest(nested[0:1]), _arrow_digest(nested[1:2]))
+
+
 class NotHashableTest(unittest.TestCase):
     """Tests for various unhashable types."""
 
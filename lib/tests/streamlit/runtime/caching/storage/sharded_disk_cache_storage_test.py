@@ -0,0 +1,255 @@
+# Copyright (c) Streamlit Inc. (2018-2022) Snowflake Inc. (2022-2025)
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Unit tests for ShardedDiskCacheStorage and ShardedDiskCacheStorageManager"""
+
+from __future__ import annotations
+
+import os
+import unittest
+from unittest.mock import patch
+
+from testfixtures import TempDirectory
+
+from streamlit.runtime.caching.storage import (
+    CacheStorageContext,
+    CacheStorageKeyNotFoundError,
+)
+from streamlit.runtime.caching.storage.in_memory_cache_storage_wrapper import (
+    InMemoryCacheStorageWrapper,
+)
+from streamlit.runtime.caching.storage.sharded_disk_cache_storage import (
+    ShardedDiskCacheStorage,
+    ShardedDiskCacheStorageManager,
+)
+from streamlit.web.cache_storage_manager_config import (
+    create_default_cache_storage_manager,
+)
+from streamlit.web.worker_pool import WorkerInfo
+from tests.testutil import patch_config_options
+
+
+def _context(
+    function_key: str = "func-key",
+    ttl_seconds: float | None = None,
+    max_entries: int | None = None,
+    persist: str | None = "disk",
+) -> CacheStorageContext:
+    return CacheStorageContext(
+        function_key=function_key,
+        function_display_name="func-display-name",
+        persist=persist,
+        ttl_seconds=ttl_seconds,
+        max_entries=max_entries,
+    )
+
+
+class ShardedDiskCacheStorageManagerTest(unittest.TestCase):
+    def setUp(self) -> None:
+        super().setUp()
+        self.tempdir = TempDirectory(create=True)
+
+    def tearDown(self) -> None:
+        super().tearDown()
+        self.tempdir.cleanup()
+
+    def test_create(self):
+        """Tests that ShardedDiskCacheStorageManager.create() returns a sharded
+        storage wrapped with an in-memory layer."""
+        manager = ShardedDiskCacheStorageManager(cache_dir=self.tempdir.path)
+        storage = manager.create(_context(ttl_seconds=60, max_entries=100))
+        self.assertIsInstance(storage, InMemoryCacheStorageWrapper)
+        self.assertEqual(storage.ttl_seconds, 60)
+        self.assertEqual(storage.max_entries, 100)
+
+    def test_clear_all(self):
+        """Tests that clear_all removes the entries of all functions."""
+        manager = ShardedDiskCacheStorageManager(cache_dir=self.tempdir.path)
+        storage_a = ShardedDiskCacheStorage(_context("func-a"), manager)
+        storage_b = ShardedDiskCacheStorage(_context("func-b"), manager)
+        storage_a.set("aa11", b"a")
+        storage_b.set("bb22", b"b")
+
+        manager.clear_all()
+
+        self.assertFalse(os.path.exists(self.tempdir.path))
+        with self.assertRaises(CacheStorageKeyNotFoundError):
+            storage_a.get("aa11")
+        with self.assertRaises(CacheStorageKeyNotFoundError):
+            storage_b.get("bb22")
+
+    @patch_config_options({"global.maxDiskCacheSize": 10})
+    def test_default_manager_with_max_size(self):
+        """The default manager is sharded if global.maxDiskCacheSize is set."""
+        manager = create_default_cache_storage_manager()
+        self.assertIsInstance(manager, ShardedDiskCacheStorageManager)
+        self.assertEqual(10 * 1024 * 1024, manager._index._max_size_bytes)
+
+    def test_default_manager_in_worker_pool(self):
+        """In the workers of a worker pool, the caches of functions that aren't
+        persisted are shared through the pool's cache folder."""
+        worker_info = WorkerInfo(worker_index=0, shared_cache_dir=self.tempdir.path)
+        with patch(
+            "streamlit.web.cache_storage_manager_config.get_worker_info",
+            return_value=worker_info,
+        ):
+            worker_a = create_default_cache_storage_manager()
+            worker_b = create_default_cache_storage_manager()
+
+        storage_a = worker_a.create(_context(persist=None))
+        storage_b = worker_b.create(_context(persist=None))
+        storage_a.set("ab1234", b"value")
+
+        self.assertEqual(b"value", storage_b.get("ab1234"))
+        self.assertTrue(os.path.isdir(os.path.join(self.tempdir.path, "func-key")))
+
+
+class ShardedDiskCacheStorageTest(unittest.TestCase):
+    def setUp(self) -> None:
+        super().setUp()
+        self.tempdir = TempDirectory(create=True)
+        self.manager = ShardedDiskCacheStorageManager(
+            max_size_bytes=10, cache_dir=self.tempdir.path
+        )
+
+    def tearDown(self) -> None:
+        super().tearDown()
+        self.tempdir.cleanup()
+
+    def test_set_and_get(self):
+        """Entries are written to a shard folder and can be read back."""
+        storage = ShardedDiskCacheStorage(_context(), self.manager)
+        storage.set("ab1234", b"value")
+
+        self.assertEqual(b"value", storage.get("ab1234"))
+        self.assertTrue(
+            os.path.isfile(
+                os.path.join(self.tempdir.path, "func-key", "ab", "ab1234.memo")
+            )
+        )
+
+    def test_get_not_found(self):
+        storage = ShardedDiskCacheStorage(_context(), self.manager)
+        with self.assertRaises(CacheStorageKeyNotFoundError):
+            storage.get("ab1234")
+
+    def test_persist_none(self):
+        """Nothing is written to disk if persist is None."""
+        storage = ShardedDiskCacheStorage(_context(persist=None), self.manager)
+        storage.set("ab1234", b"value")
+
+        self.assertEqual([], os.listdir(self.tempdir.path))
+        with self.assertRaises(CacheStorageKeyNotFoundError):
+            storage.get("ab1234")
+
+    def test_evicts_least_recently_used_over_budget(self):
+        """Once the byte budget is exceeded, the least recently used entries
+        of any function are evicted."""
+        storage_a = ShardedDiskCacheStorage(_context("func-a"), self.manager)
+        storage_b = ShardedDiskCacheStorage(_context("func-b"), self.manager)
+        storage_a.set("k1", b"1234")
+        storage_b.set("k2", b"1234")
+        # Access k1, so k2 becomes the least recently used entry.
+        storage_a.get("k1")
+
+        storage_a.set("k3", b"1234")
+
+        self.assertEqual(b"1234", storage_a.get("k1"))
+        self.assertEqual(b"1234", storage_a.get("k3"))
+        with self.assertRaises(CacheStorageKeyNotFoundError):
+            storage_b.get("k2")
+        self.assertEqual(8, self.manager._index.total_size)
+
+    def test_max_entries(self):
+        """A function keeps at most max_entries entries on disk."""
+        storage = ShardedDiskCacheStorage(_context(max_entries=1), self.manager)
+        storage.set("k1", b"1")
+        storage.set("k2", b"2")
+
+        self.assertEqual(b"2", storage.get("k2"))
+        with self.assertRaises(CacheStorageKeyNotFoundError):
+            storage.get("k1")
+
+    @patch("streamlit.runtime.caching.storage.sharded_disk_cache_storage.time.time")
+    def test_ttl(self, mock_time):
+        """Entries older than the ttl are expired and removed."""
+        mock_time.return_value = 100
+        storage = ShardedDiskCacheStorage(_context(ttl_seconds=10), self.manager)
+        storage.set("k1", b"1")
+        self.assertEqual(b"1", storage.get("k1"))
+
+        mock_time.return_value = 111
+        with self.assertRaises(CacheStorageKeyNotFoundError):
+            storage.get("k1")
+        self.assertEqual(0, self.manager._index.total_size)
+
+    def test_clear_removes_only_function_entries(self):
+        storage_a = ShardedDiskCacheStorage(_context("func-a"), self.manager)
+        storage_b = ShardedDiskCacheStorage(_context("func-b"), self.manager)
+        storage_a.set("k1", b"1")
+        storage_b.set("k2", b"2")
+
+        storage_a.clear()
+
+        with self.assertRaises(CacheStorageKeyNotFoundError):
+            storage_a.get("k1")
+        self.assertEqual(b"2", storage_b.get("k2"))
+        self.assertFalse(os.path.exists(os.path.join(self.tempdir.path, "func-a")))
+
+    def test_delete(self):
+        storage = ShardedDiskCacheStorage(_context(), self.manager)
+        storage.set("k1", b"1")
+        storage.delete("k1")
+        # Deleting a missing key doesn't raise.
+        storage.delete("k1")
+
+        with self.assertRaises(CacheStorageKeyNotFoundError):
+            storage.get("k1")
+
+    def test_index_is_loaded_from_disk(self):
+        """A new manager indexes the entries that already exist on disk."""
+        storage = ShardedDiskCacheStorage(_context(), self.manager)
+        storage.set("k1", b"1234")
+        storage.set("k2", b"12")
+
+        manager = ShardedDiskCacheStorageManager(
+            max_size_bytes=10, cache_dir=self.tempdir.path
+        )
+
+        self.assertEqual(6, manager._index.total_size)
+        self.assertEqual(2, len(manager._index.function_entries("func-key")))
+
+    def test_reads_entries_written_by_another_process(self):
+        """Entries written by another manager sharing the folder are read and
+        indexed, and expire based on their file's modification time."""
+        other_manager = ShardedDiskCacheStorageManager(
+            max_size_bytes=10, cache_dir=self.tempdir.path
+        )
+        # Load the index before the other manager writes to the folder.
+        self.assertEqual(0, self.manager._index.total_size)
+        ShardedDiskCacheStorage(_context(), other_manager).set("k1", b"1")
+        path = os.path.join(self.tempdir.path, "func-key", "k1", "k1.memo")
+        os.utime(path, (0, 0))
+
+        storage = ShardedDiskCacheStorage(_context(), self.manager)
+        self.assertEqual(b"1", storage.get("k1"))
+        self.assertEqual(1, self.manager._index.total_size)
+
+        expiring_storage = ShardedDiskCacheStorage(
+            _context(ttl_seconds=10), self.manager
+        )
+        self.manager._index.remove(path)
+        with self.assertRaises(CacheStorageKeyNotFoundError):
+            expiring_storage.get("k1")
+        self.assertFalse(os.path.exists(path))
@@ -0,0 +1,175 @@
+# Copyright (c) Streamlit Inc. (2018-2022) Snowflake Inc. (2022-2025)
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Unit tests for DiskMediaFileStorage"""
+
+from __future__ import annotations
+
+import io
+import os
+import unittest
+
+from PIL import Image
+from testfixtures import TempDirectory
+
+from streamlit.runtime.disk_media_file_storage import DiskFile, DiskMediaFileStorage
+from streamlit.runtime.media_file_storage import MediaFileKind, MediaFileStorageError
+from streamlit.runtime.memory_media_file_storage import (
+    MemoryFile,
+    get_image_variant_filename,
+)
+from streamlit.runtime.stats import CacheStat
+
+
+class DiskMediaFileStorageTest(unittest.TestCase):
+    def setUp(self):
+        super().setUp()
+        self.tempdir = TempDirectory(create=True)
+        self.storage = DiskMediaFileStorage(
+            media_endpoint="/mock/media", disk_threshold_bytes=10
+        )
+
+    def tearDown(self):
+        super().tearDown()
+        self.tempdir.cleanup()
+
+    def _write(self, name: str, data: bytes) -> str:
+        return self.tempdir.write(name, data)
+
+    def test_large_path_is_served_from_disk(self):
+        """A file path above the threshold isn't read into memory."""
+        path = self._write("video.mp4", b"0123456789abcdef")
+
+        file_id = self.storage.load_and_get_id(
+            path, mimetype="video/mp4", kind=MediaFileKind.MEDIA
+        )
+
+        media_file = self.storage.get_file(file_id)
+        self.assertIsInstance(media_file, DiskFile)
+        self.assertEqual(path, media_file.path)
+        self.assertEqual(16, media_file.content_size)
+        self.assertEqual(os.path.getmtime(path), media_file.modified_time)
+        self.assertEqual(b"456789", b"".join(media_file.iter_content(4, 10)))
+        self.assertEqual(f"/mock/media/{file_id}.mp4", self.storage.get_url(file_id))
+
+    def test_modified_path_gets_new_id(self):
+        path = self._write("video.mp4", b"0123456789abcdef")
+        file_id = self.storage.load_and_get_id(
+            path, mimetype="video/mp4", kind=MediaFileKind.MEDIA
+        )
+
+        self._write("video.mp4", b"0123456789abcdefgh")
+        self.assertNotEqual(
+            file_id,
+            self.storage.load_and_get_id(
+                path, mimetype="video/mp4", kind=MediaFileKind.MEDIA
+            ),
+        )
+
+    def test_small_files_are_kept_in_memory(self):
+        path = self._write("small.mp4", b"012")
+
+        path_id = self.storage.load_and_get_id(
+            path, mimetype="video/mp4", kind=MediaFileKind.MEDIA
+        )
+        data_id = self.storage.load_and_get_id(
+            b"345", mimetype="video/mp4", kind=MediaFileKind.MEDIA
+        )
+
+        self.assertEqual(
+            MemoryFile(b"012", "video/mp4", MediaFileKind.MEDIA, None),
+            self.storage.get_file(path_id),
+        )
+        self.assertEqual(
+            MemoryFile(b"345", "video/mp4", MediaFileKind.MEDIA, None),
+            self.storage.get_file(data_id),
+        )
+
+    def test_large_data_is_spilled(self):
+        """Raw data above the threshold is written to disk, and the file is
+        removed when it's deleted."""
+        file_id = self.storage.load_and_get_id(
+            b"0123456789abcdef",
+            mimetype="text/plain",
+            kind=MediaFileKind.DOWNLOADABLE,
+            filename="file.txt",
+        )
+
+        media_file = self.storage.get_file(file_id)
+        self.assertIsInstance(media_file, DiskFile)
+        self.assertTrue(media_file.is_spilled)
+        self.assertEqual("file.txt", media_file.filename)
+        with open(media_file.path, "rb") as f:
+            self.assertEqual(b"0123456789abcdef", f.read())
+
+        self.storage.delete_file(file_id)
+        self.assertFalse(os.path.exists(media_file.path))
+        with self.assertRaises(MediaFileStorageError):
+            self.storage.get_file(file_id)
+
+    def test_delete_keeps_user_files(self):
+        """Deleting a file that is served from the user's path doesn't remove
+        that path."""
+        path = self._write("video.mp4", b"0123456789abcdef")
+        file_id = self.storage.load_and_get_id(
+            path, mimetype="video/mp4", kind=MediaFileKind.MEDIA
+        )
+
+        self.storage.delete_file(file_id)
+
+        self.assertTrue(os.path.exists(path))
+        with self.assertRaises(MediaFileStorageError):
+            self.storage.get_file(file_id)
+
+    def test_load_with_bad_path(self):
+        with self.assertRaises(MediaFileStorageError):
+            self.storage.load_and_get_id(
+                os.path.join(self.tempdir.path, "missing.mp4"),
+                mimetype="video/mp4",
+                kind=MediaFileKind.MEDIA,
+            )
+
+    def test_cache_stats_only_count_memory(self):
+        """Files on disk don't count towards the memory footprint."""
+        self.storage.load_and_get_id(
+            b"0123456789abcdef", mimetype="video/mp4", kind=MediaFileKind.MEDIA
+        )
+        self.storage.load_and_get_id(
+            b"012", mimetype="video/mp4", kind=MediaFileKind.MEDIA
+        )
+
+        self.assertEqual(
+            [CacheStat("st_memory_media_file_storage", "", 3)],
+            self.storage.get_stats(),
+        )
+
+    def test_image_variant_of_file_on_disk(self):
+        """Variants of images on disk are created in memory, and deleted with
+        their image."""
+        data = io.BytesIO()
+        Image.new("RGB", (1000, 500), color="red").save(data, format="PNG")
+        path = self._write("image.png", data.getvalue())
+        file_id = self.storage.load_and_get_id(
+            path, mimetype="image/png", kind=MediaFileKind.MEDIA
+        )
+
+        variant = self.storage.get_file(
+            get_image_variant_filename(f"{file_id}.png", 640, False)
+        )
+        self.assertIsInstance(variant, MemoryFile)
+        self.assertEqual((640, 320), Image.open(io.BytesIO(variant.content)).size)
+
+        self.storage.delete_file(file_id)
+        self.assertEqual({}, self.storage._image_variants_by_id)
+        self.assertTrue(os.path.exists(path))
@@ -16,17 +16,20 @@
 
 from __future__ import annotations
 
+import os
 import unittest
 from unittest.mock import MagicMock
 
 from streamlit import config
+from streamlit.proto.ForwardMsg_pb2 import ForwardMsg
 from streamlit.runtime import app_session
 from streamlit.runtime.forward_msg_cache import (
     ForwardMsgCache,
     create_reference_msg,
     populate_hash_if_needed,
+    serialize_payload,
 )
-from streamlit.runtime.stats import CacheStat
+from streamlit.runtime.stats import CacheEventStat, CacheStat
 from streamlit.testing.v1.util import patch_config_options
 from tests.streamlit.message_mocks import create_dataframe_msg
 
@@ -53,6 +56,51 @@ class ForwardMsgCacheTest(unittest.TestCase):
         msg2 = create_dataframe_msg([1, 2, 3], 2)
         self.assertEqual(populate_hash_if_needed(msg1), populate_hash_if_needed(msg2))
 
+    def test_msg_hash_with_serialized_payload(self):
+        """A message's hash can be computed from its serialized payload."""
+        msg1 = create_dataframe_msg([1, 2, 3], 1)
+        msg2 = create_dataframe_msg([1, 2, 3], 2)
+        self.assertEqual(
+            populate_hash_if_needed(msg1),
+            populate_hash_if_needed(msg2, serialize_payload(msg2)),
+        )
+
+    def test_serialize_payload(self):
+        """The serialized payload, prefixed with the hash and metadata, is a
+        serialization of the whole message."""
+        cache = ForwardMsgCache()
+        for msg in (
+            create_dataframe_msg([1, 2, 3], 1),
+            ForwardMsg(script_finished=ForwardMsg.FINISHED_WITH_COMPILE_ERROR),
+            ForwardMsg(ref_hash="some_hash", debug_last_backmsg_id="backmsg"),
+        ):
+            cache.add_message(msg, _create_mock_session(), 0)
+            self.assertEqual(msg, cache.get_message(msg.hash))
+            self.assertEqual(
+                msg, ForwardMsg.FromString(cache.get_serialized_message(msg.hash))
+            )
+
+    def test_get_serialized_message(self):
+        """get_serialized_message uses the metadata of the given message."""
+        cache = ForwardMsgCache()
+        msg = create_dataframe_msg([1, 2, 3], 1)
+        cache.add_message(msg, _create_mock_session(), 0)
+
+        same_msg = create_dataframe_msg([1, 2, 3], 2)
+        populate_hash_if_needed(same_msg)
+        serialized_msg = cache.get_serialized_message(same_msg.hash, same_msg)
+
+        self.assertEqual(same_msg, ForwardMsg.FromString(serialized_msg))
+        self.assertIsNone(cache.get_serialized_message("missing_hash"))
+
+    @patch_config_options({"global.storeCachedForwardMessagesInMemory": False})
+    def test_get_serialized_message_not_stored(self):
+        cache = ForwardMsgCache()
+        msg = create_dataframe_msg([1, 2, 3])
+        cache.add_message(msg, _create_mock_session(), 0)
+
+        self.assertIsNone(cache.get_serialized_message(msg.hash))
+
     def test_reference_msg(self):
         """Test creation of 'reference' ForwardMsgs"""
         msg = create_dataframe_msg([1, 2, 3], 34)
@@ -217,3 +265,124 @@ class ForwardMsgCacheTest(unittest.TestCase):
             ),
         ]
         self.assertEqual(set(expected), set(cache.get_stats()))
+
+
+def _large_msg(value: int):
+    """Create a cacheable message of about 400 KB."""
+    msg = create_dataframe_msg([value])
+    msg.delta.new_element.markdown.body = str(value) * 400 * 1024
+    return msg
+
+
+class ForwardMsgCacheMemoryBudgetTest(unittest.TestCase):
+    def setUp(self) -> None:
+        super().setUp()
+        config_patch = patch_config_options({"global.maxCachedMessagesSize": 1})
+        config_patch.__enter__()
+        self.addCleanup(config_patch.__exit__, None, None, None)
+
+    def test_evicts_least_recently_used(self):
+        """Once the budget is exceeded, the least recently used messages of
+        any session are dropped."""
+        cache = ForwardMsgCache()
+        session1 = _create_mock_session()
+        session2 = _create_mock_session()
+        msg1 = _large_msg(1)
+        msg2 = _large_msg(2)
+        msg3 = _large_msg(3)
+
+        cache.add_message(msg1, session1, 0)
+        cache.add_message(msg2, session2, 0)
+        self.assertIsNotNone(cache.get_message(msg1.hash))
+
+        # Re-adding msg1 makes msg2 the least recently used message.
+        cache.add_message(msg1, session1, 0)
+        cache.add_message(msg3, session1, 0)
+
+        self.assertIsNotNone(cache.get_message(msg1.hash))
+        self.assertIsNone(cache.get_message(msg2.hash))
+        self.assertIsNotNone(cache.get_message(msg3.hash))
+        self.assertFalse(cache.has_message_reference(msg2, session2, 0))
+        self.assertEqual(
+            cache.get_stats()[0].byte_length, msg1.ByteSize() + msg3.ByteSize()
+        )
+
+    def test_most_recent_message_is_kept(self):
+        """A message larger than the budget is kept until it's no longer the
+        most recently used one."""
+        cache = ForwardMsgCache()
+        session = _create_mock_session()
+        msg1 = _large_msg(1)
+        msg1.delta.new_element.markdown.body *= 3
+
+        cache.add_message(msg1, session, 0)
+        self.assertIsNotNone(cache.get_message(msg1.hash))
+
+        msg2 = _large_msg(2)
+        cache.add_message(msg2, session, 0)
+        self.assertIsNone(cache.get_message(msg1.hash))
+        self.assertIsNotNone(cache.get_message(msg2.hash))
+
+    @patch_config_options({"global.spillCachedMessagesToDisk": True})
+    def test_spill_to_disk(self):
+        """Evicted messages are spilled to disk and can still be served."""
+        cache = ForwardMsgCache()
+        session = _create_mock_session()
+        msg1 = _large_msg(1)
+        msg2 = _large_msg(2)
+        msg3 = _large_msg(3)
+
+        cache.add_message(msg1, session, 0)
+        cache.add_message(msg2, session, 0)
+        cache.add_message(msg3, session, 0)
+
+        spill_path = os.path.join(cache._spill_dir.name, msg1.hash)
+        self.assertTrue(os.path.isfile(spill_path))
+        self.assertTrue(cache.has_message_reference(msg1, session, 0))
+        self.assertEqual(msg1, cache.get_message(msg1.hash))
+        self.assertEqual(
+            cache.get_stats()[0].byte_length, msg2.ByteSize() + msg3.ByteSize()
+        )
+
+        # Re-adding the message with its payload moves it back into memory.
+        cache.add_message(msg1, session, 0, serialize_payload(msg1))
+        self.assertFalse(os.path.exists(spill_path))
+        self.assertEqual(msg1, cache.get_message(msg1.hash))
+
+        cache.clear()
+        self.assertEqual([], os.listdir(cache._spill_dir.name))
+        self.assertEqual([], cache.get_stats())
+
+    @patch_config_options({"global.spillCachedMessagesToDisk": True})
+    def test_spill_file_removed_with_entry(self):
+        cache = ForwardMsgCache()
+        session = _create_mock_session()
+        msgs = [_large_msg(i) for i in range(3)]
+        for msg in msgs:
+            cache.add_message(msg, session, 0)
+        self.assertEqual(1, len(os.listdir(cache._spill_dir.name)))
+
+        cache.remove_refs_for_session(session)
+
+        self.assertEqual([], os.listdir(cache._spill_dir.name))
+
+    def test_cache_event_stats(self):
+        """Hits, misses and evictions are counted."""
+        cache = ForwardMsgCache()
+        session = _create_mock_session()
+        msg1 = _large_msg(1)
+
+        self.assertFalse(cache.has_message_reference(msg1, session, 0))
+        cache.add_message(msg1, session, 0)
+        self.assertTrue(cache.has_message_reference(msg1, session, 0))
+        cache.add_message(_large_msg(2), session, 0)
+        cache.add_message(_large_msg(3), session, 0)
+
+        self.assertEqual(
+            [
+                CacheEventStat("ForwardMessageCache", "", "hit", 1),
+                CacheEventStat("ForwardMessageCache", "", "miss", 1),
+                CacheEventStat("ForwardMessageCache", "", "eviction", 1),
+            ],
+            cache.get_cache_event_stats(),
+        )
@@ -51,6 +51,19 @@ arrow.marshall(
 )
 DF_DELTA_MSG.metadata.delta_path[:] = make_delta_path(RootContainer.MAIN, (), 0)
 
+MARKDOWN_DELTA_MSG = ForwardMsg()
+MARKDOWN_DELTA_MSG.delta.new_element.markdown.body = "Hello"
+MARKDOWN_DELTA_MSG.metadata.delta_path[:] = make_delta_path(RootContainer.MAIN, (), 0)
+
+
+def _append_text_msg(text: str, strip_suffix: str = "") -> ForwardMsg:
+    msg = ForwardMsg()
+    msg.delta.append_text.text = text
+    msg.delta.append_text.strip_suffix = strip_suffix
+    msg.metadata.delta_path[:] = make_delta_path(RootContainer.MAIN, (), 0)
+    return msg
+
+
 ADD_ROWS_MSG = ForwardMsg()
 arrow.marshall(
     ADD_ROWS_MSG.delta.arrow_add_rows.data, {"col1": [3, 4, 5], "col2": [13, 14, 15]}
@@ -167,6 +180,43 @@ class ForwardMsgQueueTest(unittest.TestCase):
         self.assertEqual(ADD_BLOCK_MSG, queue[0])
         self.assertEqual(other_msg, queue[1])
 
+    def test_compose_append_text_onto_markdown(self):
+        """append_text deltas are folded into a queued markdown element."""
+        fmq = ForwardMsgQueue()
+
+        fmq.enqueue(MARKDOWN_DELTA_MSG)
+        fmq.enqueue(_append_text_msg(" wor|"))
+        fmq.enqueue(_append_text_msg("ld|", strip_suffix="|"))
+
+        queue = fmq.flush()
+        self.assertEqual(1, len(queue))
+        self.assertEqual("Hello world|", queue[0].delta.new_element.markdown.body)
+        # The queued message itself must not be mutated.
+        self.assertEqual("Hello", MARKDOWN_DELTA_MSG.delta.new_element.markdown.body)
+
+    def test_compose_append_text_onto_append_text(self):
+        """Consecutive append_text deltas are merged into a single delta."""
+        fmq = ForwardMsgQueue()
+
+        fmq.enqueue(_append_text_msg(" wor|", strip_suffix="|"))
+        fmq.enqueue(_append_text_msg("ld|", strip_suffix="|"))
+
+        queue = fmq.flush()
+        self.assertEqual(1, len(queue))
+        self.assertEqual(" world|", queue[0].delta.append_text.text)
+        self.assertEqual("|", queue[0].delta.append_text.strip_suffix)
+
+    def test_dont_compose_append_text_onto_other_elements(self):
+        """append_text deltas are only composed with markdown elements."""
+        fmq = ForwardMsgQueue()
+
+        fmq.enqueue(TEXT_DELTA_MSG1)
+        fmq.enqueue(_append_text_msg("foo"))
+
+        queue = fmq.flush()
+        self.assertEqual(2, len(queue))
+        self.assertEqual("foo", queue[1].delta.append_text.text)
+
     def test_multiple_containers(self):
         """Deltas should only be coalesced if they're in the same container"""
         fmq = ForwardMsgQueue()
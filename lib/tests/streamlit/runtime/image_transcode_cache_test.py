@@ -0,0 +1,105 @@
+# Copyright (c) Streamlit Inc. (2018-2022) Snowflake Inc. (2022-2025)
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Unit tests for ImageTranscodeCache"""
+
+from __future__ import annotations
+
+import unittest
+
+from streamlit.runtime.image_transcode_cache import (
+    ImageTranscodeCache,
+    TranscodedImage,
+)
+from streamlit.runtime.stats import CacheEventStat, CacheStat
+from tests.testutil import patch_config_options
+
+_MB = 1024 * 1024
+
+
+def _image(byte_length: int) -> TranscodedImage:
+    return TranscodedImage(b"x" * byte_length, "image/png")
+
+
+class ImageTranscodeCacheTest(unittest.TestCase):
+    def setUp(self):
+        super().setUp()
+        self.cache = ImageTranscodeCache()
+
+    def test_get_and_put(self):
+        self.assertIsNone(self.cache.get("key"))
+
+        image = _image(10)
+        self.cache.put("key", image)
+        self.assertIs(image, self.cache.get("key"))
+
+        # Replacing an entry doesn't count it twice.
+        self.cache.put("key", image)
+        self.assertEqual(
+            [CacheStat("st_image_transcode_cache", "", 10)], self.cache.get_stats()
+        )
+
+    @patch_config_options({"global.maxCachedImagesSize": 2})
+    def test_least_recently_used_images_are_evicted(self):
+        self.cache.put("a", _image(_MB))
+        self.cache.put("b", _image(_MB))
+        # "a" is now the most recently used image.
+        self.cache.get("a")
+        self.cache.put("c", _image(_MB))
+
+        self.assertIsNone(self.cache.get("b"))
+        self.assertIsNotNone(self.cache.get("a"))
+        self.assertIsNotNone(self.cache.get("c"))
+        self.assertEqual(
+            [CacheStat("st_image_transcode_cache", "", 2 * _MB)],
+            self.cache.get_stats(),
+        )
+
+    @patch_config_options({"global.maxCachedImagesSize": 1})
+    def test_image_larger_than_cache_is_not_cached(self):
+        self.cache.put("a", _image(_MB))
+        self.cache.put("b", _image(_MB + 1))
+
+        self.assertIsNone(self.cache.get("b"))
+        self.assertIsNotNone(self.cache.get("a"))
+
+    @patch_config_options({"global.maxCachedImagesSize": 0})
+    def test_disabled(self):
+        self.assertFalse(self.cache.enabled)
+        self.cache.put("a", _image(1))
+        self.assertIsNone(self.cache.get("a"))
+
+    @patch_config_options({"global.maxCachedImagesSize": 1})
+    def test_get_cache_event_stats(self):
+        self.cache.put("a", _image(_MB))
+        self.cache.get("a")
+        self.cache.get("a")
+        self.cache.get("b")
+        self.cache.put("b", _image(_MB))
+
+        self.assertEqual(
+            [
+                CacheEventStat("st_image_transcode_cache", "", "hit", 2),
+                CacheEventStat("st_image_transcode_cache", "", "miss", 1),
+                CacheEventStat("st_image_transcode_cache", "", "eviction", 1),
+            ],
+            self.cache.get_cache_event_stats(),
+        )
+
+    def test_clear(self):
+        self.cache.put("a", _image(1))
+        self.cache.clear()
+
+        self.assertIsNone(self.cache.get("a"))
+        self.assertEqual([], self.cache.get_stats())
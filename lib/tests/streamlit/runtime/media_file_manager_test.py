@@ -17,17 +17,19 @@
 from __future__ import annotations
 
 import random
+import threading
 import unittest
 from unittest import TestCase, mock
 from unittest.mock import MagicMock, call, mock_open
 
 from streamlit.runtime.media_file_manager import MediaFileManager
-from streamlit.runtime.media_file_storage import MediaFileKind
+from streamlit.runtime.media_file_storage import MediaFileKind, MediaFileStorageError
 from streamlit.runtime.memory_media_file_storage import (
     MemoryFile,
     MemoryMediaFileStorage,
     _calculate_file_id,
 )
+from streamlit.runtime.stats import MediaFileStat
 from tests.exception_capturing_thread import call_on_threads
 
 
@@ -366,6 +368,82 @@ class MediaFileManagerTest(TestCase):
             [call(file_id) for file_id in file_ids], any_order=True
         )
 
+    @mock.patch(
+        "streamlit.runtime.media_file_manager._get_session_id",
+        MagicMock(return_value="mock_session_id"),
+    )
+    def test_replaced_file_is_orphaned(self):
+        """A file that is replaced at its coordinates loses its reference,
+        and is removed by the next remove_orphaned_files call."""
+        coord = random_coordinates()
+        png = IMAGE_FIXTURES["png"]
+        jpg = IMAGE_FIXTURES["jpg"]
+        png_id = _calculate_file_id(png["content"], png["mimetype"])
+        jpg_id = _calculate_file_id(jpg["content"], jpg["mimetype"])
+
+        self.media_file_manager.add(png["content"], png["mimetype"], coord)
+        self.media_file_manager.add(jpg["content"], jpg["mimetype"], coord)
+        self.assertEqual({jpg_id: 1}, self.media_file_manager._ref_counts)
+
+        self.media_file_manager.remove_orphaned_files()
+        self.assertEqual([jpg_id], list(self.media_file_manager._file_metadata))
+        with self.assertRaises(MediaFileStorageError):
+            self.storage.get_file(png_id)
+
+    @mock.patch("streamlit.runtime.media_file_manager._get_session_id")
+    def test_readded_file_is_not_removed(self, mock_get_session_id):
+        """A file whose references are cleared, but that is added again before
+        remove_orphaned_files is called (e.g. on a rerun), is kept."""
+        mock_get_session_id.return_value = "mock_session_id"
+        sample = IMAGE_FIXTURES["png"]
+        coord = random_coordinates()
+
+        self.media_file_manager.add(sample["content"], sample["mimetype"], coord)
+        self.media_file_manager.clear_session_refs()
+        self.media_file_manager.add(sample["content"], sample["mimetype"], coord)
+        self.media_file_manager.remove_orphaned_files()
+
+        file_id = _calculate_file_id(sample["content"], sample["mimetype"])
+        self.assertEqual({file_id: 1}, self.media_file_manager._ref_counts)
+        self.assertIn(file_id, self.media_file_manager._file_metadata)
+
+    @mock.patch("streamlit.runtime.media_file_manager._get_session_id")
+    def test_get_media_file_stats(self, mock_get_session_id):
+        """get_media_file_stats counts referenced and orphaned files, and the
+        references to them."""
+        for session_id in ("mock_session_1", "mock_session_2"):
+            mock_get_session_id.return_value = session_id
+            for sample in VIDEO_FIXTURES.values():
+                self.media_file_manager.add(
+                    sample["content"], sample["mimetype"], random_coordinates()
+                )
+        self.media_file_manager.add(
+            b"download", "text/plain", random_coordinates(), None, True
+        )
+
+        self.assertEqual(
+            [MediaFileStat(3, 0, 5, 0.0)],
+            self.media_file_manager.get_media_file_stats(),
+        )
+
+        self.media_file_manager.clear_session_refs("mock_session_2")
+        self.assertEqual(
+            [MediaFileStat(2, 1, 2, 0.0)],
+            self.media_file_manager.get_media_file_stats(),
+        )
+
+        # The downloadable file is only marked for deletion.
+        self.media_file_manager.remove_orphaned_files()
+        self.assertEqual(
+            [MediaFileStat(2, 1, 2, 0.0)],
+            self.media_file_manager.get_media_file_stats(),
+        )
+        self.media_file_manager.remove_orphaned_files()
+        self.assertEqual(
+            [MediaFileStat(2, 0, 2, 0.0)],
+            self.media_file_manager.get_media_file_stats(),
+        )
+
 
 class MediaFileManagerThreadingTest(unittest.TestCase):
     # The number of threads to run our tests on
@@ -416,3 +494,30 @@ class MediaFileManagerThreadingTest(unittest.TestCase):
 
         # Our files should be gone!
         self.assertEqual(0, len(self.media_file_manager._file_metadata))
+
+    @mock.patch("streamlit.runtime.media_file_manager._get_session_id")
+    def test_add_and_clear_sessions_multiple_threads(self, mock_get_session_id):
+        """Reference counts stay consistent when sessions add files and clear
+        their references on multiple threads."""
+        sessions_by_thread: dict[int, str] = {}
+        mock_get_session_id.side_effect = lambda: sessions_by_thread[
+            threading.get_ident()
+        ]
+
+        def run_session(ii: int) -> None:
+            sessions_by_thread[threading.get_ident()] = f"session_{ii}"
+            for _ in range(10):
+                # All sessions share some of their files.
+                for jj in range(5):
+                    self.media_file_manager.add(
+                        bytes(f"{(ii + jj) % 10}", "utf-8"), "image/png", f"{jj}"
+                    )
+                self.media_file_manager.clear_session_refs()
+                self.media_file_manager.remove_orphaned_files()
+
+        call_on_threads(run_session, num_threads=self.NUM_THREADS)
+
+        self.assertEqual({}, self.media_file_manager._ref_counts)
+        self.media_file_manager.remove_orphaned_files()
+        self.assertEqual({}, self.media_file_manager._file_metadata)
+        self.assertEqual({}, self.storage._files_by_id)
@@ -16,18 +16,25 @@
 
 from __future__ import annotations
 
+import io
+import os
+import tempfile
 import unittest
 from unittest import mock
 from unittest.mock import MagicMock, mock_open
 
 from parameterized import parameterized
+from PIL import Image, ImageCms
 
 from streamlit.runtime.media_file_storage import MediaFileKind, MediaFileStorageError
 from streamlit.runtime.memory_media_file_storage import (
     MemoryFile,
     MemoryMediaFileStorage,
+    _calculate_file_id,
     get_extension_for_mimetype,
+    get_image_variant_filename,
 )
+from tests.testutil import patch_config_options
 
 
 class MemoryMediaFileStorageTest(unittest.TestCase):
@@ -182,6 +189,21 @@ class MemoryMediaFileStorageTest(unittest.TestCase):
         """deleting a file that doesn't exist doesn't raise an error."""
         self.storage.delete_file("mock_file_id")
 
+    def test_iter_content(self):
+        """MemoryFile.iter_content yields the content in chunks."""
+        media_file = MemoryFile(
+            content=bytes(range(256)) * 1024,
+            mimetype="video/mp4",
+            kind=MediaFileKind.MEDIA,
+            filename=None,
+        )
+
+        self.assertEqual([media_file.content], list(media_file.iter_content(0, 262144)))
+
+        chunks = list(media_file.iter_content(10, 70000))
+        self.assertEqual([65536, 70000 - 10 - 65536], [len(chunk) for chunk in chunks])
+        self.assertEqual(media_file.content[10:70000], b"".join(chunks))
+
     def test_cache_stats(self):
         """Test our CacheStatsProvider implementation."""
         self.assertEqual(0, len(self.storage.get_stats()))
@@ -210,6 +232,204 @@ class MemoryMediaFileStorageTest(unittest.TestCase):
 
         self.assertEqual(0, len(self.storage.get_stats()))
 
+    def test_same_bytes_object_is_not_hashed_again(self):
+        """Loading the same bytes object again doesn't hash its content."""
+        data = b"mock_bytes"
+        file_id = self.storage.load_and_get_id(
+            data, mimetype="video/mp4", kind=MediaFileKind.MEDIA
+        )
+
+        with mock.patch(
+            "streamlit.runtime.memory_media_file_storage._calculate_file_id"
+        ) as calculate_file_id:
+            self.assertEqual(
+                file_id,
+                self.storage.load_and_get_id(
+                    data, mimetype="video/mp4", kind=MediaFileKind.MEDIA
+                ),
+            )
+            calculate_file_id.assert_not_called()
+
+            # A different mimetype is a different file.
+            calculate_file_id.return_value = "other_id"
+            self.assertEqual(
+                "other_id",
+                self.storage.load_and_get_id(
+                    data, mimetype="image/png", kind=MediaFileKind.MEDIA
+                ),
+            )
+
+    def test_equal_bytes_object_replaces_content(self):
+        """A file keeps the last bytes object its content was loaded from."""
+        data1 = bytes(bytearray(b"mock_bytes"))
+        data2 = bytes(bytearray(b"mock_bytes"))
+        self.assertIsNot(data1, data2)
+
+        file_id = self.storage.load_and_get_id(
+            data1, mimetype="video/mp4", kind=MediaFileKind.MEDIA
+        )
+        self.assertEqual(
+            file_id,
+            self.storage.load_and_get_id(
+                data2, mimetype="video/mp4", kind=MediaFileKind.MEDIA
+            ),
+        )
+        self.assertIs(data2, self.storage.get_file(file_id).content)
+        self.assertEqual(
+            {(id(data2), "video/mp4", None): file_id},
+            self.storage._file_ids_by_content,
+        )
+
+    def test_unchanged_path_is_not_read_again(self):
+        """A file at a path whose size and modification time haven't changed
+        isn't read again."""
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            path = os.path.join(tmp_dir, "file.mp4")
+            with open(path, "wb") as f:
+                f.write(b"mock_bytes")
+
+            file_id = self.storage.load_and_get_id(
+                path, mimetype="video/mp4", kind=MediaFileKind.MEDIA
+            )
+            with mock.patch.object(self.storage, "_read_file") as read_file:
+                self.assertEqual(
+                    file_id,
+                    self.storage.load_and_get_id(
+                        path, mimetype="video/mp4", kind=MediaFileKind.MEDIA
+                    ),
+                )
+                read_file.assert_not_called()
+
+            with open(path, "wb") as f:
+                f.write(b"mock_bytes_2")
+            os.utime(path, ns=(0, 0))
+            changed_file_id = self.storage.load_and_get_id(
+                path, mimetype="video/mp4", kind=MediaFileKind.MEDIA
+            )
+
+        self.assertNotEqual(file_id, changed_file_id)
+        self.assertEqual(
+            b"mock_bytes_2", self.storage.get_file(changed_file_id).content
+        )
+
+    def test_delete_file_forgets_memoized_ids(self):
+        """Deleting a file removes it from the memoized IDs, and loading it
+        again adds it back."""
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            path = os.path.join(tmp_dir, "file.mp4")
+            with open(path, "wb") as f:
+                f.write(b"mock_bytes")
+
+            file_id = self.storage.load_and_get_id(
+                path, mimetype="video/mp4", kind=MediaFileKind.MEDIA
+            )
+            self.storage.delete_file(file_id)
+            self.assertEqual({}, self.storage._file_ids_by_content)
+            self.assertEqual({}, self.storage._file_ids_by_path)
+            self.assertEqual({}, self.storage._path_keys_by_file_id)
+
+            self.assertEqual(
+                file_id,
+                self.storage.load_and_get_id(
+                    path, mimetype="video/mp4", kind=MediaFileKind.MEDIA
+                ),
+            )
+            self.assertEqual(b"mock_bytes", self.storage.get_file(file_id).content)
+
+    @patch_config_options({"server.mediaFileIdHash": "xxhash"})
+    def test_xxhash_file_id(self):
+        """The xxhash file ID hash is used if xxhash is installed, and falls
+        back to SHA-224 otherwise."""
+        with mock.patch.dict("sys.modules", {"xxhash": None}):
+            self.assertEqual(
+                56, len(_calculate_file_id(b"mock_bytes", "video/mp4", None))
+            )
+
+        mock_xxhash = MagicMock()
+        mock_xxhash.xxh3_128.return_value.hexdigest.return_value = "mock_digest"
+        with mock.patch.dict("sys.modules", {"xxhash": mock_xxhash}):
+            self.assertEqual(
+                "mock_digest", _calculate_file_id(b"mock_bytes", "video/mp4", None)
+            )
+
+    def test_image_variants(self):
+        """Image variants are created when they're first requested, and
+        deleted with their image."""
+        data = io.BytesIO()
+        Image.new("RGB", (1000, 500), color="red").save(data, format="JPEG")
+        file_id = self.storage.load_and_get_id(
+            data.getvalue(), mimetype="image/jpeg", kind=MediaFileKind.MEDIA
+        )
+
+        variant_filename = get_image_variant_filename(f"{file_id}.jpg", 320, False)
+        self.assertEqual(f"{file_id}-320w.jpg", variant_filename)
+        variant = self.storage.get_file(variant_filename)
+        self.assertEqual("image/jpeg", variant.mimetype)
+        self.assertEqual((320, 160), Image.open(io.BytesIO(variant.content)).size)
+        self.assertIs(variant, self.storage.get_file(variant_filename))
+
+        webp_variant = self.storage.get_file(
+            get_image_variant_filename(f"{file_id}.jpg", 0, True)
+        )
+        self.assertEqual("image/webp", webp_variant.mimetype)
+        self.assertEqual((1000, 500), Image.open(io.BytesIO(webp_variant.content)).size)
+
+        self.storage.delete_file(file_id)
+        self.assertEqual({}, self.storage._image_variants_by_id)
+        with self.assertRaises(MediaFileStorageError):
+            self.storage.get_file(variant_filename)
+
+    @parameterized.expand([(False,), (True,)])
+    def test_image_variant_metadata(self, webp: bool):
+        """Image variants keep their image's EXIF data and ICC profile, so
+        they're displayed with the same orientation and colors."""
+        exif = Image.Exif()
+        exif[0x0112] = 6  # Orientation: rotated 90 degrees.
+        icc_profile = ImageCms.ImageCmsProfile(ImageCms.createProfile("sRGB")).tobytes()
+        data = io.BytesIO()
+        Image.new("RGB", (1000, 500), color="red").save(
+            data, format="JPEG", exif=exif, icc_profile=icc_profile
+        )
+        file_id = self.storage.load_and_get_id(
+            data.getvalue(), mimetype="image/jpeg", kind=MediaFileKind.MEDIA
+        )
+
+        variant = self.storage.get_file(
+            get_image_variant_filename(f"{file_id}.jpg", 320, webp)
+        )
+        image = Image.open(io.BytesIO(variant.content))
+        self.assertEqual((320, 160), image.size)
+        self.assertEqual(6, image.getexif()[0x0112])
+        self.assertEqual(icc_profile, image.info["icc_profile"])
+
+    @parameterized.expand(
+        [
+            ("{file_id}-300w.jpg",),
+            ("{file_id}-0w.jpg",),
+            ("{file_id}-320w.png",),
+            ("other-320w.jpg",),
+        ]
+    )
+    def test_bad_image_variant_filename(self, filename: str):
+        data = io.BytesIO()
+        Image.new("RGB", (1000, 500), color="red").save(data, format="JPEG")
+        file_id = self.storage.load_and_get_id(
+            data.getvalue(), mimetype="image/jpeg", kind=MediaFileKind.MEDIA
+        )
+
+        with self.assertRaises(MediaFileStorageError):
+            self.storage.get_file(filename.format(file_id=file_id))
+
+    def test_no_image_variants_of_other_files(self):
+        file_id = self.storage.load_and_get_id(
+            b"mock_bytes", mimetype="video/mp4", kind=MediaFileKind.MEDIA
+        )
+
+        with self.assertRaises(MediaFileStorageError):
+            self.storage.get_file(
+                get_image_variant_filename(f"{file_id}.mp4", 320, True)
+            )
+
 
 class MemoryMediaFileStorageUtilTest(unittest.TestCase):
     """Unit tests for utility functions in memory_media_file_storage.py"""
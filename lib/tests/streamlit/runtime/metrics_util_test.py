@@ -172,11 +172,13 @@ class PageTelemetryTest(DeltaGeneratorTestCase):
             ],
             exec_time=1000,
             prep_time=2000,
+            serialization_check_time=300,
         )
 
         assert len(forward_msg.page_profile.commands) == 1
         assert forward_msg.page_profile.exec_time == 1000
         assert forward_msg.page_profile.prep_time == 2000
+        assert forward_msg.page_profile.serialization_check_time == 300
         assert forward_msg.page_profile.commands[0].name == "dataframe"
         assert not forward_msg.page_profile.is_fragment_run
 
@@ -40,6 +40,10 @@ from streamlit.runtime.memory_media_file_storage import MemoryMediaFileStorage
 from streamlit.runtime.memory_session_storage import MemorySessionStorage
 from streamlit.runtime.memory_uploaded_file_manager import MemoryUploadedFileManager
 from streamlit.runtime.runtime import AsyncObjects, RuntimeStoppedError
+from streamlit.runtime.session_manager import (
+    BatchingSessionClient,
+    BufferedSessionClient,
+)
 from streamlit.runtime.websocket_session_manager import WebsocketSessionManager
 from streamlit.watcher import event_based_path_watcher
 from tests.streamlit.message_mocks import (
@@ -60,6 +64,29 @@ class MockSessionClient(SessionClient):
         self.forward_msgs.append(msg)
 
 
+class MockBatchingSessionClient(MockSessionClient, BatchingSessionClient):
+    """A BatchingSessionClient that captures its batches of ForwardMsgs."""
+
+    def __init__(self):
+        super().__init__()
+        self.batches: list[list[ForwardMsg]] = []
+
+    def write_forward_msgs(self, msgs: list[ForwardMsg]) -> None:
+        self.batches.append(msgs)
+        self.forward_msgs.extend(msgs)
+
+
+class MockBufferedSessionClient(MockSessionClient, BufferedSessionClient):
+    """A BufferedSessionClient with a settable number of pending bytes."""
+
+    def __init__(self):
+        super().__init__()
+        self.pending_bytes = 0
+
+    def pending_write_bytes(self) -> int:
+        return self.pending_bytes
+
+
 class RuntimeConfigTests(unittest.TestCase):
     def test_runtime_config_defaults(self):
         config = RuntimeConfig(
@@ -476,6 +503,56 @@ class RuntimeTest(RuntimeTestCase):
         # It is expected that there are a couple of tasks, but not one per loop:
         self.assertLess(len(asyncio.all_tasks()), 10)
 
+    async def test_batching_session_client(self):
+        """A BatchingSessionClient receives all of a session's pending
+        messages at once."""
+        await self.runtime.start()
+
+        client = MockBatchingSessionClient()
+        session_id = self.runtime.connect_session(client=client, user_info=MagicMock())
+
+        msgs = [create_dataframe_msg([i], id=i) for i in range(3)]
+        for msg in msgs:
+            self.enqueue_forward_msg(session_id, msg)
+        await self.tick_runtime_loop()
+
+        self.assertEqual([msgs], client.batches)
+
+    async def test_batching_session_client_disconnected(self):
+        """The session is disconnected if its BatchingSessionClient raises a
+        `SessionClientDisconnectedError`."""
+        await self.runtime.start()
+
+        client = MockBatchingSessionClient()
+        client.write_forward_msgs = MagicMock(
+            side_effect=SessionClientDisconnectedError
+        )
+        session_id = self.runtime.connect_session(client=client, user_info=MagicMock())
+
+        self.enqueue_forward_msg(session_id, create_dataframe_msg([1, 2, 3]))
+        await self.tick_runtime_loop()
+
+        client.write_forward_msgs.assert_called_once()
+        self.assertFalse(self.runtime.is_active_session(session_id))
+
+    async def test_backpressured_session_client(self):
+        """Messages are held back while a client's write buffer is full, and
+        sent once it drains."""
+        await self.runtime.start()
+
+        client = MockBufferedSessionClient()
+        client.pending_bytes = 100 * 1024 * 1024
+        session_id = self.runtime.connect_session(client=client, user_info=MagicMock())
+
+        msg = create_dataframe_msg([1, 2, 3])
+        self.enqueue_forward_msg(session_id, msg)
+        await self.tick_runtime_loop()
+        self.assertEqual([], client.forward_msgs)
+
+        client.pending_bytes = 0
+        await self.tick_runtime_loop()
+        self.assertEqual([msg], client.forward_msgs)
+
     async def test_forwardmsg_hashing(self):
         """Test that outgoing ForwardMsgs contain hashes."""
         await self.runtime.start()
@@ -484,7 +561,7 @@ class RuntimeTest(RuntimeTestCase):
         session_id = self.runtime.connect_session(client=client, user_info=MagicMock())
 
         # Create a message and ensure its hash is unset; we're testing
-        # that _send_message adds the hash before it goes out.
+        # that _prepare_message adds the hash before it goes out.
         msg = create_dataframe_msg([1, 2, 3])
         msg.ClearField("hash")
         self.enqueue_forward_msg(session_id, msg)
@@ -697,6 +774,28 @@ class RuntimeTest(RuntimeTestCase):
         await self.runtime.start()
         self.assertIsInstance(self.runtime._get_async_objs(), AsyncObjects)
 
+    async def test_enqueued_some_message(self):
+        """Messages enqueued on the eventloop set need_send_data right away,
+        while messages enqueued on other threads wake up the eventloop."""
+        await self.runtime.start()
+        async_objs = self.runtime._get_async_objs()
+        # Wait for the Runtime's loop to clear need_send_data and go idle.
+        await asyncio.sleep(0.1)
+
+        with patch.object(
+            async_objs.eventloop,
+            "call_soon_threadsafe",
+            wraps=async_objs.eventloop.call_soon_threadsafe,
+        ) as call_soon_threadsafe_spy:
+            async_objs.need_send_data.clear()
+            self.runtime._enqueued_some_message()
+            self.assertTrue(async_objs.need_send_data.is_set())
+            call_soon_threadsafe_spy.assert_not_called()
+
+            async_objs.need_send_data.clear()
+            await asyncio.to_thread(self.runtime._enqueued_some_message)
+            call_soon_threadsafe_spy.assert_any_call(async_objs.need_send_data.set)
+
 
 class ScriptCheckTest(RuntimeTestCase):
     """Tests for Runtime.does_script_run_without_error"""
@@ -17,9 +17,11 @@
 from __future__ import annotations
 
 import unittest
+from unittest.mock import MagicMock
 
 from streamlit.proto.ForwardMsg_pb2 import ForwardMsg
 from streamlit.runtime import runtime_util
+from streamlit.runtime.forward_msg_cache import ForwardMsgCache
 from streamlit.runtime.runtime_util import is_cacheable_msg, serialize_forward_msg
 from tests.streamlit.message_mocks import create_dataframe_msg
 from tests.testutil import patch_config_options
@@ -34,6 +36,24 @@ class RuntimeUtilTest(unittest.TestCase):
         with patch_config_options({"global.minCachedMessageSize": 1000}):
             self.assertFalse(is_cacheable_msg(create_dataframe_msg([1, 2, 3])))
 
+    def test_should_cache_msg_with_byte_size(self):
+        """is_cacheable_msg uses the given byte size instead of measuring the
+        message."""
+        with patch_config_options({"global.minCachedMessageSize": 1000}):
+            self.assertTrue(is_cacheable_msg(create_dataframe_msg([1, 2, 3]), 1000))
+            self.assertFalse(is_cacheable_msg(create_dataframe_msg([1, 2, 3]), 999))
+
+    def test_serialize_cached_msg(self):
+        """serialize_forward_msg reuses the serialization of a cached message."""
+        cache = ForwardMsgCache()
+        cache.add_message(create_dataframe_msg([1, 2, 3], 1), MagicMock(), 0)
+
+        msg = create_dataframe_msg([1, 2, 3], 2)
+        serialized_msg = serialize_forward_msg(msg, cache)
+
+        self.assertEqual(cache.get_serialized_message(msg.hash, msg), serialized_msg)
+        self.assertEqual(msg, ForwardMsg.FromString(serialized_msg))
+
     def test_should_limit_msg_size(self):
         max_message_size_mb = 50
 
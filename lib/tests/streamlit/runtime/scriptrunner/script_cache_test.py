@@ -13,12 +13,14 @@
 # limitations under the License.
 
 import os.path
+import tempfile
 import unittest
 from unittest import mock
 from unittest.mock import Mock
 
 from streamlit import source_util
 from streamlit.runtime.scriptrunner.script_cache import ScriptCache
+from tests.testutil import patch_config_options
 
 
 def _get_script_path(name: str) -> str:
@@ -70,3 +72,63 @@ class ScriptCacheTest(unittest.TestCase):
         cache = ScriptCache()
         with self.assertRaises(SyntaxError):
             cache.get_bytecode(_get_script_path("compile_error.py.txt"))
+
+
+class ScriptCacheDiskTest(unittest.TestCase):
+    def setUp(self):
+        super().setUp()
+        self._tmp_dir = tempfile.TemporaryDirectory()
+        self.cache_path = os.path.join(self._tmp_dir.name, "bytecode")
+        config_patch = patch_config_options(
+            {"runner.bytecodeCachePath": self.cache_path}
+        )
+        config_patch.__enter__()
+        self.addCleanup(config_patch.__exit__, None, None, None)
+
+    def tearDown(self):
+        self._tmp_dir.cleanup()
+        super().tearDown()
+
+    def test_bytecode_is_shared_through_disk(self):
+        """Bytecode compiled by one ScriptCache is loaded from disk by
+        another."""
+        bytecode = ScriptCache().get_bytecode(_get_script_path("good_script.py"))
+        self.assertEqual(1, len(os.listdir(self.cache_path)))
+
+        with mock.patch(
+            "streamlit.runtime.scriptrunner.script_cache.compile", create=True
+        ) as mock_compile:
+            loaded_bytecode = ScriptCache().get_bytecode(
+                _get_script_path("good_script.py")
+            )
+            mock_compile.assert_not_called()
+        self.assertEqual(bytecode, loaded_bytecode)
+
+    def test_cache_key_includes_magic_setting(self):
+        ScriptCache().get_bytecode(_get_script_path("good_script.py"))
+        with patch_config_options({"runner.magicEnabled": False}):
+            ScriptCache().get_bytecode(_get_script_path("good_script.py"))
+
+        self.assertEqual(2, len(os.listdir(self.cache_path)))
+
+    def test_invalid_cache_file_is_ignored(self):
+        """Invalid cache files are compiled again and overwritten."""
+        ScriptCache().get_bytecode(_get_script_path("good_script.py"))
+        [filename] = os.listdir(self.cache_path)
+        with open(os.path.join(self.cache_path, filename), "wb") as f:
+            f.write(b"invalid")
+
+        bytecode = ScriptCache().get_bytecode(_get_script_path("good_script.py"))
+        exec(bytecode)
+        self.assertEqual(
+            bytecode, ScriptCache().get_bytecode(_get_script_path("good_script.py"))
+        )
+
+    def test_unwritable_cache_path(self):
+        """Scripts are still compiled if the cache can't be written."""
+        with open(self.cache_path, "w") as f:
+            f.write("not a folder")
+
+        self.assertIsNotNone(
+            ScriptCache().get_bytecode(_get_script_path("good_script.py"))
+        )
@@ -598,6 +598,7 @@ class ScriptRunnerTest(AsyncTestCase):
             assert len(call_kwargs["commands"]) == 2  # text & exception command
             assert call_kwargs["exec_time"] > 0
             assert call_kwargs["prep_time"] > 0
+            assert call_kwargs["serialization_check_time"] >= 0
             assert call_kwargs["uncaught_exception"] == "AttributeError"
 
     @parameterized.expand([(True,), (False,)])
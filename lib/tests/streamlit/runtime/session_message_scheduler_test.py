@@ -0,0 +1,176 @@
+# Copyright (c) Streamlit Inc. (2018-2022) Snowflake Inc. (2022-2025)
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Unit tests for SessionMessageScheduler"""
+
+from __future__ import annotations
+
+import unittest
+from unittest.mock import MagicMock, patch
+
+from streamlit.proto.ForwardMsg_pb2 import ForwardMsg
+from streamlit.runtime.session_manager import (
+    ActiveSessionInfo,
+    BufferedSessionClient,
+    SessionClient,
+)
+from streamlit.runtime.session_message_scheduler import SessionMessageScheduler
+from streamlit.runtime.stats import SessionMessageStat
+
+
+class MockSessionClient(SessionClient):
+    def write_forward_msg(self, msg: ForwardMsg) -> None:
+        pass
+
+
+class MockBufferedSessionClient(MockSessionClient, BufferedSessionClient):
+    def __init__(self):
+        self.pending_bytes = 0
+
+    def pending_write_bytes(self) -> int:
+        return self.pending_bytes
+
+
+def _session_info(session_id: str, client: SessionClient | None = None):
+    session = MagicMock()
+    session.id = session_id
+    return ActiveSessionInfo(client or MockSessionClient(), session)
+
+
+def _msg(byte_size: int) -> ForwardMsg:
+    """Return a ForwardMsg whose serialized size is `byte_size` bytes, for
+    sizes below 128 bytes."""
+    msg = ForwardMsg()
+    # Field tag, length and payload.
+    msg.hash = "x" * (byte_size - 2)
+    assert msg.ByteSize() == byte_size
+    return msg
+
+
+def _enqueue(scheduler, session_id: str, msgs: list[ForwardMsg]) -> None:
+    for msg in msgs:
+        scheduler.enqueue(session_id, msg, msg.ByteSize())
+
+
+def _sent(scheduled) -> list[tuple[str, int]]:
+    """The (session ID, message count) pairs of a round."""
+    return [(session_info.session.id, len(msgs)) for session_info, msgs in scheduled]
+
+
+class SessionMessageSchedulerTest(unittest.TestCase):
+    def test_single_session_sends_everything_in_order(self):
+        scheduler = SessionMessageScheduler(quantum_bytes=1000)
+        info = _session_info("a")
+        msgs = [_msg(10) for _ in range(3)]
+        _enqueue(scheduler, "a", msgs)
+
+        self.assertEqual([(info, msgs)], scheduler.next_round([info]))
+        self.assertFalse(scheduler.has_queued_messages())
+        self.assertEqual([], scheduler.next_round([info]))
+
+    def test_busy_session_does_not_starve_others(self):
+        """Each round, a session only sends its quantum of bytes."""
+        scheduler = SessionMessageScheduler(quantum_bytes=100)
+        busy = _session_info("busy")
+        quiet = _session_info("quiet")
+        _enqueue(scheduler, "busy", [_msg(50) for _ in range(6)])
+        _enqueue(scheduler, "quiet", [_msg(50)])
+
+        self.assertEqual(
+            [("busy", 2), ("quiet", 1)], _sent(scheduler.next_round([busy, quiet]))
+        )
+        self.assertEqual([("busy", 2)], _sent(scheduler.next_round([busy, quiet])))
+        self.assertEqual([("busy", 2)], _sent(scheduler.next_round([busy, quiet])))
+        self.assertEqual([], scheduler.next_round([busy, quiet]))
+
+    def test_first_session_is_rotated(self):
+        scheduler = SessionMessageScheduler(quantum_bytes=100)
+        infos = [_session_info("a"), _session_info("b")]
+        _enqueue(scheduler, "a", [_msg(100) for _ in range(2)])
+        _enqueue(scheduler, "b", [_msg(100) for _ in range(2)])
+
+        self.assertEqual([("a", 1), ("b", 1)], _sent(scheduler.next_round(infos)))
+        self.assertEqual([("b", 1), ("a", 1)], _sent(scheduler.next_round(infos)))
+
+    def test_large_message_is_not_delayed(self):
+        """A message larger than the quantum is sent right away, and its
+        session then waits until the other sessions have caught up."""
+        scheduler = SessionMessageScheduler(quantum_bytes=10)
+        large = _session_info("large")
+        small = _session_info("small")
+        _enqueue(scheduler, "large", [_msg(100), _msg(5)])
+
+        self.assertEqual([("large", 1)], _sent(scheduler.next_round([large, small])))
+
+        _enqueue(scheduler, "small", [_msg(5) for _ in range(3)])
+        self.assertEqual([("small", 2)], _sent(scheduler.next_round([large, small])))
+        self.assertEqual([("small", 1)], _sent(scheduler.next_round([large, small])))
+
+        # Rounds in which nothing could be sent are skipped.
+        self.assertEqual([("large", 1)], _sent(scheduler.next_round([large, small])))
+
+    def test_backpressured_session_is_skipped(self):
+        client = MockBufferedSessionClient()
+        scheduler = SessionMessageScheduler(max_pending_write_bytes=100)
+        info = _session_info("a", client)
+        _enqueue(scheduler, "a", [_msg(10)])
+
+        client.pending_bytes = 101
+        self.assertEqual([], scheduler.next_round([info]))
+        self.assertTrue(scheduler.has_queued_messages())
+        self.assertEqual(
+            1, scheduler.get_session_message_stats()[0].backpressured_sessions
+        )
+
+        client.pending_bytes = 100
+        self.assertEqual([("a", 1)], _sent(scheduler.next_round([info])))
+        self.assertEqual(
+            0, scheduler.get_session_message_stats()[0].backpressured_sessions
+        )
+
+    def test_inactive_sessions_are_dropped(self):
+        scheduler = SessionMessageScheduler()
+        _enqueue(scheduler, "gone", [_msg(10)])
+
+        self.assertEqual([], scheduler.next_round([_session_info("a")]))
+        self.assertFalse(scheduler.has_queued_messages())
+        self.assertEqual(
+            [SessionMessageStat(0, 0, 0.0, 0)], scheduler.get_session_message_stats()
+        )
+
+    @patch("streamlit.runtime.session_message_scheduler.time.monotonic")
+    def test_get_session_message_stats(self, mock_monotonic):
+        """The stats are aggregated over all sessions, without their IDs."""
+        scheduler = SessionMessageScheduler(quantum_bytes=10)
+        infos = [_session_info("a"), _session_info("b")]
+        mock_monotonic.return_value = 100
+        _enqueue(scheduler, "a", [_msg(10)])
+        mock_monotonic.return_value = 101
+        _enqueue(scheduler, "a", [_msg(10)])
+        _enqueue(scheduler, "b", [_msg(10)])
+
+        mock_monotonic.return_value = 103
+        self.assertEqual(
+            [SessionMessageStat(3, 2, 3.0, 0)], scheduler.get_session_message_stats()
+        )
+
+        scheduler.next_round(infos)
+        self.assertEqual(
+            [SessionMessageStat(1, 1, 2.0, 0)], scheduler.get_session_message_stats()
+        )
+
+        scheduler.next_round(infos)
+        self.assertEqual(
+            [SessionMessageStat(0, 0, 0.0, 0)], scheduler.get_session_message_stats()
+        )
@@ -760,6 +760,50 @@ class SessionStateMethodTests(unittest.TestCase):
         with pytest.raises(UnserializableSessionStateError):
             self.session_state._check_serializable()
 
+    def test_check_serializable_only_checks_changed_values(self):
+        self.session_state["value"] = [1, 2]
+        self.session_state["other_value"] = "foo"
+        self.session_state._check_serializable()
+
+        with patch(
+            "streamlit.runtime.state.session_state.pickle.dumps"
+        ) as patched_dumps:
+            # Nothing changed since the last check.
+            self.session_state._check_serializable()
+            patched_dumps.assert_not_called()
+
+            # Setting a key again checks it, even if it's the same object.
+            self.session_state["value"] = self.session_state["value"]
+            self.session_state._check_serializable()
+            patched_dumps.assert_called_once_with([1, 2])
+
+    def test_check_serializable_checks_new_widget_values(self):
+        self.session_state._check_serializable()
+
+        self.session_state._new_widget_state.set_from_value("widget_id", lambda: 1)
+        self.session_state._new_widget_state.set_widget_metadata(
+            WidgetMetadata(
+                id="widget_id",
+                deserializer=lambda x, s: x,
+                serializer=identity,
+                value_type="int_value",
+            )
+        )
+        with pytest.raises(UnserializableSessionStateError):
+            self.session_state._check_serializable()
+
+    def test_check_serializable_after_reset(self):
+        self.session_state["value"] = [1, 2]
+        self.session_state._check_serializable()
+        del self.session_state["value"]
+        self.session_state._check_serializable()
+        assert "value" not in self.session_state._serializable_values
+
+        self.session_state.clear()
+        self.session_state["value"] = lambda x: x
+        with pytest.raises(UnserializableSessionStateError):
+            self.session_state._check_serializable()
+
 
 @given(state=stst.session_state())
 @settings(deadline=400)
@@ -17,8 +17,14 @@ from __future__ import annotations
 import unittest
 
 from streamlit.runtime.stats import (
+    CacheEventStat,
+    CacheEventStatsProvider,
     CacheStat,
     CacheStatsProvider,
+    MediaFileStat,
+    MediaFileStatsProvider,
+    SessionMessageStat,
+    SessionMessageStatsProvider,
     StatsManager,
     group_stats,
 )
@@ -32,6 +38,30 @@ class MockStatsProvider(CacheStatsProvider):
         return self.stats
 
 
+class MockCacheEventStatsProvider(CacheEventStatsProvider):
+    def __init__(self):
+        self.stats: list[CacheEventStat] = []
+
+    def get_cache_event_stats(self) -> list[CacheEventStat]:
+        return self.stats
+
+
+class MockSessionMessageStatsProvider(SessionMessageStatsProvider):
+    def __init__(self):
+        self.stats: list[SessionMessageStat] = []
+
+    def get_session_message_stats(self) -> list[SessionMessageStat]:
+        return self.stats
+
+
+class MockMediaFileStatsProvider(MediaFileStatsProvider):
+    def __init__(self):
+        self.stats: list[MediaFileStat] = []
+
+    def get_media_file_stats(self) -> list[MediaFileStat]:
+        return self.stats
+
+
 class StatsManagerTest(unittest.TestCase):
     def test_get_stats(self):
         """StatsManager.get_stats should return all providers' stats."""
@@ -57,6 +87,62 @@ class StatsManagerTest(unittest.TestCase):
 
         self.assertEqual(provider1.stats + provider2.stats, manager.get_stats())
 
+    def test_get_cache_event_stats(self):
+        """StatsManager.get_cache_event_stats should return all cache event
+        providers' stats."""
+        manager = StatsManager()
+        provider1 = MockCacheEventStatsProvider()
+        provider2 = MockCacheEventStatsProvider()
+        manager.register_cache_event_provider(provider1)
+        manager.register_cache_event_provider(provider2)
+
+        self.assertEqual([], manager.get_cache_event_stats())
+
+        provider1.stats = [CacheEventStat("provider1", "foo", "hit", 1)]
+        provider2.stats = [CacheEventStat("provider2", "bar", "miss", 2)]
+
+        self.assertEqual(
+            provider1.stats + provider2.stats, manager.get_cache_event_stats()
+        )
+
+    def test_get_session_message_stats(self):
+        """StatsManager.get_session_message_stats should return all session
+        message providers' stats."""
+        manager = StatsManager()
+        provider1 = MockSessionMessageStatsProvider()
+        provider2 = MockSessionMessageStatsProvider()
+        manager.register_session_message_provider(provider1)
+        manager.register_session_message_provider(provider2)
+
+        self.assertEqual([], manager.get_session_message_stats())
+
+        provider1.stats = [SessionMessageStat(1, 1, 0.5, 0)]
+        provider2.stats = [SessionMessageStat(0, 0, 0.0, 1)]
+
+        self.assertEqual(
+            provider1.stats + provider2.stats, manager.get_session_message_stats()
+        )
+        # Session message stats aren't cache stats.
+        self.assertEqual([], manager.get_stats())
+
+    def test_get_media_file_stats(self):
+        """StatsManager.get_media_file_stats should return all media file
+        providers' stats."""
+        manager = StatsManager()
+        provider1 = MockMediaFileStatsProvider()
+        provider2 = MockMediaFileStatsProvider()
+        manager.register_media_file_provider(provider1)
+        manager.register_media_file_provider(provider2)
+
+        self.assertEqual([], manager.get_media_file_stats())
+
+        provider1.stats = [MediaFileStat(1, 2, 3, 0.5)]
+        provider2.stats = [MediaFileStat(4, 5, 6, 0.0)]
+
+        self.assertEqual(
+            provider1.stats + provider2.stats, manager.get_media_file_stats()
+        )
+
     def test_group_stats(self):
         """Should return stats grouped by category_name and cache_name.
         byte_length should be summed."""
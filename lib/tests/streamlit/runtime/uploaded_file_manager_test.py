@@ -16,11 +16,16 @@
 
 from __future__ import annotations
 
+import io
+import mmap
+import pickle
+import tempfile
+import tracemalloc
 import unittest
 
 from streamlit.runtime.memory_uploaded_file_manager import MemoryUploadedFileManager
 from streamlit.runtime.stats import CacheStat
-from streamlit.runtime.uploaded_file_manager import UploadedFileRec
+from streamlit.runtime.uploaded_file_manager import UploadedFile, UploadedFileRec
 from tests.exception_capturing_thread import call_on_threads
 
 FILE_1 = UploadedFileRec(file_id="url1", name="file1", type="type", data=b"file1")
@@ -110,6 +115,121 @@ class UploadedFileManagerTest(unittest.TestCase):
         ]
         self.assertEqual(expected, self.mgr.get_stats())
 
+    def test_get_session_files_size(self):
+        self.assertEqual(0, self.mgr.get_session_files_size("session1"))
+
+        self.mgr.add_file("session1", FILE_1)
+        self.mgr.add_file("session1", FILE_2)
+        self.mgr.add_file("session2", FILE_1)
+
+        self.assertEqual(
+            len(FILE_1.data) + len(FILE_2.data),
+            self.mgr.get_session_files_size("session1"),
+        )
+        self.assertEqual(len(FILE_1.data), self.mgr.get_session_files_size("session2"))
+
+
+def _mmap_data(data: bytes) -> mmap.mmap:
+    with tempfile.TemporaryFile() as f:
+        f.write(data)
+        f.flush()
+        return mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+
+
+class UploadedFileTest(unittest.TestCase):
+    def test_file_backed_upload_is_loaded_when_used(self):
+        """An UploadedFile of a file-backed upload only copies the upload
+        into memory once it's used, and then behaves like a BytesIO."""
+        record = UploadedFileRec("id", "file.csv", "text/csv", _mmap_data(b"a\nb\n"))
+
+        uploaded_file = UploadedFile(record, None)
+        self.assertEqual(4, uploaded_file.size)
+        self.assertEqual(b"a\nb\n", uploaded_file.getbuffer().tobytes())
+        self.assertEqual(
+            "UploadedFile(file_id='id', name='file.csv', type='text/csv', size=4)",
+            repr(uploaded_file),
+        )
+
+        uploaded_file = UploadedFile(record, None)
+        self.assertEqual([b"a\n", b"b\n"], list(uploaded_file))
+        uploaded_file.seek(0)
+        self.assertEqual(b"a\n", uploaded_file.readline())
+        uploaded_file.write(b"c")
+        self.assertEqual(b"a\nc\n", uploaded_file.getvalue())
+
+    def test_file_backed_upload_is_read_without_copying(self):
+        """Reading and seeking a file-backed upload reads its memory map,
+        without copying the whole upload into memory."""
+        size = 32 * 1024 * 1024
+        record = UploadedFileRec(
+            "id", "file.bin", "application/octet-stream", _mmap_data(b"x" * size)
+        )
+        uploaded_file = UploadedFile(record, None)
+
+        tracemalloc.start()
+        try:
+            self.assertEqual(b"x" * 1024, uploaded_file.read(1024))
+            self.assertEqual(size - 4, uploaded_file.seek(-4, io.SEEK_END))
+            buffer = bytearray(8)
+            self.assertEqual(4, uploaded_file.readinto(buffer))
+            self.assertEqual(b"xxxx", bytes(buffer[:4]))
+            self.assertEqual(size, uploaded_file.tell())
+            self.assertEqual(b"", uploaded_file.read())
+            _, peak_size = tracemalloc.get_traced_memory()
+        finally:
+            tracemalloc.stop()
+
+        self.assertLess(peak_size, 1024 * 1024)
+        # Nothing was copied into the BytesIO.
+        self.assertEqual(b"", io.BytesIO.getvalue(uploaded_file))
+
+    def test_file_backed_upload_behaves_like_bytesio(self):
+        content = b"first\nsecond\nthird"
+        uploaded_file = UploadedFile(
+            UploadedFileRec("id", "file.txt", "text/plain", _mmap_data(content)),
+            None,
+        )
+        bytes_io = io.BytesIO(content)
+
+        for file in (uploaded_file, bytes_io):
+            self.assertEqual(b"fi", file.read(2))
+            self.assertEqual(b"rst\n", file.readline())
+            self.assertEqual(b"se", file.readline(2))
+            self.assertEqual([b"cond\n", b"third"], file.readlines())
+            self.assertEqual(16, file.seek(-2, io.SEEK_CUR))
+            self.assertEqual(b"rd", file.read1())
+            self.assertEqual(100, file.seek(100))
+            self.assertEqual(b"", file.read())
+            self.assertEqual(0, file.seek(0))
+            self.assertEqual([b"first\n"], file.readlines(3))
+            with self.assertRaises(ValueError):
+                file.seek(-1)
+            self.assertEqual(content, file.getvalue())
+
+        # Writing copies the content, and keeps the position.
+        uploaded_file.seek(6)
+        uploaded_file.write(b"SECOND")
+        self.assertEqual(b"first\nSECOND\nthird", uploaded_file.getvalue())
+        self.assertEqual(b"\nthird", uploaded_file.read())
+
+        uploaded_file.close()
+        with self.assertRaises(ValueError):
+            uploaded_file.read()
+
+    def test_file_backed_upload_is_pickled_with_content(self):
+        record = UploadedFileRec("id", "file.csv", "text/csv", _mmap_data(b"a\nb\n"))
+
+        uploaded_file = pickle.loads(pickle.dumps(UploadedFile(record, None)))
+
+        self.assertEqual("file.csv", uploaded_file.name)
+        self.assertEqual(b"a\nb\n", uploaded_file.read())
+
+        # The position is kept as well.
+        original_file = UploadedFile(record, None)
+        original_file.seek(2)
+        uploaded_file = pickle.loads(pickle.dumps(original_file))
+        self.assertEqual(b"b\n", uploaded_file.read())
+
 
 class UploadedFileManagerThreadingTest(unittest.TestCase):
     # The number of threads to run our tests on
@@ -48,6 +48,13 @@ def NOOP_CALLBACK(_filepath):
 @patch("streamlit.file_util.file_in_pythonpath", MagicMock(return_value=False))
 class LocalSourcesWatcherTest(unittest.TestCase):
     def setUp(self):
+        # Every test starts without module watchers from previous tests.
+        instances_patch = patch.dict(
+            local_sources_watcher._SharedModuleWatcher._instances, clear=True
+        )
+        instances_patch.start()
+        self.addCleanup(instances_patch.stop)
+
         modules = [
             "DUMMY_MODULE_1",
             "DUMMY_MODULE_2",
@@ -269,7 +276,8 @@ class LocalSourcesWatcherTest(unittest.TestCase):
         lsw = local_sources_watcher.LocalSourcesWatcher(PagesManager(SCRIPT_PATH))
         lsw.register_file_change_callback(NOOP_CALLBACK)
         lsw.update_watched_modules()
-        self.assertEqual(len(lsw._watched_modules), 0)
+        self.assertEqual(len(lsw._page_watchers), 0)
+        self.assertEqual(len(lsw._module_watcher._watched_modules), 0)
 
     @patch("streamlit.watcher.local_sources_watcher.PathWatcher")
     def test_namespace_package_unloaded(self, fob):
@@ -299,7 +307,7 @@ class LocalSourcesWatcherTest(unittest.TestCase):
         lsw.register_file_change_callback(NOOP_CALLBACK)
 
         register = MagicMock()
-        lsw._register_necessary_watchers = register
+        lsw._module_watcher._register_necessary_watchers = register
 
         # Updates modules on first run
         lsw.update_watched_modules()
@@ -321,6 +329,74 @@ class LocalSourcesWatcherTest(unittest.TestCase):
         lsw.update_watched_modules()
         register.assert_not_called()
 
+        # Only looks at the modules that are new
+        register.reset_mock()
+        sys.modules["DUMMY_MODULE_1"] = DUMMY_MODULE_1
+        lsw.update_watched_modules()
+        register.assert_called_once()
+        self.assertEqual(["DUMMY_MODULE_1"], list(register.call_args.args[0]))
+
+    @patch("streamlit.watcher.local_sources_watcher.PathWatcher")
+    def test_sessions_share_module_watchers(self, fob):
+        """The modules of an app are watched once, for all of its sessions."""
+        callbacks = [MagicMock(), MagicMock()]
+        lsws = []
+        for callback in callbacks:
+            lsw = local_sources_watcher.LocalSourcesWatcher(PagesManager(SCRIPT_PATH))
+            lsw.register_file_change_callback(callback)
+            lsws.append(lsw)
+
+        self.assertIs(lsws[0]._module_watcher, lsws[1]._module_watcher)
+        # Each session watches its pages.
+        self.assertEqual(fob.call_count, 2)
+
+        sys.modules["DUMMY_MODULE_1"] = DUMMY_MODULE_1
+        fob.reset_mock()
+        for lsw in lsws:
+            lsw.update_watched_modules()
+
+        # DUMMY_MODULE_1 and __init__.py
+        self.assertEqual(fob.call_count, 2)
+
+        # A module change is reported to all sessions.
+        _, on_module_changed = next(
+            call.args
+            for call in fob.call_args_list
+            if call.args[0] == DUMMY_MODULE_1_FILE
+        )
+        on_module_changed(DUMMY_MODULE_1_FILE)
+
+        self.assertNotIn("DUMMY_MODULE_1", sys.modules)
+        for callback in callbacks:
+            callback.assert_called_once_with(DUMMY_MODULE_1_FILE)
+
+    @patch("streamlit.watcher.local_sources_watcher.PathWatcher")
+    def test_module_watchers_closed_with_last_session(self, fob):
+        fob.side_effect = lambda *args: MagicMock()
+        lsws = [
+            local_sources_watcher.LocalSourcesWatcher(PagesManager(SCRIPT_PATH))
+            for _ in range(2)
+        ]
+        sys.modules["DUMMY_MODULE_1"] = DUMMY_MODULE_1
+        lsws[0].update_watched_modules()
+        module_watcher = lsws[0]._module_watcher
+        self.assertNotEqual(len(module_watcher._watched_modules), 0)
+        watchers = [wm.watcher for wm in module_watcher._watched_modules.values()]
+
+        lsws[0].close()
+        for watcher in watchers:
+            watcher.close.assert_not_called()
+
+        lsws[1].close()
+        for watcher in watchers:
+            watcher.close.assert_called_once()
+        self.assertEqual(len(module_watcher._watched_modules), 0)
+        self.assertEqual(local_sources_watcher._SharedModuleWatcher._instances, {})
+
+        # A new session gets a new module watcher.
+        lsw = local_sources_watcher.LocalSourcesWatcher(PagesManager(SCRIPT_PATH))
+        self.assertIsNot(lsw._module_watcher, module_watcher)
+
     @patch(
         "streamlit.runtime.pages_manager.PagesManager.get_pages",
         MagicMock(
@@ -485,6 +561,15 @@ class LocalSourcesWatcherTest(unittest.TestCase):
         self.assertEqual(saved_filepath, SCRIPT_PATH)
 
 
+def test_import_count():
+    import_count = local_sources_watcher._get_import_count()
+    sys.modules.pop("tests.streamlit.watcher.test_data.dummy_module2", None)
+
+    import tests.streamlit.watcher.test_data.dummy_module2  # noqa: F401
+
+    assert local_sources_watcher._get_import_count() > import_count
+
+
 def test_get_module_paths_outputs_abs_paths():
     mock_module = MagicMock()
     mock_module.__file__ = os.path.relpath(DUMMY_MODULE_1_FILE)
@@ -14,9 +14,14 @@
 
 from __future__ import annotations
 
+import os
+import tempfile
+import time
 import unittest
 from unittest import mock
 
+from parameterized import parameterized
+
 from streamlit.watcher import polling_path_watcher
 
 
@@ -28,82 +33,110 @@ class PollingPathWatcherTest(unittest.TestCase):
         self.util_patch = mock.patch("streamlit.watcher.polling_path_watcher.util")
         self.util_mock = self.util_patch.start()
 
-        # Patch PollingPathWatcher's thread pool executor. We want to do
-        # all of our test polling on the test thread, so we accumulate
-        # tasks here and run them manually via `_run_executor_tasks`.
-        self._executor_tasks = []
-        self.executor_patch = mock.patch(
-            "streamlit.watcher.polling_path_watcher.PollingPathWatcher._executor",
+        # The size and modification time of every path.
+        self.stats = {}
+        self.stat_paths_patch = mock.patch(
+            "streamlit.watcher.polling_path_watcher._stat_paths",
+            new=lambda paths: {path: self.stats.get(path) for path in paths},
+        )
+        self.stat_paths_patch.start()
+        self.stat_path_patch = mock.patch(
+            "streamlit.watcher.polling_path_watcher._stat_path",
+            new=lambda path: self.stats.get(path),
         )
-        executor_mock = self.executor_patch.start()
-        executor_mock.submit = self._submit_executor_task
+        self.stat_path_patch.start()
 
-        # Patch PollingPathWatcher's `time.sleep` to no-op, so that the tasks
-        # submitted to our mock executor don't block.
-        self.sleep_patch = mock.patch(
-            "streamlit.watcher.polling_path_watcher.time.sleep"
+        # Use a new _PollingScheduler without a polling thread. We poll on
+        # the test thread instead, via `_poll_watched_paths`.
+        self.singleton_patch = mock.patch.object(
+            polling_path_watcher._PollingScheduler, "_singleton", None
         )
-        self.sleep_patch.start()
+        self.singleton_patch.start()
+        self.thread_patch = mock.patch.object(
+            polling_path_watcher._PollingScheduler, "_start_thread"
+        )
+        self.thread_patch.start()
+        # Watchers schedule their first poll relative to the real clock, so
+        # the simulated clock starts from it.
+        self.now = time.monotonic()
 
     def tearDown(self):
         super().tearDown()
         self.util_patch.stop()
-        self.executor_patch.stop()
-        self.sleep_patch.stop()
-
-    def _submit_executor_task(self, task):
-        """Submit a new task to our mock executor."""
-        self._executor_tasks.append(task)
+        self.stat_paths_patch.stop()
+        self.stat_path_patch.stop()
+        self.singleton_patch.stop()
+        self.thread_patch.stop()
 
-    def _run_executor_tasks(self):
-        """Run all tasks that have been submitted to our mock executor."""
-        tasks = self._executor_tasks
-        self._executor_tasks = []
-        for task in tasks:
-            task()
+    def _poll_watched_paths(self):
+        """Poll all watched paths, as if they were all due."""
+        self.now += 10_000
+        with mock.patch("time.monotonic", return_value=self.now):
+            polling_path_watcher._PollingScheduler.get_singleton().scan(self.now)
 
     def test_file_watch_and_callback(self):
         """Test that when a file is modified, the callback is called."""
         callback = mock.Mock()
 
-        self.util_mock.path_modification_time = lambda *args: 101.0
+        self.stats["/this/is/my/file.py"] = (101.0, 10)
         self.util_mock.calc_md5_with_blocking_retries = lambda _, **kwargs: "1"
 
         watcher = polling_path_watcher.PollingPathWatcher(
             "/this/is/my/file.py", callback
         )
 
-        self._run_executor_tasks()
+        self._poll_watched_paths()
         callback.assert_not_called()
 
-        self.util_mock.path_modification_time = lambda *args: 102.0
+        self.stats["/this/is/my/file.py"] = (102.0, 10)
         self.util_mock.calc_md5_with_blocking_retries = lambda _, **kwargs: "2"
 
-        self._run_executor_tasks()
-        callback.assert_called_once()
+        self._poll_watched_paths()
+        callback.assert_called_once_with("/this/is/my/file.py")
 
         watcher.close()
 
-    def test_callback_not_called_if_same_mtime(self):
-        """Test that we ignore files with same mtime."""
+    def test_callback_not_called_if_same_mtime_and_size(self):
+        """Test that we ignore files with same mtime and size."""
         callback = mock.Mock()
 
-        self.util_mock.path_modification_time = lambda *args: 101.0
-        self.util_mock.calc_md5_with_blocking_retries = lambda _, **kwargs: "1"
+        self.stats["/this/is/my/file.py"] = (101.0, 10)
+        self.util_mock.calc_md5_with_blocking_retries = mock.Mock(return_value="1")
 
         watcher = polling_path_watcher.PollingPathWatcher(
             "/this/is/my/file.py", callback
         )
 
-        self._run_executor_tasks()
+        self._poll_watched_paths()
         callback.assert_not_called()
 
-        # Same mtime!
-        self.util_mock.calc_md5_with_blocking_retries = lambda _, **kwargs: "2"
+        # Same mtime and size!
+        self.util_mock.calc_md5_with_blocking_retries.return_value = "2"
 
         # This is the test:
-        self._run_executor_tasks()
+        self._poll_watched_paths()
         callback.assert_not_called()
+        # The file isn't even hashed.
+        self.util_mock.calc_md5_with_blocking_retries.assert_called_once()
+
+        watcher.close()
+
+    def test_callback_called_if_size_changed(self):
+        """Test that a change in size is detected even with the same mtime."""
+        callback = mock.Mock()
+
+        self.stats["/this/is/my/file.py"] = (101.0, 10)
+        self.util_mock.calc_md5_with_blocking_retries = lambda _, **kwargs: "1"
+
+        watcher = polling_path_watcher.PollingPathWatcher(
+            "/this/is/my/file.py", callback
+        )
+
+        self.stats["/this/is/my/file.py"] = (101.0, 11)
+        self.util_mock.calc_md5_with_blocking_retries = lambda _, **kwargs: "2"
+
+        self._poll_watched_paths()
+        callback.assert_called_once()
 
         watcher.close()
 
@@ -111,22 +144,22 @@ class PollingPathWatcherTest(unittest.TestCase):
         """Test that callback are executed anyway even if modification time is 0.0"""
         callback = mock.Mock()
 
-        self.util_mock.path_modification_time = lambda *args: 0.0
+        self.stats["/this/is/my/folder"] = (0.0, 0)
         self.util_mock.calc_md5_with_blocking_retries = lambda _, **kwargs: "11"
 
         watcher = polling_path_watcher.PollingPathWatcher(
             "/this/is/my/folder/", callback
         )
 
-        self._run_executor_tasks()
+        self._poll_watched_paths()
         callback.assert_not_called()
 
         # Same mtime!
         self.util_mock.calc_md5_with_blocking_retries = lambda _, **kwargs: "22"
 
         # This is the test:
-        self._run_executor_tasks()
-        callback.assert_called()
+        self._poll_watched_paths()
+        callback.assert_called_once_with("/this/is/my/folder/")
 
         watcher.close()
 
@@ -134,23 +167,64 @@ class PollingPathWatcherTest(unittest.TestCase):
         """Test that we ignore files with same md5."""
         callback = mock.Mock()
 
-        self.util_mock.path_modification_time = lambda *args: 101.0
+        self.stats["/this/is/my/file.py"] = (101.0, 10)
         self.util_mock.calc_md5_with_blocking_retries = lambda _, **kwargs: "1"
 
         watcher = polling_path_watcher.PollingPathWatcher(
             "/this/is/my/file.py", callback
         )
 
-        self._run_executor_tasks()
+        self._poll_watched_paths()
         callback.assert_not_called()
 
-        self.util_mock.path_modification_time = lambda *args: 102.0
+        self.stats["/this/is/my/file.py"] = (102.0, 10)
         # Same MD5
 
         # This is the test:
-        self._run_executor_tasks()
+        self._poll_watched_paths()
+        callback.assert_not_called()
+
+        watcher.close()
+
+    def test_deleted_file(self):
+        """A file that's deleted and created again is still watched."""
+        callback = mock.Mock()
+
+        self.stats["/this/is/my/file.py"] = (101.0, 10)
+        self.util_mock.calc_md5_with_blocking_retries = lambda _, **kwargs: "1"
+
+        watcher = polling_path_watcher.PollingPathWatcher(
+            "/this/is/my/file.py", callback
+        )
+
+        del self.stats["/this/is/my/file.py"]
+        self._poll_watched_paths()
         callback.assert_not_called()
 
+        self.stats["/this/is/my/file.py"] = (102.0, 12)
+        self.util_mock.calc_md5_with_blocking_retries = lambda _, **kwargs: "2"
+        self._poll_watched_paths()
+        callback.assert_called_once()
+
+        watcher.close()
+
+    def test_nonexistent_path_created(self):
+        callback = mock.Mock()
+
+        self.util_mock.calc_md5_with_blocking_retries = lambda _, **kwargs: "1"
+
+        watcher = polling_path_watcher.PollingPathWatcher(
+            "/this/is/my/file.py", callback, allow_nonexistent=True
+        )
+
+        self._poll_watched_paths()
+        callback.assert_not_called()
+
+        self.stats["/this/is/my/file.py"] = (101.0, 10)
+        self.util_mock.calc_md5_with_blocking_retries = lambda _, **kwargs: "2"
+        self._poll_watched_paths()
+        callback.assert_called_once()
+
         watcher.close()
 
     def test_kwargs_plumbed_to_calc_md5(self):
@@ -165,7 +239,7 @@ class PollingPathWatcherTest(unittest.TestCase):
         """
         callback = mock.Mock()
 
-        self.util_mock.path_modification_time = lambda *args: 101.0
+        self.stats["/this/is/my/dir"] = (101.0, 10)
         self.util_mock.calc_md5_with_blocking_retries = mock.Mock(return_value="1")
 
         watcher = polling_path_watcher.PollingPathWatcher(
@@ -175,15 +249,15 @@ class PollingPathWatcherTest(unittest.TestCase):
             allow_nonexistent=True,
         )
 
-        self._run_executor_tasks()
+        self._poll_watched_paths()
         callback.assert_not_called()
         _, kwargs = self.util_mock.calc_md5_with_blocking_retries.call_args
         assert kwargs == {"glob_pattern": "*.py", "allow_nonexistent": True}
 
-        self.util_mock.path_modification_time = lambda *args: 102.0
+        self.stats["/this/is/my/dir"] = (102.0, 10)
         self.util_mock.calc_md5_with_blocking_retries = mock.Mock(return_value="2")
 
-        self._run_executor_tasks()
+        self._poll_watched_paths()
         callback.assert_called_once()
         _, kwargs = self.util_mock.calc_md5_with_blocking_retries.call_args
         assert kwargs == {"glob_pattern": "*.py", "allow_nonexistent": True}
@@ -197,7 +271,7 @@ class PollingPathWatcherTest(unittest.TestCase):
         mod_count = [0.0]
 
         def modify_mock_file():
-            self.util_mock.path_modification_time = lambda *args: mod_count[0]
+            self.stats[filename] = (mod_count[0], 10)
             self.util_mock.calc_md5_with_blocking_retries = (
                 lambda _, **kwargs: "%d" % mod_count[0]
             )
@@ -212,14 +286,14 @@ class PollingPathWatcherTest(unittest.TestCase):
         watcher1 = polling_path_watcher.PollingPathWatcher(filename, callback1)
         watcher2 = polling_path_watcher.PollingPathWatcher(filename, callback2)
 
-        self._run_executor_tasks()
+        self._poll_watched_paths()
 
         callback1.assert_not_called()
         callback2.assert_not_called()
 
         # "Modify" our file
         modify_mock_file()
-        self._run_executor_tasks()
+        self._poll_watched_paths()
 
         self.assertEqual(callback1.call_count, 1)
         self.assertEqual(callback2.call_count, 1)
@@ -229,7 +303,7 @@ class PollingPathWatcherTest(unittest.TestCase):
 
         # Modify our file again
         modify_mock_file()
-        self._run_executor_tasks()
+        self._poll_watched_paths()
 
         self.assertEqual(callback1.call_count, 1)
         self.assertEqual(callback2.call_count, 2)
@@ -238,8 +312,228 @@ class PollingPathWatcherTest(unittest.TestCase):
 
         # Modify our file a final time
         modify_mock_file()
+        self._poll_watched_paths()
 
         # Both watchers are now closed, so their callback counts
         # should not have increased.
         self.assertEqual(callback1.call_count, 1)
         self.assertEqual(callback2.call_count, 2)
+
+    def test_unchanged_paths_are_polled_less_often(self):
+        callback = mock.Mock()
+        self.stats["/this/is/my/file.py"] = (101.0, 10)
+        self.util_mock.calc_md5_with_blocking_retries = lambda _, **kwargs: "1"
+
+        watcher = polling_path_watcher.PollingPathWatcher(
+            "/this/is/my/file.py", callback
+        )
+        self.assertEqual(
+            watcher._polling_period, polling_path_watcher._POLLING_PERIOD_SECS
+        )
+
+        polling_periods = []
+        for _ in range(20):
+            self._poll_watched_paths()
+            polling_periods.append(watcher._polling_period)
+
+        self.assertEqual(polling_periods, sorted(polling_periods))
+        self.assertGreater(
+            polling_periods[0], polling_path_watcher._POLLING_PERIOD_SECS
+        )
+        self.assertEqual(
+            polling_periods[-1], polling_path_watcher._MAX_POLLING_PERIOD_SECS
+        )
+        self.assertEqual(watcher._next_poll_time, self.now + polling_periods[-1])
+
+        # A change makes the path hot again.
+        self.stats["/this/is/my/file.py"] = (102.0, 10)
+        self.util_mock.calc_md5_with_blocking_retries = lambda _, **kwargs: "2"
+        self._poll_watched_paths()
+
+        callback.assert_called_once()
+        self.assertEqual(
+            watcher._polling_period, polling_path_watcher._POLLING_PERIOD_SECS
+        )
+
+        watcher.close()
+
+    def test_only_due_paths_are_polled(self):
+        self.stats["/this/is/my/file.py"] = (101.0, 10)
+        self.util_mock.calc_md5_with_blocking_retries = lambda _, **kwargs: "1"
+        watcher = polling_path_watcher.PollingPathWatcher(
+            "/this/is/my/file.py", mock.Mock()
+        )
+        scheduler = polling_path_watcher._PollingScheduler.get_singleton()
+
+        with mock.patch.object(watcher, "_poll") as poll_mock:
+            scheduler.scan(watcher._next_poll_time - 0.01)
+            poll_mock.assert_not_called()
+
+            scheduler.scan(watcher._next_poll_time)
+            poll_mock.assert_called_once_with((101.0, 10), watcher._next_poll_time)
+
+        watcher.close()
+
+    @mock.patch("streamlit.watcher.polling_path_watcher._LOGGER")
+    def test_poll_error_is_logged(self, patched_logger):
+        self.stats["/this/is/my/file.py"] = (101.0, 10)
+        self.util_mock.calc_md5_with_blocking_retries = lambda _, **kwargs: "1"
+        callback = mock.Mock(side_effect=[RuntimeError("oops"), None])
+        watcher = polling_path_watcher.PollingPathWatcher(
+            "/this/is/my/file.py", callback
+        )
+
+        self.stats["/this/is/my/file.py"] = (102.0, 10)
+        self.util_mock.calc_md5_with_blocking_retries = lambda _, **kwargs: "2"
+        self._poll_watched_paths()
+        patched_logger.warning.assert_called_once()
+
+        # The path is still watched.
+        self.stats["/this/is/my/file.py"] = (103.0, 10)
+        self.util_mock.calc_md5_with_blocking_retries = lambda _, **kwargs: "3"
+        self._poll_watched_paths()
+        self.assertEqual(callback.call_count, 2)
+
+        watcher.close()
+
+    @mock.patch("streamlit.watcher.polling_path_watcher._LOGGER")
+    def test_scan_timing_is_reported(self, patched_logger):
+        self.stats["/this/is/my/file.py"] = (101.0, 10)
+        self.util_mock.calc_md5_with_blocking_retries = lambda _, **kwargs: "1"
+        watcher = polling_path_watcher.PollingPathWatcher(
+            "/this/is/my/file.py", mock.Mock()
+        )
+        scheduler = polling_path_watcher._PollingScheduler.get_singleton()
+
+        # Fast scans aren't logged.
+        with mock.patch("time.monotonic", side_effect=[0.0, 0.1]):
+            scheduler.scan(watcher._next_poll_time)
+        self.assertEqual(scheduler.last_scan_secs, 0.1)
+        patched_logger.debug.assert_not_called()
+
+        # The scan takes 0.5 seconds.
+        with mock.patch("time.monotonic", side_effect=[0.0, 0.5, 1.0, 1.5]):
+            scheduler.scan(watcher._next_poll_time)
+            scheduler.scan(watcher._next_poll_time)
+
+        self.assertEqual(scheduler.last_scan_secs, 0.5)
+        self.assertEqual(scheduler.last_scan_path_count, 1)
+        self.assertEqual(patched_logger.debug.call_count, 2)
+        # Slow scans are only reported once.
+        patched_logger.warning.assert_called_once()
+
+        watcher.close()
+
+
+class StatPathsTest(unittest.TestCase):
+    @parameterized.expand(
+        [
+            ("stat", polling_path_watcher._stat_paths),
+            ("scan", polling_path_watcher._scan_paths),
+        ]
+    )
+    def test_stat_paths(self, _, stat_paths):
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            file_path = os.path.join(tmp_dir, "file.py")
+            with open(file_path, "w") as f:
+                f.write("hello")
+            dir_path = os.path.join(tmp_dir, "pages")
+            os.mkdir(dir_path)
+            missing_path = os.path.join(tmp_dir, "missing.py")
+            path_in_missing_folder = os.path.join(tmp_dir, "missing", "file.py")
+
+            stats = stat_paths(
+                [file_path, dir_path, missing_path, path_in_missing_folder]
+            )
+            for path, stat in stats.items():
+                self.assertEqual(stat, polling_path_watcher._stat_path(path))
+
+            self.assertEqual(
+                stats,
+                {
+                    file_path: (os.stat(file_path).st_mtime, 5),
+                    dir_path: (
+                        os.stat(dir_path).st_mtime,
+                        os.stat(dir_path).st_size,
+                    ),
+                    missing_path: None,
+                    path_in_missing_folder: None,
+                },
+            )
+
+    def test_folders_are_listed_once(self):
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            paths = [os.path.join(tmp_dir, f"file{i}.py") for i in range(3)]
+            for path in paths:
+                open(path, "w").close()
+
+            with mock.patch("os.scandir", wraps=os.scandir) as scandir_spy:
+                stats = polling_path_watcher._scan_paths(paths)
+
+            scandir_spy.assert_called_once_with(tmp_dir)
+            self.assertEqual(list(stats), paths)
+            self.assertTrue(all(stat is not None for stat in stats.values()))
+
+
+class PollingSchedulerTest(unittest.TestCase):
+    def test_polls_on_a_single_thread(self):
+        """Every watcher is polled by the same thread, which is only started
+        once."""
+        with (
+            mock.patch.object(
+                polling_path_watcher._PollingScheduler, "_singleton", None
+            ),
+            mock.patch(
+                "streamlit.watcher.polling_path_watcher.threading.Thread"
+            ) as thread_mock,
+            mock.patch("streamlit.watcher.polling_path_watcher.util"),
+            tempfile.TemporaryDirectory() as tmp_dir,
+        ):
+            watchers = [
+                polling_path_watcher.PollingPathWatcher(
+                    os.path.join(tmp_dir, f"file{i}.py"),
+                    mock.Mock(),
+                    allow_nonexistent=True,
+                )
+                for i in range(3)
+            ]
+
+            thread_mock.assert_called_once()
+            thread_mock.return_value.start.assert_called_once()
+
+            for watcher in watchers:
+                watcher.close()
+
+    def test_thread_exits_without_watchers(self):
+        """The polling thread exits once all watchers are closed, and a new
+        one is started when a path is watched again."""
+        with (
+            mock.patch.object(
+                polling_path_watcher._PollingScheduler, "_singleton", None
+            ),
+            mock.patch("streamlit.watcher.polling_path_watcher.util"),
+            mock.patch("time.sleep"),
+            tempfile.TemporaryDirectory() as tmp_dir,
+        ):
+            path = os.path.join(tmp_dir, "file.py")
+            watcher = polling_path_watcher.PollingPathWatcher(
+                path, mock.Mock(), allow_nonexistent=True
+            )
+            scheduler = polling_path_watcher._PollingScheduler.get_singleton()
+            thread = scheduler._thread
+            assert thread is not None
+
+            watcher.close()
+            thread.join(timeout=5)
+            self.assertFalse(thread.is_alive())
+            self.assertIsNone(scheduler._thread)
+
+            watcher = polling_path_watcher.PollingPathWatcher(
+                path, mock.Mock(), allow_nonexistent=True
+            )
+            thread = scheduler._thread
+            assert thread is not None
+
+            polling_path_watcher.PollingPathWatcher.close_all()
+            thread.join(timeout=5)
+            self.assertFalse(thread.is_alive())
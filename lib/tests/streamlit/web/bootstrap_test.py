@@ -450,3 +450,33 @@ class BootstrapRunTest(IsolatedAsyncioTestCase):
 
         with testutil.patch_config_options({"server.headless": True}):
             bootstrap.run("", False, [], {}, stop_immediately_for_testing=True)
+
+    @patch("streamlit.web.bootstrap._run_server")
+    @patch("streamlit.web.bootstrap._run_worker_pool")
+    @patch("streamlit.web.bootstrap.is_worker_pool_supported", Mock(return_value=True))
+    def test_bootstrap_run_worker_pool(self, mock_run_worker_pool, mock_run_server):
+        with testutil.patch_config_options({"server.workerProcesses": 3}):
+            bootstrap.run("/app.py", False, [], {"server.port": 8502})
+
+        mock_run_worker_pool.assert_called_once_with(
+            "/app.py",
+            False,
+            {"server.port": 8502},
+            3,
+            stop_immediately_for_testing=False,
+        )
+        mock_run_server.assert_not_called()
+
+    @patch("streamlit.web.bootstrap._LOGGER.warning")
+    @patch("streamlit.web.bootstrap._run_server")
+    @patch("streamlit.web.bootstrap._run_worker_pool")
+    @patch("streamlit.web.bootstrap.is_worker_pool_supported", Mock(return_value=False))
+    def test_bootstrap_run_worker_pool_unsupported(
+        self, mock_run_worker_pool, mock_run_server, mock_log_warning
+    ):
+        with testutil.patch_config_options({"server.workerProcesses": 3}):
+            bootstrap.run("/app.py", False, [], {})
+
+        mock_run_worker_pool.assert_not_called()
+        mock_run_server.assert_called_once()
+        mock_log_warning.assert_called_once()
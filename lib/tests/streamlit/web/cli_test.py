@@ -38,6 +38,7 @@ import streamlit
 import streamlit.web.bootstrap
 from streamlit import config
 from streamlit.config_option import ConfigOption
+from streamlit.import_time_util import ImportTime
 from streamlit.runtime.credentials import Credentials
 from streamlit.web import cli
 from streamlit.web.cli import _convert_config_option_to_click_option
@@ -446,6 +447,64 @@ class CliTest(unittest.TestCase):
         clear_resource_caches.assert_called_once()
         clear_data_caches.assert_called_once()
 
+    def test_cache_warm_compiles_scripts(self):
+        """streamlit cache warm compiles the main script, its pages folder, and
+        the given pages into the bytecode cache."""
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            cache_path = os.path.join(tmp_dir, "bytecode")
+            os.makedirs(os.path.join(tmp_dir, "app", "pages"))
+            for script in ("app.py", "pages/page.py", "other_page.py"):
+                Path(tmp_dir, "app", script).write_text("import streamlit as st\n")
+
+            with testutil.patch_config_options(
+                {"runner.bytecodeCachePath": cache_path}
+            ):
+                result = self.runner.invoke(
+                    cli,
+                    [
+                        "cache",
+                        "warm",
+                        os.path.join(tmp_dir, "app", "app.py"),
+                        "other_page.py",
+                    ],
+                )
+
+            self.assertEqual(0, result.exit_code, result.output)
+            self.assertEqual(3, len(os.listdir(cache_path)))
+
+    def test_cache_warm_requires_cache_path(self):
+        with tempfile.NamedTemporaryFile(suffix=".py") as script:
+            result = self.runner.invoke(cli, ["cache", "warm", script.name])
+
+        self.assertEqual(2, result.exit_code)
+        self.assertIn("runner.bytecodeCachePath", result.output)
+
+    @patch(
+        "streamlit.import_time_util.profile_import",
+        return_value=[
+            ImportTime("site", 5000, 9000, 0),
+            ImportTime("streamlit.config", 1000, 3000, 1),
+            ImportTime("streamlit.elements", 2000, 2500, 1),
+            ImportTime("streamlit", 500, 6000, 0),
+        ],
+    )
+    def test_import_time(self, _):
+        """streamlit import-time lists the slowest modules imported by
+        Streamlit."""
+        result = self.runner.invoke(cli, ["import-time", "--top", "2"])
+
+        self.assertEqual(0, result.exit_code, result.output)
+        self.assertIn("Importing streamlit took 6.0 ms.", result.output)
+        modules = [line.split()[-1] for line in result.output.splitlines()[3:]]
+        self.assertEqual(["streamlit", "streamlit.config"], modules)
+
+        result = self.runner.invoke(cli, ["import-time", "--sort", "self"])
+
+        modules = [line.split()[-1] for line in result.output.splitlines()[3:]]
+        self.assertEqual(
+            ["streamlit.elements", "streamlit.config", "streamlit"], modules
+        )
+
     def test_activate_command(self):
         """Tests activating a credential"""
         mock_credential = MagicMock()
@@ -14,8 +14,10 @@
 
 from __future__ import annotations
 
+import asyncio
 from unittest.mock import ANY, MagicMock, patch
 
+import tornado.concurrent
 import tornado.httpserver
 import tornado.testing
 import tornado.web
@@ -100,6 +102,113 @@ class BrowserWebSocketHandlerTest(ServerTestCase):
 
                 write_message_mock.assert_called_once()
 
+    @patch_config_options({"server.websocketBatchSize": 1})
+    @tornado.testing.gen_test
+    async def test_write_forward_msgs_batches_messages(self):
+        """`write_forward_msgs` packs messages into batches of at most
+        server.websocketBatchSize kilobytes.
+        """
+        with self._patch_app_session():
+            await self.server.start()
+            await self.ws_connect()
+
+            session_info = self.server._runtime._session_mgr.list_active_sessions()[0]
+            websocket_handler = session_info.client
+
+            msgs = [ForwardMsg(debug_last_backmsg_id=str(i) * 280) for i in range(5)]
+            with patch.object(websocket_handler, "write_message") as write_message_mock:
+                websocket_handler.write_forward_msgs(msgs)
+
+            payloads = [c.args[0] for c in write_message_mock.call_args_list]
+            # The first 3 messages fit into a 1 KB batch, the other 2 into another.
+            self.assertEqual(2, len(payloads))
+            received_msgs = []
+            for payload in payloads:
+                batch = ForwardMsg()
+                batch.ParseFromString(payload)
+                self.assertEqual("forward_msg_batch", batch.WhichOneof("type"))
+                for serialized_msg in batch.forward_msg_batch.messages:
+                    received_msg = ForwardMsg()
+                    received_msg.ParseFromString(serialized_msg)
+                    received_msgs.append(received_msg)
+            self.assertEqual(msgs, received_msgs)
+
+    @patch_config_options({"server.websocketBatchSize": 0})
+    @tornado.testing.gen_test
+    async def test_write_forward_msgs_without_batching(self):
+        """With a batch size of 0, each message is sent on its own."""
+        with self._patch_app_session():
+            await self.server.start()
+            await self.ws_connect()
+
+            session_info = self.server._runtime._session_mgr.list_active_sessions()[0]
+            websocket_handler = session_info.client
+
+            msgs = [ForwardMsg(debug_last_backmsg_id=str(i)) for i in range(3)]
+            with patch.object(websocket_handler, "write_message") as write_message_mock:
+                websocket_handler.write_forward_msgs(msgs)
+
+            self.assertEqual(
+                [msg.SerializeToString() for msg in msgs],
+                [c.args[0] for c in write_message_mock.call_args_list],
+            )
+
+    @tornado.testing.gen_test
+    async def test_pending_write_bytes(self):
+        """pending_write_bytes counts the messages that weren't sent yet."""
+        with self._patch_app_session():
+            await self.server.start()
+            await self.ws_connect()
+
+            session_info = self.server._runtime._session_mgr.list_active_sessions()[0]
+            websocket_handler = session_info.client
+
+            self.assertEqual(0, websocket_handler.pending_write_bytes())
+
+            msg = ForwardMsg(debug_last_backmsg_id="x" * 10)
+            sent: tornado.concurrent.Future[None] = tornado.concurrent.Future()
+            with patch.object(websocket_handler, "write_message", return_value=sent):
+                websocket_handler.write_forward_msg(msg)
+            self.assertEqual(
+                len(msg.SerializeToString()), websocket_handler.pending_write_bytes()
+            )
+
+            sent.set_result(None)
+            await asyncio.sleep(0)
+            self.assertEqual(0, websocket_handler.pending_write_bytes())
+
+    @tornado.testing.gen_test
+    async def test_pending_write_bytes_after_sending(self):
+        """A message doesn't count as pending once the client received it."""
+        with self._patch_app_session():
+            await self.server.start()
+            ws_client = await self.ws_connect()
+
+            session_info = self.server._runtime._session_mgr.list_active_sessions()[0]
+            websocket_handler = session_info.client
+
+            websocket_handler.write_forward_msg(ForwardMsg(debug_last_backmsg_id="x"))
+            self.assertGreater(websocket_handler.pending_write_bytes(), 0)
+
+            await ws_client.read_message()
+            await asyncio.sleep(0)
+            self.assertEqual(0, websocket_handler.pending_write_bytes())
+
+    @tornado.testing.gen_test
+    async def test_write_forward_msgs_reraises_websocket_closed_error(self):
+        with self._patch_app_session():
+            await self.server.start()
+            await self.ws_connect()
+
+            session_info = self.server._runtime._session_mgr.list_active_sessions()[0]
+            websocket_handler = session_info.client
+
+            with patch.object(websocket_handler, "write_message") as write_message_mock:
+                write_message_mock.side_effect = tornado.websocket.WebSocketClosedError
+
+                with self.assertRaises(SessionClientDisconnectedError):
+                    websocket_handler.write_forward_msgs([ForwardMsg(), ForwardMsg()])
+
     @tornado.testing.gen_test
     async def test_backmsg_deserialization_exception(self):
         """If BackMsg deserialization raises an Exception, we should call the Runtime's
@@ -14,6 +14,8 @@
 
 from __future__ import annotations
 
+import io
+import os
 from typing import Final
 from unittest import mock
 from unittest.mock import MagicMock
@@ -21,14 +23,27 @@ from unittest.mock import MagicMock
 import tornado.testing
 import tornado.web
 from parameterized import parameterized
+from PIL import Image
+from testfixtures import TempDirectory
 
+from streamlit.runtime.disk_media_file_storage import DiskMediaFileStorage
 from streamlit.runtime.media_file_manager import MediaFileManager
-from streamlit.runtime.memory_media_file_storage import MemoryMediaFileStorage
+from streamlit.runtime.memory_media_file_storage import (
+    MemoryMediaFileStorage,
+    _calculate_file_id,
+)
 from streamlit.web.server.media_file_handler import MediaFileHandler
+from tests.testutil import patch_config_options
 
 MOCK_ENDPOINT: Final = "/mock/media"
 
 
+def _create_png(width: int, height: int) -> bytes:
+    data = io.BytesIO()
+    Image.new("RGB", (width, height), color="red").save(data, format="PNG")
+    return data.getvalue()
+
+
 class MediaFileHandlerTest(tornado.testing.AsyncHTTPTestCase):
     def setUp(self) -> None:
         super().setUp()
@@ -102,8 +117,164 @@ class MediaFileHandlerTest(tornado.testing.AsyncHTTPTestCase):
         self.assertEqual(str(len(b"mock_data")), rsp.headers["Content-Length"])
         self.assertEqual(content_disposition_header, rsp.headers["Content-Disposition"])
 
+    @mock.patch(
+        "streamlit.runtime.media_file_manager._get_session_id",
+        MagicMock(return_value="mock_session_id"),
+    )
+    def test_range_request(self) -> None:
+        """Range requests get a partial response."""
+        url = self.media_file_manager.add(b"0123456789", "video/mp4", "mock_coords")
+        rsp = self.fetch(url, method="GET", headers={"Range": "bytes=2-5"})
+
+        self.assertEqual(206, rsp.code)
+        self.assertEqual(b"2345", rsp.body)
+        self.assertEqual("bytes 2-5/10", rsp.headers["Content-Range"])
+
+    @mock.patch(
+        "streamlit.runtime.media_file_manager._get_session_id",
+        MagicMock(return_value="mock_session_id"),
+    )
+    def test_etag(self) -> None:
+        """Files have their ID as ETag, and aren't sent again to clients that
+        have them cached."""
+        url = self.media_file_manager.add(b"mock_data", "video/mp4", "mock_coords")
+        file_id = _calculate_file_id(b"mock_data", "video/mp4")
+
+        rsp = self.fetch(url, method="GET")
+        self.assertEqual(f'"{file_id}"', rsp.headers["Etag"])
+
+        rsp = self.fetch(
+            url, method="GET", headers={"If-None-Match": rsp.headers["Etag"]}
+        )
+        self.assertEqual(304, rsp.code)
+        self.assertEqual(b"", rsp.body)
+
+    @patch_config_options({"server.enableImageVariants": True})
+    @mock.patch(
+        "streamlit.runtime.media_file_manager._get_session_id",
+        MagicMock(return_value="mock_session_id"),
+    )
+    def test_image_variant(self) -> None:
+        """Images requested with a max width are resized to the next variant
+        width."""
+        url = self.media_file_manager.add(
+            _create_png(1000, 500), "image/png", "mock_coords"
+        )
+
+        rsp = self.fetch(f"{url}?w=500", method="GET")
+        self.assertEqual(200, rsp.code)
+        self.assertEqual("image/png", rsp.headers["Content-Type"])
+        self.assertEqual((640, 320), Image.open(io.BytesIO(rsp.body)).size)
+        file_id = os.path.splitext(os.path.basename(url))[0]
+        self.assertEqual(f'"{file_id}-640w"', rsp.headers["Etag"])
+
+        # Variants that aren't smaller than the image, and invalid widths,
+        # get the image itself.
+        for width_arg in ("1280", "5000", "0", "invalid"):
+            rsp = self.fetch(f"{url}?w={width_arg}", method="GET")
+            self.assertEqual(200, rsp.code)
+            self.assertEqual((1000, 500), Image.open(io.BytesIO(rsp.body)).size)
+
+    @patch_config_options({"server.enableImageVariants": True})
+    @mock.patch(
+        "streamlit.runtime.media_file_manager._get_session_id",
+        MagicMock(return_value="mock_session_id"),
+    )
+    def test_image_variant_of_other_file(self) -> None:
+        """Files other than PNG and JPEG images don't have variants."""
+        url = self.media_file_manager.add(b"mock_data", "video/mp4", "mock_coords")
+
+        rsp = self.fetch(f"{url}?w=320", method="GET")
+        self.assertEqual(200, rsp.code)
+        self.assertEqual(b"mock_data", rsp.body)
+
+    @patch_config_options({"server.enableImageVariants": False})
+    @mock.patch(
+        "streamlit.runtime.media_file_manager._get_session_id",
+        MagicMock(return_value="mock_session_id"),
+    )
+    def test_image_variants_disabled(self) -> None:
+        png = _create_png(1000, 500)
+        url = self.media_file_manager.add(png, "image/png", "mock_coords")
+
+        rsp = self.fetch(f"{url}?w=320", method="GET")
+        self.assertEqual(png, rsp.body)
+
+    @patch_config_options(
+        {"server.enableImageVariants": True, "server.enableWebpImageVariants": True}
+    )
+    @mock.patch(
+        "streamlit.runtime.media_file_manager._get_session_id",
+        MagicMock(return_value="mock_session_id"),
+    )
+    def test_webp_image_variant(self) -> None:
+        """Browsers that accept WebP get WebP images."""
+        png = _create_png(1000, 500)
+        url = self.media_file_manager.add(png, "image/png", "mock_coords")
+
+        rsp = self.fetch(url, method="GET", headers={"Accept": "image/webp,*/*"})
+        self.assertEqual("image/webp", rsp.headers["Content-Type"])
+        self.assertEqual("Accept", rsp.headers["Vary"])
+        image = Image.open(io.BytesIO(rsp.body))
+        self.assertEqual(("WEBP", (1000, 500)), (image.format, image.size))
+
+        rsp = self.fetch(
+            f"{url}?w=320", method="GET", headers={"Accept": "image/webp,*/*"}
+        )
+        image = Image.open(io.BytesIO(rsp.body))
+        self.assertEqual(("WEBP", (320, 160)), (image.format, image.size))
+
+        rsp = self.fetch(url, method="GET", headers={"Accept": "image/png"})
+        self.assertEqual("image/png", rsp.headers["Content-Type"])
+        self.assertEqual(png, rsp.body)
+
     def test_invalid_file(self) -> None:
         """Requests for invalid files fail with 404."""
         url = f"{MOCK_ENDPOINT}/invalid_media_file.mp4"
         rsp = self.fetch(url, method="GET")
         self.assertEqual(404, rsp.code)
+
+
+class DiskMediaFileHandlerTest(tornado.testing.AsyncHTTPTestCase):
+    def setUp(self) -> None:
+        super().setUp()
+        self.tempdir = TempDirectory(create=True)
+        storage = DiskMediaFileStorage(MOCK_ENDPOINT, disk_threshold_bytes=5)
+        self.media_file_manager = MediaFileManager(storage)
+        MediaFileHandler.initialize_storage(storage)
+
+    def tearDown(self) -> None:
+        super().tearDown()
+        self.tempdir.cleanup()
+
+    def get_app(self) -> tornado.web.Application:
+        return tornado.web.Application(
+            [(f"{MOCK_ENDPOINT}/(.*)", MediaFileHandler, {"path": ""})]
+        )
+
+    @mock.patch(
+        "streamlit.runtime.media_file_manager._get_session_id",
+        MagicMock(return_value="mock_session_id"),
+    )
+    def test_file_on_disk(self) -> None:
+        """Files on disk are served with their modification time, and support
+        range requests."""
+        path = self.tempdir.write("video.mp4", b"0123456789")
+        os.utime(path, (1_700_000_000, 1_700_000_000))
+        url = self.media_file_manager.add(path, "video/mp4", "mock_coords")
+
+        rsp = self.fetch(url, method="GET")
+        self.assertEqual(200, rsp.code)
+        self.assertEqual(b"0123456789", rsp.body)
+        self.assertEqual("Tue, 14 Nov 2023 22:13:20 GMT", rsp.headers["Last-Modified"])
+
+        rsp = self.fetch(url, method="GET", headers={"Range": "bytes=-3"})
+        self.assertEqual(206, rsp.code)
+        self.assertEqual(b"789", rsp.body)
+
+        rsp = self.fetch(
+            url,
+            method="GET",
+            headers={"If-Modified-Since": "Tue, 14 Nov 2023 22:13:20 GMT"},
+        )
+        self.assertEqual(304, rsp.code)
@@ -0,0 +1,99 @@
+# Copyright (c) Streamlit Inc. (2018-2022) Snowflake Inc. (2022-2025)
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""MultipartParser unit tests"""
+
+from __future__ import annotations
+
+import mmap
+import unittest
+from unittest.mock import patch
+
+import requests
+from parameterized import parameterized
+
+from streamlit.web.server.multipart_parser import (
+    MultipartFile,
+    MultipartParseError,
+    MultipartParser,
+)
+
+
+def _encode(files) -> tuple[str, bytes]:
+    """Return the Content-Type and body of a multipart/form-data request."""
+    req = requests.Request(method="PUT", url="http://mock", files=files).prepare()
+    return req.headers["Content-Type"], req.body
+
+
+def _parse(content_type: str, body: bytes, chunk_size: int) -> list[MultipartFile]:
+    parser = MultipartParser(content_type)
+    for start in range(0, len(body), chunk_size):
+        parser.feed(body[start : start + chunk_size])
+    return parser.finish()
+
+
+class MultipartParserTest(unittest.TestCase):
+    @parameterized.expand([(1,), (7,), (1024,), (1024 * 1024,)])
+    def test_parse_files(self, chunk_size):
+        """Files are parsed independently of how the body is split into
+        chunks, and form fields that aren't files are ignored."""
+        content_type, body = _encode(
+            {
+                "file1": ("file1.txt", b"123\r\n--456", "text/plain"),
+                "field": (None, b"ignored"),
+                "file2": ("file2.bin", b""),
+            }
+        )
+
+        self.assertEqual(
+            [
+                MultipartFile("file1.txt", "text/plain", b"123\r\n--456"),
+                MultipartFile("file2.bin", "application/unknown", b""),
+            ],
+            _parse(content_type, body, chunk_size),
+        )
+
+    def test_non_ascii_filename(self):
+        content_type, body = _encode({"file": ("漢字.txt", b"123")})
+
+        self.assertEqual("漢字.txt", _parse(content_type, body, 1024)[0].filename)
+
+    @patch("streamlit.web.server.multipart_parser.SPOOL_MAX_MEMORY_BYTES", 10)
+    def test_large_file_is_spooled(self):
+        """Files larger than SPOOL_MAX_MEMORY_BYTES are kept in a temporary
+        file."""
+        content_type, body = _encode({"file": ("file.bin", b"0123456789abcdef")})
+
+        (file,) = _parse(content_type, body, 4)
+
+        self.assertIsInstance(file.data, mmap.mmap)
+        self.assertEqual(b"0123456789abcdef", file.data[:])
+
+    def test_not_multipart(self):
+        with self.assertRaises(MultipartParseError):
+            MultipartParser("application/x-www-form-urlencoded")
+
+    def test_truncated_body(self):
+        content_type, body = _encode({"file": ("file.txt", b"123")})
+        parser = MultipartParser(content_type)
+        parser.feed(body[:-10])
+
+        with self.assertRaises(MultipartParseError):
+            parser.finish()
+
+    def test_invalid_boundary(self):
+        parser = MultipartParser("multipart/form-data; boundary=abc")
+
+        with self.assertRaises(MultipartParseError):
+            parser.feed(b"--abcXX")
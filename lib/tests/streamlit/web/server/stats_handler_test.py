@@ -22,7 +22,12 @@ from google.protobuf.json_format import MessageToDict
 from tornado.httputil import HTTPHeaders
 
 from streamlit.proto.openmetrics_data_model_pb2 import MetricSet as MetricSetProto
-from streamlit.runtime.stats import CacheStat
+from streamlit.runtime.stats import (
+    CacheEventStat,
+    CacheStat,
+    MediaFileStat,
+    SessionMessageStat,
+)
 from streamlit.web.server.server import METRIC_ENDPOINT
 from streamlit.web.server.stats_request_handler import StatsRequestHandler
 
@@ -30,8 +35,20 @@ from streamlit.web.server.stats_request_handler import StatsRequestHandler
 class StatsHandlerTest(tornado.testing.AsyncHTTPTestCase):
     def get_app(self):
         self.mock_stats = []
+        self.mock_cache_event_stats = []
+        self.mock_session_stats = []
+        self.mock_media_file_stats = []
         mock_stats_manager = MagicMock()
         mock_stats_manager.get_stats = MagicMock(side_effect=lambda: self.mock_stats)
+        mock_stats_manager.get_cache_event_stats = MagicMock(
+            side_effect=lambda: self.mock_cache_event_stats
+        )
+        mock_stats_manager.get_session_message_stats = MagicMock(
+            side_effect=lambda: self.mock_session_stats
+        )
+        mock_stats_manager.get_media_file_stats = MagicMock(
+            side_effect=lambda: self.mock_media_file_stats
+        )
         return tornado.web.Application(
             [
                 (
@@ -97,6 +114,220 @@ class StatsHandlerTest(tornado.testing.AsyncHTTPTestCase):
 
         self.assertEqual(expected_body, response.body)
 
+    def test_has_cache_event_stats(self):
+        """Cache event stats are written as a counter family."""
+        self.mock_cache_event_stats = [
+            CacheEventStat(
+                category_name="ForwardMessageCache",
+                cache_name="",
+                event="hit",
+                event_count=4,
+            ),
+        ]
+
+        response = self.fetch("/_stcore/metrics")
+        self.assertEqual(200, response.code)
+
+        expected_body = (
+            b"# TYPE cache_memory_bytes gauge\n"
+            b"# UNIT cache_memory_bytes bytes\n"
+            b"# HELP Total memory consumed by a cache.\n"
+            b"# TYPE cache_events counter\n"
+            b"# HELP Number of hits, misses and evictions of a cache.\n"
+            b'cache_events_total{cache_type="ForwardMessageCache",cache="",event="hit"} 4\n'
+            b"# EOF\n"
+        )
+
+        self.assertEqual(expected_body, response.body)
+
+        response = self.fetch(
+            "/_stcore/metrics", headers={"Accept": "application/x-protobuf"}
+        )
+        metric_set = MetricSetProto()
+        metric_set.ParseFromString(response.body)
+        families = MessageToDict(metric_set)["metricFamilies"]
+        self.assertEqual(
+            {
+                "name": "cache_events",
+                "type": "COUNTER",
+                "help": "Number of hits, misses and evictions of a cache.",
+                "metrics": [
+                    {
+                        "labels": [
+                            {"name": "cache_type", "value": "ForwardMessageCache"},
+                            {"name": "cache"},
+                            {"name": "event", "value": "hit"},
+                        ],
+                        "metricPoints": [{"counterValue": {"intValue": "4"}}],
+                    }
+                ],
+            },
+            families[1],
+        )
+
+    def test_has_session_message_stats(self):
+        """Session message stats are written as gauge families, without
+        session IDs."""
+        self.mock_session_stats = [
+            SessionMessageStat(
+                queued_messages=5,
+                max_queue_depth=3,
+                max_queue_latency_seconds=0.5,
+                backpressured_sessions=1,
+            ),
+        ]
+
+        response = self.fetch("/_stcore/metrics")
+        self.assertEqual(200, response.code)
+
+        expected_body = (
+            b"# TYPE cache_memory_bytes gauge\n"
+            b"# UNIT cache_memory_bytes bytes\n"
+            b"# HELP Total memory consumed by a cache.\n"
+            b"# TYPE session_message_queued_messages gauge\n"
+            b"# HELP Number of messages waiting to be sent to any session.\n"
+            b"session_message_queued_messages 5\n"
+            b"# TYPE session_message_max_queue_depth gauge\n"
+            b"# HELP Largest number of messages waiting to be sent to a session.\n"
+            b"session_message_max_queue_depth 3\n"
+            b"# TYPE session_message_max_queue_latency_seconds gauge\n"
+            b"# UNIT session_message_max_queue_latency_seconds seconds\n"
+            b"# HELP Age of the oldest message waiting to be sent to a session.\n"
+            b"session_message_max_queue_latency_seconds 0.5\n"
+            b"# TYPE session_message_backpressured_sessions gauge\n"
+            b"# HELP Number of sessions whose client is too slow to send more messages to.\n"
+            b"session_message_backpressured_sessions 1\n"
+            b"# EOF\n"
+        )
+
+        self.assertEqual(expected_body, response.body)
+
+    def test_protobuf_session_message_stats(self):
+        """Session message stats are returned as protobuf metric families."""
+        self.mock_session_stats = [
+            SessionMessageStat(
+                queued_messages=5,
+                max_queue_depth=3,
+                max_queue_latency_seconds=0.5,
+                backpressured_sessions=1,
+            ),
+        ]
+
+        response = self.fetch(
+            "/_stcore/metrics", headers={"Accept": "application/x-protobuf"}
+        )
+        self.assertEqual(200, response.code)
+
+        metric_set = MetricSetProto()
+        metric_set.ParseFromString(response.body)
+        families = MessageToDict(metric_set)["metricFamilies"]
+
+        self.assertEqual(
+            [
+                "cache_memory_bytes",
+                "session_message_queued_messages",
+                "session_message_max_queue_depth",
+                "session_message_max_queue_latency_seconds",
+                "session_message_backpressured_sessions",
+            ],
+            [family["name"] for family in families],
+        )
+        self.assertEqual(
+            [
+                [{"metricPoints": [{"gaugeValue": {"intValue": "5"}}]}],
+                [{"metricPoints": [{"gaugeValue": {"intValue": "3"}}]}],
+                [{"metricPoints": [{"gaugeValue": {"doubleValue": 0.5}}]}],
+                [{"metricPoints": [{"gaugeValue": {"intValue": "1"}}]}],
+            ],
+            [family["metrics"] for family in families[1:]],
+        )
+
+    def test_has_media_file_stats(self):
+        """Media file stats are written as two gauge families and a counter
+        family."""
+        self.mock_media_file_stats = [
+            MediaFileStat(
+                referenced_files=3,
+                orphaned_files=1,
+                references=5,
+                lock_wait_seconds=0.25,
+            ),
+        ]
+
+        response = self.fetch("/_stcore/metrics")
+        self.assertEqual(200, response.code)
+
+        expected_body = (
+            b"# TYPE cache_memory_bytes gauge\n"
+            b"# UNIT cache_memory_bytes bytes\n"
+            b"# HELP Total memory consumed by a cache.\n"
+            b"# TYPE media_files gauge\n"
+            b"# HELP Number of media files that are or are no longer in use.\n"
+            b'media_files{state="referenced"} 3\n'
+            b'media_files{state="orphaned"} 1\n'
+            b"# TYPE media_file_references gauge\n"
+            b"# HELP Number of places in apps that use a media file.\n"
+            b"media_file_references 5\n"
+            b"# TYPE media_file_lock_wait_seconds counter\n"
+            b"# UNIT media_file_lock_wait_seconds seconds\n"
+            b"# HELP Time spent waiting for the media file manager's locks.\n"
+            b"media_file_lock_wait_seconds_total 0.25\n"
+            b"# EOF\n"
+        )
+
+        self.assertEqual(expected_body, response.body)
+
+    def test_protobuf_media_file_stats(self):
+        """Media file stats are returned as protobuf metric families."""
+        self.mock_media_file_stats = [
+            MediaFileStat(
+                referenced_files=3,
+                orphaned_files=1,
+                references=5,
+                lock_wait_seconds=0.25,
+            ),
+        ]
+
+        response = self.fetch(
+            "/_stcore/metrics", headers={"Accept": "application/x-protobuf"}
+        )
+        self.assertEqual(200, response.code)
+
+        metric_set = MetricSetProto()
+        metric_set.ParseFromString(response.body)
+        families = MessageToDict(metric_set)["metricFamilies"]
+
+        self.assertEqual(
+            [
+                "cache_memory_bytes",
+                "media_files",
+                "media_file_references",
+                "media_file_lock_wait_seconds",
+            ],
+            [family["name"] for family in families],
+        )
+        self.assertEqual(
+            [
+                {
+                    "labels": [{"name": "state", "value": "referenced"}],
+                    "metricPoints": [{"gaugeValue": {"intValue": "3"}}],
+                },
+                {
+                    "labels": [{"name": "state", "value": "orphaned"}],
+                    "metricPoints": [{"gaugeValue": {"intValue": "1"}}],
+                },
+            ],
+            families[1]["metrics"],
+        )
+        self.assertEqual(
+            [{"metricPoints": [{"gaugeValue": {"intValue": "5"}}]}],
+            families[2]["metrics"],
+        )
+        self.assertEqual(
+            [{"metricPoints": [{"counterValue": {"doubleValue": 0.25}}]}],
+            families[3]["metrics"],
+        )
+
     def test_new_metrics_endpoint_should_not_display_deprecation_warning(self):
         response = self.fetch("/_stcore/metrics")
         self.assertNotIn("link", response.headers)
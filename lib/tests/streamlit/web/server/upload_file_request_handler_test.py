@@ -16,7 +16,9 @@
 
 from __future__ import annotations
 
+import mmap
 from typing import NamedTuple
+from unittest.mock import patch
 
 import requests
 import tornado.testing
@@ -27,6 +29,7 @@ from streamlit.logger import get_logger
 from streamlit.runtime.memory_uploaded_file_manager import MemoryUploadedFileManager
 from streamlit.web.server.server import UPLOAD_FILE_ENDPOINT
 from streamlit.web.server.upload_file_request_handler import UploadFileRequestHandler
+from tests.testutil import patch_config_options
 
 LOGGER = get_logger(__name__)
 
@@ -142,6 +145,51 @@ class UploadFileRequestHandlerTest(tornado.testing.AsyncHTTPTestCase):
         self.assertEqual(400, response.code)
         self.assertIn("Expected 1 file, but got 0", response.reason)
 
+    @patch("streamlit.web.server.multipart_parser.SPOOL_MAX_MEMORY_BYTES", 10)
+    def test_upload_large_file(self):
+        """Large files are kept in a temporary file instead of memory."""
+        file = MockFile("filename", b"0123456789abcdef")
+        response = self._upload_files(
+            {file.name: file.data}, session_id="test_session_id", file_id=file.name
+        )
+
+        self.assertEqual(204, response.code, response.reason)
+        (rec,) = self.file_mgr.get_files("test_session_id", [file.name])
+        self.assertIsInstance(rec.data, mmap.mmap)
+        self.assertEqual(file.data, rec.data[:])
+
+    @patch_config_options({"server.maxSessionUploadSize": 1})
+    def test_session_upload_quota(self):
+        """Uploads fail with 413 once a session's files would exceed
+        server.maxSessionUploadSize."""
+        data = b"0" * (600 * 1024)
+        response = self._upload_files(
+            {"file1": data}, session_id="test_session_id", file_id="file1"
+        )
+        self.assertEqual(204, response.code, response.reason)
+
+        response = self._upload_files(
+            {"file2": data}, session_id="test_session_id", file_id="file2"
+        )
+        self.assertEqual(413, response.code)
+        self.assertEqual([], self.file_mgr.get_files("test_session_id", ["file2"]))
+
+        # Other sessions have their own quota.
+        response = self._upload_files(
+            {"file2": data}, session_id="other_session_id", file_id="file2"
+        )
+        self.assertEqual(204, response.code, response.reason)
+
+    def test_upload_not_multipart_error(self):
+        """A body that isn't multipart/form-data fails with 400 status."""
+        response = self.fetch(
+            f"{UPLOAD_FILE_ENDPOINT}/session_id/file_id",
+            method="PUT",
+            headers={"Content-Type": "application/octet-stream"},
+            body=b"123",
+        )
+        self.assertEqual(400, response.code)
+
 
 class UploadFileRequestHandlerInvalidSessionTest(tornado.testing.AsyncHTTPTestCase):
     """Tests the /upload_file endpoint."""
@@ -0,0 +1,274 @@
+# Copyright (c) Streamlit Inc. (2018-2022) Snowflake Inc. (2022-2025)
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Unit tests for the handlers of a worker pool's main process"""
+
+from __future__ import annotations
+
+import itertools
+import json
+import unittest
+import urllib.parse
+from typing import Any
+from unittest.mock import MagicMock
+
+import tornado.httpserver
+import tornado.testing
+import tornado.web
+import tornado.websocket
+
+from streamlit.proto.ForwardMsg_pb2 import ForwardMsg
+from streamlit.web.server.worker_proxy_handlers import (
+    _get_new_session_id,
+    create_worker_proxy_app,
+)
+from streamlit.web.worker_pool import Worker, WorkerPool
+
+
+class _WorkerHandler(tornado.web.RequestHandler):
+    """Describes the request it received, like an echo server."""
+
+    def initialize(self, worker_index: int) -> None:
+        self._worker_index = worker_index
+
+    def _respond(self) -> None:
+        self.set_header("X-Worker-Index", str(self._worker_index))
+        self.set_header("Content-Type", "application/json")
+        self.write(
+            json.dumps(
+                {
+                    "worker_index": self._worker_index,
+                    "method": self.request.method,
+                    "uri": self.request.uri,
+                    "body": self.request.body.decode(),
+                }
+            )
+        )
+
+    def get(self, *args: Any) -> None:
+        self._respond()
+
+    def post(self, *args: Any) -> None:
+        self._respond()
+
+    def put(self, *args: Any) -> None:
+        self._respond()
+
+
+class _WorkerNotFoundHandler(tornado.web.RequestHandler):
+    def get(self) -> None:
+        self.set_status(404)
+        self.write("Not found")
+
+
+class _WorkerWebSocketHandler(tornado.websocket.WebSocketHandler):
+    """Creates a session, and echoes every message it receives."""
+
+    _session_ids = itertools.count()
+
+    def initialize(self, worker_index: int) -> None:
+        self._worker_index = worker_index
+
+    def select_subprotocol(self, subprotocols: list[str]) -> str | None:
+        return subprotocols[0] if subprotocols else None
+
+    def open(self) -> None:
+        # Like the server, a reconnect to an existing session reuses its ID.
+        protocols = self.request.headers.get("Sec-Websocket-Protocol", "").split(",")
+        session_id = (
+            protocols[2].strip()
+            if len(protocols) >= 3
+            else f"session-{next(self._session_ids)}"
+        )
+
+        msg = ForwardMsg()
+        msg.new_session.initialize.session_id = session_id
+        self.write_message(msg.SerializeToString(), binary=True)
+
+    def on_message(self, message: str | bytes) -> None:
+        self.write_message(
+            f"worker {self._worker_index}: {message!r}",
+        )
+
+
+class WorkerProxyHandlersTest(tornado.testing.AsyncHTTPTestCase):
+    def get_app(self) -> tornado.web.Application:
+        self.pool = WorkerPool(2, run_worker=MagicMock())
+        self._worker_servers = []
+        for index in range(2):
+            worker_app = tornado.web.Application(
+                [
+                    (
+                        "/_stcore/stream",
+                        _WorkerWebSocketHandler,
+                        {"worker_index": index},
+                    ),
+                    ("/not_found", _WorkerNotFoundHandler),
+                    ("/(.*)", _WorkerHandler, {"worker_index": index}),
+                ]
+            )
+            sock, port = tornado.testing.bind_unused_port()
+            server = tornado.httpserver.HTTPServer(worker_app)
+            server.add_sockets([sock])
+            self._worker_servers.append(server)
+
+            process = MagicMock()
+            process.is_alive.return_value = True
+            self.pool.workers.append(Worker(index, port, process))
+
+        return create_worker_proxy_app(self.pool)
+
+    def tearDown(self) -> None:
+        for server in self._worker_servers:
+            server.stop()
+        super().tearDown()
+
+    def _fetch_json(self, path: str, **kwargs: Any) -> dict[str, Any]:
+        response = self.fetch(path, **kwargs)
+        self.assertEqual(200, response.code)
+        return json.loads(response.body)
+
+    def get_ws_url(self, path: str) -> str:
+        parts = list(urllib.parse.urlparse(self.get_url(path)))
+        parts[0] = "ws"
+        return urllib.parse.urlunparse(tuple(parts))
+
+    def test_forwards_requests(self):
+        """Requests are forwarded with their method, path, and body, and
+        the worker's response is sent back."""
+        response = self.fetch("/some/path?query=1", method="PUT", body="body")
+
+        self.assertEqual(200, response.code)
+        self.assertEqual("application/json", response.headers["Content-Type"])
+        self.assertIn("X-Worker-Index", response.headers)
+        self.assertEqual(
+            {
+                "method": "PUT",
+                "uri": "/some/path?query=1",
+                "body": "body",
+            },
+            {
+                key: value
+                for key, value in json.loads(response.body).items()
+                if key != "worker_index"
+            },
+        )
+
+    def test_forwards_error_responses(self):
+        response = self.fetch("/not_found")
+
+        self.assertEqual(404, response.code)
+        self.assertEqual(b"Not found", response.body)
+
+    def test_spreads_requests_over_workers(self):
+        worker_indexes = {self._fetch_json("/")["worker_index"] for _ in range(2)}
+
+        self.assertEqual({0, 1}, worker_indexes)
+
+    def test_forwards_media_requests_to_their_worker(self):
+        for index in range(2):
+            response = self._fetch_json(f"/media/{index}/file.png")
+
+            self.assertEqual(index, response["worker_index"])
+            self.assertEqual("/media/file.png", response["uri"])
+
+    def test_media_requests_to_unknown_worker(self):
+        response = self.fetch("/media/2/file.png")
+
+        self.assertEqual(503, response.code)
+
+    def test_forwards_uploads_to_session_worker(self):
+        self.pool.pin_session("session", self.pool.workers[1])
+
+        response = self._fetch_json(
+            "/_stcore/upload_file/session/file", method="PUT", body="file"
+        )
+
+        self.assertEqual(1, response["worker_index"])
+        self.assertEqual("file", response["body"])
+
+    def test_uploads_to_unknown_session(self):
+        response = self.fetch(
+            "/_stcore/upload_file/unknown/file", method="PUT", body="file"
+        )
+
+        self.assertEqual(400, response.code)
+
+    def test_no_workers(self):
+        for worker in self.pool.workers:
+            worker.process.is_alive.return_value = False
+
+        response = self.fetch("/")
+
+        self.assertEqual(503, response.code)
+
+    @tornado.testing.gen_test
+    async def test_websocket_reconnects_to_session_worker(self):
+        """A session's websocket is forwarded to the worker that created the
+        session, even after a reconnect."""
+        ws_client = await tornado.websocket.websocket_connect(
+            self.get_ws_url("/_stcore/stream"),
+            subprotocols=["streamlit", "PLACEHOLDER_AUTH_TOKEN"],
+        )
+        session_id = _get_new_session_id(await ws_client.read_message())
+        assert session_id is not None
+        worker = self.pool.get_session_worker(session_id)
+        assert worker is not None
+        self.assertEqual(1, worker.connection_count)
+
+        ws_client.write_message("hello")
+        self.assertEqual(
+            f"worker {worker.index}: 'hello'", await ws_client.read_message()
+        )
+        ws_client.close()
+
+        # A new session goes to the other, idle worker, but reconnects go to
+        # the session's worker.
+        for _ in range(2):
+            ws_client = await tornado.websocket.websocket_connect(
+                self.get_ws_url("/_stcore/stream"),
+                subprotocols=["streamlit", "PLACEHOLDER_AUTH_TOKEN", session_id],
+            )
+            self.assertEqual(
+                session_id, _get_new_session_id(await ws_client.read_message())
+            )
+            ws_client.write_message("hello")
+            self.assertEqual(
+                f"worker {worker.index}: 'hello'", await ws_client.read_message()
+            )
+            ws_client.close()
+
+
+class GetNewSessionIdTest(unittest.TestCase):
+    def test_new_session(self):
+        msg = ForwardMsg()
+        msg.new_session.initialize.session_id = "session"
+
+        self.assertEqual("session", _get_new_session_id(msg.SerializeToString()))
+
+    def test_batched_new_session(self):
+        new_session_msg = ForwardMsg()
+        new_session_msg.new_session.initialize.session_id = "session"
+        msg = ForwardMsg()
+        msg.forward_msg_batch.messages.append(b"")
+        msg.forward_msg_batch.messages.append(new_session_msg.SerializeToString())
+
+        self.assertEqual("session", _get_new_session_id(msg.SerializeToString()))
+
+    def test_other_messages(self):
+        msg = ForwardMsg()
+        msg.script_finished = ForwardMsg.FINISHED_SUCCESSFULLY
+
+        self.assertIsNone(_get_new_session_id(msg.SerializeToString()))
+        self.assertIsNone(_get_new_session_id(b"not a message"))
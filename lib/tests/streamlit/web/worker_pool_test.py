@@ -0,0 +1,145 @@
+# Copyright (c) Streamlit Inc. (2018-2022) Snowflake Inc. (2022-2025)
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Unit tests for WorkerPool"""
+
+from __future__ import annotations
+
+import json
+import os
+import tempfile
+import unittest
+from typing import Any
+from unittest.mock import MagicMock, patch
+
+from streamlit.web import worker_pool
+from streamlit.web.worker_pool import Worker, WorkerPool
+
+
+def _create_pool(worker_count: int) -> WorkerPool:
+    """Create a WorkerPool with workers whose processes are mocks."""
+    pool = WorkerPool(worker_count, run_worker=MagicMock())
+    for index in range(worker_count):
+        process = MagicMock()
+        process.is_alive.return_value = True
+        pool.workers.append(Worker(index, 8000 + index, process))
+    return pool
+
+
+class WorkerPoolTest(unittest.TestCase):
+    def test_new_sessions_go_to_worker_with_fewest_connections(self):
+        pool = _create_pool(3)
+        pool.workers[0].connection_count = 2
+        pool.workers[1].connection_count = 1
+        pool.workers[2].connection_count = 2
+
+        self.assertIs(pool.workers[1], pool.get_worker_for_new_session())
+
+    def test_new_sessions_are_spread_over_idle_workers(self):
+        pool = _create_pool(3)
+
+        self.assertEqual(
+            [0, 1, 2, 0],
+            [pool.get_worker_for_new_session().index for _ in range(4)],
+        )
+
+    def test_exited_workers_are_skipped(self):
+        pool = _create_pool(2)
+        pool.workers[0].process.is_alive.return_value = False
+
+        self.assertIs(pool.workers[1], pool.get_worker_for_new_session())
+        self.assertIs(pool.workers[1], pool.get_any_worker())
+        self.assertIsNone(pool.get_worker(0))
+        self.assertIs(pool.workers[1], pool.get_worker(1))
+        self.assertIsNone(pool.get_worker(2))
+
+        pool.workers[1].process.is_alive.return_value = False
+        self.assertIsNone(pool.get_worker_for_new_session())
+        self.assertIsNone(pool.get_any_worker())
+        self.assertFalse(pool.is_alive)
+
+    def test_pin_session(self):
+        pool = _create_pool(2)
+        pool.pin_session("session", pool.workers[1])
+
+        self.assertIs(pool.workers[1], pool.get_session_worker("session"))
+        self.assertIsNone(pool.get_session_worker("unknown"))
+
+        # Sessions of an exited worker can't be reached anymore.
+        pool.workers[1].process.is_alive.return_value = False
+        self.assertIsNone(pool.get_session_worker("session"))
+
+    @patch("streamlit.web.worker_pool._MAX_PINNED_SESSIONS", 2)
+    def test_least_recently_used_sessions_are_forgotten(self):
+        pool = _create_pool(1)
+        pool.pin_session("a", pool.workers[0])
+        pool.pin_session("b", pool.workers[0])
+        pool.get_session_worker("a")
+        pool.pin_session("c", pool.workers[0])
+
+        self.assertIsNotNone(pool.get_session_worker("a"))
+        self.assertIsNone(pool.get_session_worker("b"))
+        self.assertIsNotNone(pool.get_session_worker("c"))
+
+
+@unittest.skipUnless(
+    worker_pool.is_worker_pool_supported(), "Worker pools require os.fork"
+)
+class WorkerPoolProcessTest(unittest.TestCase):
+    def test_start_and_stop(self):
+        """Every worker runs with its own port and the pool's cache folder."""
+        with tempfile.TemporaryDirectory() as tmp_dir:
+
+            def run_worker(worker_options: dict[str, Any]) -> None:
+                worker_info = worker_pool.get_worker_info()
+                assert worker_info is not None
+                with open(
+                    os.path.join(tmp_dir, str(worker_info.worker_index)), "w"
+                ) as f:
+                    json.dump(
+                        {
+                            "options": worker_options,
+                            "shared_cache_dir": worker_info.shared_cache_dir,
+                        },
+                        f,
+                    )
+
+            pool = WorkerPool(2, run_worker)
+            pool.start()
+            for worker in pool.workers:
+                worker.process.join(10)
+                self.assertEqual(0, worker.process.exitcode)
+
+            worker_outputs = []
+            for worker in pool.workers:
+                with open(os.path.join(tmp_dir, str(worker.index))) as f:
+                    worker_outputs.append(json.load(f))
+
+            shared_cache_dir = worker_outputs[0]["shared_cache_dir"]
+            self.assertTrue(os.path.isdir(shared_cache_dir))
+            for worker, worker_output in zip(pool.workers, worker_outputs):
+                self.assertEqual(
+                    {
+                        "server.port": worker.port,
+                        "server.address": "127.0.0.1",
+                        "server.headless": True,
+                    },
+                    worker_output["options"],
+                )
+                self.assertEqual(shared_cache_dir, worker_output["shared_cache_dir"])
+
+            pool.stop()
+            self.assertFalse(os.path.exists(shared_cache_dir))
+            # The main process isn't a worker.
+            self.assertIsNone(worker_pool.get_worker_info())
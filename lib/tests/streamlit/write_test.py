@@ -34,11 +34,13 @@ from streamlit.elements import write
 from streamlit.error_util import handle_uncaught_app_exception
 from streamlit.errors import StreamlitAPIException
 from streamlit.runtime.state import QueryParamsProxy, SessionStateProxy
+from tests.delta_generator_test_case import DeltaGeneratorTestCase
 from tests.streamlit.data_test_cases import (
     SHARED_TEST_CASES,
     CaseMetadata,
 )
 from tests.streamlit.runtime.secrets_test import MOCK_TOML
+from tests.testutil import patch_config_options
 
 
 class StreamlitWriteTest(unittest.TestCase):
@@ -583,6 +585,94 @@ class StreamlitStreamTest(unittest.TestCase):
             )
 
 
+class StreamlitStreamDeltaTest(DeltaGeneratorTestCase):
+    """Test the messages sent by st.write_stream."""
+
+    def _flushed_deltas(self):
+        return [msg.delta for msg in self.forward_msg_queue.flush()]
+
+    def test_sends_only_new_text(self):
+        """After the first chunk, only the newly streamed text is sent."""
+        sent = []
+
+        def test_stream():
+            yield "Hello"
+            sent.append(self._flushed_deltas())
+            yield " streaming"
+            sent.append(self._flushed_deltas())
+            yield " world"
+            sent.append(self._flushed_deltas())
+
+        stream_return = st.write_stream(test_stream)
+
+        self.assertEqual(stream_return, "Hello streaming world")
+        self.assertEqual("Hello", sent[0][0].new_element.markdown.body)
+        self.assertEqual(" streaming" + write._TEXT_CURSOR, sent[1][0].append_text.text)
+        self.assertEqual("", sent[1][0].append_text.strip_suffix)
+        self.assertEqual(" world" + write._TEXT_CURSOR, sent[2][0].append_text.text)
+        self.assertEqual(write._TEXT_CURSOR, sent[2][0].append_text.strip_suffix)
+        # The final message replaces the element with the full response.
+        self.assertEqual(
+            "Hello streaming world",
+            self.get_delta_from_queue().new_element.markdown.body,
+        )
+
+    @patch_config_options({"runner.writeStreamFlushInterval": 1000.0})
+    def test_coalesces_chunks_within_flush_interval(self):
+        """Chunks that arrive within the flush interval aren't sent
+        individually."""
+        sent = []
+
+        def test_stream():
+            yield "Hello"
+            sent.append(self._flushed_deltas())
+            yield " streaming"
+            sent.append(self._flushed_deltas())
+            yield " world"
+            sent.append(self._flushed_deltas())
+
+        stream_return = st.write_stream(test_stream)
+
+        self.assertEqual(stream_return, "Hello streaming world")
+        self.assertEqual(1, len(sent[0]))
+        self.assertEqual([], sent[1])
+        self.assertEqual([], sent[2])
+        self.assertEqual(
+            "Hello streaming world",
+            self.get_delta_from_queue().new_element.markdown.body,
+        )
+
+    @patch_config_options({"runner.writeStreamFlushInterval": 0.5})
+    def test_sends_coalesced_text_after_stall(self):
+        """Text that was coalesced before the stream stalled is sent with the
+        next chunk, even if that chunk is empty, and before a non-text
+        chunk."""
+        sent = []
+
+        def test_stream():
+            yield "Hello"
+            sent.append(self._flushed_deltas())
+            yield " streaming"
+            sent.append(self._flushed_deltas())
+            # The stream stalls for longer than the flush interval.
+            time.sleep(0.6)
+            yield ""
+            sent.append(self._flushed_deltas())
+            yield " world"
+            sent.append(self._flushed_deltas())
+            yield lambda: None
+            sent.append(self._flushed_deltas())
+
+        stream_return = st.write_stream(test_stream)
+
+        self.assertEqual(stream_return, "Hello streaming world")
+        self.assertEqual("Hello", sent[0][0].new_element.markdown.body)
+        self.assertEqual([], sent[1])
+        self.assertEqual(" streaming" + write._TEXT_CURSOR, sent[2][0].append_text.text)
+        self.assertEqual([], sent[3])
+        self.assertEqual("Hello streaming world", sent[4][0].new_element.markdown.body)
+
+
 def make_is_type_mock(true_type_matchers):
     """Return a function that mocks is_type.
 